@@ -0,0 +1,4 @@
+"""Benchmarks of FairDM's hot paths against a bulk-generated portal.
+
+See ``docs/contributing/testing/benchmarks.md``.
+"""
@@ -0,0 +1,191 @@
+"""
+pytest configuration for the FairDM benchmark suite.
+
+The suite runs against its own test database, one per scale, seeded once by
+``generate_fake_data --bulk`` and kept between runs by ``--reuse-db``. Pass
+``--create-db`` to seed it afresh.
+
+    pytest benchmarks
+    pytest benchmarks --bench-scale large --bench-save main
+    pytest benchmarks --bench-scale large --bench-compare main
+"""
+
+import io
+
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+
+from .harness import (
+    Bench,
+    load_baseline,
+    regressions,
+    save_baseline,
+    summary,
+)
+
+#: Seed of the generated data, so every database of a scale holds the same records.
+SEED = 20240601
+
+_results = pytest.StashKey[list]()
+_regressions = pytest.StashKey[list]()
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("benchmarks")
+    group.addoption(
+        "--bench-scale",
+        default="small",
+        help="Size of the seeded data: small, medium or large (default: small)",
+    )
+    group.addoption(
+        "--bench-rounds",
+        type=int,
+        default=5,
+        help="Timed rounds per scenario (default: 5)",
+    )
+    group.addoption(
+        "--bench-save", metavar="NAME", help="Save the results as baseline NAME"
+    )
+    group.addoption(
+        "--bench-compare",
+        metavar="NAME",
+        help="Fail if a scenario regressed since baseline NAME",
+    )
+    group.addoption(
+        "--bench-tolerance",
+        type=float,
+        default=0.25,
+        help="Slowdown allowed by --bench-compare, as a fraction (default: 0.25)",
+    )
+
+
+def pytest_configure(config):
+    config.stash[_results] = []
+    config.stash[_regressions] = []
+
+
+@pytest.fixture(scope="session")
+def bench_scale(request):
+    """The name of the scale the database is seeded at."""
+    from fairdm.factories.bulk import SCALES
+
+    scale = request.config.getoption("bench_scale")
+    if scale not in SCALES:
+        raise pytest.UsageError(f"--bench-scale must be one of {', '.join(SCALES)}")
+    return scale
+
+
+@pytest.fixture(scope="session")
+def django_db_modify_db_settings(
+    django_db_modify_db_settings_parallel_suffix, bench_scale
+):
+    """Keep each scale's seeded data apart from the test suite's database."""
+    from django.conf import settings
+
+    for db in settings.DATABASES.values():
+        test = db.setdefault("TEST", {})
+        name = test.get("NAME") or f"test_{db['NAME']}"
+        test["NAME"] = f"{name}_bench_{bench_scale}"
+
+
+@pytest.fixture(scope="session")
+def django_db_setup(django_db_setup, django_db_blocker, bench_scale):
+    """Load the reference data and, on a new database, generate the portal's."""
+    from research_vocabs.models import Concept
+
+    from fairdm.core.models import Dataset
+
+    with django_db_blocker.unblock():
+        call_command("seed_licenses", verbosity=0)
+        Concept.preload()
+        if not Dataset.all_objects.exists():
+            call_command(
+                "generate_fake_data",
+                bulk=True,
+                scale=bench_scale,
+                seed=SEED,
+                stdout=io.StringIO(),
+            )
+
+
+@pytest.fixture
+def bench(request):
+    """Time a scenario and hold it to a query budget; see :class:`harness.Bench`."""
+    name = f"{request.node.module.__name__.rsplit('.', 1)[-1]}::{request.node.name}"
+    return Bench(
+        name,
+        rounds=request.config.getoption("bench_rounds"),
+        results=request.config.stash[_results],
+    )
+
+
+@pytest.fixture
+def public_dataset(db):
+    """The first public dataset; every dataset holds a similar share of records."""
+    from fairdm.core.models import Dataset
+    from fairdm.utils.choices import Visibility
+
+    return Dataset.all_objects.filter(visibility=Visibility.PUBLIC).earliest("pk")
+
+
+@pytest.fixture
+def root_sample(public_dataset):
+    """The root of the public dataset's sample tree: its first sample."""
+    from fairdm.core.models import Sample
+
+    return Sample.objects.filter(dataset=public_dataset).earliest("pk")
+
+
+@pytest.fixture
+def api_url():
+    """The API list URL of a registered sample or measurement type."""
+    from fairdm.api.viewsets import _model_to_slug
+    from fairdm.core.models import Sample
+
+    def url(model):
+        kind = "samples" if issubclass(model, Sample) else "measurements"
+        return reverse(f"api:{kind}-{_model_to_slug(model)}-list")
+
+    return url
+
+
+def pytest_sessionfinish(session, exitstatus):
+    config = session.config
+    results = config.stash[_results]
+    if not results:
+        return
+    scale = config.getoption("bench_scale")
+    if name := config.getoption("bench_compare"):
+        baseline = load_baseline(name)
+        if baseline["scale"] == scale:
+            found = regressions(results, baseline, config.getoption("bench_tolerance"))
+            config.stash[_regressions] = found
+            if found:
+                session.exitstatus = pytest.ExitCode.TESTS_FAILED
+    if name := config.getoption("bench_save"):
+        save_baseline(name, scale, results)
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    results = config.stash[_results]
+    if not results:
+        return
+    baseline = None
+    if name := config.getoption("bench_compare"):
+        baseline = load_baseline(name)
+        if baseline["scale"] != config.getoption("bench_scale"):
+            terminalreporter.write_line(
+                f"Baseline {name!r} is of the {baseline['scale']} scale; "
+                "timings were not compared."
+            )
+            baseline = None
+    terminalreporter.section(f"benchmarks ({config.getoption('bench_scale')})")
+    for line in summary(results, baseline):
+        terminalreporter.write_line(line)
+    if found := config.stash[_regressions]:
+        terminalreporter.section("regressions")
+        for line in found:
+            terminalreporter.write_line(line, red=True)
+    if name := config.getoption("bench_save"):
+        terminalreporter.write_line(f"Saved baseline {name!r}")
@@ -0,0 +1,159 @@
+"""Timing, query budgets and baselines for the benchmark scenarios.
+
+A scenario hands the ``bench`` fixture a function doing one unit of work: a
+request, an import, a walk of the hierarchy. :class:`Bench` runs it once to warm
+up, once more counting its queries, then the configured number of timed rounds.
+A scenario that runs more queries than its budget fails, listing them, so an N+1
+pattern shows up as a failure whatever the machine.
+
+Timings depend on the machine, so they are compared only with a baseline saved on
+the same one: ``--bench-save NAME`` writes ``baselines/NAME.json`` and
+``--bench-compare NAME`` fails the run if a scenario got slower by more than
+``--bench-tolerance`` or runs more queries than it did.
+"""
+
+from __future__ import annotations
+
+import json
+import statistics
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+BASELINES = Path(__file__).parent / "baselines"
+
+#: Queries listed when a scenario exceeds its budget.
+SHOWN_QUERIES = 20
+
+
+@dataclass
+class Result:
+    """One scenario's query count and timings, in seconds."""
+
+    name: str
+    queries: int
+    budget: int | None
+    rounds: int
+    best: float
+    median: float
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+
+class Bench:
+    """Time a scenario and hold it to a query budget.
+
+    Args:
+        name: The scenario's name in results and baselines.
+        rounds: Timed rounds when the scenario does not say.
+        results: Where the result is recorded, for the summary and baselines.
+    """
+
+    def __init__(self, name: str, rounds: int, results: list[Result]):
+        self.name = name
+        self.rounds = rounds
+        self.results = results
+
+    def __call__(
+        self, fn: Callable, budget: int | None = None, rounds: int | None = None
+    ):
+        """Run ``fn`` and record how it did, returning what it returned.
+
+        Args:
+            fn: One unit of work, taking no arguments.
+            budget: The most queries one run may make.
+            rounds: Timed rounds, for a scenario too slow for the default.
+        """
+        # The warm-up fills the per-process caches a running portal has filled
+        fn()
+        with CaptureQueriesContext(connection) as captured:
+            value = fn()
+
+        timings = []
+        for _ in range(rounds or self.rounds):
+            start = time.perf_counter()
+            fn()
+            timings.append(time.perf_counter() - start)
+
+        result = Result(
+            name=self.name,
+            queries=len(captured),
+            budget=budget,
+            rounds=len(timings),
+            best=min(timings),
+            median=statistics.median(timings),
+        )
+        self.results.append(result)
+        if budget is not None and result.queries > budget:
+            shown = captured.captured_queries[:SHOWN_QUERIES]
+            queries = "\n".join(f"  {query['sql']}" for query in shown)
+            pytest.fail(
+                f"{self.name} ran {result.queries} queries, over its budget of "
+                f"{budget}:\n{queries}",
+                pytrace=False,
+            )
+        return value
+
+
+def save_baseline(name: str, scale: str, results: list[Result]) -> Path:
+    """Write ``results`` as the baseline ``name``."""
+    path = BASELINES / f"{name}.json"
+    data = {"scale": scale, "results": {r.name: r.as_dict() for r in results}}
+    path.write_text(json.dumps(data, indent=2, sort_keys=True) + "\n")
+    return path
+
+
+def load_baseline(name: str) -> dict:
+    """The baseline ``name``, as :func:`save_baseline` wrote it."""
+    path = BASELINES / f"{name}.json"
+    if not path.exists():
+        raise pytest.UsageError(f"No baseline {name!r} in {BASELINES}")
+    return json.loads(path.read_text())
+
+
+def regressions(results: list[Result], baseline: dict, tolerance: float) -> list[str]:
+    """What got worse since ``baseline``: more queries, or a slower median."""
+    found = []
+    for result in results:
+        before = baseline["results"].get(result.name)
+        if before is None:
+            continue
+        if result.queries > before["queries"]:
+            found.append(
+                f"{result.name}: {result.queries} queries, was {before['queries']}"
+            )
+        if result.median > before["median"] * (1 + tolerance):
+            found.append(
+                f"{result.name}: {result.median * 1000:.1f} ms, "
+                f"was {before['median'] * 1000:.1f} ms"
+            )
+    return found
+
+
+def summary(results: list[Result], baseline: dict | None = None) -> list[str]:
+    """The results as the lines of a table, against ``baseline`` if given."""
+    width = max(len(r.name) for r in results)
+    lines = [
+        f"{'scenario':<{width}}  {'queries':>7}  {'budget':>6}  "
+        f"{'best ms':>9}  {'median ms':>9}  {'change':>7}"
+    ]
+    for r in sorted(results, key=lambda r: r.name):
+        change = ""
+        before = (baseline or {}).get("results", {}).get(r.name)
+        if before and before["median"]:
+            change = f"{(r.median / before['median'] - 1) * 100:+.0f}%"
+        budget = "" if r.budget is None else r.budget
+        lines.append(
+            f"{r.name:<{width}}  {r.queries:>7}  {budget:>6}  "
+            f"{r.best * 1000:>9.2f}  {r.median * 1000:>9.2f}  {change:>7}"
+        )
+    return lines
@@ -0,0 +1,57 @@
+"""Benchmarks of the REST API's list and detail endpoints.
+
+Lists are asked for a full page of 100, so a query per row could not fit in any of
+the budgets below.
+"""
+
+import pytest
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from fairdm_demo.models import CustomSample, ExampleMeasurement
+
+PAGE = {"page_size": 100}
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def api_client():
+    return APIClient()
+
+
+def _get(client, url, params=None):
+    def request():
+        response = client.get(url, params)
+        assert response.status_code == 200, response.content[:500]
+        return response
+
+    return request
+
+
+@pytest.mark.parametrize("basename", ["project", "dataset", "contributor"])
+def test_list(bench, api_client, basename):
+    bench(_get(api_client, reverse(f"api:{basename}-list"), PAGE), budget=15)
+
+
+def test_dataset_detail(bench, api_client, public_dataset):
+    url = reverse("api:dataset-detail", kwargs={"uuid": public_dataset.uuid})
+    bench(_get(api_client, url), budget=10)
+
+
+@pytest.mark.parametrize(
+    "model", [CustomSample, ExampleMeasurement], ids=lambda model: model.__name__
+)
+def test_type_list(bench, api_client, api_url, model):
+    bench(_get(api_client, api_url(model), PAGE), budget=15)
+
+
+@pytest.mark.parametrize("name", ["api-sample-discovery", "api-measurement-discovery"])
+def test_discovery(bench, api_client, name):
+    bench(_get(api_client, reverse(f"api:{name}"), PAGE), budget=15)
+
+
+def test_sample_tiles(bench, api_client):
+    # One of the four tiles covering the globe at zoom 1: a quarter of all samples
+    url = reverse("api:api-sample-tiles", kwargs={"z": 1, "x": 1, "y": 0})
+    bench(_get(api_client, url), budget=10)
@@ -0,0 +1,32 @@
+"""Benchmarks of the collection table pages.
+
+A page of 100 rows, first and last: the last one pays for the offset.
+"""
+
+import pytest
+from django.urls import reverse
+
+from fairdm.registry import registry
+from fairdm_demo.models import CustomSample, ExampleMeasurement
+
+PER_PAGE = 100
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.mark.parametrize(
+    "model", [CustomSample, ExampleMeasurement], ids=lambda model: model.__name__
+)
+@pytest.mark.parametrize("position", ["first", "last"])
+def test_table_page(bench, client, model, position):
+    url = reverse(f"{registry.get_for_model(model).get_slug()}-collection")
+    page = 1
+    if position == "last":
+        page = max(1, -(-model.objects.count() // PER_PAGE))
+
+    def request():
+        response = client.get(url, {"page": page, "per_page": PER_PAGE})
+        assert response.status_code == 200
+        return response
+
+    bench(request, budget=30)
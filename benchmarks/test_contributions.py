@@ -0,0 +1,57 @@
+"""Benchmarks of the joins between contributions and the records they credit.
+
+``Contribution.object_id`` is an integer like the primary keys it points at, so
+both directions join on the ``(content_type, object_id)`` index.
+"""
+
+import pytest
+
+from fairdm.contrib.contributors.models import Contribution, Person
+from fairdm.core.models import Dataset
+
+PAGE = 100
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def credited_person(db):
+    """The person with the most credits."""
+    from django.db.models import Count
+
+    return (
+        Person.objects.annotate(credits=Count("contributions"))
+        .order_by("-credits", "pk")
+        .first()
+    )
+
+
+def test_datasets_of_a_contributor(bench, credited_person):
+    def run():
+        return list(
+            Dataset.all_objects.filter(contributors__contributor=credited_person)
+        )
+
+    assert bench(run, budget=1)
+
+
+def test_contributors_of_a_page_of_datasets(bench):
+    def run():
+        page = Dataset.all_objects.prefetch_related("contributors__contributor")
+        return [
+            [credit.contributor for credit in dataset.contributors.all()]
+            for dataset in page.order_by("pk")[:PAGE]
+        ]
+
+    # The page, its credits, then the polymorphic contributors by type
+    assert bench(run, budget=5)
+
+
+def test_credited_records_of_a_contributor(bench, credited_person):
+    def run():
+        queryset = Contribution.objects.filter(contributor=credited_person)
+        queryset = queryset.prefetch_related("content_object")
+        return [credit.content_object for credit in queryset]
+
+    # The credits, then one query per credited model
+    assert bench(run, budget=4)
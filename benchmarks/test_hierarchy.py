@@ -0,0 +1,38 @@
+"""Benchmarks of walking the sample hierarchy.
+
+Each dataset's samples form one tree, so the root of the first public dataset
+reaches every other sample in it.
+"""
+
+import pytest
+
+from fairdm.core.models import Sample
+from fairdm.core.sample.hierarchy import ANCESTORS, depths
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.mark.parametrize("depth", [1, 3, None], ids=lambda depth: f"depth={depth}")
+def test_descendants(bench, root_sample, depth):
+    def run():
+        return list(root_sample.get_descendants(depth=depth).values_list("pk"))
+
+    assert bench(run, budget=1)
+
+
+def test_descendant_depths(bench, root_sample):
+    assert bench(lambda: depths(root_sample.pk), budget=1)
+
+
+def test_ancestors_of_a_leaf(bench, public_dataset):
+    leaf = Sample.objects.filter(dataset=public_dataset).latest("pk")
+
+    assert bench(lambda: depths(leaf.pk, ANCESTORS), budget=1)
+
+
+def test_descendants_as_records(bench, root_sample):
+    # Polymorphic records: one query for the bases, then one per specimen type
+    def run():
+        return list(root_sample.get_descendants())
+
+    assert bench(run, budget=4)
@@ -0,0 +1,59 @@
+"""Benchmarks of importing measurements into a dataset and exporting them."""
+
+import pytest
+import tablib
+from django.contrib.contenttypes.models import ContentType
+
+from fairdm.contrib.import_export.streaming import STREAM_FORMATS, stream_export
+from fairdm.core.models import Sample
+from fairdm.registry import registry
+from fairdm_demo.models import ExampleMeasurement
+
+#: Rows per import.
+ROWS = 500
+
+#: Queries an imported row may cost. Rows are saved one by one, each through its
+#: base and type tables, hooks and receivers; every lookup is resolved up front.
+QUERIES_PER_ROW = 12
+
+pytestmark = pytest.mark.django_db
+
+
+def _resource(dataset):
+    return registry.get_for_model(ExampleMeasurement).get_resource_class()(
+        dataset=dataset
+    )
+
+
+def test_import(bench, public_dataset):
+    samples = list(
+        Sample.objects.filter(dataset=public_dataset).values_list("uuid", flat=True)
+    )
+    data = tablib.Dataset(
+        *[(f"bench-{i}", samples[i % len(samples)], "x") for i in range(ROWS)],
+        headers=["name", "sample", "char_field"],
+    )
+
+    def run():
+        # A dry run rolls back, so every round imports the same new rows
+        result = _resource(public_dataset).import_data(
+            data, dry_run=True, raise_errors=True
+        )
+        assert result.totals["new"] == ROWS
+
+    bench(run, budget=ROWS * QUERIES_PER_ROW, rounds=3)
+
+
+@pytest.mark.parametrize("fmt", sorted(STREAM_FORMATS))
+def test_export(bench, public_dataset, fmt):
+    ctype = ContentType.objects.get_for_model(
+        ExampleMeasurement, for_concrete_model=False
+    )
+    queryset = ExampleMeasurement.objects.filter(
+        dataset=public_dataset, polymorphic_ctype=ctype
+    )
+
+    def run():
+        return b"".join(stream_export(_resource(public_dataset), queryset, fmt))
+
+    assert bench(run, budget=10)
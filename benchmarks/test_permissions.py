@@ -0,0 +1,49 @@
+"""Benchmarks of object permission checks over a page of records.
+
+The user holds rights on a few datasets; samples inherit them through their
+dataset. Each round loads the user afresh, as the next request would.
+"""
+
+import pytest
+
+from fairdm.core.models import Dataset, Sample
+from fairdm.core.permission_cache import prefetch_permissions
+from fairdm.core.utils import assign_perm
+from fairdm.factories import PersonFactory
+
+PAGE = 100
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def editor(db):
+    person = PersonFactory(is_active=True)
+    for dataset in Dataset.all_objects.order_by("pk")[:10]:
+        assign_perm("change_dataset", person, dataset)
+    return person
+
+
+def _fresh(user):
+    return type(user).objects.get(pk=user.pk)
+
+
+def test_datasets_from_the_snapshot(bench, editor):
+    datasets = list(Dataset.all_objects.order_by("pk")[:PAGE])
+
+    def run():
+        user = _fresh(editor)
+        return [user.has_perm("dataset.change_dataset", d) for d in datasets]
+
+    assert any(bench(run, budget=6))
+
+
+def test_samples_prefetched(bench, editor):
+    samples = Sample.objects.order_by("pk")[:PAGE]
+
+    def run():
+        user = _fresh(editor)
+        page = prefetch_permissions(user, samples.all())
+        return [user.has_perm("sample.change_sample", s) for s in page]
+
+    assert any(bench(run, budget=8))
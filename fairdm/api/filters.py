@@ -5,7 +5,11 @@ from __future__ import annotations
 import contextlib
 from typing import TYPE_CHECKING
 
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Q
+from rest_framework.exceptions import ValidationError
 from rest_framework.filters import BaseFilterBackend
+from rest_framework.settings import api_settings
 
 from fairdm.core.utils import get_objects_for_user
 
@@ -44,16 +48,43 @@ def _get_public_filter(model) -> dict:
     return {}  # No known visibility field
 
 
+def _record_grants(user, model) -> bool:
+    """Whether ``user`` holds a view grant on any individual sample or measurement.
+
+    Answered from the user's cached permission snapshot, so the guardian subquery
+    for direct record grants is only added for the few users who have one.
+    """
+    from django.contrib.contenttypes.models import ContentType
+
+    from fairdm.core.permission_cache import get_snapshot
+
+    base_class = getattr(model, "type_of", None) or model
+    snapshot = get_snapshot(user)
+    if snapshot is None:
+        return True
+    content_type_id = ContentType.objects.get_for_model(base_class).pk
+    codename = f"view_{base_class._meta.model_name}"
+    return any(
+        key[0] == content_type_id and codename in codenames
+        for key, codenames in snapshot.grants.items()
+    )
+
+
 class FairDMVisibilityFilter(BaseFilterBackend):
     """Queryset-level visibility filter for FairDM API list endpoints.
 
     Restricts list querysets to objects the requesting user can see:
       - Records that are publicly visible (via ``visibility=PUBLIC`` or cascaded
         through ``dataset__visibility=PUBLIC``) are always included.
-      - Records where the user has an explicit guardian 'view' permission are also
-        included.
+      - Datasets the user may view through a guardian grant, their own or a
+        group's, are included, and so are the samples and measurements in them.
+        These are read from the dataset access index
+        (:mod:`fairdm.core.dataset.access`) as an integer ``IN`` subquery.
+      - Projects, samples and measurements the user has an explicit guardian
+        'view' permission on are also included.
 
-    Both sets are combined via queryset union to avoid N+1 queries.
+    Each condition is a filter on the same queryset, so the result needs no union
+    and no ``DISTINCT``, and stays ordered and paginated by the database's indexes.
 
     For models with no known visibility mechanism (e.g. Contributor), the filter
     short-circuits and returns the full unfiltered queryset, making all records
@@ -72,15 +103,151 @@ class FairDMVisibilityFilter(BaseFilterBackend):
         if not public_filter:
             return queryset
 
-        if request.user and request.user.is_authenticated:
-            public_qs = queryset.filter(**public_filter)
-            view_perm = f"{queryset.model._meta.app_label}.view_{queryset.model._meta.model_name}"
-            permitted_qs = get_objects_for_user(
-                request.user,
-                view_perm,
-                queryset,
-            )
-            return (public_qs | permitted_qs).distinct()
-
-        # Anonymous users: public records only
-        return queryset.filter(**public_filter)
+        user = request.user
+        if not (user and user.is_authenticated):
+            # Anonymous users: public records only
+            return queryset.filter(**public_filter)
+
+        model = queryset.model
+        view_perm = f"{model._meta.app_label}.view_{model._meta.model_name}"
+        # A global grant on the polymorphic base covers every subtype's records.
+        base_class = getattr(model, "type_of", None) or model
+        base_perm = f"{base_class._meta.app_label}.view_{base_class._meta.model_name}"
+        if user.is_superuser or user.has_perm(view_perm) or user.has_perm(base_perm):
+            return queryset
+
+        from fairdm.core.dataset.access import accessible_datasets
+        from fairdm.core.models import Dataset
+
+        visible = Q(**public_filter)
+        if issubclass(model, Dataset):
+            visible |= Q(pk__in=accessible_datasets(user))
+        else:
+            if "dataset__visibility" in public_filter:
+                visible |= Q(dataset_id__in=accessible_datasets(user))
+            if "visibility" in public_filter or _record_grants(user, model):
+                permitted = get_objects_for_user(user, view_perm, queryset)
+                visible |= Q(pk__in=permitted.values("pk"))
+        return queryset.filter(visible)
+
+
+class FairDMSearchFilter(BaseFilterBackend):
+    """Full-text search of projects, datasets, samples and measurements by ``?q=``.
+
+    Matches against each record's search document (:mod:`fairdm.core.search`) under
+    its GIN index, and orders the results by relevance unless the client asks for
+    an ``?ordering=``. Listed after ``OrderingFilter`` so that a viewset's default
+    ordering does not displace the ranking. Other models are returned unfiltered.
+    """
+
+    search_param = "q"
+
+    def filter_queryset(self, request: Request, queryset, view: APIView):
+        from fairdm.core.search import is_indexed, search
+
+        text = request.query_params.get(self.search_param, "").strip()
+        if not text or not is_indexed(queryset.model):
+            return queryset
+        ordered = request.query_params.get(api_settings.ORDERING_PARAM)
+        return search(queryset, text, rank=not ordered)
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                "name": self.search_param,
+                "required": False,
+                "in": "query",
+                "description": (
+                    "Full-text search of names, identifiers, descriptions, keywords "
+                    'and tags. Supports "quoted phrases", or, and -exclusions.'
+                ),
+                "schema": {"type": "string"},
+            }
+        ]
+
+
+def _location_path(model) -> str | None:
+    """The lookup from ``model`` to its location: its own, or its sample's."""
+    for path, name in (("location", "location"), ("sample__location", "sample")):
+        try:
+            model._meta.get_field(name)
+        except FieldDoesNotExist:
+            continue
+        return path
+    return None
+
+
+class FairDMViewportFilter(BaseFilterBackend):
+    """Restrict samples and measurements to those located in a map viewport.
+
+    ``?bbox=west,south,east,north`` keeps records located inside the box, in
+    degrees; a ``west`` greater than ``east`` crosses the antimeridian.
+    ``?near=lon,lat&radius=km`` keeps records within ``radius`` kilometres of a
+    point. Measurements are located by their sample. Both are answered from the
+    geohash index of :class:`~fairdm.contrib.location.managers.PointQuerySet`, so
+    map clients can fetch only what they show. Models without a location are
+    returned unfiltered.
+    """
+
+    bbox_param = "bbox"
+    near_param = "near"
+    radius_param = "radius"
+
+    def filter_queryset(self, request: Request, queryset, view: APIView):
+        from fairdm.contrib.location.managers import parse_bbox, parse_near
+        from fairdm.contrib.location.models import Point
+
+        params = request.query_params
+        path = _location_path(queryset.model)
+        if path is None:
+            return queryset
+
+        if bbox := params.get(self.bbox_param):
+            try:
+                box = parse_bbox(bbox)
+            except ValueError as exc:
+                raise ValidationError(
+                    {self.bbox_param: [f"Expected west,south,east,north: {exc}"]}
+                ) from exc
+            points = Point.objects.within_bbox(*box)
+            queryset = queryset.filter(**{f"{path}__in": points.values("pk")})
+
+        if near := params.get(self.near_param):
+            try:
+                x, y, km = parse_near(near, params.get(self.radius_param, ""))
+            except ValueError as exc:
+                raise ValidationError(
+                    {self.near_param: [f"Expected lon,lat with a radius in km: {exc}"]}
+                ) from exc
+            points = Point.objects.within_radius(x, y, km)
+            queryset = queryset.filter(**{f"{path}__in": points.values("pk")})
+        return queryset
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                "name": self.bbox_param,
+                "required": False,
+                "in": "query",
+                "description": (
+                    "Only records located inside west,south,east,north, in degrees."
+                ),
+                "schema": {"type": "string"},
+            },
+            {
+                "name": self.near_param,
+                "required": False,
+                "in": "query",
+                "description": (
+                    "Only records located within radius kilometres of lon,lat."
+                ),
+                "schema": {"type": "string"},
+            },
+            {
+                "name": self.radius_param,
+                "required": False,
+                "in": "query",
+                "description": "The radius of near, in kilometres.",
+                "schema": {"type": "number"},
+            },
+        ]
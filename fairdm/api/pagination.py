@@ -1,6 +1,48 @@
-"""FairDM API pagination classes."""
+"""FairDM API pagination classes.
 
-from rest_framework.pagination import PageNumberPagination
+Two styles are offered. Page numbers are the default and suit browsing; a cursor
+suits harvesting, because each page is a range scan on an indexed key rather than
+an ``OFFSET`` past every earlier row, and it never issues ``COUNT(*)``.
+"""
+
+from django.utils.translation import gettext_lazy as _
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import CursorPagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+#: Values of ``?count=`` that turn the total count off.
+_FALSE_VALUES = frozenset({"0", "false", "no", "off"})
+
+
+class FairDMCursorPagination(CursorPagination):
+    """Keyset pagination on the primary key, for streaming a whole collection.
+
+    Response format::
+
+        {
+            "next": "http://example.com/api/v1/samples/rock-samples/?cursor=cD0yNQ%3D%3D",
+            "previous": null,
+            "results": [...],
+        }
+
+    Each page is fetched with ``WHERE pk > <last seen> ORDER BY pk LIMIT n``, so
+    the cost of page ten thousand is the cost of page one. There is no ``count``:
+    answering it is the scan this style exists to avoid.
+
+    The key is ``pk`` rather than ``id`` because on a Sample or Measurement
+    subclass the primary key is the indexed ``*_ptr_id`` column of the subtype's
+    own table, whereas ``id`` lives on the polymorphic base and needs a join.
+
+    Query parameters:
+        - ``cursor``: opaque position token from a previous ``next`` or ``previous``
+        - ``page_size``: number of results per page (max 100)
+    """
+
+    page_size = 25
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    ordering = "pk"
 
 
 class FairDMPagination(PageNumberPagination):
@@ -18,8 +60,132 @@ class FairDMPagination(PageNumberPagination):
     Query parameters:
         - ``page``: page number (1-based)
         - ``page_size``: number of results per page (max 100)
+        - ``count``: ``false`` to skip the total count; ``count`` is then ``null``
+          and ``next`` is decided by fetching one row past the page
+        - ``cursor``: switch to :class:`FairDMCursorPagination` for this request.
+          Pass it empty (``?cursor=``) to start at the first page.
     """
 
     page_size = 25
     page_size_query_param = "page_size"
     max_page_size = 100
+
+    count_query_param = "count"
+    count_query_description = _("Set to false to omit the total count.")
+
+    cursor_pagination_class = FairDMCursorPagination
+    cursor_query_param = "cursor"
+
+    #: The cursor paginator serving this request, when the client asked for one.
+    cursor_paginator: CursorPagination | None = None
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        if self.cursor_query_param in request.query_params:
+            self.cursor_paginator = self.cursor_pagination_class()
+            page = self.cursor_paginator.paginate_queryset(queryset, request, view)
+            self.display_page_controls = self.cursor_paginator.display_page_controls
+            return page
+
+        if self.wants_count(request):
+            return super().paginate_queryset(queryset, request, view)
+        return self._paginate_without_count(queryset, request)
+
+    def wants_count(self, request) -> bool:
+        """Whether this request asked for the total count, which it does by default."""
+        value = request.query_params.get(self.count_query_param, "")
+        return value.strip().lower() not in _FALSE_VALUES
+
+    def _paginate_without_count(self, queryset, request) -> list | None:
+        """One page by ``OFFSET``, with ``next`` decided by a row past the page."""
+        page_size = self.get_page_size(request)
+        if not page_size:
+            return None
+
+        try:
+            number = int(request.query_params.get(self.page_query_param) or 1)
+        except ValueError:
+            number = 0
+        if number < 1:
+            raise NotFound(self.invalid_page_message)
+
+        offset = (number - 1) * page_size
+        rows = list(queryset[offset : offset + page_size + 1])
+        if number > 1 and not rows:
+            raise NotFound(self.invalid_page_message)
+
+        self.page = _UncountedPage(rows[:page_size], number, len(rows) > page_size)
+        return list(self.page.object_list)
+
+    def get_paginated_response(self, data):
+        if self.cursor_paginator is not None:
+            return self.cursor_paginator.get_paginated_response(data)
+        if isinstance(self.page, _UncountedPage):
+            return Response(
+                {
+                    "count": None,
+                    "next": self.get_next_link(),
+                    "previous": self.get_previous_link(),
+                    "results": data,
+                }
+            )
+        return super().get_paginated_response(data)
+
+    def get_paginated_response_schema(self, schema):
+        response_schema = super().get_paginated_response_schema(schema)
+        response_schema["properties"]["count"]["nullable"] = True
+        return response_schema
+
+    def get_schema_operation_parameters(self, view):
+        parameters = super().get_schema_operation_parameters(view)
+        parameters += [
+            {
+                "name": self.count_query_param,
+                "required": False,
+                "in": "query",
+                "description": str(self.count_query_description),
+                "schema": {"type": "boolean"},
+            },
+            {
+                "name": self.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": str(
+                    self.cursor_pagination_class.cursor_query_description
+                ),
+                "schema": {"type": "string"},
+            },
+        ]
+        return parameters
+
+    def get_next_link(self):
+        if not isinstance(self.page, _UncountedPage):
+            return super().get_next_link()
+        if not self.page.has_next:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.page_query_param, self.page.number + 1)
+
+    def get_previous_link(self):
+        if not isinstance(self.page, _UncountedPage):
+            return super().get_previous_link()
+        if self.page.number == 1:
+            return None
+        url = self.request.build_absolute_uri()
+        if self.page.number == 2:
+            return remove_query_param(url, self.page_query_param)
+        return replace_query_param(url, self.page_query_param, self.page.number - 1)
+
+    def to_html(self):
+        if self.cursor_paginator is not None:
+            return self.cursor_paginator.to_html()
+        return super().to_html()
+
+
+class _UncountedPage:
+    """A page that knows whether another follows, without knowing how many do."""
+
+    def __init__(self, object_list: list, number: int, has_next: bool):
+        self.object_list = object_list
+        self.number = number
+        self.has_next = has_next
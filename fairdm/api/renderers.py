@@ -0,0 +1,60 @@
+"""FairDM API renderers for streamed bulk exports.
+
+The export action writes its own ``StreamingHttpResponse``, so these renderers
+never render a successful response. They exist so that content negotiation can
+choose the export format from ``?format=csv`` or an ``Accept`` header, exactly as
+it chooses JSON for every other endpoint. When the action fails before it starts
+streaming, DRF renders the error through the negotiated renderer, which is why
+``render()`` still writes the error body as JSON.
+"""
+
+from __future__ import annotations
+
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+from rest_framework.renderers import BaseRenderer
+
+from fairdm.contrib.import_export.streaming import STREAM_FORMATS, parquet_available
+
+
+class StreamingExportRenderer(BaseRenderer):
+    """Base for the export formats. Carries the format's name and media type only."""
+
+    charset = None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None) -> bytes:
+        if isinstance(data, bytes):
+            return data
+        return json.dumps(data, cls=DjangoJSONEncoder).encode()
+
+
+class CSVExportRenderer(StreamingExportRenderer):
+    format = "csv"
+    media_type = STREAM_FORMATS["csv"].content_type
+
+
+class NDJSONExportRenderer(StreamingExportRenderer):
+    format = "ndjson"
+    media_type = STREAM_FORMATS["ndjson"].content_type
+
+
+class ParquetExportRenderer(StreamingExportRenderer):
+    format = "parquet"
+    media_type = STREAM_FORMATS["parquet"].content_type
+
+
+def export_renderer_classes() -> list[type[StreamingExportRenderer]]:
+    """The export formats this installation can produce, CSV first as the default.
+
+    Parquet is offered only when ``pyarrow`` is installed, so a client asking for
+    it on an installation without it is refused at negotiation rather than failing
+    part way through a download.
+    """
+    renderers: list[type[StreamingExportRenderer]] = [
+        CSVExportRenderer,
+        NDJSONExportRenderer,
+    ]
+    if parquet_available():
+        renderers.append(ParquetExportRenderer)
+    return renderers
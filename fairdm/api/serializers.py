@@ -102,6 +102,40 @@ class BaseMeasurementSerializer(
         ]
 
 
+class DatasetExtentSerializer(serializers.ModelSerializer):
+    """The stored bounds, date span and sample count of a dataset."""
+
+    earliest = serializers.CharField(read_only=True)
+    latest = serializers.CharField(read_only=True)
+
+    class Meta:
+        from fairdm.core.dataset.models import DatasetExtent
+
+        model = DatasetExtent
+        fields = [
+            "sample_count",
+            "min_x",
+            "min_y",
+            "max_x",
+            "max_y",
+            "earliest",
+            "latest",
+        ]
+        read_only_fields = fields
+
+
+class BaseDatasetSerializer(
+    ObjectPermissionsAssignmentMixin, serializers.ModelSerializer
+):
+    """Base DRF serializer for datasets.
+
+    Adds the dataset's stored ``extent``, read from the row the viewset joins with
+    ``with_extent()``, so listing datasets runs no aggregate per dataset.
+    """
+
+    extent = DatasetExtentSerializer(read_only=True)
+
+
 # ---------------------------------------------------------------------------
 # Validation helpers for custom serializer_class enforcement
 # ---------------------------------------------------------------------------
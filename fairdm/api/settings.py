@@ -67,6 +67,16 @@ All list endpoints are paginated (default page size: 25, maximum: 100).
 
 - `?page=<n>` — page number
 - `?page_size=<n>` — results per page (capped at 100)
+- `?count=false` — omit the total count, which is expensive on very large collections
+- `?cursor=` — page by cursor instead: follow `next` to walk a whole collection at a
+  constant cost per page. Responses carry no `count`.
+
+### Bulk export
+
+Every sample and measurement type also has `/export/`, which streams the whole visible
+collection as one file instead of pages. Filters apply as they do to the list.
+
+- `?format=csv` (default), `?format=ndjson`, or `?format=parquet` where installed
 
 ### Filtering & Ordering
 
@@ -111,7 +121,9 @@ REST_FRAMEWORK = {
     "DEFAULT_FILTER_BACKENDS": [
         "fairdm.api.filters.FairDMVisibilityFilter",
         "django_filters.rest_framework.DjangoFilterBackend",
+        "fairdm.api.filters.FairDMViewportFilter",
         "rest_framework.filters.OrderingFilter",
+        "fairdm.api.filters.FairDMSearchFilter",
     ],
 }
 
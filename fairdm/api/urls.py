@@ -12,7 +12,11 @@ from drf_spectacular.views import (
 )
 
 from fairdm.api.router import fairdm_api_router
-from fairdm.api.viewsets import MeasurementDiscoveryView, SampleDiscoveryView
+from fairdm.api.viewsets import (
+    MeasurementDiscoveryView,
+    SampleDiscoveryView,
+    SampleTileView,
+)
 
 # Namespace isolates all API URL names under ``api`` so they cannot collide
 # with portal UI routes (project-list, dataset-list, etc.).  API routes are
@@ -29,6 +33,12 @@ urlpatterns = [
         MeasurementDiscoveryView.as_view(),
         name="api-measurement-discovery",
     ),
+    # ── Map tiles ──────────────────────────────────────────────────────────
+    path(
+        "v1/tiles/<int:z>/<int:x>/<int:y>.geojson",
+        SampleTileView.as_view(),
+        name="api-sample-tiles",
+    ),
     # ── Router-generated endpoints ─────────────────────────────────────────
     path("v1/", include(fairdm_api_router.urls)),
     # ── Authentication endpoints (dj-rest-auth) ────────────────────────────
@@ -5,7 +5,10 @@ This module provides:
 - :class:`BaseViewSet` — the base class for all FairDM API viewsets.
 - :class:`ProjectViewSet`, :class:`DatasetViewSet` — full CRUD viewsets for
   core models.
-- :class:`ContributorViewSet` — read-only viewset for contributor profiles.
+- :class:`ContributorViewSet` — read-only viewset for contributor profiles, with
+  a ``network/`` action listing each contributor's collaborators.
+- :class:`StreamingExportMixin` — the ``export/`` list action that streams a
+  whole filtered collection as CSV, NDJSON or Parquet.
 - :func:`generate_viewset` — factory that creates a ``ModelViewSet`` subclass
   from a registry :class:`~fairdm.registry.ModelConfiguration`.
 - :class:`SampleDiscoveryView`, :class:`MeasurementDiscoveryView` — catalog
@@ -17,14 +20,20 @@ from __future__ import annotations
 import contextlib
 from typing import Any
 
+from django.http import StreamingHttpResponse
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiParameter, extend_schema
 from rest_framework import serializers
+from rest_framework.decorators import action
 from rest_framework.exceptions import PermissionDenied
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework.viewsets import ModelViewSet, ReadOnlyModelViewSet
 
+from fairdm.api.renderers import export_renderer_classes
 from fairdm.api.serializers import (
+    BaseDatasetSerializer,
     BaseMeasurementSerializer,
     BaseSampleSerializer,
     _validate_measurement_serializer,
@@ -32,6 +41,12 @@ from fairdm.api.serializers import (
     build_model_serializer,
 )
 from fairdm.contrib.contributors.models import Contributor
+from fairdm.contrib.import_export.streaming import (
+    DEFAULT_CHUNK_SIZE,
+    STREAM_FORMATS,
+    stream_export,
+)
+from fairdm.core.instrumentation import InstrumentedViewMixin
 from fairdm.core.models import Dataset, Measurement, Project, Sample
 
 # ---------------------------------------------------------------------------
@@ -39,7 +54,7 @@ from fairdm.core.models import Dataset, Measurement, Project, Sample
 # ---------------------------------------------------------------------------
 
 
-class BaseViewSet(ModelViewSet):
+class BaseViewSet(InstrumentedViewMixin, ModelViewSet):
     """Internal base class — see generated subclasses for API documentation.
 
     Portal developers: use :func:`generate_viewset` or subclass the per-model
@@ -64,6 +79,54 @@ class BaseViewSet(ModelViewSet):
         instance.delete()
 
 
+class StreamingExportMixin:
+    """Adds ``GET <collection>/export/``, streaming every visible row in one response.
+
+    The queryset goes through ``filter_queryset()``, so the visibility filter and
+    the registry's generated filter set apply exactly as they do to the list
+    endpoint, and ``?<field>=<value>`` narrows an export the same way. Rows are
+    written by the model's registry resource, so an export has the columns a
+    portal configured for export elsewhere.
+
+    The format is negotiated: ``?format=csv`` (the default), ``?format=ndjson``,
+    or ``?format=parquet`` when pyarrow is installed, or the matching ``Accept``
+    header. Rows are read ``export_chunk_size`` at a time with ``.iterator()``,
+    so memory stays flat however many rows the collection holds.
+    """
+
+    export_chunk_size = DEFAULT_CHUNK_SIZE
+
+    @extend_schema(
+        responses={
+            (200, spec.content_type): OpenApiTypes.BINARY
+            for spec in STREAM_FORMATS.values()
+        }
+    )
+    @action(
+        detail=False,
+        methods=["get"],
+        url_path="export",
+        renderer_classes=export_renderer_classes(),
+        pagination_class=None,
+    )
+    def export(self, request: Request, *args: Any, **kwargs: Any):
+        """Stream every record in this collection that you may see, as one file."""
+        from fairdm.registry import registry
+
+        queryset = self.filter_queryset(self.get_queryset())
+        model = queryset.model
+        resource = registry.get_for_model(model).get_resource_class()(dataset=None)
+        spec = STREAM_FORMATS[request.accepted_renderer.format]
+
+        response = StreamingHttpResponse(
+            stream_export(resource, queryset, spec.extension, self.export_chunk_size),
+            content_type=spec.content_type,
+        )
+        filename = f"{_model_to_slug(model)}.{spec.extension}"
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+        return response
+
+
 # ---------------------------------------------------------------------------
 # Core model viewsets
 # ---------------------------------------------------------------------------
@@ -128,15 +191,16 @@ class DatasetViewSet(BaseViewSet):
         return Dataset.all_objects.all()
 
     def get_queryset(self):
-        return Dataset.all_objects.all()
+        return Dataset.all_objects.with_extent()
 
     def get_serializer_class(self):
         if hasattr(self, "_serializer_class"):
             return self._serializer_class
         self._serializer_class = build_model_serializer(
             Dataset,
-            ["uuid", "name", "visibility", "added", "modified"],
+            ["uuid", "name", "visibility", "added", "modified", "extent"],
             view_name="api:dataset-detail",
+            base_class=BaseDatasetSerializer,
         )
         return self._serializer_class
 
@@ -153,7 +217,7 @@ class DatasetViewSet(BaseViewSet):
         serializer.save(created_by=self.request.user)
 
 
-class ContributorViewSet(ReadOnlyModelViewSet):
+class ContributorViewSet(InstrumentedViewMixin, ReadOnlyModelViewSet):
     """People and organizations that contribute to research projects.
 
     Contributor profiles are publicly accessible (read-only). Use this endpoint
@@ -179,6 +243,40 @@ class ContributorViewSet(ReadOnlyModelViewSet):
         )
         return self._serializer_class
 
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(
+                "limit",
+                OpenApiTypes.INT,
+                description="Most collaborators to return (default 50, up to 500).",
+            )
+        ],
+        responses={200: OpenApiTypes.OBJECT},
+    )
+    @action(detail=True, methods=["get"], url_path="network", pagination_class=None)
+    def network(self, request: Request, *args: Any, **kwargs: Any):
+        """The contributors most often credited alongside this one, with how often."""
+        contributor = self.get_object()
+        try:
+            limit = min(int(request.query_params.get("limit", 50)), 500)
+        except ValueError:
+            limit = 50
+        collaborators = contributor.get_co_contributors(limit=max(limit, 1))
+        return Response(
+            {
+                "uuid": contributor.uuid,
+                "name": contributor.name,
+                "collaborators": [
+                    {
+                        "uuid": other.uuid,
+                        "name": other.name,
+                        "shared_credits": other.collaboration_count,
+                    }
+                    for other in collaborators.non_polymorphic()
+                ],
+            }
+        )
+
 
 # ---------------------------------------------------------------------------
 # Viewset factory
@@ -261,7 +359,7 @@ def generate_viewset(config: Any, base_class: type = BaseViewSet) -> type:
     # Build queryset attribute (evaluated lazily via lambda to avoid import order issues)
     _model = model
 
-    class _GeneratedViewSet(base_class):
+    class _GeneratedViewSet(StreamingExportMixin, base_class):
         pass
 
     _GeneratedViewSet.__name__ = f"{model_name}ViewSet"
@@ -272,6 +370,11 @@ def generate_viewset(config: Any, base_class: type = BaseViewSet) -> type:
     if filterset_class is not None:
         _GeneratedViewSet.filterset_class = filterset_class
 
+    if getattr(config, "api_pagination", "page") == "cursor":
+        from fairdm.api.pagination import FairDMCursorPagination
+
+        _GeneratedViewSet.pagination_class = FairDMCursorPagination
+
     # Inject a consumer-facing description so drf-spectacular uses it as the
     # Swagger operation description instead of inheriting BaseViewSet internals.
     # Priority: config.description → config.metadata.description → model docstring → fallback
@@ -320,41 +423,30 @@ def _model_to_slug(model) -> str:
 # ---------------------------------------------------------------------------
 
 
-class _BaseDiscoveryView(APIView):
+class _BaseDiscoveryView(InstrumentedViewMixin, APIView):
     """Shared base for sample/measurement discovery catalog views."""
 
     permission_classes: list = []  # Public, no auth required
     registry_attr: str = ""  # "samples" or "measurements"
+    base_model: type | None = None  # Sample or Measurement
     url_prefix: str = ""  # "/api/v1/samples/" or "/api/v1/measurements/"
 
     def get(self, request: Request) -> Response:
+        from fairdm.core.statistics import count_for, get_type_counts
         from fairdm.registry import registry
 
+        # Public records only for anonymous users, all records otherwise; every
+        # type is counted by the one grouped query behind get_type_counts().
+        public_only = not (request.user and request.user.is_authenticated)
+        counts = get_type_counts(self.base_model, public_only=public_only)
+
         types = []
         for model in getattr(registry, self.registry_attr):
             config = registry.get_for_model(model)
             slug = _model_to_slug(model)
             endpoint = f"{request.scheme}://{request.get_host()}/api/v1/{self.url_prefix}/{slug}/"
 
-            # Count: public records only for anonymous, all accessible for authenticated
-            try:
-                if request.user and request.user.is_authenticated:
-                    count = model.objects.count()
-                else:
-                    from fairdm.utils.choices import Visibility
-
-                    # Samples/Measurements cascade visibility via dataset;
-                    # fall back to total count if the field is absent
-                    if hasattr(model, "visibility"):
-                        count = model.objects.filter(
-                            visibility=Visibility.PUBLIC
-                        ).count()
-                    else:
-                        count = model.objects.filter(
-                            dataset__visibility=Visibility.PUBLIC
-                        ).count()
-            except Exception:
-                count = 0
+            count = count_for(model, counts)
 
             # Gather field metadata
             fields = list(config.fields or [])
@@ -388,6 +480,7 @@ class SampleDiscoveryView(_BaseDiscoveryView):
     """
 
     registry_attr = "samples"
+    base_model = Sample
     url_prefix = "samples"
 
 
@@ -399,4 +492,77 @@ class MeasurementDiscoveryView(_BaseDiscoveryView):
     """
 
     registry_attr = "measurements"
+    base_model = Measurement
     url_prefix = "measurements"
+
+
+# ---------------------------------------------------------------------------
+# Map tiles
+# ---------------------------------------------------------------------------
+
+#: Seconds a tile may be served from a cache.
+DEFAULT_TILE_TIMEOUT = 300
+
+
+class SampleTileView(InstrumentedViewMixin, APIView):
+    """Clustered sample locations for one web map tile.
+
+    ``GET /api/v1/tiles/{z}/{x}/{y}.geojson`` returns a GeoJSON FeatureCollection
+    of the samples the user may see in the tile, grouped into clusters
+    server-side (see :mod:`fairdm.contrib.location.tiles`). ``?dataset=<uuid>``
+    draws a single dataset's samples.
+
+    Tiles are cacheable for ``FAIRDM_TILE_TIMEOUT`` seconds. Anonymous users all
+    see the same public tiles, which are cached by the server and marked public
+    for shared caches. Tiles drawn for a signed-in user are marked private.
+    """
+
+    permission_classes: list = []  # Visibility is applied to the samples drawn
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(
+                "dataset",
+                OpenApiTypes.STR,
+                description="Only the samples of the dataset with this UUID.",
+            )
+        ],
+        responses={200: OpenApiTypes.OBJECT},
+    )
+    def get(self, request: Request, z: int, x: int, y: int) -> Response:
+        from django.conf import settings
+        from django.core.cache import cache
+        from django.utils.cache import patch_cache_control, patch_vary_headers
+        from rest_framework.exceptions import NotFound, ValidationError
+
+        from fairdm.api.filters import FairDMVisibilityFilter
+        from fairdm.contrib.location.tiles import MAX_ZOOM, sample_tile
+
+        if z > MAX_ZOOM or x >= 2**z or y >= 2**z:
+            raise NotFound("No such tile.")
+
+        dataset = request.query_params.get("dataset", "")
+        # A short UUID is alphanumeric, which also keeps the cache key safe.
+        max_length = Dataset._meta.get_field("uuid").max_length
+        if dataset and not (dataset.isalnum() and len(dataset) <= max_length):
+            raise ValidationError({"dataset": "Expected a dataset UUID."})
+        anonymous = not (request.user and request.user.is_authenticated)
+        timeout = getattr(settings, "FAIRDM_TILE_TIMEOUT", DEFAULT_TILE_TIMEOUT)
+        key = f"fairdm:tiles:samples:{z}/{x}/{y}:{dataset}"
+
+        tile = cache.get(key) if anonymous else None
+        if tile is None:
+            samples = Sample.objects.all()
+            if dataset:
+                samples = samples.filter(dataset__uuid=dataset)
+            samples = FairDMVisibilityFilter().filter_queryset(request, samples, self)
+            tile = sample_tile(samples, z, x, y)
+            if anonymous:
+                cache.set(key, tile, timeout)
+
+        response = Response(tile)
+        patch_cache_control(
+            response, public=anonymous, private=not anonymous, max_age=timeout
+        )
+        patch_vary_headers(response, ["Authorization", "Cookie"])
+        return response
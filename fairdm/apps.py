@@ -65,6 +65,15 @@ class FairDMConfig(AppConfig):
 
         self._install_quantity_formatter()
 
+        from fairdm.core import permission_cache, search, statistics
+        from fairdm.core.dataset import access, extent
+
+        access.connect_signals()
+        extent.connect_signals()
+        permission_cache.connect_signals()
+        search.connect_signals()
+        statistics.connect_signals()
+
         self._check_production_configuration()
 
         return super().ready()
@@ -132,12 +132,17 @@ def check_cache_backend(app_configs, **kwargs):
     Check that production uses a shared cache backend (e.g. Redis or
     Memcached), not an absent, empty, or per-process backend such as locmem,
     dummy or filebased — and not the baseline's own unconfigured placeholder.
+    A cache wrapped by ``instrument_caches()`` is judged by the backend it wraps.
 
     Error ID: fairdm.E200
     """
+    from fairdm.core.instrumentation import INSTRUMENTED_CACHE
+
     errors = []
     caches = getattr(settings, "CACHES", {})
     default_cache = caches.get("default", {})
+    if default_cache.get("BACKEND") == INSTRUMENTED_CACHE:
+        default_cache = default_cache.get("OPTIONS", {}).get("WRAPPED", {})
     backend = default_cache.get("BACKEND", "")
     location = default_cache.get("LOCATION", "")
 
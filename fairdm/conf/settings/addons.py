@@ -281,6 +281,17 @@ IMPORT_EXPORT_FORMATS = [LaTex, *DEFAULT_FORMATS]
 
 IMPORT_FORMATS = [CSV, TSV, XLS, XLSX, ODS]
 
+# Rows imported per background task, each chunk in its own transaction
+FAIRDM_IMPORT_CHUNK_SIZE = 1000
+
+# Keep each dataset's download package on storage until the dataset changes
+FAIRDM_DATA_PACKAGE_CACHE = False
+
+# Prebuild each public dataset's downloads in the background when it changes,
+# at most one build per dataset every FAIRDM_DATASET_ARTEFACTS_DEBOUNCE seconds
+FAIRDM_DATASET_ARTEFACTS = False
+FAIRDM_DATASET_ARTEFACTS_DEBOUNCE = 60
+
 # =============================================================================
 # MARKDOWN EDITOR
 # https://martor.readthedocs.io
@@ -1,5 +1,6 @@
 import django_tables2 as tables
 from django.core.exceptions import FieldDoesNotExist
+from django.utils.functional import cached_property
 from django.utils.safestring import mark_safe
 from django.utils.translation import gettext_lazy as _
 from easy_icons import icon
@@ -16,6 +17,47 @@ def render_concept_many_to_many(value):
     return mark_safe(", ".join(f"<a href='{c.uri}'>{c.name}</a>" for c in value.all()))
 
 
+def _related_path(model, accessor):
+    """The relation a column's accessor follows, and whether it leads to many rows.
+
+    ``sample.location.x`` on a measurement gives ``("sample__location", False)``;
+    a many-to-many column such as a ``ConceptManyToManyField`` gives
+    ``("keywords", True)``. An accessor that reads no relation gives ``("", False)``.
+    """
+    path, many = [], False
+    for bit in str(accessor).replace(".", "__").split("__"):
+        try:
+            field = model._meta.get_field(bit)
+        except FieldDoesNotExist:
+            break
+        if not field.is_relation or field.related_model is None:
+            break
+        path.append(bit)
+        many = many or field.many_to_many or field.one_to_many
+        model = field.related_model
+    return "__".join(path), many
+
+
+def related_lookups(table_class, model, exclude=()):
+    """The ``select_related`` and ``prefetch_related`` paths a table's rows read.
+
+    Derived from the visible columns of ``table_class`` over ``model``, leaving out
+    the ``exclude``-d column names, so that rendering a page of the table costs
+    the same few queries whatever its length.
+
+    Returns:
+        tuple[list[str], list[str]]: The paths to select and to prefetch.
+    """
+    select, prefetch = set(), set()
+    for name, column in table_class.base_columns.items():
+        if name in exclude or not column.visible:
+            continue
+        path, many = _related_path(model, column.accessor or name)
+        if path:
+            (prefetch if many else select).add(path)
+    return sorted(select), sorted(prefetch)
+
+
 field_map = {
     "CharField": "char",
     "TextField": "char",
@@ -137,11 +179,20 @@ class MeasurementTable(BaseTable):
             "class": "table table-striped table-hover overflow-auto align-middle mb-0"
         }
 
-    def __init__(self, data=None, *args, **kwargs):
-        # modify the queryset (data) here if required
-        data = data.prefetch_related("sample")
-        super().__init__(*args, data=data, **kwargs)
+    @cached_property
+    def sample_types(self):
+        """Verbose names of the registered sample types, by content type id.
+
+        Read once per table, from the content type cache, rather than once per row.
+        """
+        from django.contrib.contenttypes.models import ContentType
+
+        from fairdm.registry import registry
+
+        content_types = ContentType.objects.get_for_models(*registry.samples)
+        return {ct.pk: model._meta.verbose_name for model, ct in content_types.items()}
 
     def render_sample(self, value):
-        sample_type = value.get_real_instance_class()
-        return sample_type._meta.verbose_name
+        if name := self.sample_types.get(value.polymorphic_ctype_id):
+            return name
+        return value.get_real_instance_class()._meta.verbose_name
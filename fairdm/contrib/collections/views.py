@@ -1,10 +1,11 @@
-import contextlib
-
 from django.urls import path, reverse
 from django.views.generic import RedirectView
 from django_filters.filterset import FilterSet
 
+from fairdm.contrib.collections.tables import related_lookups
 from fairdm.contrib.import_export.utils import export_choices
+from fairdm.core.models import Measurement, Sample
+from fairdm.core.statistics import count_for, get_type_counts
 from fairdm.registry import registry
 from fairdm.views import FairDMTableView, FairDMTemplateView
 
@@ -85,6 +86,26 @@ class DataTableView(FairDMTableView):
         """
         return self.model_config.get_table_class()
 
+    def get_table_data(self):
+        """
+        Return the filtered queryset, joined or prefetched for the table's columns.
+
+        The relations the visible columns read (the dataset, the location, a
+        measurement's sample, many-to-many concepts) are loaded with the page
+        instead of one cell at a time.
+        """
+        queryset = super().get_table_data()
+        select, prefetch = related_lookups(
+            self.get_table_class(),
+            self.model,
+            exclude=self.get_table_kwargs().get("exclude", ()),
+        )
+        if select:
+            queryset = queryset.select_related(*select)
+        if prefetch:
+            queryset = queryset.prefetch_related(*prefetch)
+        return queryset
+
     def get_table_kwargs(self):
         """
         Return the keyword arguments for instantiating the table.
@@ -201,22 +222,19 @@ class CollectionsOverview(FairDMTemplateView):
 
         context = super().get_context_data(**kwargs)
 
-        # Calculate overall statistics
-        total_samples = 0
-        total_measurements = 0
-
-        for sample_model in registry.samples:
-            with contextlib.suppress(Exception):
-                total_samples += sample_model.objects.count()
-
-        for measurement_model in registry.measurements:
-            with contextlib.suppress(Exception):
-                total_measurements += measurement_model.objects.count()
+        # One grouped query per base type covers every registered type
+        sample_counts = get_type_counts(Sample)
+        measurement_counts = get_type_counts(Measurement)
 
         context.update(
             {
-                "total_samples": total_samples,
-                "total_measurements": total_measurements,
+                "total_samples": sum(
+                    count_for(model, sample_counts) for model in registry.samples
+                ),
+                "total_measurements": sum(
+                    count_for(model, measurement_counts)
+                    for model in registry.measurements
+                ),
                 "total_sample_types": len(registry.samples),
                 "total_measurement_types": len(registry.measurements),
             }
@@ -235,7 +253,7 @@ class CollectionsOverview(FairDMTemplateView):
                 except NoReverseMatch:
                     url = None
 
-                count = sample_model.objects.count()
+                count = count_for(sample_model, sample_counts)
 
                 sample_types.append(
                     {
@@ -268,7 +286,7 @@ class CollectionsOverview(FairDMTemplateView):
                 except NoReverseMatch:
                     url = None
 
-                count = measurement_model.objects.count()
+                count = count_for(measurement_model, measurement_counts)
 
                 measurement_types.append(
                     {
@@ -323,6 +341,7 @@ class SamplesOverview(FairDMTemplateView):
         context = super().get_context_data(**kwargs)
 
         # Calculate sample statistics
+        sample_counts = get_type_counts(Sample)
         total_samples = 0
         sample_types = []
 
@@ -336,7 +355,7 @@ class SamplesOverview(FairDMTemplateView):
                 except NoReverseMatch:
                     url = None
 
-                count = sample_model.objects.count()
+                count = count_for(sample_model, sample_counts)
                 total_samples += count
 
                 sample_types.append(
@@ -397,6 +416,7 @@ class MeasurementsOverview(FairDMTemplateView):
         context = super().get_context_data(**kwargs)
 
         # Calculate measurement statistics
+        measurement_counts = get_type_counts(Measurement)
         total_measurements = 0
         measurement_types = []
 
@@ -410,7 +430,7 @@ class MeasurementsOverview(FairDMTemplateView):
                 except NoReverseMatch:
                     url = None
 
-                count = measurement_model.objects.count()
+                count = count_for(measurement_model, measurement_counts)
                 total_measurements += count
 
                 measurement_types.append(
@@ -263,21 +263,21 @@ class UserAdmin(BaseUserAdmin, HijackUserAdminMixin, ImportExportModelAdmin):
     _DISMISSED_KEY = "contributors_dismissed_candidates"
 
     def change_view(self, request, object_id, form_url="", extra_context=None):
-        """Inject fuzzy-match duplicate candidates into the change-form context."""
-        from fairdm.contrib.contributors.services.matching import (
-            find_duplicate_candidates,
-        )
+        """Inject fuzzy-match duplicate candidates into the change-form context.
+
+        The candidates are the pairs stored by the ``detect_duplicate_contributors``
+        task, so opening a person does not score them against everyone else.
+        """
+        from fairdm.contrib.contributors.services.matching import stored_candidates
 
         extra_context = extra_context or {}
         try:
-            person = Person.objects.get(pk=object_id)
-        except Person.DoesNotExist:
+            person = Person.objects.only("pk").get(pk=object_id)
+        except (Person.DoesNotExist, ValueError):
             return super().change_view(request, object_id, form_url, extra_context)
 
         dismissed: set = set(request.session.get(self._DISMISSED_KEY, []))
-        all_candidates = find_duplicate_candidates(person)
-        candidates = [c for c in all_candidates if c["person"].pk not in dismissed]
-        extra_context["fuzzy_candidates"] = candidates
+        extra_context["fuzzy_candidates"] = stored_candidates(person, exclude=dismissed)
         return super().change_view(request, object_id, form_url, extra_context)
 
     def dismiss_candidate_view(self, request, pk, candidate_pk):
@@ -458,17 +458,18 @@ class OrganizationAdmin(admin.ModelAdmin):
     @admin.action(description="Sync from ROR")
     def sync_from_ror(self, request, queryset):
         """Trigger ROR sync for selected organizations."""
-        from fairdm.contrib.contributors.tasks import sync_contributor_identifier
-
-        synced_count = 0
-        for org in queryset:
-            # Find ROR identifier for this organization
-            ror_identifier = org.identifiers.filter(type="ROR").first()
-
-            if ror_identifier:
-                # Trigger async sync task
-                sync_contributor_identifier.delay(ror_identifier.pk)
-                synced_count += 1
+        from fairdm.contrib.contributors.models import ContributorIdentifier
+        from fairdm.contrib.contributors.tasks import sync_contributor_batch
+
+        identifiers = ContributorIdentifier.objects.filter(
+            related__in=queryset, type="ROR"
+        ).values_list("pk", "related_id")
+        pks = [pk for pk, _ in identifiers]
+        synced_count = len({related_id for _, related_id in identifiers})
+
+        if pks:
+            # One batch task fetches every organization's record concurrently
+            sync_contributor_batch.delay(pks)
 
         if synced_count > 0:
             self.message_user(
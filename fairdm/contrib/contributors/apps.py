@@ -10,10 +10,21 @@ class ContributorsConfig(AppConfig):
 
     def ready(self):
         from allauth.account.signals import email_confirmed
-        from django.db.models.signals import post_delete
+        from django.db.models.signals import (
+            post_delete,
+            post_save,
+            pre_delete,
+            pre_migrate,
+        )
 
         from .models import Contribution
-        from .receivers import withdraw_rights_on_credit_deletion
+        from .receivers import (
+            count_new_credit,
+            create_trigram_extension,
+            note_credit_deletion,
+            withdraw_deleted_credit,
+            withdraw_rights_on_credit_deletion,
+        )
         from .signals import handle_email_confirmed
 
         email_confirmed.connect(handle_email_confirmed)
@@ -22,3 +33,23 @@ class ContributorsConfig(AppConfig):
             sender=Contribution,
             dispatch_uid="contributors.withdraw_rights_on_credit_deletion",
         )
+        post_save.connect(
+            count_new_credit,
+            sender=Contribution,
+            dispatch_uid="contributors.count_new_credit",
+        )
+        pre_delete.connect(
+            note_credit_deletion,
+            sender=Contribution,
+            dispatch_uid="contributors.note_credit_deletion",
+        )
+        post_delete.connect(
+            withdraw_deleted_credit,
+            sender=Contribution,
+            dispatch_uid="contributors.withdraw_deleted_credit",
+        )
+        pre_migrate.connect(
+            create_trigram_extension,
+            sender=self,
+            dispatch_uid="contributors.create_trigram_extension",
+        )
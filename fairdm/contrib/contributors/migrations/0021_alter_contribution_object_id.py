@@ -0,0 +1,34 @@
+# Generated by Django 5.2.12 on 2026-10-16 15:20
+
+from django.db import migrations, models
+
+
+def refuse_non_integer_object_ids(apps, schema_editor):
+    """Stop before the column is converted if any credit names a non-integer id."""
+    Contribution = apps.get_model("contributors", "Contribution")
+    invalid = Contribution.objects.filter(
+        models.Q(object_id="") | models.Q(object_id__regex=r"[^0-9]")
+    )
+    if invalid.exists():
+        sample = list(invalid.values_list("pk", "object_id")[:5])
+        raise RuntimeError(
+            "Contribution.object_id is becoming an integer, but some contributions "
+            f"name an object id that is not one, e.g. (pk, object_id) {sample}. "
+            "Correct or delete them and run the migration again."
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contributors', '0020_contributors_audit'),
+    ]
+
+    operations = [
+        migrations.RunPython(refuse_non_integer_object_ids, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='contribution',
+            name='object_id',
+            field=models.PositiveBigIntegerField(help_text='The id of the object this contribution is attributed to.', verbose_name='object id'),
+        ),
+    ]
@@ -0,0 +1,56 @@
+# Generated by Django 5.2.12 on 2026-10-16 16:02
+
+import auto_prefetch
+import django.db.models.deletion
+import django.db.models.manager
+import django_lifecycle.mixins
+from django.db import migrations, models
+
+
+def count_collaborations(apps, schema_editor):
+    """Build the collaboration graph from the contributions that already exist."""
+    Collaboration = apps.get_model("contributors", "Collaboration")
+    Contribution = apps.get_model("contributors", "Contribution")
+    quote = schema_editor.connection.ops.quote_name
+    edges = quote(Collaboration._meta.db_table)
+    credits = quote(Contribution._meta.db_table)
+    schema_editor.execute(
+        f"INSERT INTO {edges} (contributor_id, collaborator_id, weight) "
+        f"SELECT a.contributor_id, b.contributor_id, COUNT(*) "
+        f"FROM {credits} a JOIN {credits} b "
+        f"ON a.content_type_id = b.content_type_id "
+        f"AND a.object_id = b.object_id "
+        f"AND a.contributor_id <> b.contributor_id "
+        f"GROUP BY a.contributor_id, b.contributor_id"
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contributors', '0021_alter_contribution_object_id'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Collaboration',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('weight', models.PositiveIntegerField(default=0, help_text='The number of objects both contributors are credited on.', verbose_name='shared credits')),
+                ('collaborator', auto_prefetch.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='collaborated_with', to='contributors.contributor', verbose_name='collaborator')),
+                ('contributor', auto_prefetch.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='collaborations', to='contributors.contributor', verbose_name='contributor')),
+            ],
+            options={
+                'verbose_name': 'collaboration',
+                'verbose_name_plural': 'collaborations',
+                'indexes': [models.Index(fields=['contributor', '-weight'], name='collaboration_weight_idx')],
+                'constraints': [models.UniqueConstraint(fields=('contributor', 'collaborator'), name='unique_collaboration_pair')],
+            },
+            bases=(django_lifecycle.mixins.LifecycleModelMixin, models.Model),
+            managers=[
+                ('objects', django.db.models.manager.Manager()),
+                ('prefetch_manager', django.db.models.manager.Manager()),
+            ],
+        ),
+        migrations.RunPython(count_collaborations, migrations.RunPython.noop),
+    ]
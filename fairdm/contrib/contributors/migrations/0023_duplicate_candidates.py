@@ -0,0 +1,61 @@
+# Generated by Django 5.2.12 on 2026-10-16 18:40
+
+import auto_prefetch
+import django.contrib.postgres.indexes
+import django.contrib.postgres.operations
+import django.db.models.deletion
+import django.db.models.manager
+import django_lifecycle.mixins
+from django.db import migrations, models
+
+from fairdm.contrib.contributors.services.matching import name_key
+
+
+def key_names(apps, schema_editor):
+    """Set the name key of every existing person."""
+    Person = apps.get_model("contributors", "Person")
+    people = list(Person.objects.only("pk", "name"))
+    for person in people:
+        person.name_key = name_key(person.name)
+    Person.objects.bulk_update(people, ["name_key"], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contributors', '0022_collaboration'),
+    ]
+
+    operations = [
+        django.contrib.postgres.operations.TrigramExtension(),
+        migrations.AddField(
+            model_name='person',
+            name='name_key',
+            field=models.CharField(blank=True, default='', editable=False, help_text='The name normalised for duplicate matching: lowercase, without accents or punctuation, with its words sorted. Set on save.', max_length=255, verbose_name='name key'),
+        ),
+        migrations.RunPython(key_names, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='person',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass('name_key', name='gin_trgm_ops'), name='person_name_key_trgm'),
+        ),
+        migrations.CreateModel(
+            name='DuplicateCandidate',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('score', models.FloatField(help_text='How similar the two names are, from 0 to 1.', verbose_name='score')),
+                ('candidate', auto_prefetch.ForeignKey(help_text='The person whose name is close to theirs.', on_delete=django.db.models.deletion.CASCADE, related_name='+', to='contributors.person', verbose_name='candidate')),
+                ('person', auto_prefetch.ForeignKey(help_text='The person who may be a duplicate.', on_delete=django.db.models.deletion.CASCADE, related_name='duplicate_candidates', to='contributors.person', verbose_name='person')),
+            ],
+            options={
+                'verbose_name': 'duplicate candidate',
+                'verbose_name_plural': 'duplicate candidates',
+                'indexes': [models.Index(fields=['person', '-score'], name='duplicate_candidate_idx')],
+                'constraints': [models.UniqueConstraint(fields=('person', 'candidate'), name='unique_duplicate_candidate')],
+            },
+            bases=(django_lifecycle.mixins.LifecycleModelMixin, models.Model),
+            managers=[
+                ('objects', django.db.models.manager.Manager()),
+                ('prefetch_manager', django.db.models.manager.Manager()),
+            ],
+        ),
+    ]
@@ -7,6 +7,7 @@ from django.conf import settings
 from django.contrib.auth.models import AbstractUser
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db.models import Count
 from django.db.models.functions import Lower
 from django.templatetags.static import static
@@ -16,7 +17,13 @@ from django.utils.encoding import force_str
 from django.utils.functional import classproperty
 from django.utils.translation import gettext_lazy as _
 from django_countries.fields import CountryField
-from django_lifecycle import AFTER_CREATE, AFTER_DELETE, BEFORE_CREATE, hook
+from django_lifecycle import (
+    AFTER_CREATE,
+    AFTER_DELETE,
+    AFTER_UPDATE,
+    BEFORE_CREATE,
+    hook,
+)
 from django_lifecycle.mixins import LifecycleModelMixin
 from easy_icons import icon
 from easy_thumbnails.fields import ThumbnailerImageField
@@ -280,7 +287,8 @@ class Contributor(PolymorphicMixin, PolymorphicModel):
         recorded against a concrete specimen or measurement type - ``Sample`` and
         ``Measurement`` can never be instantiated directly, so every real credit is
         stored under a subclass's own content type, which a ``GenericRelation`` reverse
-        query from the polymorphic base alone cannot match (FR-034).
+        query from the polymorphic base alone cannot match (FR-034). ``object_id`` is an
+        integer, so the result is usable as a ``pk__in`` subquery as it stands.
         """
         content_type_ids = self.contributions.values_list(
             "content_type_id", flat=True
@@ -429,7 +437,8 @@ class Contributor(PolymorphicMixin, PolymorphicModel):
         """
         Get other contributors who have contributed to the same objects as this contributor.
 
-        Returns contributors ordered by frequency of co-contribution (most frequent first).
+        Returns contributors ordered by frequency of co-contribution (most frequent
+        first), read from the precomputed collaboration graph (:class:`Collaboration`).
 
         Args:
             limit: Maximum number of co-contributors to return (default: all)
@@ -441,35 +450,20 @@ class Contributor(PolymorphicMixin, PolymorphicModel):
             >>> person.get_co_contributors(limit=5)
             <QuerySet [<Person: Jane Smith>, <Person: Bob Wilson>, ...]>
         """
-        # The (content_type, object_id) pairs this contributor is actually credited on.
-        my_contributions = list(
-            self.contributions.values_list("content_type_id", "object_id")
-        )
-        if not my_contributions:
-            return Contributor.objects.none()
-
-        from django.db.models import Count, Q
-
-        # Matches a contribution sharing one of *my* exact (content_type, object_id)
-        # pairs - not merely any of my content types together with any of my object
-        # ids, which two separate filter() calls would allow to pair up across
-        # different objects entirely.
-        shared_credit = Q()
-        for content_type_id, object_id in my_contributions:
-            shared_credit |= Q(
-                contributions__content_type_id=content_type_id,
-                contributions__object_id=object_id,
-            )
+        from django.db.models import F, FilteredRelation, Q
 
+        # One indexed read of this contributor's precomputed edges (Collaboration),
+        # rather than a filtered count over every contribution in the portal.
         co_contributors = (
-            Contributor.objects.exclude(pk=self.pk)
-            .annotate(
-                collaboration_count=Count(
-                    "contributions", filter=shared_credit, distinct=True
+            Contributor.objects.annotate(
+                edge=FilteredRelation(
+                    "collaborated_with",
+                    condition=Q(collaborated_with__contributor=self),
                 )
             )
-            .filter(collaboration_count__gt=0)
-            .order_by("-collaboration_count")
+            .filter(edge__isnull=False)
+            .annotate(collaboration_count=F("edge__weight"))
+            .order_by("-collaboration_count", "pk")
         )
 
         if limit:
@@ -532,12 +526,30 @@ class Person(AbstractUser, Contributor):
         ),
     )
 
+    name_key = models.CharField(
+        _("name key"),
+        max_length=255,
+        blank=True,
+        default="",
+        editable=False,
+        help_text=_(
+            "The name normalised for duplicate matching: lowercase, without accents "
+            "or punctuation, with its words sorted. Set on save."
+        ),
+    )
+
     USERNAME_FIELD = "email"
     REQUIRED_FIELDS = []
 
     username = None
 
     class Meta(AbstractUser.Meta):
+        indexes = [
+            # Picks the candidates a name is scored against with pg_trgm's ``%``
+            GinIndex(
+                OpClass("name_key", name="gin_trgm_ops"), name="person_name_key_trgm"
+            ),
+        ]
         constraints = [
             models.UniqueConstraint(
                 Lower("email"),
@@ -553,9 +565,15 @@ class Person(AbstractUser, Contributor):
         return self.name
 
     def save(self, *args, **kwargs):
-        """Save Person, auto-populating name from first/last if blank."""
+        """Save Person, auto-populating name from first/last if blank and keying it."""
+        from .services.matching import name_key
+
         if not self.name:
             self.name = f"{self.first_name} {self.last_name}".strip()
+        self.name_key = name_key(self.name)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "name" in update_fields:
+            kwargs["update_fields"] = {*update_fields, "name_key"}
         super().save(*args, **kwargs)
 
     @property
@@ -1202,10 +1220,11 @@ class Contribution(LifecycleModelMixin, OrderedModel):
         help_text=_("The type of object this contribution is attributed to."),
         on_delete=models.CASCADE,
     )
-    object_id = models.CharField(
+    # An integer like every credited model's primary key, so the generic relations
+    # join ``object_id = id`` on the (content_type, object_id) index without a cast.
+    object_id = models.PositiveBigIntegerField(
         verbose_name=_("object id"),
         help_text=_("The id of the object this contribution is attributed to."),
-        max_length=23,
     )
     content_object = GenericForeignKey("content_type", "object_id")
     contributor = models.ForeignKey(
@@ -1362,6 +1381,27 @@ class Contribution(LifecycleModelMixin, OrderedModel):
         if self.is_person():
             remove_all_model_perms(self.contributor, self.content_object)
 
+    @hook(AFTER_UPDATE, when="contributor", has_changed=True)
+    def move_collaborations(self):
+        """Move this credit's collaborations to its new contributor.
+
+        A credit reassigned by saving it is neither created nor deleted, so the
+        collaboration graph follows here rather than through the create and delete
+        receivers. A person merge reassigns credits in bulk and moves the graph
+        itself (``services.collaboration.move_collaborations``).
+        """
+        from .services.collaboration import (
+            add_credit,
+            collaborators_on,
+            remove_credit,
+        )
+
+        others = collaborators_on(
+            self.content_type_id, self.object_id, self.contributor_id
+        )
+        remove_credit(self.initial_value("contributor"), others)
+        add_credit(self.contributor_id, others)
+
     def is_person(self):
         """Check if the contributor is a person."""
         return isinstance(self.contributor, Person)
@@ -1379,6 +1419,102 @@ class Contribution(LifecycleModelMixin, OrderedModel):
         )
 
 
+class Collaboration(models.Model):
+    """How many objects two contributors are both credited on.
+
+    A precomputed edge of the collaboration graph, stored once in each direction so
+    ``Contributor.get_co_contributors()`` reads one contributor's edges from the
+    ``(contributor, -weight)`` index. Maintained by
+    :mod:`fairdm.contrib.contributors.services.collaboration` as contributions are
+    created, reassigned and deleted.
+    """
+
+    contributor = models.ForeignKey(
+        "contributors.Contributor",
+        on_delete=models.CASCADE,
+        related_name="collaborations",
+        verbose_name=_("contributor"),
+    )
+    collaborator = models.ForeignKey(
+        "contributors.Contributor",
+        on_delete=models.CASCADE,
+        related_name="collaborated_with",
+        verbose_name=_("collaborator"),
+    )
+    weight = models.PositiveIntegerField(
+        default=0,
+        verbose_name=_("shared credits"),
+        help_text=_("The number of objects both contributors are credited on."),
+    )
+    added = None
+    modified = None
+
+    class Meta:
+        verbose_name = _("collaboration")
+        verbose_name_plural = _("collaborations")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["contributor", "collaborator"],
+                name="unique_collaboration_pair",
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=["contributor", "-weight"], name="collaboration_weight_idx"
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.contributor_id} ↔ {self.collaborator_id} ({self.weight})"
+
+
+class DuplicateCandidate(models.Model):
+    """A person whose name is close enough to another's to be a possible duplicate.
+
+    Written in batches by
+    :func:`fairdm.contrib.contributors.services.matching.detect_duplicates` and read
+    by the person admin, so opening a person does not rescan every other person.
+    Stored once in each direction, like :class:`Collaboration`, so one person's
+    candidates are a single read of the ``(person, -score)`` index.
+    """
+
+    person = models.ForeignKey(
+        "contributors.Person",
+        on_delete=models.CASCADE,
+        related_name="duplicate_candidates",
+        verbose_name=_("person"),
+        help_text=_("The person who may be a duplicate."),
+    )
+    candidate = models.ForeignKey(
+        "contributors.Person",
+        on_delete=models.CASCADE,
+        related_name="+",
+        verbose_name=_("candidate"),
+        help_text=_("The person whose name is close to theirs."),
+    )
+    score = models.FloatField(
+        verbose_name=_("score"),
+        help_text=_("How similar the two names are, from 0 to 1."),
+    )
+    added = None
+    modified = None
+
+    class Meta:
+        verbose_name = _("duplicate candidate")
+        verbose_name_plural = _("duplicate candidates")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["person", "candidate"], name="unique_duplicate_candidate"
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["person", "-score"], name="duplicate_candidate_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.person_id} ≈ {self.candidate_id} ({self.score:.2f})"
+
+
 class ContributorIdentifier(AbstractIdentifier, LifecycleModelMixin):
     """External identifiers for a Contributor (``Person`` or ``Organization``).
 
@@ -12,10 +12,28 @@ collects regardless of whether the delete started from an instance or a queryset
 connecting a receiver here also disables the collector's "fast delete" fast path (which
 skips sending signals when nothing listens for them), so the signal is guaranteed to
 fire for both.
+
+The collaboration receivers keep ``Collaboration`` in step the same way, for the same
+reason. Deleting a credited object deletes all of its credits in one batch, and every
+``post_delete`` in the batch runs after the last row is gone, so each credit's
+collaborators are recorded in ``pre_delete``; a pair is then withdrawn once, by
+whichever of its two credits is processed first. A deletion that fails part way
+leaves its records behind; the next deletion, which has another ``origin``, discards
+them.
 """
 
+import threading
+
+from django.db import DEFAULT_DB_ALIAS, connections
+
 from fairdm.utils.permissions import remove_all_model_perms
 
+from .services.collaboration import add_credit, collaborators_on, remove_credit
+
+#: (content type id, object id) → (origin, {contribution pk: contributor id}) for
+#: the credits whose deletion has started but not yet been counted.
+_deleting = threading.local()
+
 
 def withdraw_rights_on_credit_deletion(sender, instance, **kwargs):
     """Withdraw a person contributor's object-level rights over an object when their
@@ -24,3 +42,61 @@ def withdraw_rights_on_credit_deletion(sender, instance, **kwargs):
 
     if isinstance(instance.contributor, Person):
         remove_all_model_perms(instance.contributor, instance.content_object)
+
+
+def _key(instance) -> tuple[int, int]:
+    return instance.content_type_id, int(instance.object_id)
+
+
+def _pending(instance, origin) -> dict:
+    """The credits of ``instance``'s object being deleted along with it.
+
+    Records left by another deletion are dropped: that deletion raised or was rolled
+    back before it counted them, and its credits may still exist.
+    """
+    recorded = getattr(_deleting, "credits", {})
+    _deleting.credits = {
+        key: entry for key, entry in recorded.items() if entry[0] is origin
+    }
+    entry = _deleting.credits.setdefault(_key(instance), (origin, {}))
+    return entry[1]
+
+
+def count_new_credit(sender, instance, created=False, raw=False, **kwargs):
+    """Add a new credit to the collaboration graph."""
+    if created and not raw:
+        others = collaborators_on(
+            instance.content_type_id, instance.object_id, instance.contributor_id
+        )
+        add_credit(instance.contributor_id, others)
+
+
+def note_credit_deletion(sender, instance, origin=None, **kwargs):
+    """Record a credit about to be deleted, while its collaborators are still there."""
+    if instance.contributor_id is not None:
+        _pending(instance, origin)[instance.pk] = instance.contributor_id
+
+
+def withdraw_deleted_credit(sender, instance, origin=None, **kwargs):
+    """Take a deleted credit out of the collaboration graph."""
+    pending = _pending(instance, origin)
+    try:
+        pending.pop(instance.pk, None)
+        others = collaborators_on(instance.content_type_id, instance.object_id)
+        remove_credit(instance.contributor_id, others | set(pending.values()))
+    finally:
+        if not pending:
+            _deleting.credits.pop(_key(instance), None)
+
+
+def create_trigram_extension(sender, using=DEFAULT_DB_ALIAS, **kwargs):
+    """Enable pg_trgm before any table is created.
+
+    Migration ``0023`` enables it as well. This covers a database built without
+    migrations, as the test suite's is, whose ``person_name_key_trgm`` index needs
+    the extension's ``gin_trgm_ops`` operator class.
+    """
+    connection = connections[using]
+    if connection.vendor == "postgresql":
+        with connection.cursor() as cursor:
+            cursor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
@@ -0,0 +1,139 @@
+"""Collaboration graph maintenance (FR-035).
+
+Keeps :class:`~fairdm.contrib.contributors.models.Collaboration` in step with
+``Contribution``: crediting a contributor on an object adds one to their edge with
+every contributor already credited on it, and withdrawing the credit takes it away
+again. Edges are stored in both directions, so each change touches only the edges
+of the contributors credited on that one object. The receivers in
+``fairdm.contrib.contributors.receivers`` call these functions.
+
+Contributions written without signals (``bulk_create``, ``QuerySet.update()`` of the
+contributor) leave the graph stale until :func:`rebuild_collaborations` runs, which
+``manage.py rebuild_collaborations`` does. A person merge moves every credit of one
+contributor at once and keeps the graph current with :func:`move_collaborations`.
+"""
+
+from __future__ import annotations
+
+from django.db import connection, transaction
+from django.db.models import F
+
+
+def collaborators_on(content_type_id, object_id, contributor_id=None) -> set[int]:
+    """The contributors credited on an object, leaving out ``contributor_id``."""
+    from fairdm.contrib.contributors.models import Contribution
+
+    credited = Contribution.objects.filter(
+        content_type_id=content_type_id,
+        object_id=object_id,
+        contributor__isnull=False,
+    ).values_list("contributor_id", flat=True)
+    return set(credited) - {contributor_id}
+
+
+def _pairs(contributor_id, others):
+    for other in others:
+        yield contributor_id, other
+        yield other, contributor_id
+
+
+def _shift(contributor_id, others, step: int) -> None:
+    from fairdm.contrib.contributors.models import Collaboration
+
+    Collaboration.objects.filter(
+        contributor_id=contributor_id, collaborator_id__in=others
+    ).update(weight=F("weight") + step)
+    Collaboration.objects.filter(
+        contributor_id__in=others, collaborator_id=contributor_id
+    ).update(weight=F("weight") + step)
+
+
+def add_credit(contributor_id, others) -> None:
+    """Count one more object shared by ``contributor_id`` and each of ``others``."""
+    from fairdm.contrib.contributors.models import Collaboration
+
+    others = set(others) - {contributor_id, None}
+    if contributor_id is None or not others:
+        return
+    with transaction.atomic():
+        Collaboration.objects.bulk_create(
+            [
+                Collaboration(contributor_id=a, collaborator_id=b)
+                for a, b in _pairs(contributor_id, others)
+            ],
+            ignore_conflicts=True,
+        )
+        _shift(contributor_id, others, 1)
+
+
+def remove_credit(contributor_id, others) -> None:
+    """Count one fewer object shared by ``contributor_id`` and each of ``others``.
+
+    Edges left with no shared object are deleted.
+    """
+    from fairdm.contrib.contributors.models import Collaboration
+
+    others = set(others) - {contributor_id, None}
+    if contributor_id is None or not others:
+        return
+    with transaction.atomic():
+        _shift(contributor_id, others, -1)
+        Collaboration.objects.filter(
+            contributor_id__in=[contributor_id, *others], weight__lte=0
+        ).delete()
+
+
+def move_collaborations(from_id, to_id) -> None:
+    """Hand every edge of ``from_id`` to ``to_id``, adding up edges both have.
+
+    For a merge that reassigns all of ``from_id``'s credits to ``to_id`` with
+    ``QuerySet.update()``. The two must share no credited object by then, or the
+    objects they share would be counted twice.
+    """
+    from fairdm.contrib.contributors.models import Collaboration
+
+    edges = connection.ops.quote_name(Collaboration._meta.db_table)
+    with transaction.atomic(), connection.cursor() as cursor:
+        for moved, other in (
+            ("contributor_id", "collaborator_id"),
+            ("collaborator_id", "contributor_id"),
+        ):
+            # Only the quoted table name and the fixed column names above are
+            # interpolated.
+            cursor.execute(
+                f"INSERT INTO {edges} ({moved}, {other}, weight) "  # noqa: S608
+                f"SELECT %s, {other}, weight FROM {edges} "
+                f"WHERE {moved} = %s AND {other} <> %s "
+                f"ON CONFLICT (contributor_id, collaborator_id) "
+                f"DO UPDATE SET weight = {edges}.weight + EXCLUDED.weight",
+                [to_id, from_id, to_id],
+            )
+        Collaboration.objects.filter(contributor_id=from_id).delete()
+        Collaboration.objects.filter(collaborator_id=from_id).delete()
+
+
+def rebuild_collaborations() -> int:
+    """Recount every edge from the contributions table, in one statement.
+
+    Returns:
+        int: The number of edges written, counting each direction.
+    """
+    from fairdm.contrib.contributors.models import Collaboration, Contribution
+
+    quote = connection.ops.quote_name
+    edges = quote(Collaboration._meta.db_table)
+    contributions = quote(Contribution._meta.db_table)
+    with transaction.atomic():
+        Collaboration.objects.all().delete()
+        with connection.cursor() as cursor:
+            # Only the backend-quoted table names are interpolated.
+            cursor.execute(
+                f"INSERT INTO {edges} (contributor_id, collaborator_id, weight) "  # noqa: S608
+                f"SELECT a.contributor_id, b.contributor_id, COUNT(*) "
+                f"FROM {contributions} a JOIN {contributions} b "
+                f"ON a.content_type_id = b.content_type_id "
+                f"AND a.object_id = b.object_id "
+                f"AND a.contributor_id <> b.contributor_id "
+                f"GROUP BY a.contributor_id, b.contributor_id"
+            )
+    return Collaboration.objects.count()
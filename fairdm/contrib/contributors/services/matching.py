@@ -3,19 +3,67 @@ Fuzzy name matching service for identifying potential duplicate Person records.
 
 Uses rapidfuzz token_sort_ratio so that name-token reordering (e.g. "Smith, John"
 vs "John Smith") does not lower the similarity score.
+
+Names are only scored within a block. Every person stores a ``name_key``, their
+name lowercased, without accents or punctuation and with its words sorted (see
+:func:`name_key`), so reordered and punctuated names share a key. A person's block
+is everyone whose key is trigram-similar to theirs, found through the
+``person_name_key_trgm`` GIN index with pg_trgm's ``%`` operator (a similarity of
+at least ``pg_trgm.similarity_threshold``, 0.3 by default). A block holds a
+handful of people, not the whole table.
+
+:func:`detect_duplicates` scores every block in one pass and stores the pairs as
+:class:`~fairdm.contrib.contributors.models.DuplicateCandidate` rows, which the
+person admin reads through :func:`stored_candidates`.
 """
 
 from __future__ import annotations
 
+import re
+import unicodedata
 from typing import TYPE_CHECKING
 
+from django.contrib.postgres.lookups import TrigramSimilar
+from django.contrib.postgres.search import TrigramSimilarity
+from django.db import connection, transaction
+from django.db.models import F
 from rapidfuzz.fuzz import token_sort_ratio
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from fairdm.contrib.contributors.models import Person
 
+#: Default minimum score for a pair to be a candidate.
+DEFAULT_THRESHOLD = 0.85
+
+#: The most people one person's block holds, most trigram-similar first.
+BLOCK_SIZE = 50
+
+#: People whose blocks one query of :func:`detect_duplicates` finds.
+BATCH_SIZE = 1000
+
+_NON_WORD = re.compile(r"[\W_]+")
+
+
+def name_key(name: str | None) -> str:
+    """The blocking key of a name: lowercase, unaccented words in sorted order.
 
-def find_duplicate_candidates(person: Person, threshold: float = 0.85) -> list[dict]:
+    ``"Smith, Jöhn"`` and ``"John Smith"`` both key to ``"john smith"``.
+    """
+    decomposed = unicodedata.normalize("NFKD", name or "")
+    plain = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return " ".join(sorted(_NON_WORD.sub(" ", plain.lower()).split()))
+
+
+def _score(name: str, other: str) -> float:
+    # token_sort_ratio returns 0-100; normalise to 0-1
+    return token_sort_ratio(name, other) / 100.0
+
+
+def find_duplicate_candidates(
+    person: Person, threshold: float = DEFAULT_THRESHOLD
+) -> list[dict]:
     """Return a list of potential duplicate Person records for *person*.
 
     Each entry in the returned list is a dict with keys:
@@ -25,6 +73,9 @@ def find_duplicate_candidates(person: Person, threshold: float = 0.85) -> list[d
     Only entries with ``score >= threshold`` are included.  The list is sorted
     by score descending. *person* itself is always excluded.
 
+    Only the people in *person*'s block are scored. A threshold of 0 asks for
+    everyone, so it scores every other person instead.
+
     Args:
         person: The Person to find duplicates for.
         threshold: Minimum similarity score (0-1). Defaults to 0.85.
@@ -38,16 +89,99 @@ def find_duplicate_candidates(person: Person, threshold: float = 0.85) -> list[d
     if not query_name:
         return []
 
+    people = PersonModel.objects.exclude(pk=person.pk).only("pk", "name")
+    if threshold > 0:
+        key = name_key(query_name)
+        people = (
+            people.filter(TrigramSimilar(F("name_key"), key))
+            .annotate(similarity=TrigramSimilarity("name_key", key))
+            .order_by("-similarity")[:BLOCK_SIZE]
+        )
+
     candidates: list[dict] = []
-    for candidate in PersonModel.objects.exclude(pk=person.pk).only("pk", "name"):
+    for candidate in people:
         candidate_name = (candidate.name or "").strip()
         if not candidate_name:
             continue
-        # token_sort_ratio returns 0-100; normalise to 0-1
-        raw_score = token_sort_ratio(query_name, candidate_name)
-        score = raw_score / 100.0
+        score = _score(query_name, candidate_name)
         if score >= threshold:
             candidates.append({"person": candidate, "score": score})
 
     candidates.sort(key=lambda c: c["score"], reverse=True)
     return candidates
+
+
+def _blocks(pks: list[int]) -> list[tuple[int, int]]:
+    """The ``(person, other)`` pairs in the blocks of *pks*, each pair once.
+
+    One self-join per batch; the ``%`` condition is answered from the trigram
+    index for each person in the batch.
+    """
+    from fairdm.contrib.contributors.models import Person
+
+    quote = connection.ops.quote_name
+    table = quote(Person._meta.db_table)
+    pk = quote(Person._meta.pk.column)
+    with connection.cursor() as cursor:
+        # Only the backend-quoted table and column names are interpolated.
+        cursor.execute(
+            f"SELECT a.{pk}, b.{pk} FROM {table} a JOIN {table} b "  # noqa: S608
+            f"ON b.name_key %% a.name_key AND b.{pk} > a.{pk} "
+            f"WHERE a.{pk} = ANY(%s) AND a.name_key <> ''",
+            [pks],
+        )
+        return cursor.fetchall()
+
+
+def detect_duplicates(
+    threshold: float = DEFAULT_THRESHOLD,
+) -> dict[tuple[int, int], float]:
+    """Score every block and replace the stored duplicate candidates.
+
+    Args:
+        threshold: Minimum similarity score (0-1) for a pair to be stored.
+
+    Returns:
+        The score of each candidate pair, keyed by the pair's primary keys with the
+        lower first.
+    """
+    from fairdm.contrib.contributors.models import (
+        Contributor,
+        DuplicateCandidate,
+        Person,
+    )
+
+    pks = list(Person.objects.order_by("pk").values_list("pk", flat=True))
+    pairs: dict[tuple[int, int], float] = {}
+    for start in range(0, len(pks), BATCH_SIZE):
+        block_pairs = _blocks(pks[start : start + BATCH_SIZE])
+        names = dict(
+            Contributor.objects.filter(
+                pk__in={pk for pair in block_pairs for pk in pair}
+            ).values_list("pk", "name")
+        )
+        # A blank name keys to "", which is in no block
+        for a, b in block_pairs:
+            score = _score(names[a].strip(), names[b].strip())
+            if score >= threshold:
+                pairs[a, b] = score
+
+    rows = []
+    for (a, b), score in pairs.items():
+        rows.append(DuplicateCandidate(person_id=a, candidate_id=b, score=score))
+        rows.append(DuplicateCandidate(person_id=b, candidate_id=a, score=score))
+    with transaction.atomic():
+        DuplicateCandidate.objects.all().delete()
+        DuplicateCandidate.objects.bulk_create(rows, batch_size=1000)
+    return pairs
+
+
+def stored_candidates(person: Person, exclude: Iterable[int] = ()) -> list[dict]:
+    """The stored duplicate candidates of *person*, in the shape of
+    :func:`find_duplicate_candidates`, leaving out the people in *exclude*."""
+    return [
+        {"person": pair.candidate, "score": pair.score}
+        for pair in person.duplicate_candidates.exclude(candidate__in=list(exclude))
+        .select_related("candidate")
+        .order_by("-score")
+    ]
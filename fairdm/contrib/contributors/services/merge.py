@@ -1,7 +1,13 @@
 """Person merge service (US4).
 
 Provides merge_persons() which transfers all data from person_discard
-to person_keep inside a single atomic transaction, then deletes person_discard.
+to person_keep inside a single atomic transaction, then deletes person_discard,
+and merge_many() which merges a list of pairs, one transaction per pair.
+
+Related rows are moved with one ``UPDATE ... WHERE`` per table rather than one save
+per row. Rows that would break a unique constraint once moved - a credit on an
+object person_keep is already credited on, a second identifier of the same type,
+a permission person_keep already holds - are deleted first, in one statement each.
 
 All private helper functions are prefixed with _ and are not part of the public API.
 """
@@ -11,11 +17,15 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING
 
+from django.apps import apps
 from django.db import transaction
+from django.db.models import Exists, OuterRef
 
 from fairdm.contrib.contributors.exceptions import ClaimingError
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from fairdm.contrib.contributors.models import Person
 
 logger = logging.getLogger(__name__)
@@ -82,125 +92,185 @@ def merge_persons(person_keep: Person, person_discard: Person) -> Person:
     return person_keep
 
 
+def merge_many(pairs: Iterable[tuple[int, int]]) -> dict:
+    """Merge each ``(keep_pk, discard_pk)`` pair, in one transaction per pair.
+
+    A failed pair is rolled back alone and logged; the pairs after it still run.
+    A person merged away by an earlier pair is followed to the person it was merged
+    into, so chains such as ``(a, b), (b, c)`` merge both into ``a``.
+
+    Args:
+        pairs: Primary keys of the Person to keep and the Person to discard.
+
+    Returns:
+        dict: {"merged": N, "failed": [(keep_pk, discard_pk), ...]}
+    """
+    from fairdm.contrib.contributors.models import Person
+
+    survivors: dict[int, int] = {}
+
+    def survivor(pk):
+        while pk in survivors:
+            pk = survivors[pk]
+        return pk
+
+    merged, failed = 0, []
+    for keep_pk, discard_pk in pairs:
+        keep_pk, discard_pk = survivor(keep_pk), survivor(discard_pk)
+        if keep_pk == discard_pk:
+            continue
+        people = Person.objects.in_bulk([keep_pk, discard_pk])
+        try:
+            merge_persons(people[keep_pk], people[discard_pk])
+        except Exception:
+            logger.exception("Could not merge person %s into %s", discard_pk, keep_pk)
+            failed.append((keep_pk, discard_pk))
+            continue
+        survivors[discard_pk] = keep_pk
+        merged += 1
+
+    return {"merged": merged, "failed": failed}
+
+
 # ─── Private helpers ─────────────────────────────────────────────────────────
 
 
+def _move(queryset, held, **changes) -> None:
+    """Delete the rows of *queryset* matched by the *held* subquery, then move the
+    rest with one update."""
+    queryset.filter(Exists(held)).delete()
+    queryset.update(**changes)
+
+
 def _reassign_contributions(keep: Person, discard: Person) -> None:
-    """Move Contributions from discard to keep, skipping existing duplicates."""
+    """Move Contributions from discard to keep, skipping existing duplicates.
+
+    The update bypasses the ``move_collaborations`` hook, so the collaboration
+    graph is moved in bulk too. The duplicates are deleted first, which withdraws
+    their edges through the deletion receivers, so keep and discard share no object
+    by the time the edges are added together.
+    """
     from fairdm.contrib.contributors.models import Contribution
 
-    for contrib in Contribution.objects.filter(contributor=discard):
-        already_exists = Contribution.objects.filter(
-            contributor=keep,
-            content_type=contrib.content_type,
-            object_id=contrib.object_id,
-        ).exists()
-        if not already_exists:
-            contrib.contributor = keep
-            contrib.save(update_fields=["contributor"])
-        else:
-            # Discard duplicate — keep the existing contribution
-            contrib.delete()
+    from .collaboration import move_collaborations
+
+    discarded = Contribution.objects.filter(contributor=discard)
+    discarded.filter(
+        Exists(
+            Contribution.objects.filter(
+                contributor=keep,
+                content_type=OuterRef("content_type"),
+                object_id=OuterRef("object_id"),
+            )
+        )
+    ).delete()
+    move_collaborations(discard.pk, keep.pk)
+    discarded.update(contributor=keep)
 
 
 def _reassign_identifiers(keep: Person, discard: Person) -> None:
-    """Move ContributorIdentifiers from discard to keep, avoiding constraint violations."""
+    """Move ContributorIdentifiers from discard to keep, avoiding constraint violations.
+
+    Values are globally unique, so only a second identifier of a type keep already
+    has can conflict; those are dropped. ``update()`` also bypasses the
+    AFTER_CREATE lifecycle hook (sync task dispatch).
+    """
     from fairdm.contrib.contributors.models import ContributorIdentifier
 
-    for identifier in ContributorIdentifier.objects.filter(related=discard):
-        # Check for exact value match (value is globally unique — can't have 2 with same value)
-        # Also check for same (related, type) combo on keep
-        value_exists = (
-            ContributorIdentifier.objects.filter(value=identifier.value)
-            .exclude(pk=identifier.pk)
-            .exists()
-        )
-        type_exists_on_keep = ContributorIdentifier.objects.filter(
-            related=keep, type=identifier.type
-        ).exists()
-
-        if value_exists or type_exists_on_keep:
-            # Skip — would violate uniqueness constraints
-            identifier.delete()
-        else:
-            # Use update() to bypass AFTER_CREATE lifecycle hook (sync task dispatch)
-            ContributorIdentifier.objects.filter(pk=identifier.pk).update(
-                related_id=keep.pk
-            )
+    _move(
+        ContributorIdentifier.objects.filter(related=discard),
+        ContributorIdentifier.objects.filter(related=keep, type=OuterRef("type")),
+        related_id=keep.pk,
+    )
 
 
 def _reassign_affiliations(keep: Person, discard: Person) -> None:
-    """Move Affiliations from discard to keep, skipping exact duplicates."""
+    """Move Affiliations from discard to keep, skipping exact duplicates.
+
+    If keep already has a primary affiliation it stays primary, and the moved ones
+    are not.
+    """
     from fairdm.contrib.contributors.models import Affiliation
 
-    for affil in Affiliation.objects.filter(person=discard):
-        already_exists = Affiliation.objects.filter(
-            person=keep,
-            organization=affil.organization,
-        ).exists()
-        if not already_exists:
-            affil.person = keep
-            affil.save(update_fields=["person"])
-        else:
-            affil.delete()
+    changes = {"person": keep}
+    if Affiliation.objects.filter(person=keep, is_primary=True).exists():
+        changes["is_primary"] = False
+    _move(
+        Affiliation.objects.filter(person=discard),
+        Affiliation.objects.filter(person=keep, organization=OuterRef("organization")),
+        **changes,
+    )
 
 
 def _reassign_allauth_records(keep: Person, discard: Person) -> None:
-    """Transfer allauth EmailAddress and SocialAccount records to person_keep."""
+    """Transfer allauth EmailAddress and SocialAccount records to person_keep.
+
+    Addresses keep already has are dropped, and keep's primary address stays its
+    primary one.
+    """
     from allauth.account.models import EmailAddress
 
-    for email_addr in EmailAddress.objects.filter(user=discard):
-        already_exists = EmailAddress.objects.filter(
-            user=keep,
-            email__iexact=email_addr.email,
-        ).exists()
-        if not already_exists:
-            email_addr.user = keep
-            email_addr.save(update_fields=["user"])
-        else:
-            email_addr.delete()
+    changes = {"user": keep}
+    if EmailAddress.objects.filter(user=keep, primary=True).exists():
+        changes["primary"] = False
+    _move(
+        EmailAddress.objects.filter(user=discard),
+        EmailAddress.objects.filter(user=keep, email__iexact=OuterRef("email")),
+        **changes,
+    )
 
     # Transfer social accounts (ORCID etc.)
-    try:
+    if apps.is_installed("allauth.socialaccount"):
         from allauth.socialaccount.models import SocialAccount
 
         SocialAccount.objects.filter(user=discard).update(user=keep)
-    except ImportError:
-        pass  # Social accounts not installed
 
 
 def _transfer_permissions(keep: Person, discard: Person) -> None:
-    """Copy all guardian object-level permissions from discard to keep."""
-    try:
-        from guardian.models import UserObjectPermission
-
-        for perm in UserObjectPermission.objects.filter(user=discard):
-            UserObjectPermission.objects.assign_perm(
-                perm.permission.codename,
-                keep,
-                perm.content_object,
-            )
-    except Exception:
-        logger.warning(
-            "guardian permission transfer failed — guardian may not be installed",
-            exc_info=True,
-        )
+    """Move all guardian object-level permissions from discard to keep.
+
+    A permission keep already holds on the same object is dropped rather than
+    moved, which guardian's ``(user, permission, object_pk)`` uniqueness requires.
+    The update sends no ``post_save``, so the dataset access index is moved the
+    same way and both people's cached permission snapshots are retired here.
+    """
+    from guardian.models import UserObjectPermission
+
+    from fairdm.core.dataset.models import DatasetAccess
+    from fairdm.core.permission_cache import invalidate_permissions
+
+    _move(
+        UserObjectPermission.objects.filter(user=discard),
+        UserObjectPermission.objects.filter(
+            user=keep,
+            permission=OuterRef("permission"),
+            object_pk=OuterRef("object_pk"),
+        ),
+        user=keep,
+    )
+    _move(
+        DatasetAccess.objects.filter(user=discard),
+        DatasetAccess.objects.filter(user=keep, dataset=OuterRef("dataset")),
+        user=keep,
+    )
+    invalidate_permissions(keep.pk)
+    invalidate_permissions(discard.pk)
 
 
 def _invalidate_sessions(person: Person) -> None:
-    """Invalidate all active sessions for person_discard."""
-    try:
-        from django.contrib.sessions.models import Session
-
-        for session in Session.objects.all():
-            try:
-                data = session.get_decoded()
-                if data.get("_auth_user_id") == str(person.pk):
-                    session.delete()
-            except Exception:
-                logger.debug("Skipping corrupted session during invalidation")
-    except ImportError:
-        pass  # Session backend not available
+    """Invalidate all active sessions for person_discard.
+
+    allauth's ``UserSession`` records each login's session against its user, so
+    the person's sessions are found by an indexed lookup rather than by decoding
+    every session. A session allauth did not record stops authenticating anyway
+    once the person is deleted, since its user can no longer be loaded.
+    """
+    if not apps.is_installed("allauth.usersessions"):
+        return
+    from allauth.usersessions.models import UserSession
+
+    for session in UserSession.objects.filter(user=person):
+        session.end()
 
 
 def _merge_profile_fields(keep: Person, discard: Person) -> None:
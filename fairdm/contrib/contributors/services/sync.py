@@ -0,0 +1,348 @@
+"""Batch synchronisation of contributors with ORCID and ROR.
+
+:func:`sync_identifiers` refreshes many contributors in one pass:
+
+- Records are fetched concurrently by a thread pool sharing one pooled HTTP
+  session. A token bucket per registry keeps the request rate within what the
+  registry allows, and the session retries ``429`` and ``5xx`` answers, honouring
+  ``Retry-After``.
+- The ``ETag`` and ``Last-Modified`` of every response are cached by identifier
+  and sent back on the next sync. A record the registry answers ``304 Not
+  Modified`` for is neither downloaded nor rewritten; only its ``last_synced`` is
+  bumped.
+- Fetched records are applied with the transforms of
+  :mod:`fairdm.contrib.contributors.utils.transforms` without saving, and written
+  with one ``bulk_update`` per contributor type, refreshing each person's
+  ``name_key`` as ``Person.save()`` would.
+
+Only the HTTP requests run in the pool. Every database access stays on the
+calling thread.
+
+Settings:
+    FAIRDM_CONTRIBUTOR_SYNC_RATES: Requests per second, by identifier type.
+        Merged over :data:`DEFAULT_RATES`.
+    FAIRDM_CONTRIBUTOR_SYNC_TIMEOUT: Seconds the response validators are cached
+        for. Defaults to :data:`DEFAULT_TIMEOUT`.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+
+from .matching import name_key
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+logger = logging.getLogger(__name__)
+
+#: Where each type of identifier is looked up. ``{id}`` is the bare identifier.
+ENDPOINTS = {
+    "ORCID": "https://pub.orcid.org/v3.0/{id}",
+    "ROR": "https://api.ror.org/organizations/{id}",
+}
+
+#: Requests per second, by identifier type. ORCID's public API allows 24 a
+#: second; ROR allows 2,000 every five minutes.
+DEFAULT_RATES = {"ORCID": 12.0, "ROR": 5.0}
+
+#: Concurrent requests.
+DEFAULT_WORKERS = 8
+
+#: Seconds a record's validators are kept: thirty days.
+DEFAULT_TIMEOUT = 60 * 60 * 24 * 30
+
+#: The fields each contributor type's transform sets, written by ``bulk_update``.
+FIELDS = {
+    "ORCID": [
+        "synced_data",
+        "name",
+        "first_name",
+        "last_name",
+        "profile",
+        "alternative_names",
+        "links",
+        "name_key",
+        "last_synced",
+        "modified",
+    ],
+    "ROR": [
+        "synced_data",
+        "name",
+        "alternative_names",
+        "city",
+        "country",
+        "location",
+        "links",
+        "last_synced",
+        "modified",
+    ],
+}
+
+
+def _registry(identifier_type: str):
+    """The contributor model and transform for a type of identifier."""
+    from fairdm.contrib.contributors.models import Organization, Person
+    from fairdm.contrib.contributors.utils.transforms import (
+        ORCIDTransform,
+        RORTransform,
+    )
+
+    return {
+        "ORCID": (Person, ORCIDTransform),
+        "ROR": (Organization, RORTransform),
+    }[identifier_type]
+
+
+def _cache_key(identifier_type: str, value: str) -> str:
+    return f"fairdm:contributors:sync:{identifier_type}:{value}"
+
+
+class TokenBucket:
+    """Allow ``rate`` acquisitions a second on average, in bursts of ``capacity``.
+
+    Shared by the threads of a pool; :meth:`acquire` blocks until a token is free.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Any] = time.sleep,
+    ):
+        self.rate = rate
+        self.capacity = capacity or max(rate, 1.0)
+        self.tokens = self.capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take one token, waiting for it if the bucket is empty."""
+        while True:
+            with self._lock:
+                now = self._clock()
+                elapsed = now - self._updated
+                self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+                self._updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            self._sleep(wait)
+
+
+def pooled_session(workers: int = DEFAULT_WORKERS):
+    """A ``requests`` session with a connection per worker, retrying busy answers."""
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    retry = Retry(
+        total=3,
+        backoff_factor=1,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=("GET",),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=workers, max_retries=retry)
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers["Accept"] = "application/json"
+    return session
+
+
+@dataclass
+class Fetched:
+    """The answer to one lookup."""
+
+    identifier_type: str
+    value: str
+    status: int
+    data: dict | None = None
+    validators: dict = field(default_factory=dict)
+
+
+@dataclass
+class SyncResult:
+    """What a sync did, by record."""
+
+    updated: int = 0
+    unchanged: int = 0
+    failed: int = 0
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+
+class SyncEngine:
+    """Fetch identifier records concurrently and apply them in bulk.
+
+    Args:
+        endpoints: URL templates by identifier type, merged over :data:`ENDPOINTS`.
+            Tests point these at a local server.
+        rates: Requests per second by identifier type, merged over the settings.
+        workers: Concurrent requests.
+        session: The HTTP session to share. Defaults to :func:`pooled_session`.
+        timeout: Seconds to wait for each answer.
+    """
+
+    def __init__(
+        self,
+        endpoints: dict[str, str] | None = None,
+        rates: dict[str, float] | None = None,
+        workers: int = DEFAULT_WORKERS,
+        session=None,
+        timeout: float = 10,
+    ):
+        self.endpoints = {**ENDPOINTS, **(endpoints or {})}
+        rates = {
+            **DEFAULT_RATES,
+            **getattr(settings, "FAIRDM_CONTRIBUTOR_SYNC_RATES", {}),
+            **(rates or {}),
+        }
+        self.buckets = {kind: TokenBucket(rate) for kind, rate in rates.items()}
+        self.workers = workers
+        self.session = session or pooled_session(workers)
+        self.timeout = timeout
+
+    def fetch(self, identifier_type: str, value: str, validators: dict) -> Fetched:
+        """Look up one record, conditionally on its cached validators."""
+        import requests
+
+        headers = {}
+        if etag := validators.get("etag"):
+            headers["If-None-Match"] = etag
+        if modified := validators.get("last_modified"):
+            headers["If-Modified-Since"] = modified
+
+        url = self.endpoints[identifier_type].format(id=value)
+        if bucket := self.buckets.get(identifier_type):
+            bucket.acquire()
+        try:
+            response = self.session.get(url, headers=headers, timeout=self.timeout)
+            if response.status_code == 304:
+                return Fetched(identifier_type, value, 304, validators=validators)
+            if response.status_code != 200:
+                logger.warning(
+                    "%s %s answered %s", identifier_type, value, response.status_code
+                )
+                return Fetched(identifier_type, value, response.status_code)
+            data = response.json()
+        except (requests.RequestException, ValueError):
+            logger.exception("Failed to fetch %s %s", identifier_type, value)
+            return Fetched(identifier_type, value, 0)
+
+        validators = {
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+        }
+        return Fetched(identifier_type, value, 200, data, validators)
+
+    def sync(self, identifier_pks: Iterable[int]) -> SyncResult:
+        """Refresh the contributors of the given ORCID and ROR identifiers.
+
+        Returns:
+            SyncResult: How many records were updated, unchanged or failed.
+        """
+        from fairdm.contrib.contributors.models import (
+            Contributor,
+            ContributorIdentifier,
+        )
+
+        rows = ContributorIdentifier.objects.filter(
+            pk__in=list(identifier_pks), type__in=self.endpoints
+        ).values_list("type", "value", "related_id")
+
+        contributors, jobs = {}, []
+        by_type: dict[str, dict[str, int]] = {}
+        for identifier_type, value, related_id in rows:
+            by_type.setdefault(identifier_type, {})[_bare(value)] = related_id
+        for identifier_type, values in by_type.items():
+            model, _ = _registry(identifier_type)
+            found = model.objects.in_bulk(values.values())
+            for value, related_id in values.items():
+                if related_id in found:
+                    contributors[identifier_type, value] = found[related_id]
+
+        # A contributor with no stored record is fetched in full, whatever is cached
+        keys = {_cache_key(*key): key for key in contributors}
+        cached = cache.get_many(list(keys))
+        for cache_key, key in keys.items():
+            stored = contributors[key].synced_data
+            jobs.append((*key, cached.get(cache_key, {}) if stored else {}))
+
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            fetched = list(pool.map(lambda job: self.fetch(*job), jobs))
+
+        result = SyncResult()
+        now = timezone.now()
+        changed: dict[str, list] = {}
+        unchanged, validators = [], {}
+        for answer in fetched:
+            contributor = contributors[answer.identifier_type, answer.value]
+            if answer.status == 304:
+                unchanged.append(contributor.pk)
+            elif answer.status == 200:
+                _, transform = _registry(answer.identifier_type)
+                try:
+                    transform().import_data(answer.data, contributor, save=False)
+                except Exception:
+                    logger.exception(
+                        "Could not apply %s %s", answer.identifier_type, answer.value
+                    )
+                    result.failed += 1
+                    continue
+                if "name_key" in FIELDS[answer.identifier_type]:
+                    contributor.name_key = name_key(contributor.name)
+                contributor.last_synced = now.date()
+                contributor.modified = now
+                changed.setdefault(answer.identifier_type, []).append(contributor)
+                if any(answer.validators.values()):
+                    key = _cache_key(answer.identifier_type, answer.value)
+                    validators[key] = answer.validators
+            else:
+                result.failed += 1
+
+        with transaction.atomic():
+            for identifier_type, objs in changed.items():
+                model, _ = _registry(identifier_type)
+                model.objects.bulk_update(objs, FIELDS[identifier_type], batch_size=500)
+            Contributor.objects.filter(pk__in=unchanged).update(last_synced=now.date())
+        timeout = getattr(settings, "FAIRDM_CONTRIBUTOR_SYNC_TIMEOUT", DEFAULT_TIMEOUT)
+        cache.set_many(validators, timeout)
+
+        result.updated = sum(len(objs) for objs in changed.values())
+        result.unchanged = len(unchanged)
+        logger.info("Contributor sync: %s", result)
+        return result
+
+
+def _bare(value: str) -> str:
+    """An identifier without a resolver prefix: ``https://ror.org/x`` becomes ``x``."""
+    return value.strip().rstrip("/").rsplit("/", 1)[-1]
+
+
+def sync_identifiers(identifier_pks: Iterable[int], **engine_kwargs) -> SyncResult:
+    """Refresh the contributors of the given identifiers with a new :class:`SyncEngine`.
+
+    Args:
+        identifier_pks: Primary keys of ``ContributorIdentifier`` rows. Types other
+            than ORCID and ROR are skipped.
+        **engine_kwargs: Passed to :class:`SyncEngine`.
+    """
+    return SyncEngine(**engine_kwargs).sync(identifier_pks)
@@ -2,6 +2,7 @@
 
 Tasks:
 - sync_contributor_identifier: Fetch ORCID/ROR data for a ContributorIdentifier
+- sync_contributor_batch: Fetch ORCID/ROR data for many identifiers at once
 - refresh_all_contributors: Periodic task to refresh stale data
 - detect_duplicate_contributors: Periodic task to find potential duplicates
 """
@@ -16,6 +17,9 @@ from requests.exceptions import RequestException
 
 logger = logging.getLogger(__name__)
 
+#: Identifiers synchronised by one batch task.
+SYNC_BATCH_SIZE = 500
+
 
 @shared_task(
     autoretry_for=(RequestException,),
@@ -163,15 +167,34 @@ def _sync_ror(identifier, contributor):
         return True
 
 
+@shared_task
+def sync_contributor_batch(identifier_pks: list[int]) -> dict:
+    """Fetch external data for many ContributorIdentifiers at once.
+
+    Runs the concurrent, cached sync engine in
+    ``fairdm.contrib.contributors.services.sync``.
+
+    Args:
+        identifier_pks: Primary keys of ContributorIdentifier instances.
+
+    Returns:
+        dict: {"updated": N, "unchanged": N, "failed": N}
+    """
+    from .services.sync import sync_identifiers
+
+    return sync_identifiers(identifier_pks).as_dict()
+
+
 @shared_task
 def refresh_all_contributors() -> int:
     """Periodic task: refresh stale contributors.
 
-    Queries contributors where last_synced is older than 7 days or NULL.
-    Processes in batches with delays to respect rate limits.
+    Queries contributors where last_synced is older than 7 days or NULL, and
+    queues every one of them in batches of ``SYNC_BATCH_SIZE``. Each batch task
+    keeps to the registries' rate limits itself.
 
     Returns:
-        int: Number of sync tasks queued.
+        int: Number of identifiers queued.
     """
     from django.db.models import Q
 
@@ -179,53 +202,60 @@ def refresh_all_contributors() -> int:
 
     # Find identifiers that need refreshing
     stale_threshold = timezone.now().date() - timedelta(days=7)
-    stale_identifiers = ContributorIdentifier.objects.filter(
-        type__in=["ORCID", "ROR"],
-    ).filter(
-        Q(related__last_synced__lt=stale_threshold)
-        | Q(related__last_synced__isnull=True)
+    stale_identifiers = (
+        ContributorIdentifier.objects.filter(
+            type__in=["ORCID", "ROR"],
+        )
+        .filter(
+            Q(related__last_synced__lt=stale_threshold)
+            | Q(related__last_synced__isnull=True)
+        )
+        .order_by("pk")
     )
 
-    count = 0
-    for identifier in stale_identifiers[:100]:  # Limit to 100 per run
-        sync_contributor_identifier.delay(identifier.pk)
-        count += 1
+    pks = list(stale_identifiers.values_list("pk", flat=True))
+    for start in range(0, len(pks), SYNC_BATCH_SIZE):
+        sync_contributor_batch.delay(pks[start : start + SYNC_BATCH_SIZE])
 
-    logger.info(f"Queued {count} contributor syncs")
-    return count
+    logger.info(f"Queued {len(pks)} contributor syncs")
+    return len(pks)
 
 
 @shared_task
 def detect_duplicate_contributors() -> dict:
     """Periodic task: identify potential duplicate contributor profiles.
 
-    Uses name similarity and identifier matching to find duplicates.
+    Scores similar names with the blocking matcher and stores the candidate pairs
+    the person admin shows (see ``services/matching.py``). People linked by
+    candidate pairs, directly or through others, form one group.
 
     Returns:
         dict: {"groups_found": N, "total_duplicates": N}
     """
-    from .models import Person
+    from .services.matching import detect_duplicates
+
+    pairs = detect_duplicates()
 
-    # Simple duplicate detection: find persons with same normalized name
-    # More sophisticated matching would use fuzzy string matching
-    duplicates = {}
-    persons = Person.objects.all().values("pk", "name", "email")
+    # Union the pairs into groups
+    parent: dict[int, int] = {}
 
-    for person in persons:
-        normalized_name = person["name"].lower().strip()
-        if normalized_name not in duplicates:
-            duplicates[normalized_name] = []
-        duplicates[normalized_name].append(person["pk"])
+    def root(pk):
+        while parent.setdefault(pk, pk) != pk:
+            parent[pk] = parent[parent[pk]]
+            pk = parent[pk]
+        return pk
 
-    # Filter to groups with 2+ members
-    duplicate_groups = {k: v for k, v in duplicates.items() if len(v) >= 2}
+    for a, b in pairs:
+        parent[root(a)] = root(b)
+    groups = {root(pk) for pk in parent}
 
-    total_duplicates = sum(len(v) for v in duplicate_groups.values())
+    total_duplicates = len(parent)
     logger.info(
-        f"Found {len(duplicate_groups)} potential duplicate groups with {total_duplicates} total persons"
+        f"Found {len(pairs)} candidate pairs in {len(groups)} potential duplicate "
+        f"groups with {total_duplicates} total persons"
     )
 
     return {
-        "groups_found": len(duplicate_groups),
+        "groups_found": len(groups),
         "total_duplicates": total_duplicates,
     }
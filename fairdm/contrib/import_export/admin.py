@@ -0,0 +1,10 @@
+from django.contrib import admin
+
+from .models import ImportJob
+
+
+@admin.register(ImportJob)
+class ImportJobAdmin(admin.ModelAdmin):
+    list_display = ["dataset", "data_type", "status", "processed_rows", "added"]
+    list_filter = ["status", "data_type"]
+    readonly_fields = ["uuid", "totals", "started", "finished"]
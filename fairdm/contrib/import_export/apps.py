@@ -1,4 +1,4 @@
-from django.apps import AppConfig
+from django.apps import AppConfig, apps
 from django.utils.translation import gettext_lazy as _
 
 
@@ -6,3 +6,29 @@ class FairDMImportExportConfig(AppConfig):
     name = "fairdm.contrib.import_export"
     label = "fairdm_import_export"
     verbose_name = _("Import / Export")
+
+    def ready(self):
+        from django.db.models.signals import post_delete, post_save
+
+        from fairdm.core.models import Dataset, Measurement, Sample
+
+        from .models import DatasetArtefact
+        from .receivers import dataset_changed, delete_artefact_file, record_changed
+
+        post_save.connect(
+            dataset_changed,
+            sender=Dataset,
+            dispatch_uid="import_export.dataset_changed",
+        )
+        # Signals are sent with the concrete class as sender, so every sample and
+        # measurement type is connected individually.
+        for model in apps.get_models():
+            if issubclass(model, (Sample, Measurement)):
+                uid = f"import_export.record_changed.{model._meta.label}"
+                for signal in (post_save, post_delete):
+                    signal.connect(record_changed, sender=model, dispatch_uid=uid)
+        post_delete.connect(
+            delete_artefact_file,
+            sender=DatasetArtefact,
+            dispatch_uid="import_export.delete_artefact_file",
+        )
@@ -0,0 +1,199 @@
+"""Prebuilt dataset downloads, regenerated in the background when a dataset changes.
+
+A dataset's DataCite XML, its ZIP package and one CSV per record type are built
+by a worker and kept in media storage as :class:`DatasetArtefact` rows. Download
+views serve them as files with an ``ETag`` (the content hash) and
+``Last-Modified``, so a harvester re-fetching an unchanged dataset gets a 304 and
+a first fetch costs a file read instead of a render.
+
+Saving or deleting a dataset, sample or measurement schedules a rebuild of its
+dataset. Scheduling is debounced: the first change queues a build
+``FAIRDM_DATASET_ARTEFACTS_DEBOUNCE`` seconds out and later changes inside that
+window ride along with it, so importing 50,000 rows queues one build, not 50,000.
+While a build is pending the views render the download live.
+
+Enabled with ``FAIRDM_DATASET_ARTEFACTS = True``; it needs a Celery worker.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import tempfile
+from collections.abc import Iterable
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files import File
+from django.core.files.storage import default_storage
+from django.db import transaction
+from django.http import FileResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+
+from .models import DatasetArtefact
+from .utils import (
+    DataPackage,
+    build_metadata,
+    export_table,
+    get_package_version,
+    types_in,
+)
+
+#: Storage directory for artefacts, one subdirectory per dataset.
+ARTEFACT_DIR = "artefacts"
+
+#: Bytes an artefact is held in memory while it is built before it spills to disk.
+SPOOL_MAX_SIZE = 8 * 1024 * 1024
+
+
+def artefacts_enabled() -> bool:
+    return getattr(settings, "FAIRDM_DATASET_ARTEFACTS", False)
+
+
+def _debounce_key(dataset_pk: int) -> str:
+    return f"fairdm:artefacts:pending:{dataset_pk}"
+
+
+def schedule_rebuild(dataset_pk: int | None) -> None:
+    """Queue a rebuild of the dataset's artefacts unless one is already pending.
+
+    The pending marker outlives the countdown, so a build lost with its worker
+    blocks the next one for a little while and no longer.
+    """
+    if dataset_pk is None or not artefacts_enabled():
+        return
+    delay = getattr(settings, "FAIRDM_DATASET_ARTEFACTS_DEBOUNCE", 60)
+    if not cache.add(_debounce_key(dataset_pk), True, timeout=delay * 2):
+        return
+
+    from .tasks import build_dataset_artefacts
+
+    transaction.on_commit(
+        lambda: build_dataset_artefacts.apply_async((dataset_pk,), countdown=delay)
+    )
+
+
+def clear_pending(dataset_pk: int) -> None:
+    """Let changes made from now on schedule another build."""
+    cache.delete(_debounce_key(dataset_pk))
+
+
+def _store(dataset, kind, label, stem, extension, chunks: Iterable[bytes], version):
+    """Write one artefact, hashing it as it is written; keep it if it is unchanged."""
+    digest = hashlib.sha256()
+    size = 0
+    with tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE) as spool:
+        for chunk in chunks:
+            if isinstance(chunk, str):
+                chunk = chunk.encode()
+            digest.update(chunk)
+            size += len(chunk)
+            spool.write(chunk)
+        checksum = digest.hexdigest()
+
+        artefact = DatasetArtefact.objects.filter(
+            dataset=dataset, kind=kind, label=label
+        ).first()
+        if artefact is not None and artefact.checksum == checksum:
+            # The content is what is stored already; only the version moves on.
+            artefact.version = version
+            artefact.save(update_fields=["version"])
+            return artefact
+
+        spool.seek(0)
+        name = f"{ARTEFACT_DIR}/{dataset.uuid}/{stem}-{checksum[:12]}.{extension}"
+        name = default_storage.save(name, File(spool))
+
+    if artefact is None:
+        artefact = DatasetArtefact(dataset=dataset, kind=kind, label=label)
+    else:
+        default_storage.delete(artefact.file.name)
+    artefact.file.name = name
+    artefact.checksum = checksum
+    artefact.size = size
+    artefact.version = version
+    artefact.save()
+    return artefact
+
+
+def build_artefacts(dataset) -> list[DatasetArtefact]:
+    """Build and store every artefact for the dataset, removing any it no longer has."""
+    version = get_package_version(dataset)
+    Kind = DatasetArtefact.Kind
+
+    built = [
+        _store(
+            dataset,
+            Kind.METADATA,
+            "",
+            "metadata",
+            "xml",
+            [build_metadata(dataset)],
+            version,
+        )
+    ]
+    for related in (dataset.samples, dataset.measurements):
+        for model in types_in(related):
+            built.append(
+                _store(
+                    dataset,
+                    Kind.TABLE,
+                    model._meta.label_lower,
+                    model._meta.model_name,
+                    "csv",
+                    export_table(dataset, model),
+                    version,
+                )
+            )
+    built.append(
+        _store(
+            dataset,
+            Kind.PACKAGE,
+            "",
+            "package",
+            "zip",
+            DataPackage(dataset, None).stream(),
+            version,
+        )
+    )
+
+    remove_artefacts(dataset, keep=built)
+    return built
+
+
+def remove_artefacts(dataset, keep: Iterable[DatasetArtefact] = ()) -> None:
+    """Delete the dataset's artefacts, and their files, other than ``keep``."""
+    # Files go with their rows, through the post_delete receiver.
+    dataset.artefacts.exclude(pk__in=[artefact.pk for artefact in keep]).delete()
+
+
+def current_artefact(dataset, kind, label="") -> DatasetArtefact | None:
+    """The stored artefact, unless a change to the dataset is still to be built.
+
+    Every change marks a build as pending, so a cache read answers whether the
+    stored files still describe the dataset. The live package version costs two
+    aggregate queries and is only computed when the artefacts are rebuilt.
+    """
+    if not artefacts_enabled() or cache.get(_debounce_key(dataset.pk)):
+        return None
+    return dataset.artefacts.filter(kind=kind, label=label).first()
+
+
+def artefact_response(request, artefact, filename, content_type):
+    """Serve a stored artefact, answering conditional requests without reading it."""
+    last_modified = artefact.modified.timestamp()
+    not_modified = get_conditional_response(
+        request, etag=artefact.etag, last_modified=int(last_modified)
+    )
+    if not_modified is not None:
+        return not_modified
+
+    response = FileResponse(
+        default_storage.open(artefact.file.name, "rb"),
+        as_attachment=True,
+        filename=filename,
+        content_type=content_type,
+    )
+    response["ETag"] = artefact.etag
+    response["Last-Modified"] = http_date(last_modified)
+    return response
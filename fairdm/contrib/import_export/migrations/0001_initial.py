@@ -0,0 +1,82 @@
+# Generated by Django 5.2.12 on 2026-10-16 09:12
+
+import uuid
+
+import auto_prefetch
+import django.core.serializers.json
+import django.db.models.deletion
+import django.db.models.manager
+import django_lifecycle.mixins
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('dataset', '0011_alter_dataset_options_alter_dataset_license_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ImportJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('added', models.DateTimeField(auto_now_add=True, help_text='The date and time this record was added to the database.', verbose_name='Date added')),
+                ('modified', models.DateTimeField(auto_now=True, help_text='The date and time this record was last modified.', verbose_name='Last modified')),
+                ('uuid', models.UUIDField(default=uuid.uuid4, editable=False, unique=True)),
+                ('data_type', models.CharField(help_text="The registered model the rows are imported as, as 'app_label.model'.", max_length=255, verbose_name='data type')),
+                ('file', models.FileField(upload_to='imports/%Y/%m/', verbose_name='file')),
+                ('input_format', models.CharField(help_text='The extension the file was uploaded with, which selects its parser.', max_length=16, verbose_name='format')),
+                ('status', models.CharField(choices=[('queued', 'Queued'), ('running', 'Running'), ('completed', 'Completed'), ('failed', 'Failed')], default='queued', max_length=16, verbose_name='status')),
+                ('chunk_size', models.PositiveIntegerField(verbose_name='chunk size')),
+                ('headers', models.JSONField(blank=True, default=list, verbose_name='headers')),
+                ('total_rows', models.PositiveIntegerField(blank=True, null=True, verbose_name='total rows')),
+                ('processed_rows', models.PositiveIntegerField(default=0, verbose_name='processed rows')),
+                ('rejected_rows', models.PositiveIntegerField(default=0, help_text='Rows in chunks that were rolled back because one of their rows failed.', verbose_name='rejected rows')),
+                ('totals', models.JSONField(blank=True, default=dict, help_text='Rows per import type: new, update, skip, delete, error, invalid.', verbose_name='totals')),
+                ('errors', models.JSONField(blank=True, default=list, encoder=django.core.serializers.json.DjangoJSONEncoder, verbose_name='errors')),
+                ('message', models.TextField(blank=True, verbose_name='message')),
+                ('started', models.DateTimeField(blank=True, null=True, verbose_name='started')),
+                ('finished', models.DateTimeField(blank=True, null=True, verbose_name='finished')),
+                ('created_by', auto_prefetch.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='created by')),
+                ('dataset', auto_prefetch.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='import_jobs', to='dataset.dataset', verbose_name='dataset')),
+            ],
+            options={
+                'verbose_name': 'import job',
+                'verbose_name_plural': 'import jobs',
+                'ordering': ['-added'],
+            },
+            bases=(django_lifecycle.mixins.LifecycleModelMixin, models.Model),
+            managers=[
+                ('objects', django.db.models.manager.Manager()),
+                ('prefetch_manager', django.db.models.manager.Manager()),
+            ],
+        ),
+        migrations.CreateModel(
+            name='ImportChunk',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('added', models.DateTimeField(auto_now_add=True, help_text='The date and time this record was added to the database.', verbose_name='Date added')),
+                ('modified', models.DateTimeField(auto_now=True, help_text='The date and time this record was last modified.', verbose_name='Last modified')),
+                ('index', models.PositiveIntegerField(help_text="The chunk's position in the file, counting from 0.", verbose_name='index')),
+                ('start', models.PositiveIntegerField(help_text="Rows in the file before this chunk's first row.", verbose_name='start')),
+                ('rows', models.JSONField(encoder=django.core.serializers.json.DjangoJSONEncoder, help_text="The chunk's rows as parsed, in the order of the job's headers.", verbose_name='rows')),
+                ('job', auto_prefetch.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='chunks', to='fairdm_import_export.importjob', verbose_name='import job')),
+            ],
+            options={
+                'verbose_name': 'import chunk',
+                'verbose_name_plural': 'import chunks',
+                'ordering': ['job', 'index'],
+                'constraints': [models.UniqueConstraint(fields=('job', 'index'), name='import_chunk_unique_index')],
+            },
+            bases=(django_lifecycle.mixins.LifecycleModelMixin, models.Model),
+            managers=[
+                ('objects', django.db.models.manager.Manager()),
+                ('prefetch_manager', django.db.models.manager.Manager()),
+            ],
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 5.2.12 on 2026-10-16 11:40
+
+import auto_prefetch
+import django.db.models.deletion
+import django.db.models.manager
+import django_lifecycle.mixins
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dataset', '0011_alter_dataset_options_alter_dataset_license_and_more'),
+        ('fairdm_import_export', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DatasetArtefact',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('added', models.DateTimeField(auto_now_add=True, help_text='The date and time this record was added to the database.', verbose_name='Date added')),
+                ('modified', models.DateTimeField(auto_now=True, help_text='The date and time this record was last modified.', verbose_name='Last modified')),
+                ('kind', models.CharField(choices=[('metadata', 'DataCite metadata'), ('package', 'Data package'), ('table', 'Table')], max_length=16, verbose_name='kind')),
+                ('label', models.CharField(blank=True, help_text="For a table, the model it holds, as 'app_label.model'.", max_length=255, verbose_name='label')),
+                ('file', models.FileField(max_length=255, upload_to='', verbose_name='file')),
+                ('checksum', models.CharField(max_length=64, verbose_name='SHA-256')),
+                ('size', models.PositiveBigIntegerField(verbose_name='size')),
+                ('version', models.CharField(max_length=16, verbose_name='dataset version')),
+                ('dataset', auto_prefetch.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='artefacts', to='dataset.dataset', verbose_name='dataset')),
+            ],
+            options={
+                'verbose_name': 'dataset artefact',
+                'verbose_name_plural': 'dataset artefacts',
+                'constraints': [models.UniqueConstraint(fields=('dataset', 'kind', 'label'), name='dataset_artefact_unique_kind')],
+            },
+            bases=(django_lifecycle.mixins.LifecycleModelMixin, models.Model),
+            managers=[
+                ('objects', django.db.models.manager.Manager()),
+                ('prefetch_manager', django.db.models.manager.Manager()),
+            ],
+        ),
+    ]
@@ -0,0 +1,278 @@
+"""Import jobs: a stored upload and the progress of importing it.
+
+An upload is no longer imported inside the request that receives it. The request
+stores the file as an :class:`ImportJob` and queues it; a worker parses the file
+once into :class:`ImportChunk` rows, then imports one chunk per task, each in its
+own transaction. The job carries the running totals and the row errors, so the
+page that started it can poll for progress and the dataset keeps the report once
+the job is done.
+"""
+
+import os
+import uuid
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import F
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+from fairdm.db import models
+
+#: Row errors kept on a job. Every error is still counted in ``totals``; only the
+#: details beyond this many are dropped, so a file that fails on every row does
+#: not store a report as large as itself.
+MAX_REPORTED_ERRORS = 1000
+
+
+class ImportJob(models.Model):
+    """One uploaded file being imported into a dataset."""
+
+    class Status(models.TextChoices):
+        QUEUED = "queued", _("Queued")
+        RUNNING = "running", _("Running")
+        COMPLETED = "completed", _("Completed")
+        FAILED = "failed", _("Failed")
+
+    uuid = models.UUIDField(default=uuid.uuid4, unique=True, editable=False)
+    dataset = models.ForeignKey(
+        "dataset.Dataset",
+        on_delete=models.CASCADE,
+        related_name="import_jobs",
+        verbose_name=_("dataset"),
+    )
+    data_type = models.CharField(
+        _("data type"),
+        max_length=255,
+        help_text=_(
+            "The registered model the rows are imported as, as 'app_label.model'."
+        ),
+    )
+    file = models.FileField(_("file"), upload_to="imports/%Y/%m/")
+    input_format = models.CharField(
+        _("format"),
+        max_length=16,
+        help_text=_(
+            "The extension the file was uploaded with, which selects its parser."
+        ),
+    )
+    created_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="+",
+        verbose_name=_("created by"),
+    )
+    status = models.CharField(
+        _("status"),
+        max_length=16,
+        choices=Status.choices,
+        default=Status.QUEUED,
+    )
+    chunk_size = models.PositiveIntegerField(_("chunk size"))
+    headers = models.JSONField(_("headers"), default=list, blank=True)
+    total_rows = models.PositiveIntegerField(_("total rows"), null=True, blank=True)
+    processed_rows = models.PositiveIntegerField(_("processed rows"), default=0)
+    rejected_rows = models.PositiveIntegerField(
+        _("rejected rows"),
+        default=0,
+        help_text=_(
+            "Rows in chunks that were rolled back because one of their rows failed."
+        ),
+    )
+    totals = models.JSONField(
+        _("totals"),
+        default=dict,
+        blank=True,
+        help_text=_("Rows per import type: new, update, skip, delete, error, invalid."),
+    )
+    errors = models.JSONField(
+        _("errors"), default=list, blank=True, encoder=DjangoJSONEncoder
+    )
+    message = models.TextField(_("message"), blank=True)
+    started = models.DateTimeField(_("started"), null=True, blank=True)
+    finished = models.DateTimeField(_("finished"), null=True, blank=True)
+
+    class Meta:
+        verbose_name = _("import job")
+        verbose_name_plural = _("import jobs")
+        ordering = ["-added"]
+
+    def __str__(self):
+        return f"{self.data_type} import ({self.get_status_display()})"
+
+    @property
+    def filename(self) -> str:
+        return os.path.basename(self.file.name)
+
+    @property
+    def is_active(self) -> bool:
+        """Whether a worker still has this job, which keeps its status page polling."""
+        return self.status in (self.Status.QUEUED, self.Status.RUNNING)
+
+    @property
+    def has_errors(self) -> bool:
+        return bool(self.errors) or self.status == self.Status.FAILED
+
+    @property
+    def progress(self) -> int:
+        """Percentage of rows processed, 0 until the file has been parsed."""
+        if not self.total_rows:
+            return 100 if self.status == self.Status.COMPLETED else 0
+        return min(100, self.processed_rows * 100 // self.total_rows)
+
+    def get_resource(self):
+        """The registry resource for the job's data type, bound to its dataset."""
+        from fairdm.registry import registry
+
+        config = registry.get_for_model(self.data_type)
+        return config.get_resource_class()(dataset=self.dataset)
+
+    def read_dataset(self):
+        """Parse the stored upload into a tablib dataset."""
+        from .utils import get_import_formats
+
+        fmt = get_import_formats()[self.input_format](encoding="utf-8-sig")
+        with self.file.open("rb") as fh:
+            content = fh.read()
+        if not fmt.is_binary():
+            content = content.decode("utf-8-sig")
+        return fmt.create_dataset(content)
+
+    def record_chunk(self, chunk: "ImportChunk", result) -> None:
+        """Add one chunk's import result to the job's running totals and report.
+
+        A chunk whose transaction was rolled back contributes its errors and its
+        row count to ``rejected_rows``, but none of its import types, because none
+        of its rows were written.
+        """
+        rolled_back = result.has_errors() or result.has_validation_errors()
+        totals = dict(self.totals)
+        for import_type, count in result.totals.items():
+            if rolled_back and import_type not in ("error", "invalid"):
+                continue
+            totals[import_type] = totals.get(import_type, 0) + count
+
+        errors = list(self.errors)
+        for number, row_errors in result.row_errors():
+            for error in row_errors:
+                errors.append(
+                    {"row": chunk.start + number, "message": str(error.error)}
+                )
+        for row in result.invalid_rows:
+            messages = [str(e) for e in row.non_field_specific_errors]
+            messages += [
+                f"{field}: {error}"
+                for field, field_errors in row.field_specific_errors.items()
+                for error in field_errors
+            ]
+            errors.append(
+                {"row": chunk.start + row.number, "message": "; ".join(messages)}
+            )
+
+        ImportJob.objects.filter(pk=self.pk).update(
+            processed_rows=F("processed_rows") + len(chunk.rows),
+            rejected_rows=F("rejected_rows") + (len(chunk.rows) if rolled_back else 0),
+            totals=totals,
+            errors=errors[:MAX_REPORTED_ERRORS],
+            modified=timezone.now(),
+        )
+        self.refresh_from_db()
+
+    def finish(self, status: str = Status.COMPLETED, message: str = "") -> None:
+        self.status = status
+        self.message = message
+        self.finished = timezone.now()
+        self.save(update_fields=["status", "message", "finished", "modified"])
+
+
+class ImportChunk(models.Model):
+    """A slice of a parsed upload waiting to be imported.
+
+    The staging table is what lets each chunk be its own task. Parsing a
+    spreadsheet is all-or-nothing, so it happens once; every later task reads only
+    its own rows, and deletes them once they are imported.
+    """
+
+    job = models.ForeignKey(
+        ImportJob,
+        on_delete=models.CASCADE,
+        related_name="chunks",
+        verbose_name=_("import job"),
+    )
+    index = models.PositiveIntegerField(
+        _("index"),
+        help_text=_("The chunk's position in the file, counting from 0."),
+    )
+    start = models.PositiveIntegerField(
+        _("start"),
+        help_text=_("Rows in the file before this chunk's first row."),
+    )
+    rows = models.JSONField(
+        _("rows"),
+        encoder=DjangoJSONEncoder,
+        help_text=_("The chunk's rows as parsed, in the order of the job's headers."),
+    )
+
+    class Meta:
+        verbose_name = _("import chunk")
+        verbose_name_plural = _("import chunks")
+        ordering = ["job", "index"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["job", "index"], name="import_chunk_unique_index"
+            ),
+        ]
+
+    def __str__(self):
+        return f"Chunk {self.index} of {self.job_id}"
+
+
+class DatasetArtefact(models.Model):
+    """A prebuilt download for a dataset, stored under a name carrying its hash.
+
+    Built in the background when the dataset or its records change (see
+    :mod:`fairdm.contrib.import_export.artefacts`). ``version`` is the dataset's
+    package version at build time. A download view serves the artefact while no
+    rebuild is pending and builds live otherwise.
+    """
+
+    class Kind(models.TextChoices):
+        METADATA = "metadata", _("DataCite metadata")
+        PACKAGE = "package", _("Data package")
+        TABLE = "table", _("Table")
+
+    dataset = models.ForeignKey(
+        "dataset.Dataset",
+        on_delete=models.CASCADE,
+        related_name="artefacts",
+        verbose_name=_("dataset"),
+    )
+    kind = models.CharField(_("kind"), max_length=16, choices=Kind.choices)
+    label = models.CharField(
+        _("label"),
+        max_length=255,
+        blank=True,
+        help_text=_("For a table, the model it holds, as 'app_label.model'."),
+    )
+    file = models.FileField(_("file"), max_length=255)
+    checksum = models.CharField(_("SHA-256"), max_length=64)
+    size = models.PositiveBigIntegerField(_("size"))
+    version = models.CharField(_("dataset version"), max_length=16)
+
+    class Meta:
+        verbose_name = _("dataset artefact")
+        verbose_name_plural = _("dataset artefacts")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["dataset", "kind", "label"], name="dataset_artefact_unique_kind"
+            ),
+        ]
+
+    def __str__(self):
+        return self.file.name
+
+    @property
+    def etag(self) -> str:
+        return f'"{self.checksum}"'
@@ -0,0 +1,59 @@
+from django.shortcuts import get_object_or_404
+from django.utils.translation import gettext_lazy as _
+from django.views.generic import TemplateView
+
+from fairdm import plugins
+from fairdm.contrib.plugins import Plugin, reverse
+from fairdm.core.dataset.models import Dataset
+
+from .views import DataImportView
+
+
+class ImportJobStatus(Plugin, TemplateView):
+    """Progress and report of one import job.
+
+    An htmx request gets the status fragment alone, which re-requests itself
+    every few seconds for as long as the job is queued or running.
+    """
+
+    name = "job"
+    url_path = "<uuid:job>"
+    permission = "dataset.change_dataset"
+    template_name = "import_export/import_job.html"
+    partial_template_name = "import_export/partials/import_job_status.html"
+
+    def get_template_names(self):
+        if self.request.htmx:
+            return [self.partial_template_name]
+        return super().get_template_names()
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context["job"] = get_object_or_404(
+            self.base_object.import_jobs, uuid=self.kwargs["job"]
+        )
+        return context
+
+
+@plugins.register(Dataset, label=_("Import"), icon="upload", order=540)
+class DataImport(Plugin, DataImportView):
+    """Upload a file to import into this dataset, and list its earlier imports."""
+
+    url_path = "import"
+    permission = "dataset.change_dataset"
+    check = True
+    extra_views = [ImportJobStatus]
+
+    def get_object(self):
+        return self.base_object
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        jobs = list(self.base_object.import_jobs.all()[:20])
+        for job in jobs:
+            job.status_url = reverse(self.base_object, "import-job", job=job.uuid)
+        context["import_jobs"] = jobs
+        return context
+
+    def get_success_url(self):
+        return reverse(self.base_object, "import-job", job=self.job.uuid)
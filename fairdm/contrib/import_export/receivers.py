@@ -0,0 +1,26 @@
+"""Signal receivers for the import/export app.
+
+Connected in ``FairDMImportExportConfig.ready()`` per model rather than for every
+sender: a ``post_delete`` receiver without a sender would switch off Django's
+fast-delete path for every model in the project.
+"""
+
+from django.core.files.storage import default_storage
+
+from .artefacts import schedule_rebuild
+
+
+def dataset_changed(sender, instance, **kwargs):
+    """Rebuild a dataset's artefacts after it is saved."""
+    schedule_rebuild(instance.pk)
+
+
+def record_changed(sender, instance, **kwargs):
+    """Rebuild the artefacts of a sample's or measurement's dataset after it changes."""
+    schedule_rebuild(instance.dataset_id)
+
+
+def delete_artefact_file(sender, instance, **kwargs):
+    """Remove an artefact's file with its row, also on a cascade from its dataset."""
+    if instance.file.name:
+        default_storage.delete(instance.file.name)
@@ -0,0 +1,198 @@
+"""Celery tasks for dataset imports.
+
+Tasks:
+- stage_import: Parse an ImportJob's upload once into ImportChunk rows
+- import_chunk: Import one staged chunk in its own transaction, then queue the next
+- build_dataset_artefacts: Rebuild the stored downloads of a changed dataset
+
+One task per chunk keeps every task well inside ``CELERY_TASK_SOFT_TIME_LIMIT``
+however long the file is, and means a worker lost part way through costs one
+chunk, not the import: the chunk's transaction never committed, and with
+``acks_late`` the broker hands the same chunk to another worker.
+"""
+
+import logging
+
+import tablib
+from celery import shared_task
+from django.db import transaction
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(soft_time_limit=10 * 60, time_limit=12 * 60)
+def stage_import(job_pk: int) -> bool:
+    """Parse a queued job's upload and stage it as chunks.
+
+    The only step whose cost grows with the whole file, since spreadsheet formats
+    cannot be read a slice at a time, so it is given a longer limit than the
+    project default.
+
+    Args:
+        job_pk: Primary key of the ImportJob.
+
+    Returns:
+        bool: True if the job was staged and its first chunk queued.
+    """
+    from .models import ImportChunk, ImportJob
+
+    try:
+        job = ImportJob.objects.get(pk=job_pk)
+    except ImportJob.DoesNotExist:
+        logger.exception(f"ImportJob {job_pk} does not exist")
+        return False
+
+    if job.status != ImportJob.Status.QUEUED:
+        # A redelivered message for a job that has already been staged.
+        return False
+
+    try:
+        data = job.read_dataset()
+    except Exception as err:
+        logger.exception(f"Could not read the upload for ImportJob {job_pk}")
+        job.finish(ImportJob.Status.FAILED, str(err) or "The file could not be read.")
+        return False
+
+    size = job.chunk_size
+    with transaction.atomic():
+        ImportChunk.objects.bulk_create(
+            (
+                ImportChunk(
+                    job=job,
+                    index=index,
+                    start=start,
+                    rows=[list(row) for row in data[start : start + size]],
+                )
+                for index, start in enumerate(range(0, data.height, size))
+            ),
+            batch_size=100,
+        )
+        job.headers = list(data.headers or [])
+        job.total_rows = data.height
+        job.status = ImportJob.Status.RUNNING
+        job.started = timezone.now()
+        job.save(
+            update_fields=["headers", "total_rows", "status", "started", "modified"]
+        )
+
+    import_chunk.delay(job.pk, 0)
+    return True
+
+
+@shared_task(acks_late=True, reject_on_worker_lost=True)
+def import_chunk(job_pk: int, index: int) -> bool:
+    """Import one staged chunk, record its result, and queue the next chunk.
+
+    The resource imports the chunk inside a savepoint and rolls it back when any
+    row fails, as the synchronous import did for the whole file. The job's totals
+    and the deletion of the chunk commit in the enclosing transaction either way,
+    so a rejected chunk is reported rather than retried. The chunk row is locked
+    for that transaction, so two deliveries of the same chunk import it once.
+
+    Args:
+        job_pk: Primary key of the ImportJob.
+        index: Position of the chunk to import.
+
+    Returns:
+        bool: True if the chunk was imported or the job completed.
+    """
+    from .models import ImportJob
+
+    try:
+        job = ImportJob.objects.select_related("dataset").get(pk=job_pk)
+    except ImportJob.DoesNotExist:
+        logger.exception(f"ImportJob {job_pk} does not exist")
+        return False
+
+    if job.status != ImportJob.Status.RUNNING:
+        return False
+
+    if not job.chunks.filter(index=index).exists():
+        return _resume(job_pk)
+
+    try:
+        resource = job.get_resource()
+        with transaction.atomic():
+            chunk = job.chunks.select_for_update().filter(index=index).first()
+            if chunk is None:
+                # Imported by another delivery while this one waited for the lock.
+                return False
+            data = tablib.Dataset(*chunk.rows, headers=job.headers)
+            result = resource.import_data(
+                data,
+                dry_run=False,
+                raise_errors=False,
+                use_transactions=True,
+                rollback_on_validation_errors=True,
+            )
+            job.record_chunk(chunk, result)
+            chunk.delete()
+    except Exception as err:
+        logger.exception(f"ImportJob {job_pk} failed on chunk {index}")
+        job.finish(ImportJob.Status.FAILED, str(err))
+        return False
+
+    import_chunk.delay(job.pk, index + 1)
+    return True
+
+
+def _resume(job_pk: int) -> bool:
+    """Queue the first chunk a running job has left, or complete the job.
+
+    A missing chunk is either the one past the last, or a chunk that committed
+    before its message was redelivered. In the second case the worker may have
+    been lost before it queued the next chunk, so the lowest chunk left is queued
+    again. If that chunk's own message was sent after all, it is still imported
+    once: the chunk row is locked while it imports and deleted when it commits.
+
+    Returns:
+        bool: True if the job was completed.
+    """
+    from .models import ImportJob
+
+    with transaction.atomic():
+        job = ImportJob.objects.select_for_update().get(pk=job_pk)
+        if job.status != ImportJob.Status.RUNNING:
+            return False
+        remaining = job.chunks.order_by("index").values_list("index", flat=True)
+        index = remaining.first()
+        if index is None:
+            job.finish()
+            return True
+
+    import_chunk.delay(job_pk, index)
+    return False
+
+
+@shared_task(soft_time_limit=10 * 60, time_limit=12 * 60)
+def build_dataset_artefacts(dataset_pk: int) -> bool:
+    """Rebuild a dataset's stored downloads (see ``artefacts``).
+
+    Only public datasets have artefacts; a dataset that is no longer public has
+    them removed.
+
+    Args:
+        dataset_pk: Primary key of the Dataset.
+
+    Returns:
+        bool: True if the artefacts were built.
+    """
+    from fairdm.core.models import Dataset
+    from fairdm.utils.choices import Visibility
+
+    from .artefacts import build_artefacts, clear_pending, remove_artefacts
+
+    # Cleared first, so a change made while this build runs queues the next one.
+    clear_pending(dataset_pk)
+    try:
+        dataset = Dataset.all_objects.get(pk=dataset_pk)
+    except Dataset.DoesNotExist:
+        return False
+
+    if dataset.visibility != Visibility.PUBLIC:
+        remove_artefacts(dataset)
+        return False
+
+    build_artefacts(dataset)
+    return True
@@ -1,12 +1,19 @@
-import io
+import hashlib
+import tempfile
 import zipfile
+from collections.abc import Iterable, Iterator
 
 from defusedxml.minidom import parseString
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
+from django.core.files import File
+from django.core.files.storage import default_storage
+from django.db.models import Count, Max
 from django.template.loader import render_to_string
 from import_export.formats.base_formats import DEFAULT_FORMATS
 
+from .streaming import DEFAULT_CHUNK_SIZE, Spool, stream_export
+
 
 def get_formats():
     """Returns the available formats."""
@@ -35,9 +42,17 @@ import_choices = {f: f for f in get_import_formats()}
 # export_file_extensions = {f().get_title(): f().get_extension() for f in get_export_formats()}
 
 
-def build_metadata(dataset, request):
+def build_metadata(dataset, request=None):
+    """The dataset's DataCite XML, pretty-printed.
+
+    Without a request, as when built by a worker, the dataset's address is formed
+    from ``SITE_DOMAIN``.
+    """
     template_name = "publishing/datacite44.xml"
-    uri = request.build_absolute_uri(dataset.get_absolute_url())
+    if request is None:
+        uri = f"https://{settings.SITE_DOMAIN}{dataset.get_absolute_url()}"
+    else:
+        uri = request.build_absolute_uri(dataset.get_absolute_url())
     xml = render_to_string(
         template_name, {"dataset": dataset, "uri": uri}, request=request
     )
@@ -56,66 +71,165 @@ def build_export_for_datatype(dataset, queryset, fmt="csv"):
     return tablib_dataset.export(fmt)
 
 
+def types_in(related) -> list:
+    """The concrete model of every polymorphic type present in ``related``."""
+    ctype_ids = related.order_by().values_list("polymorphic_ctype", flat=True)
+    return [
+        ctype.model_class()
+        for ctype in ContentType.objects.filter(id__in=ctype_ids.distinct())
+    ]
+
+
+def export_table(dataset, model, chunk_size=DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+    """The dataset's records of exactly ``model`` as CSV, streamed in chunks.
+
+    Exactly this type: a subtype's rows belong in the subtype's own table.
+    """
+    from fairdm.registry import registry
+
+    ctype = ContentType.objects.get_for_model(model, for_concrete_model=False)
+    qs = model.objects.filter(dataset=dataset, polymorphic_ctype=ctype)
+    resource = registry.get_for_model(model).get_resource_class()(dataset=dataset)
+    return stream_export(resource, qs, "csv", chunk_size)
+
+
+def get_package_version(dataset) -> str:
+    """A token that changes whenever the dataset's package could have.
+
+    ``dataset.modified`` alone is not enough: adding or editing a sample leaves
+    the dataset row untouched. The latest change and the count of its samples and
+    measurements cover edits, additions and deletions, in two aggregate queries.
+    """
+    parts = [dataset.modified.isoformat()]
+    for related in (dataset.samples, dataset.measurements):
+        stats = related.order_by().aggregate(count=Count("pk"), latest=Max("modified"))
+        parts += [str(stats["count"]), str(stats["latest"])]
+    return hashlib.sha256("|".join(parts).encode()).hexdigest()[:16]
+
+
 class DataPackage:
-    def __init__(self, dataset, request):
+    """A dataset's download package: licence, readme, metadata and one CSV per type.
+
+    The archive is written as it is read. :meth:`stream` yields the ZIP a piece at
+    a time, each data member encoded from a chunked queryset iterator, so neither
+    the archive nor any one CSV is ever held whole in memory. :meth:`build_package`
+    collects the same stream into a temporary file that spills to disk, and
+    :meth:`cached` keeps that file on storage for as long as the dataset is
+    unchanged.
+    """
+
+    #: Bytes a built package is held in memory before it spills to disk.
+    spool_max_size = 8 * 1024 * 1024
+
+    #: Storage directory for cached packages, one subdirectory per dataset.
+    cache_dir = "packages"
+
+    def __init__(self, dataset, request, chunk_size=DEFAULT_CHUNK_SIZE):
         self.dataset = dataset
         self.request = request
+        self.chunk_size = chunk_size
+
+    def members(self) -> Iterator[tuple[str, bytes | str | Iterable[bytes]]]:
+        """Each archive member as ``(name, content)``, content whole or as chunks."""
+        yield from self.add_license()
+        yield from self.add_readme()
+        yield from self.add_metadata()
+        yield from self.add_samples()
+        yield from self.add_measurements()
+
+    def stream(self) -> Iterator[bytes]:
+        """The ZIP archive, handed on as it is written.
+
+        ``zipfile`` writes to a sink that cannot seek by putting each member's
+        sizes in a trailing data descriptor, which is what lets a member be
+        written before its length is known. Data members are always ZIP64, as a
+        CSV of unknown length may pass 4 GiB.
+        """
+        spool = Spool()
+        with zipfile.ZipFile(spool, "w", zipfile.ZIP_DEFLATED) as zip_file:
+            for name, content in self.members():
+                if isinstance(content, (bytes, str)):
+                    zip_file.writestr(name, content)
+                else:
+                    with zip_file.open(name, "w", force_zip64=True) as member:
+                        for chunk in content:
+                            member.write(chunk)
+                            if data := spool.drain():
+                                yield data
+                if data := spool.drain():
+                    yield data
+        yield spool.drain()
 
     def build_package(self):
-        buffer = io.BytesIO()
-        with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as zip_file:
-            # Add files to the ZIP
-            self.add_license(zip_file)
-            self.add_readme(zip_file)
-            self.add_metadata(zip_file)
-            self.add_samples(zip_file)
-            self.add_measurements(zip_file)
-
-        buffer.seek(0)  # Rewind the buffer for reading
-        return buffer
-
-    def add_license(self, zip_file):
+        """The whole archive in a rewound temporary file, spilled to disk when large.
+
+        The caller owns the file and closes it; it is closed here only if the
+        archive cannot be built.
+        """
+        # Handed to the caller open, so not a context manager here.
+        package = tempfile.SpooledTemporaryFile(max_size=self.spool_max_size)  # noqa: SIM115
+        try:
+            for chunk in self.stream():
+                package.write(chunk)
+        except BaseException:
+            package.close()
+            raise
+        package.seek(0)
+        return package
+
+    def get_cache_name(self) -> str:
+        version = get_package_version(self.dataset)
+        return f"{self.cache_dir}/{self.dataset.uuid}/{version}.zip"
+
+    def cached(self, storage=None):
+        """The stored package for the dataset as it is now, built first if missing.
+
+        Packages of earlier versions of the dataset are removed when a new one is
+        stored, so each dataset keeps one.
+        """
+        storage = storage or default_storage
+        name = self.get_cache_name()
+        if not storage.exists(name):
+            with self.build_package() as package:
+                name = storage.save(name, File(package))
+            self._prune(storage, name)
+        return storage.open(name, "rb")
+
+    def _prune(self, storage, keep: str) -> None:
+        directory, current = keep.rsplit("/", 1)
+        try:
+            _, files = storage.listdir(directory)
+        except (NotImplementedError, FileNotFoundError):
+            return
+        for filename in files:
+            if filename != current:
+                storage.delete(f"{directory}/{filename}")
+
+    def add_license(self):
         """Add the license for the dataset."""
         if self.dataset.license:
-            zip_file.writestr("license.txt", self.dataset.license.text)
+            yield "license.txt", self.dataset.license.text
 
-    def add_readme(self, zip_file):
+    def add_readme(self):
         """Add a readme file to the ZIP."""
-        zip_file.writestr("readme.txt", "This is a dynamically generated ZIP file.")
+        yield "readme.txt", "This is a dynamically generated ZIP file."
 
-    def add_metadata(self, zip_file):
+    def add_metadata(self):
         """Add XML metadata files to the ZIP."""
-        zip_file.writestr("metadata.xml", build_metadata(self.dataset, self.request))
-
-    def add_samples(self, zip_file):
-        """Add the samples to the ZIP."""
-
-        # get a list of all sample types collected by this dataset
-        sample_types = self.dataset.samples.values_list("polymorphic_ctype", flat=True)
-
-        ctypes = ContentType.objects.filter(id__in=sample_types)
-
-        # for each sample type, create a separate export file
-        for model_ctype in ctypes:
-            model = model_ctype.model_class()
-            qs = model.objects.filter(dataset=self.dataset)
-            export = build_export_for_datatype(self.dataset, qs)
-            zip_file.writestr(f"samples/{model._meta.verbose_name_plural}.csv", export)
-
-    def add_measurements(self, zip_file):
-        """Add the measurements to the ZIP."""
-        # get a list of all sample types collected by this dataset
-        measurements = self.dataset.measurements.values_list(
-            "polymorphic_ctype", flat=True
-        )
-
-        ctypes = ContentType.objects.filter(id__in=measurements)
-
-        # for each measurements type, create a separate export file
-        for model_ctype in ctypes:
-            model = model_ctype.model_class()
-            qs = model.objects.filter(dataset=self.dataset)
-            export = build_export_for_datatype(self.dataset, qs)
-            zip_file.writestr(
-                f"measurements/{model._meta.verbose_name_plural}.csv", export
+        yield "metadata.xml", build_metadata(self.dataset, self.request)
+
+    def _export_types(self, related, folder):
+        """One CSV member per concrete type found in ``related``, streamed in chunks."""
+        for model in types_in(related):
+            yield (
+                f"{folder}/{model._meta.verbose_name_plural}.csv",
+                export_table(self.dataset, model, self.chunk_size),
             )
+
+    def add_samples(self):
+        """Add the samples to the ZIP, one file per sample type."""
+        return self._export_types(self.dataset.samples, "samples")
+
+    def add_measurements(self):
+        """Add the measurements to the ZIP, one file per measurement type."""
+        return self._export_types(self.dataset.measurements, "measurements")
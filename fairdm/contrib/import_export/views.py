@@ -1,12 +1,17 @@
-from io import StringIO
+import hashlib
 
 from braces.views import MessageMixin
 from django import forms
+from django.conf import settings
 from django.core.files.base import ContentFile
+from django.db import transaction
+from django.http import FileResponse, Http404, HttpResponse, StreamingHttpResponse
+from django.utils.cache import get_conditional_response
 from django.utils.decorators import method_decorator
+from django.utils.http import content_disposition_header
 from django.utils.translation import gettext as _
 from django.views.decorators.http import require_POST
-from django.views.generic import FormView
+from django.views.generic import FormView, View
 from django.views.generic.detail import SingleObjectMixin
 from django_downloadview import VirtualDownloadView
 
@@ -17,8 +22,16 @@ from fairdm.registry import registry
 from fairdm.utils.utils import user_guide
 from fairdm.views import FairDMModelFormMixin
 
+from .artefacts import artefact_response, current_artefact
 from .forms import ExportForm, ImportForm
-from .utils import DataPackage, get_export_formats, get_import_formats
+from .models import DatasetArtefact, ImportJob
+from .tasks import stage_import
+from .utils import (
+    DataPackage,
+    export_table,
+    get_export_formats,
+    get_import_formats,
+)
 
 
 class BaseImportExportView(MessageMixin, FormView):
@@ -31,17 +44,12 @@ class BaseImportExportView(MessageMixin, FormView):
     model = Dataset
     form_class = None
     success_url = None
-    import_kwargs = {}
 
     def get_context_data(self, **kwargs):
-        context = super().get_context_data()
+        context = super().get_context_data(**kwargs)
         context["export_formats"] = self.export_formats
         context["import_formats"] = self.import_formats
         context["data_type"] = self.get_resource_model()._meta.verbose_name_plural
-        context["result"] = kwargs.get("result")
-        context["import_error_display"] = ["message"]
-        if self.request.user.is_superuser:
-            context["import_error_display"].extend(["row", "traceback"])
         return context
 
     @property
@@ -79,18 +87,17 @@ class BaseImportExportView(MessageMixin, FormView):
 
         if not self.dtype:
             # Default to the first registered model if no type is provided
-            if not registry.all:
+            if not registry.samples:
                 raise ValueError("No models are registered in the FairDMRegistry.")
-            self.meta = registry.samples[0]
-            self.dtype = f"{self.meta['app_label']}.{self.meta['model']}"  # Ensures dtype is still assigned
-        else:
-            # Retrieve the model metadata from the registry
-            result = registry.get_for_model(self.dtype)
-            if not result:
-                raise ValueError(f"This data type is not supported: {self.dtype}")
-            self.meta = result
+            model = registry.samples[0]
+            self.dtype = model._meta.label_lower  # Ensures dtype is still assigned
+            return model
 
-        return self.meta["class"]
+        # Retrieve the model from the registry
+        try:
+            return registry.get_for_model(self.dtype).model
+        except (KeyError, ValueError, LookupError):
+            raise ValueError(f"This data type is not supported: {self.dtype}") from None
 
     def get_resource_qs(self):
         return self.resource_model.objects.filter(dataset=self.get_object())
@@ -102,25 +109,9 @@ class BaseImportExportView(MessageMixin, FormView):
             raise ValueError(f"Unsupported file format: {extension}")
         return fmt(encoding=self.from_encoding)
 
-    def result_has_errors(self, result, form):
-        context = self.get_context_data(form=form, result=result)
-        context["about"] = [
-            _(
-                "The import process encountered errors. Please review the details below and correct any issues in your data file before reuploading."
-            )
-        ]
-        return self.render_to_response(context)
-
     def form_invalid(self, form):
         return super().form_invalid(form)
 
-    def get_import_kwargs(self):
-        """
-        Returns a dictionary of keyword arguments for the import process.
-        This can be overridden in subclasses to customize the import behavior.
-        """
-        return self.import_kwargs.copy()
-
 
 class DataImportView(BaseImportExportView):
     name = "import"
@@ -143,11 +134,6 @@ class DataImportView(BaseImportExportView):
     }
     form_class = ImportForm
     template_name = "import_export/import.html"
-    import_kwargs = {
-        "dry_run": False,
-        "raise_errors": False,
-        "rollback_on_validation_errors": True,
-    }
 
     @staticmethod
     def check(request, instance, **kwargs):
@@ -158,32 +144,35 @@ class DataImportView(BaseImportExportView):
 
     def form_valid(self, form):
         file = form.cleaned_data["file"]
-        result = self.handle_import(file)
-
-        if (result and result.has_errors()) or result.has_validation_errors():
-            self.messages.error("There were errors in the import.")
-            #     # raise ValueError(result.errors) # DEBUG ONLY
-            return self.result_has_errors(result, form)
-        else:
-            self.messages.success("Data imported successfully.")
-
+        try:
+            self.get_dataset_format(file)
+        except ValueError as err:
+            form.add_error("file", str(err))
+            return self.form_invalid(form)
+
+        self.job = self.queue_import(file)
+        self.messages.success(
+            _("Your file has been uploaded and will be imported in the background.")
+        )
         return super().form_valid(form)
 
-    # @method_decorator(require_POST)
-    def handle_import(self, file):
-        # Process and import the data
-        resource = self.get_resource()
-        input_format = self.get_dataset_format(file)
-        if not input_format:
-            return None
-
-        None if input_format.is_binary() else self.from_encoding
-        # Open the file in text mode and read the content
-        file_content = file.read()  # Decode bytes to string
+    def queue_import(self, file):
+        """Store the upload as an import job and hand it to a worker.
 
-        dataset = input_format.create_dataset(file_content)
-        print(self.get_import_kwargs())
-        return resource.import_data(dataset, **self.get_import_kwargs())
+        Nothing is parsed here. The task is queued once this request's transaction
+        commits (``ATOMIC_REQUESTS``), so the worker never looks for a job that is
+        not yet visible to it.
+        """
+        job = ImportJob.objects.create(
+            dataset=self.get_object(),
+            data_type=self.dtype,
+            file=file,
+            input_format=file.name.rsplit(".", 1)[-1].lower(),
+            created_by=self.request.user,
+            chunk_size=getattr(settings, "FAIRDM_IMPORT_CHUNK_SIZE", 1000),
+        )
+        transaction.on_commit(lambda: stage_import.delay(job.pk))
+        return job
 
     def get_success_url(self):
         return self.get_object().get_absolute_url()
@@ -265,29 +254,111 @@ class DataExportView(VirtualDownloadView, BaseImportExportView):
         return self.export_formats[self.format]()
 
 
-class DatasetPackageDownloadView(SingleObjectMixin, VirtualDownloadView):
+class DatasetPackageDownloadView(SingleObjectMixin, View):
+    """The dataset's ZIP package, streamed as it is written.
+
+    A prebuilt package (``FAIRDM_DATASET_ARTEFACTS``) is served as a stored file
+    while it is current. Otherwise, with ``FAIRDM_DATA_PACKAGE_CACHE`` enabled the
+    package is kept on storage for as long as the dataset is unchanged, so repeated
+    downloads are served as a stored file instead of being rebuilt.
+    """
+
     model = Dataset
+    slug_field = "uuid"
+    slug_url_kwarg = "uuid"
+
+    def get(self, request, *args, **kwargs):
+        self.object = self.get_object()
+        filename = self.get_basename()
+
+        artefact = current_artefact(self.object, DatasetArtefact.Kind.PACKAGE)
+        if artefact is not None:
+            return artefact_response(request, artefact, filename, "application/zip")
+
+        package = DataPackage(self.object, request)
+        if getattr(settings, "FAIRDM_DATA_PACKAGE_CACHE", False):
+            return FileResponse(
+                package.cached(),
+                as_attachment=True,
+                filename=filename,
+                content_type="application/zip",
+            )
 
-    def get_file(self):
-        """Return :class:`django.core.files.base.ContentFile` object."""
-        return DataPackage(self.get_object(), self.request).build_package()
+        response = StreamingHttpResponse(
+            package.stream(), content_type="application/zip"
+        )
+        response["Content-Disposition"] = content_disposition_header(True, filename)
+        return response
 
     def get_basename(self):
-        return f"{self.get_object()}.zip"
+        return f"{self.object}.zip"
 
-    def get_content_type(self, file):
-        """Define the MIME type for the ZIP file."""
-        return "application/zip"
 
+class MetadataDownloadView(SingleObjectMixin, View):
+    """The dataset's DataCite XML.
 
-class MetadataDownloadView(VirtualDownloadView):
-    template_name = "publishing/datacite44.xml"
+    Served from the prebuilt artefact while it is current, and rendered otherwise.
+    Either way the response carries an ``ETag`` of its content, so a harvester
+    polling an unchanged dataset is answered with a 304.
+    """
 
-    def get_file(self):
-        return StringIO(build_metadata(self.get_object(), self.request))
+    model = Dataset
+    slug_field = "uuid"
+    slug_url_kwarg = "uuid"
+    content_type = "application/xml"
+
+    def get(self, request, *args, **kwargs):
+        self.object = self.get_object()
+        filename = self.get_basename()
+
+        artefact = current_artefact(self.object, DatasetArtefact.Kind.METADATA)
+        if artefact is not None:
+            return artefact_response(request, artefact, filename, self.content_type)
+
+        xml = build_metadata(self.object, request)
+        etag = f'"{hashlib.sha256(xml.encode()).hexdigest()}"'
+        not_modified = get_conditional_response(request, etag=etag)
+        if not_modified is not None:
+            return not_modified
+
+        response = HttpResponse(xml, content_type=self.content_type)
+        response["Content-Disposition"] = content_disposition_header(True, filename)
+        response["ETag"] = etag
+        return response
 
     def get_basename(self):
-        return f"{self.get_object()}.xml"
+        return f"{self.object}.xml"
+
+
+class DatasetTableDownloadView(SingleObjectMixin, View):
+    """One record type of the dataset as CSV, as it appears in the package.
+
+    ``label`` is the model as ``app_label.model``. Served from the prebuilt
+    artefact while it is current, and streamed from the database otherwise.
+    """
+
+    model = Dataset
+    slug_field = "uuid"
+    slug_url_kwarg = "uuid"
+
+    def get(self, request, *args, **kwargs):
+        self.object = self.get_object()
+        label = self.kwargs["label"].lower()
+        try:
+            model = registry.get_for_model(label).model
+        except (KeyError, ValueError, LookupError):
+            raise Http404(f"No such data type: {label}") from None
+        filename = f"{model._meta.verbose_name_plural}.csv"
+
+        artefact = current_artefact(self.object, DatasetArtefact.Kind.TABLE, label)
+        if artefact is not None:
+            return artefact_response(request, artefact, filename, "text/csv")
+
+        response = StreamingHttpResponse(
+            export_table(self.object, model), content_type="text/csv"
+        )
+        response["Content-Disposition"] = content_disposition_header(True, filename)
+        return response
 
 
 class UploadForm(forms.Form):
@@ -1,6 +1,5 @@
 from django.core.exceptions import ImproperlyConfigured
-from django.utils.decorators import method_decorator
-from django.views.decorators.cache import cache_page
+from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.response import Response
 
 try:
@@ -15,9 +14,8 @@ except ModuleNotFoundError as exc:
     ) from exc
 
 from fairdm.api.serializers import BaseSerializerMixin
-from fairdm.api.utils import DjangoFilterBackend
 from fairdm.api.viewsets import BaseViewSet
-from fairdm.contrib.samples.models import Sample
+from fairdm.core.models import Sample
 
 from .serializers import GeoFeatureSerializer
 
@@ -40,7 +38,6 @@ class GeoJsonViewset(BaseViewSet):
     distance_ordering_filter_field = "point"
     filter_backends = (DjangoFilterBackend,)
 
-    @method_decorator(cache_page(60 * 60 * 2))
     def list(self, request, *args, **kwargs):
         if self.is_geojson():
             qs = self.filter_queryset(self.get_queryset())
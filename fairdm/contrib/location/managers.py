@@ -1,26 +1,155 @@
-from django.contrib.gis.db import models
+"""Spatial queries over locations, without PostGIS.
 
-# from django.contrib.gis.utils import LayerMapping
-from django.contrib.postgres.aggregates import JSONBAgg
+Coordinates are stored as decimal longitude (``x``) and latitude (``y``) in
+degrees. Box queries are answered from the indexed ``geohash`` column (see
+:mod:`fairdm.contrib.location.geohash`) and then trimmed exactly on ``x`` and
+``y``; distances are great-circle distances on a sphere, computed in SQL. This
+works on any database, so portals do not need GDAL or PostGIS to put their
+samples on a map.
+"""
 
-from fairdm.db.gis.functions import AsGeoFeature
+from __future__ import annotations
 
+import math
+from functools import reduce
+from operator import or_
 
-class PointManager(models.QuerySet):
-    def with_distance(self, point):
-        return self.annotate(distance=models.Distance("geom", point))
+from django.db.models import FloatField, Q, Value
+from django.db.models.functions import (
+    ASin,
+    Cast,
+    Cos,
+    Least,
+    Power,
+    Radians,
+    Sin,
+    Sqrt,
+)
 
-    def get_feature(self, *args, **kwargs):
-        return self.annotate(feature=AsGeoFeature(*args)).get(*args, **kwargs)
+from fairdm.db.models import QuerySet
 
-    def features(self, *args):
-        if not args:
-            args = [f.name for f in self.model._meta.fields]
-        return self.annotate(feature=AsGeoFeature(*args))
+from . import geohash
 
-    def feature_collection(self, *args):
-        return self.features(*args).aggregate(features=JSONBAgg("feature"))
+#: The mean radius of the Earth, in kilometres.
+EARTH_RADIUS_KM = 6371.0088
 
-    def as_feature_collection(self, *args):
-        """Converts a queryset in a geojson spec FeatureCollection"""
-        return dict(type="FeatureCollection", **self.feature_collection())
+#: Half the Earth's circumference: no two points are further apart.
+MAX_DISTANCE_KM = math.pi * EARTH_RADIUS_KM
+
+_KM_PER_DEGREE = math.pi * EARTH_RADIUS_KM / 180
+
+
+def parse_bbox(value: str) -> tuple[float, float, float, float]:
+    """The ``west, south, east, north`` degrees of a comma-separated box.
+
+    Raises:
+        ValueError: When ``value`` is not four finite numbers, or its latitudes
+            are out of range or reversed.
+    """
+    west, south, east, north = (float(part) for part in value.split(","))
+    if not all(math.isfinite(v) for v in (west, south, east, north)):
+        raise ValueError("coordinates must be finite numbers")
+    if not -90 <= south <= north <= 90:
+        raise ValueError("latitudes must be within -90 to 90, south first")
+    return west, south, east, north
+
+
+def parse_near(point: str, radius: str) -> tuple[float, float, float]:
+    """The ``x, y`` degrees of a comma-separated point, and a radius in km.
+
+    Raises:
+        ValueError: When ``point`` is not two finite numbers, or ``radius`` is
+            not one.
+    """
+    x, y = (float(part) for part in point.split(","))
+    km = float(radius)
+    if not all(math.isfinite(v) for v in (x, y, km)):
+        raise ValueError("coordinates and radius must be finite numbers")
+    return x, y, km
+
+
+def _wrap(longitude: float) -> float:
+    if -180 <= longitude <= 180:
+        return longitude
+    return (longitude + 180) % 360 - 180
+
+
+def _radians(name):
+    return Radians(Cast(name, FloatField()))
+
+
+class PointQuerySet(QuerySet):
+    def within_bbox(self, west, south, east, north):
+        """The points inside a box, given in degrees.
+
+        A box whose ``west`` edge lies east of its ``east`` edge crosses the
+        antimeridian, and is searched as two boxes either side of it.
+        """
+        west, south, east, north = (float(v) for v in (west, south, east, north))
+        if east - west >= 360:
+            west, east = -180.0, 180.0
+        else:
+            west, east = _wrap(west), _wrap(east)
+        if west > east:
+            boxes = [(west, south, 180.0, north), (-180.0, south, east, north)]
+        else:
+            boxes = [(west, south, east, north)]
+        return self.filter(reduce(or_, (self._box(*box) for box in boxes)))
+
+    @staticmethod
+    def _box(west, south, east, north) -> Q:
+        exact = Q(x__gte=west, x__lte=east, y__gte=south, y__lte=north)
+        cells = geohash.covering(west, south, east, north)
+        if not cells:
+            return exact
+        return exact & reduce(or_, (Q(geohash__startswith=cell) for cell in cells))
+
+    def with_distance(self, x, y):
+        """Annotate each point with its ``distance`` in kilometres from ``x, y``."""
+        lat = math.radians(float(y))
+        half_dlat = (_radians("y") - Value(lat)) / 2
+        half_dlon = (_radians("x") - Value(math.radians(float(x)))) / 2
+        a = Power(Sin(half_dlat), 2) + Value(math.cos(lat)) * Cos(
+            _radians("y")
+        ) * Power(Sin(half_dlon), 2)
+        return self.annotate(
+            distance=Value(2 * EARTH_RADIUS_KM)
+            * ASin(Sqrt(Least(a, Value(1.0), output_field=FloatField())))
+        )
+
+    def within_radius(self, x, y, km):
+        """The points within ``km`` kilometres of ``x, y``, annotated with their
+        ``distance``.
+
+        The box around the circle is searched first, so only the points in it
+        have their distance computed.
+        """
+        x, y, km = float(x), float(y), float(km)
+        dlat = km / _KM_PER_DEGREE
+        south, north = max(y - dlat, -90.0), min(y + dlat, 90.0)
+        if south == -90 or north == 90:
+            west, east = -180.0, 180.0
+        else:
+            # The widest the circle gets, at the latitude furthest from the equator.
+            dlon = dlat / math.cos(math.radians(max(abs(south), abs(north))))
+            west, east = (-180.0, 180.0) if dlon >= 180 else (x - dlon, x + dlon)
+        return (
+            self.within_bbox(west, south, east, north)
+            .with_distance(x, y)
+            .filter(distance__lte=km)
+        )
+
+    def nearest(self, x, y, k: int = 10, start_km: float = 10.0):
+        """The ``k`` points nearest ``x, y``, nearest first, with their ``distance``.
+
+        Searches a circle of ``start_km`` kilometres, widening it fourfold until
+        it holds ``k`` points or covers the globe.
+        """
+        km = start_km
+        while km < MAX_DISTANCE_KM and self.within_radius(x, y, km).count() < k:
+            km *= 4
+        if km < MAX_DISTANCE_KM:
+            nearby = self.within_radius(x, y, km)
+        else:
+            nearby = self.with_distance(x, y)
+        return nearby.order_by("distance", "pk")[:k]
@@ -0,0 +1,30 @@
+# Generated by Django 5.2.12 on 2026-10-16 16:05
+
+from django.db import migrations, models
+
+from fairdm.contrib.location.geohash import encode
+
+
+def fill_geohashes(apps, schema_editor):
+    Point = apps.get_model("fairdm_location", "Point")
+    points = list(Point.objects.only("x", "y"))
+    for point in points:
+        point.geohash = encode(point.x, point.y)
+    Point.objects.bulk_update(points, ["geohash"], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('fairdm_location', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='point',
+            name='geohash',
+            field=models.CharField(db_index=True, default='', editable=False, help_text='The geohash of the location, which indexes spatial queries.', max_length=10, verbose_name='geohash'),
+            preserve_default=False,
+        ),
+        migrations.RunPython(fill_geohashes, migrations.RunPython.noop),
+    ]
@@ -2,10 +2,15 @@ from django.conf import settings
 from django.contrib import admin
 from django.urls import reverse
 from django.utils.translation import gettext as _
+from django_lifecycle import BEFORE_SAVE, hook
 
 from fairdm.core.models import Measurement
 from fairdm.db import models
 
+from .geohash import PRECISION as GEOHASH_PRECISION
+from .geohash import encode as encode_geohash
+from .managers import PointQuerySet
+
 X_OPTS = settings.FAIRDM_X_COORD
 Y_OPTS = settings.FAIRDM_Y_COORD
 
@@ -36,6 +41,15 @@ class Point(models.Model):
         default=settings.FAIRDM_CRS,
         editable=False,
     )
+    geohash = models.CharField(
+        verbose_name=_("geohash"),
+        help_text=_("The geohash of the location, which indexes spatial queries."),
+        max_length=GEOHASH_PRECISION,
+        db_index=True,
+        editable=False,
+    )
+
+    objects = PointQuerySet.as_manager()  # type: ignore[assignment,misc]
 
     class Meta:
         verbose_name = _("location")
@@ -46,6 +60,10 @@ class Point(models.Model):
         """Returns the string representation of this site"""
         return f"{self.latitude}, {self.longitude}"
 
+    @hook(BEFORE_SAVE)
+    def set_geohash(self):
+        self.geohash = encode_geohash(self.x, self.y)
+
     def point2d(self):
         return {"type": "Point", "coordinates": [self.x, self.y]}
 
@@ -0,0 +1,92 @@
+"""Clustered map tiles of sample locations.
+
+A map of every sample in a portal cannot be drawn from one GeoJSON document of
+every sample. Instead, the map asks for the tiles it shows, in the usual
+``{z}/{x}/{y}`` web map scheme, and each tile holds clusters rather than samples:
+the samples in the tile are grouped by the geohash cell of their location, with
+cells about an eighth of the tile wide, so a tile holds at most a few hundred
+features whatever the zoom. See :mod:`fairdm.contrib.location.geohash`.
+
+A cluster is a GeoJSON point feature at the mean position of its samples, with
+their ``count``. A cluster of one sample also carries the sample's ``uuid``.
+"""
+
+from __future__ import annotations
+
+import math
+
+from django.db.models import Avg, Count, FloatField, Min
+from django.db.models.functions import Cast, Substr
+
+from . import geohash
+from .models import Point
+
+#: The deepest zoom level served.
+MAX_ZOOM = 22
+
+#: Clusters across a tile's width.
+CLUSTERS_PER_TILE = 8
+
+
+def tile_bounds(z: int, x: int, y: int) -> tuple[float, float, float, float]:
+    """The ``west, south, east, north`` degrees of a web map tile.
+
+    Tiles in the top and bottom rows reach the poles, so no location falls
+    outside every tile.
+    """
+    n = 2**z
+
+    def latitude(row):
+        return math.degrees(math.atan(math.sinh(math.pi * (1 - 2 * row / n))))
+
+    north = 90.0 if y == 0 else latitude(y)
+    south = -90.0 if y == n - 1 else latitude(y + 1)
+    return x / n * 360 - 180, south, (x + 1) / n * 360 - 180, north
+
+
+def cluster_precision(z: int) -> int:
+    """The geohash length whose cells are about ``1 / CLUSTERS_PER_TILE`` of a tile."""
+    target = 360 / 2**z / CLUSTERS_PER_TILE
+    for precision in range(1, geohash.PRECISION + 1):
+        if geohash.cell_size(precision)[0] <= target:
+            return precision
+    return geohash.PRECISION
+
+
+def sample_tile(samples, z: int, x: int, y: int) -> dict:
+    """The clustered samples of one tile, as a GeoJSON FeatureCollection.
+
+    Args:
+        samples: The samples to draw, already narrowed to those the user may see.
+        z, x, y: The tile.
+    """
+    points = Point.objects.within_bbox(*tile_bounds(z, x, y))
+    clusters = (
+        samples.filter(location__in=points.values("pk"))
+        .order_by()
+        .values(cell=Substr("location__geohash", 1, cluster_precision(z)))
+        .annotate(
+            count=Count("pk"),
+            lon=Avg(Cast("location__x", FloatField())),
+            lat=Avg(Cast("location__y", FloatField())),
+            # Any one uuid will do; it is only read for a cluster of one.
+            first_uuid=Min("uuid"),
+        )
+        .order_by("cell")
+    )
+    features = []
+    for cluster in clusters:
+        properties = {"count": cluster["count"]}
+        if cluster["count"] == 1:
+            properties["uuid"] = cluster["first_uuid"]
+        features.append(
+            {
+                "type": "Feature",
+                "geometry": {
+                    "type": "Point",
+                    "coordinates": [cluster["lon"], cluster["lat"]],
+                },
+                "properties": properties,
+            }
+        )
+    return {"type": "FeatureCollection", "features": features}
@@ -1,14 +1,11 @@
-import json
 from decimal import ROUND_DOWN, ROUND_HALF_UP, Decimal
 
-from django.contrib.gis.measure import Distance
 from django.core.exceptions import ValidationError
-from django.db.models import F, Max, Min
+from django.db.models import Max, Min
 
 from .models import Point
 
 # from rest_framework_gis.filters import DistanceToPointFilter
-# from fairdm.contrib.samples.serializers import SampleGeojsonSerializer
 
 
 def normalize_coordinate(value, precision=5, coerce=str):
@@ -45,16 +42,34 @@ def normalize_coordinate(value, precision=5, coerce=str):
     return coerce(rounded)
 
 
-def serialize_dataset_samples(self, dataset):
-    qs = dataset.samples.annotate(geom=F("location__point"))  # noqa: F841
-    # serializer = SampleGeojsonSerializer(qs, many=True)
-    # return {str(dataset.uuid): json.dumps(serializer.data)}
-    return {str(dataset.uuid): json.dumps([])}
+def serialize_dataset_samples(dataset):
+    """Serializes the located samples of a dataset as a GeoJSON FeatureCollection.
+
+    Suits a single dataset's map; portal-wide maps should request clustered tiles
+    from the API instead (see `fairdm.contrib.location.tiles`).
+    """
+    samples = dataset.samples.filter(location__isnull=False).values_list(
+        "uuid", "name", "location__x", "location__y"
+    )
+    features = [
+        {
+            "type": "Feature",
+            "geometry": {"type": "Point", "coordinates": [float(x), float(y)]},
+            # A string, as in the tiles, so both serialise to the same payload
+            "properties": {"uuid": str(uuid), "name": name},
+        }
+        for uuid, name, x, y in samples.order_by("pk")
+    ]
+    return {"type": "FeatureCollection", "features": features}
 
 
 def get_sites_within(location, radius=25):
-    """Gets nearby sites within {radius} km radius"""
-    Point.objects.filter(point__distance_lt=(location.point, Distance(km=radius)))
+    """Gets the other sites within {radius} km of a location, nearest first"""
+    return (
+        Point.objects.within_radius(location.x, location.y, radius)
+        .exclude(pk=location.pk)
+        .order_by("distance")
+    )
 
 
 def locations_for_dataset(dataset):
@@ -49,8 +49,9 @@ def has_perm(request: HttpRequest, permission: str, obj: Model | None = None) ->
     ``guardian.utils.get_40x_or_None`` uses for the same reason.
 
     Exported because the memo is only worth having if plugin predicates use it too — a record page
-    evaluates every registered plugin, and an unmemoised object-level check costs several queries
-    each time.
+    evaluates every registered plugin. Below the memo, object-level checks are answered from the
+    user's cached permission snapshot (``fairdm.core.permission_cache``), so a miss here costs no
+    query either once the snapshot is warm.
     """
     cache: dict[tuple[Any, ...], bool] = getattr(request, _MEMO_ATTR, None)
     if cache is None:
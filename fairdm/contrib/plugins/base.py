@@ -12,6 +12,9 @@ from django.forms.widgets import Media
 from django.urls import URLPattern, path
 from django.views.generic.base import View
 
+from fairdm.core.instrumentation import span
+from fairdm.core.utils import get_non_polymorphic_instance
+
 from .access import can_open
 
 if TYPE_CHECKING:
@@ -76,6 +79,21 @@ class Plugin(PermissionRequiredMixin, View):
 
         return slugify(cls.__name__)
 
+    def dispatch(self, request, *args, **kwargs):
+        """Serve the request inside a ``plugin.<name>`` span of the request's trace.
+
+        Resolving the record and building the context are timed as spans of their own,
+        so an instrumented request shows which plugin its time went to and where.
+        """
+        model = self.registered_model
+        with span(
+            f"plugin.{self.get_name()}",
+            "plugin",
+            plugin=self.get_name(),
+            model=model._meta.label if model else "",
+        ):
+            return super().dispatch(request, *args, **kwargs)
+
     @classmethod
     def get_url_path(cls) -> str | None:
         """Get the URL path segment.
@@ -148,7 +166,8 @@ class Plugin(PermissionRequiredMixin, View):
         from django.http import Http404
 
         try:
-            return self.get_base_object()
+            with span(f"plugin.{self.get_name()}.base_object"):
+                return self.get_base_object()
         except Http404:
             # A record that does not exist is a 404, not an absent record. Swallowing it here is
             # what turned a missing sample into a 500 further along.
@@ -167,7 +186,7 @@ class Plugin(PermissionRequiredMixin, View):
             Http404: if no such record exists
             ValueError: if the mount is missing, which is a wiring mistake rather than a bad request
         """
-        from django.shortcuts import get_object_or_404
+        from fairdm.core.records import resolve_record
 
         from .registration import registry
 
@@ -201,8 +220,13 @@ class Plugin(PermissionRequiredMixin, View):
         # declare `dataset.change_dataset`). `all_objects`, where a model has one, is the
         # explicit unfiltered route (see 004-core-datasets R1); models without one keep the
         # default manager unchanged.
-        manager = getattr(self.registered_model, "all_objects", self.registered_model)
-        return get_object_or_404(manager, **filters)
+        # The record is resolved once per request and shared with every other plugin,
+        # related view and permission check that asks for it (see `fairdm.core.records`).
+        manager = (
+            "all_objects" if hasattr(self.registered_model, "all_objects") else None
+        )
+        request = getattr(self, "request", None)
+        return resolve_record(request, self.registered_model, manager, **filters).typed
 
     def get_queryset(self):
         """Base queryset for plugins built on Django's ``SingleObjectMixin``.
@@ -257,10 +281,18 @@ class Plugin(PermissionRequiredMixin, View):
         Returns:
             Context dictionary
         """
+        with span(f"plugin.{self.get_name()}.context"):
+            return self._get_context_data(**kwargs)
+
+    def _get_context_data(self, **kwargs: Any) -> dict[str, Any]:
         context = super().get_context_data(**kwargs)  # type: ignore[misc]
 
         # The core record, always. `object` is left to the view class.
         context["base_object"] = self.base_object
+        # Read by `{% plugin_url %}`, which reverses against the polymorphic base.
+        context["non_polymorphic_object"] = get_non_polymorphic_instance(
+            self.base_object
+        )
 
         # Kept for templates that predate `base_object`; it resolves to the view's own object when
         # the view has one, and to the core record otherwise.
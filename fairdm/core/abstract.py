@@ -1,3 +1,4 @@
+from django.contrib.postgres.search import SearchVectorField
 from django.core.exceptions import ValidationError
 from django.db.models import Manager, Model, QuerySet
 from django.urls import reverse
@@ -44,6 +45,12 @@ class BaseModel(models.Model):
         blank=True,
     )
 
+    search_vector = SearchVectorField(
+        verbose_name=_("search document"),
+        null=True,
+        editable=False,
+    )
+
     tracker = FieldTracker()
 
     class Meta:
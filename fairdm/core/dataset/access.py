@@ -0,0 +1,123 @@
+"""The dataset access index: which users and groups may view which datasets.
+
+:class:`~fairdm.core.dataset.models.DatasetAccess` mirrors every guardian
+``view_dataset`` grant as an integer-keyed row, so list filtering can ask
+"datasets this user may view" as one indexed semi-join,
+``dataset_id IN (SELECT dataset_id FROM dataset_datasetaccess WHERE ...)``,
+instead of casting guardian's text ``object_pk`` for every candidate row.
+
+Receivers on guardian's permission models keep the index in step with grants made
+through ``assign_perm``/``remove_perm`` and with every credit change, which goes
+through them. A group's members are resolved when the index is read, so joining or
+leaving a group needs no maintenance. Grants written without signals (guardian's
+``bulk_create`` for a queryset, raw SQL) need :func:`rebuild_access_index`.
+"""
+
+from __future__ import annotations
+
+import functools
+
+from django.contrib.auth.models import Permission
+from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
+from django.db.models import Q
+
+from .models import Dataset, DatasetAccess
+
+VIEW_CODENAME = "view_dataset"
+
+
+@functools.cache
+def _view_permission() -> tuple[int, int]:
+    """The ids of the dataset content type and its ``view_dataset`` permission."""
+    content_type = ContentType.objects.get_for_model(Dataset)
+    permission = Permission.objects.get(
+        content_type=content_type, codename=VIEW_CODENAME
+    )
+    return content_type.pk, permission.pk
+
+
+def _is_view_grant(row) -> bool:
+    return (row.content_type_id, row.permission_id) == _view_permission()
+
+
+def _grantee(row) -> dict:
+    if getattr(row, "user_id", None) is not None:
+        return {"user_id": row.user_id}
+    return {"group_id": row.group_id}
+
+
+def _dataset_pk(row) -> int | None:
+    try:
+        return int(row.object_pk)
+    except (TypeError, ValueError):
+        return None
+
+
+def grant_saved(sender, instance, **kwargs):
+    """Index a new ``view_dataset`` grant."""
+    pk = _dataset_pk(instance)
+    if pk is None or not _is_view_grant(instance):
+        return
+    # A guardian row may outlive its dataset; the index's foreign key cannot.
+    if Dataset.all_objects.filter(pk=pk).exists():
+        DatasetAccess.objects.get_or_create(dataset_id=pk, **_grantee(instance))
+
+
+def grant_deleted(sender, instance, **kwargs):
+    """Drop the index row of a withdrawn ``view_dataset`` grant."""
+    pk = _dataset_pk(instance)
+    if pk is None or not _is_view_grant(instance):
+        return
+    DatasetAccess.objects.filter(dataset_id=pk, **_grantee(instance)).delete()
+
+
+def accessible_datasets(user):
+    """The ids of the datasets ``user`` may view through a grant, as a subquery."""
+    return DatasetAccess.objects.filter(
+        Q(user=user) | Q(group__in=user.groups.values("pk"))
+    ).values("dataset_id")
+
+
+def rebuild_access_index() -> int:
+    """Rebuild the whole index from guardian's rows.
+
+    Returns:
+        int: The number of index rows written.
+    """
+    from guardian.utils import get_group_obj_perms_model, get_user_obj_perms_model
+
+    content_type_id, permission_id = _view_permission()
+    existing = set(Dataset.all_objects.values_list("pk", flat=True))
+    rows = []
+    sources = (
+        (get_user_obj_perms_model(), "user_id"),
+        (get_group_obj_perms_model(), "group_id"),
+    )
+    for model, grantee in sources:
+        grants = model.objects.filter(
+            content_type_id=content_type_id, permission_id=permission_id
+        ).values_list(grantee, "object_pk")
+        for grantee_id, object_pk in grants.iterator():
+            try:
+                pk = int(object_pk)
+            except (TypeError, ValueError):
+                continue
+            if pk in existing:
+                rows.append(DatasetAccess(dataset_id=pk, **{grantee: grantee_id}))
+
+    with transaction.atomic():
+        DatasetAccess.objects.all().delete()
+        DatasetAccess.objects.bulk_create(rows, batch_size=1000, ignore_conflicts=True)
+    return len(rows)
+
+
+def connect_signals() -> None:
+    """Connect the receivers above to guardian's user and group permission models."""
+    from django.db.models.signals import post_delete, post_save
+    from guardian.utils import get_group_obj_perms_model, get_user_obj_perms_model
+
+    for model in (get_user_obj_perms_model(), get_group_obj_perms_model()):
+        uid = f"dataset.access.{model._meta.label}"
+        post_save.connect(grant_saved, sender=model, dispatch_uid=uid)
+        post_delete.connect(grant_deleted, sender=model, dispatch_uid=uid)
@@ -0,0 +1,265 @@
+"""Stored dataset extents: the bounds, date span and sample count of each dataset.
+
+:class:`~fairdm.core.dataset.models.DatasetExtent` keeps these per dataset so that
+pages and API lists read them instead of aggregating over the samples. Receivers
+keep the rows in step, doing as little as each change allows:
+
+- A new sample, or a new sample date, widens its dataset's extent in one
+  ``UPDATE``, so importing n samples costs n small updates rather than n
+  aggregates.
+- A deleted sample or date shrinks it. The extent is only recomputed when the
+  deleted value lay on its edge.
+- A sample moved to another dataset or location, a changed date, or a location
+  whose coordinates change, recomputes the datasets concerned.
+
+Deleting a dataset or project deletes its extent along with its samples, so the
+samples deleted with it are skipped. Samples written without signals
+(``bulk_create``, ``QuerySet.update()``) leave extents stale until
+:func:`rebuild_extents` runs, which ``manage.py rebuild_dataset_extents`` does.
+"""
+
+from __future__ import annotations
+
+from django.db.models import Count, F, Max, Min, Q, QuerySet, Value
+from django.db.models.functions import Coalesce, Greatest, Least
+
+from .models import Dataset, DatasetExtent
+
+_BOUNDS = {
+    "min_x": (Min, "x"),
+    "min_y": (Min, "y"),
+    "max_x": (Max, "x"),
+    "max_y": (Max, "y"),
+}
+
+
+def _sample_models():
+    from fairdm.core.models import Sample
+    from fairdm.core.sample.models import SampleDate
+
+    return Sample, SampleDate
+
+
+def refresh_extents(dataset_ids) -> int:
+    """Recompute the extents of the given datasets from their samples.
+
+    Two grouped queries read every dataset's samples and dates at once, and the
+    rows are written in one upsert.
+
+    Returns:
+        int: The number of extents written.
+    """
+    Sample, SampleDate = _sample_models()
+    dataset_ids = set(dataset_ids) - {None}
+    if not dataset_ids:
+        return 0
+
+    samples = (
+        Sample._base_manager.filter(dataset_id__in=dataset_ids)
+        .order_by()
+        .values("dataset_id")
+        .annotate(
+            sample_count=Count("pk"),
+            **{
+                name: function(f"location__{axis}")
+                for name, (function, axis) in _BOUNDS.items()
+            },
+        )
+    )
+    dates = (
+        SampleDate.objects.filter(related__dataset_id__in=dataset_ids)
+        .order_by()
+        .values("related__dataset_id")
+        .annotate(earliest=Min("value"), latest=Max("value"))
+    )
+    extents = {
+        pk: DatasetExtent(dataset_id=pk)
+        for pk in Dataset.all_objects.filter(pk__in=dataset_ids).values_list(
+            "pk", flat=True
+        )
+    }
+    for row in samples:
+        if extent := extents.get(row.pop("dataset_id")):
+            for name, value in row.items():
+                setattr(extent, name, value)
+    for row in dates:
+        if extent := extents.get(row["related__dataset_id"]):
+            extent.earliest, extent.latest = row["earliest"], row["latest"]
+
+    DatasetExtent.objects.bulk_create(
+        extents.values(),
+        update_conflicts=True,
+        unique_fields=["dataset"],
+        update_fields=["sample_count", *_BOUNDS, "earliest", "latest", "modified"],
+    )
+    return len(extents)
+
+
+def rebuild_extents() -> int:
+    """Recompute every dataset's extent, a thousand datasets at a time.
+
+    Returns:
+        int: The number of extents written.
+    """
+    ids = list(Dataset.all_objects.order_by("pk").values_list("pk", flat=True))
+    return sum(refresh_extents(ids[i : i + 1000]) for i in range(0, len(ids), 1000))
+
+
+def _widened(name: str, function, value):
+    value = Value(value, output_field=DatasetExtent._meta.get_field(name))
+    return function(Coalesce(F(name), value), value)
+
+
+def widen(dataset_id, point=None, date=None, count: int = 0) -> None:
+    """Stretch a dataset's extent over a location and a date, and count samples.
+
+    Args:
+        dataset_id: The dataset whose extent is widened.
+        point: A sample's location, if it has one.
+        date: A sample's date.
+        count: The number of samples added.
+    """
+    changes = {}
+    if count:
+        changes["sample_count"] = F("sample_count") + count
+    if point is not None:
+        for name, (function, axis) in _BOUNDS.items():
+            combine = Least if function is Min else Greatest
+            changes[name] = _widened(name, combine, getattr(point, axis))
+    if date is not None:
+        changes["earliest"] = _widened("earliest", Least, date)
+        changes["latest"] = _widened("latest", Greatest, date)
+    if not changes:
+        return
+    if not DatasetExtent.objects.filter(dataset_id=dataset_id).update(**changes):
+        refresh_extents([dataset_id])
+
+
+def _on_edge(dataset_id, point=None, date=None) -> bool:
+    """Whether a location or a date lies on the edge of a dataset's extent."""
+    edge = Q()
+    if point is not None:
+        edge |= Q(min_x=point.x) | Q(max_x=point.x)
+        edge |= Q(min_y=point.y) | Q(max_y=point.y)
+    if date is not None:
+        edge |= Q(earliest=date) | Q(latest=date)
+    if not edge:
+        return False
+    return DatasetExtent.objects.filter(edge, dataset_id=dataset_id).exists()
+
+
+def _cascaded(origin) -> bool:
+    """Whether a deletion started from a dataset or project, taking the extent too."""
+    from fairdm.core.models import Project
+
+    model = origin.model if isinstance(origin, QuerySet) else type(origin)
+    return issubclass(model, (Dataset, Project))
+
+
+def _dataset_of(sample_id):
+    Sample, _ = _sample_models()
+    return (
+        Sample._base_manager.filter(pk=sample_id)
+        .values_list("dataset_id", flat=True)
+        .first()
+    )
+
+
+def dataset_created(sender, instance, created=False, raw=False, **kwargs):
+    """Give a new dataset its empty extent."""
+    if created and not raw:
+        DatasetExtent.objects.get_or_create(dataset_id=instance.pk)
+
+
+def sample_saved(sender, instance, created=False, raw=False, **kwargs):
+    """Widen the extent for a new sample; recompute it for a moved one."""
+    if raw:
+        return
+    if created:
+        widen(instance.dataset_id, point=instance.location, count=1)
+    elif instance.has_changed("dataset"):
+        refresh_extents([instance.initial_value("dataset"), instance.dataset_id])
+    elif instance.has_changed("location"):
+        refresh_extents([instance.dataset_id])
+
+
+def sample_deleted(sender, instance, origin=None, **kwargs):
+    """Count one sample fewer, recomputing the extent if its location was an edge."""
+    if _cascaded(origin):
+        return
+    point = instance.location
+    if _on_edge(instance.dataset_id, point=point):
+        refresh_extents([instance.dataset_id])
+    else:
+        DatasetExtent.objects.filter(dataset_id=instance.dataset_id).update(
+            sample_count=F("sample_count") - 1
+        )
+
+
+def date_saved(sender, instance, created=False, raw=False, **kwargs):
+    """Widen the extent for a new sample date; recompute it for a changed one."""
+    if raw:
+        return
+    if created:
+        widen(_dataset_of(instance.related_id), date=instance.value)
+    elif instance.has_changed("value"):
+        refresh_extents([_dataset_of(instance.related_id)])
+
+
+def date_deleted(sender, instance, origin=None, **kwargs):
+    """Recompute the extent if the deleted sample date was its first or last."""
+    if _cascaded(origin):
+        return
+    dataset_id = _dataset_of(instance.related_id)
+    if _on_edge(dataset_id, date=instance.value):
+        refresh_extents([dataset_id])
+
+
+def location_saved(sender, instance, created=False, raw=False, **kwargs):
+    """Recompute the extents of the datasets with samples at a moved location."""
+    if created or raw or not (instance.has_changed("x") or instance.has_changed("y")):
+        return
+    Sample, _ = _sample_models()
+    refresh_extents(
+        Sample._base_manager.filter(location=instance)
+        .order_by()
+        .values_list("dataset_id", flat=True)
+        .distinct()
+    )
+
+
+def connect_signals() -> None:
+    """Connect the receivers above.
+
+    ``post_save`` is sent with the concrete class as sender, so each sample type is
+    connected individually. ``post_delete`` is connected for the base ``Sample``
+    alone: deleting a sample of any type deletes its base row, which sends it once.
+    """
+    from django.apps import apps
+    from django.db.models.signals import post_delete, post_save
+
+    from fairdm.contrib.location.models import Point
+
+    Sample, SampleDate = _sample_models()
+    for model in apps.get_models():
+        if issubclass(model, Sample):
+            post_save.connect(
+                sample_saved,
+                sender=model,
+                dispatch_uid=f"dataset.extent.sample_saved.{model._meta.label}",
+            )
+    post_delete.connect(
+        sample_deleted, sender=Sample, dispatch_uid="dataset.extent.sample_deleted"
+    )
+    post_save.connect(
+        date_saved, sender=SampleDate, dispatch_uid="dataset.extent.date_saved"
+    )
+    post_delete.connect(
+        date_deleted, sender=SampleDate, dispatch_uid="dataset.extent.date_deleted"
+    )
+    post_save.connect(
+        location_saved, sender=Point, dispatch_uid="dataset.extent.location_saved"
+    )
+    post_save.connect(
+        dataset_created, sender=Dataset, dispatch_uid="dataset.extent.dataset_created"
+    )
@@ -33,7 +33,7 @@ filterset = DatasetFilter(data={"license": license_id}, queryset=Dataset.objects
 
 **Generic search**:
 ```python
-# Search across name, UUID, keywords
+# Search names, UUIDs, descriptions, keywords and tags
 filterset = DatasetFilter(data={"search": "geology"}, queryset=Dataset.objects.all())
 ```
 
@@ -67,9 +67,9 @@ filterset = DatasetFilter(
 """
 
 import django_filters
-from django.db.models import Q
 
 from fairdm.core.filters import BaseListFilter
+from fairdm.core.search import search
 
 from .models import Dataset
 
@@ -86,7 +86,7 @@ class DatasetFilter(BaseListFilter):
     - visibility: Choice-based filter on visibility level
 
     **Search**:
-    - search: Generic search across name, UUID, and keywords (case-insensitive)
+    - search: Full-text search of names, UUIDs, descriptions, keywords and tags
 
     **Cross-Relationship Filters**:
     - description_type: Filter by DatasetDescription type (ABSTRACT, METHODS, etc.)
@@ -99,7 +99,7 @@ class DatasetFilter(BaseListFilter):
     - Returns only datasets matching ALL three criteria
 
     **Performance**:
-    - Generic search uses indexed fields (name, uuid, keywords)
+    - Search uses the GIN-indexed search document (`fairdm.core.search`)
     - Cross-relationship filters use database indexes on type fields
     - Expected query time: <10ms for most filter combinations on 10k+ datasets
 
@@ -130,7 +130,7 @@ class DatasetFilter(BaseListFilter):
     search = django_filters.CharFilter(
         method="filter_search",
         label="Search",
-        help_text="Search across dataset name, UUID, and keywords",
+        help_text="Search dataset names, UUIDs, descriptions and keywords",
     )
 
     project = django_filters.ModelChoiceFilter(
@@ -192,12 +192,11 @@ class DatasetFilter(BaseListFilter):
 
     def filter_search(self, queryset, name, value):
         """
-        Generic search filter across multiple fields.
+        Full-text search of the datasets' search documents.
 
-        Searches the following fields (case-insensitive):
-        - name: Dataset name (icontains lookup)
-        - uuid: Dataset UUID (icontains lookup)
-        - keywords: Associated keyword names (icontains lookup)
+        Matches names, UUIDs, descriptions, keywords and tags, best match first
+        (see `fairdm.core.search`). Each word matches the start of a word, so a
+        partial UUID or a word still being typed matches too.
 
         Args:
             queryset: The queryset to filter
@@ -205,22 +204,18 @@ class DatasetFilter(BaseListFilter):
             value: The search term
 
         Returns:
-            Filtered queryset matching search term in any of the above fields
+            Filtered queryset of the matching datasets
 
         Examples:
             >>> # Search by name
             >>> filterset = DatasetFilter(data={"search": "geology"})
-            >>> # Returns datasets with "geology" in name or keywords
+            >>> # Returns datasets with "geology" in name, descriptions or keywords
 
             >>> # Search by UUID
             >>> filterset = DatasetFilter(data={"search": "abc123"})
-            >>> # Returns datasets with "abc123" in UUID
+            >>> # Returns datasets whose UUID starts with "abc123"
         """
         if not value:
             return queryset
 
-        return queryset.filter(
-            Q(name__icontains=value)
-            | Q(uuid__icontains=value)
-            | Q(keywords__name__icontains=value)
-        ).distinct()  # distinct() prevents duplicate results from keywords join
+        return search(queryset, value)
@@ -0,0 +1,82 @@
+# Generated by Django 5.2.12 on 2026-10-16 14:05
+
+import auto_prefetch
+import django.db.models.deletion
+import django.db.models.manager
+import django_lifecycle.mixins
+from django.conf import settings
+from django.db import migrations, models
+
+
+def populate_access_index(apps, schema_editor):
+    """Index the ``view_dataset`` grants that already exist."""
+    try:
+        UserObjectPermission = apps.get_model("guardian", "UserObjectPermission")
+        GroupObjectPermission = apps.get_model("guardian", "GroupObjectPermission")
+    except LookupError:
+        return
+    ContentType = apps.get_model("contenttypes", "ContentType")
+    Permission = apps.get_model("auth", "Permission")
+    Dataset = apps.get_model("dataset", "Dataset")
+    DatasetAccess = apps.get_model("dataset", "DatasetAccess")
+
+    try:
+        content_type = ContentType.objects.get(app_label="dataset", model="dataset")
+        permission = Permission.objects.get(
+            content_type=content_type, codename="view_dataset"
+        )
+    except (ContentType.DoesNotExist, Permission.DoesNotExist):
+        return
+
+    existing = set(Dataset.objects.values_list("pk", flat=True))
+    rows = []
+    for model, grantee in (
+        (UserObjectPermission, "user_id"),
+        (GroupObjectPermission, "group_id"),
+    ):
+        grants = model.objects.filter(
+            content_type=content_type, permission=permission
+        ).values_list(grantee, "object_pk")
+        for grantee_id, object_pk in grants.iterator():
+            try:
+                pk = int(object_pk)
+            except (TypeError, ValueError):
+                continue
+            if pk in existing:
+                rows.append(DatasetAccess(dataset_id=pk, **{grantee: grantee_id}))
+    DatasetAccess.objects.bulk_create(rows, batch_size=1000, ignore_conflicts=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('dataset', '0011_alter_dataset_options_alter_dataset_license_and_more'),
+        ('guardian', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DatasetAccess',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('added', models.DateTimeField(auto_now_add=True, help_text='The date and time this record was added to the database.', verbose_name='Date added')),
+                ('modified', models.DateTimeField(auto_now=True, help_text='The date and time this record was last modified.', verbose_name='Last modified')),
+                ('dataset', auto_prefetch.ForeignKey(on_delete=django.db.models.deletion.CASCADE, help_text='The dataset the user or group may view.', related_name='access_grants', to='dataset.dataset', verbose_name='dataset')),
+                ('group', auto_prefetch.ForeignKey(blank=True, help_text="The group whose members may view the dataset, for a group's grant.", null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='auth.group', verbose_name='group')),
+                ('user', auto_prefetch.ForeignKey(blank=True, help_text="The user who may view the dataset, for a user's grant.", null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='user')),
+            ],
+            options={
+                'verbose_name': 'dataset access',
+                'verbose_name_plural': 'dataset access',
+                'constraints': [models.UniqueConstraint(fields=('user', 'dataset'), name='dataset_access_unique_user'), models.UniqueConstraint(fields=('group', 'dataset'), name='dataset_access_unique_group'), models.CheckConstraint(condition=models.Q(models.Q(('group__isnull', True), ('user__isnull', False)), models.Q(('group__isnull', False), ('user__isnull', True)), _connector='OR'), name='dataset_access_user_or_group')],
+            },
+            bases=(django_lifecycle.mixins.LifecycleModelMixin, models.Model),
+            managers=[
+                ('objects', django.db.models.manager.Manager()),
+                ('prefetch_manager', django.db.models.manager.Manager()),
+            ],
+        ),
+        migrations.RunPython(populate_access_index, migrations.RunPython.noop),
+    ]
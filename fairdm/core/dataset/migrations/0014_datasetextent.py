@@ -0,0 +1,83 @@
+# Generated by Django 5.2.12 on 2026-10-16 16:40
+
+import auto_prefetch
+import django.db.models.deletion
+import django.db.models.manager
+import django_lifecycle.mixins
+from django.db import migrations, models
+from django.db.models import Count, Max, Min
+
+import fairdm.db.fields
+
+
+def populate_extents(apps, schema_editor):
+    """Compute the extent of every existing dataset."""
+    Dataset = apps.get_model("dataset", "Dataset")
+    DatasetExtent = apps.get_model("dataset", "DatasetExtent")
+    Sample = apps.get_model("sample", "Sample")
+    SampleDate = apps.get_model("sample", "SampleDate")
+
+    extents = {
+        pk: DatasetExtent(dataset_id=pk)
+        for pk in Dataset.objects.values_list("pk", flat=True)
+    }
+    samples = (
+        Sample.objects.order_by()
+        .values("dataset_id")
+        .annotate(
+            sample_count=Count("pk"),
+            min_x=Min("location__x"),
+            min_y=Min("location__y"),
+            max_x=Max("location__x"),
+            max_y=Max("location__y"),
+        )
+    )
+    for row in samples:
+        if extent := extents.get(row.pop("dataset_id")):
+            for name, value in row.items():
+                setattr(extent, name, value)
+    dates = (
+        SampleDate.objects.order_by()
+        .values("related__dataset_id")
+        .annotate(earliest=Min("value"), latest=Max("value"))
+    )
+    for row in dates:
+        if extent := extents.get(row["related__dataset_id"]):
+            extent.earliest, extent.latest = row["earliest"], row["latest"]
+    DatasetExtent.objects.bulk_create(extents.values(), batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dataset', '0013_search_vector'),
+        ('sample', '0009_search_vector'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DatasetExtent',
+            fields=[
+                ('added', models.DateTimeField(auto_now_add=True, help_text='The date and time this record was added to the database.', verbose_name='Date added')),
+                ('modified', models.DateTimeField(auto_now=True, help_text='The date and time this record was last modified.', verbose_name='Last modified')),
+                ('dataset', auto_prefetch.OneToOneField(help_text='The dataset whose samples are summarised.', on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='extent', serialize=False, to='dataset.dataset', verbose_name='dataset')),
+                ('sample_count', models.PositiveIntegerField(default=0, help_text='The number of samples in the dataset.', verbose_name='samples')),
+                ('min_x', models.DecimalField(blank=True, decimal_places=5, help_text='The westernmost sample longitude in the dataset.', max_digits=8, null=True, verbose_name='west')),
+                ('min_y', models.DecimalField(blank=True, decimal_places=5, help_text='The southernmost sample latitude in the dataset.', max_digits=7, null=True, verbose_name='south')),
+                ('max_x', models.DecimalField(blank=True, decimal_places=5, help_text='The easternmost sample longitude in the dataset.', max_digits=8, null=True, verbose_name='east')),
+                ('max_y', models.DecimalField(blank=True, decimal_places=5, help_text='The northernmost sample latitude in the dataset.', max_digits=7, null=True, verbose_name='north')),
+                ('earliest', fairdm.db.fields.PartialDateField(blank=True, help_text='The earliest date recorded for a sample in the dataset.', null=True, verbose_name='earliest date')),
+                ('latest', fairdm.db.fields.PartialDateField(blank=True, help_text='The latest date recorded for a sample in the dataset.', null=True, verbose_name='latest date')),
+            ],
+            options={
+                'verbose_name': 'dataset extent',
+                'verbose_name_plural': 'dataset extents',
+            },
+            bases=(django_lifecycle.mixins.LifecycleModelMixin, models.Model),
+            managers=[
+                ('objects', django.db.models.manager.Manager()),
+                ('prefetch_manager', django.db.models.manager.Manager()),
+            ],
+        ),
+        migrations.RunPython(populate_extents, migrations.RunPython.noop),
+    ]
@@ -1,5 +1,6 @@
 from django.conf import settings
 from django.contrib.contenttypes.fields import GenericRelation
+from django.contrib.postgres.indexes import GinIndex
 from django.core.exceptions import ValidationError
 from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
@@ -155,6 +156,10 @@ class DatasetQuerySet(QuerySet):
             "keywords",
         )
 
+    def with_extent(self) -> "DatasetQuerySet":
+        """Join each dataset's stored extent, for its bounds and sample count."""
+        return self.select_related("extent")
+
 
 class DatasetManager(models.Manager.from_queryset(DatasetQuerySet)):  # type: ignore[misc]
     """The default manager for `Dataset`. Excludes PRIVATE datasets (FR-019).
@@ -316,6 +321,9 @@ class Dataset(BaseModel):
         verbose_name_plural = _("datasets")
         default_related_name = "datasets"
         ordering = ["-modified"]
+        indexes = [
+            GinIndex(fields=["search_vector"], name="dataset_search_idx"),
+        ]
         permissions = [
             *CORE_PERMISSIONS,
             ("import_data", "Can import data into dataset"),
@@ -333,9 +341,11 @@ class Dataset(BaseModel):
 
     @cached_property
     def bbox(self):
-        from fairdm.contrib.location.utils import bbox_for_dataset
-
-        return bbox_for_dataset(self)
+        """The bounds of the dataset's sample locations, from its stored extent."""
+        try:
+            return self.extent.bbox
+        except DatasetExtent.DoesNotExist:
+            return dict.fromkeys(("min_x", "max_x", "min_y", "max_y"))
 
 
 class DatasetDescription(AbstractDescription):
@@ -486,3 +496,153 @@ class DatasetIdentifier(AbstractIdentifier):
 
     VOCABULARY = FairDMIdentifiers.from_collection("Dataset")
     related = models.ForeignKey("Dataset", on_delete=models.CASCADE)
+
+
+class DatasetAccess(models.Model):
+    """A user's or a group's right to view a dataset, indexed for list filtering.
+
+    Mirrors the guardian ``view_dataset`` rows, which are keyed by a content type
+    and a text ``object_pk`` and so cannot be joined to a dataset's integer key
+    without a cast. The API visibility filter reads these rows instead, and samples
+    and measurements inherit them through ``dataset_id``. Kept in step with guardian
+    by ``fairdm.core.dataset.access``; ``manage.py rebuild_access_index`` rebuilds
+    the table after grants written without signals.
+    """
+
+    dataset = models.ForeignKey(
+        Dataset,
+        on_delete=models.CASCADE,
+        related_name="access_grants",
+        verbose_name=_("dataset"),
+        help_text=_("The dataset the user or group may view."),
+    )
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="+",
+        verbose_name=_("user"),
+        help_text=_("The user who may view the dataset, for a user's grant."),
+    )
+    group = models.ForeignKey(
+        "auth.Group",
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="+",
+        verbose_name=_("group"),
+        help_text=_(
+            "The group whose members may view the dataset, for a group's grant."
+        ),
+    )
+
+    class Meta:
+        verbose_name = _("dataset access")
+        verbose_name_plural = _("dataset access")
+        # Leading with the grantee, so each index answers "which datasets may
+        # this user (or group) view" on its own.
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "dataset"], name="dataset_access_unique_user"
+            ),
+            models.UniqueConstraint(
+                fields=["group", "dataset"], name="dataset_access_unique_group"
+            ),
+            models.CheckConstraint(
+                condition=models.Q(user__isnull=False, group__isnull=True)
+                | models.Q(user__isnull=True, group__isnull=False),
+                name="dataset_access_user_or_group",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id or self.group_id} → {self.dataset_id}"
+
+
+def _coordinate_field(opts: dict, integer_digits: int, **kwargs):
+    return models.DecimalField(
+        max_digits=opts.get("max_digits") or opts["decimal_places"] + integer_digits,
+        decimal_places=opts["decimal_places"],
+        null=True,
+        blank=True,
+        **kwargs,
+    )
+
+
+class DatasetExtent(models.Model):
+    """Where, when and how many samples a dataset holds, stored for listing.
+
+    The bounds of the sample locations, the span of the sample dates and the
+    number of samples would otherwise be aggregated over the dataset's samples
+    each time a dataset is shown, and once per card on list pages. One row per
+    dataset keeps them, so lists read them with a join (`with_extent()`).
+    Kept in step with samples, their locations and their dates by
+    ``fairdm.core.dataset.extent``; ``manage.py rebuild_dataset_extents``
+    recomputes every row after writes made without signals.
+    """
+
+    dataset = models.OneToOneField(
+        Dataset,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="extent",
+        verbose_name=_("dataset"),
+        help_text=_("The dataset whose samples are summarised."),
+    )
+    sample_count = models.PositiveIntegerField(
+        _("samples"), default=0, help_text=_("The number of samples in the dataset.")
+    )
+    min_x = _coordinate_field(
+        settings.FAIRDM_X_COORD,
+        3,
+        verbose_name=_("west"),
+        help_text=_("The westernmost sample longitude in the dataset."),
+    )
+    min_y = _coordinate_field(
+        settings.FAIRDM_Y_COORD,
+        2,
+        verbose_name=_("south"),
+        help_text=_("The southernmost sample latitude in the dataset."),
+    )
+    max_x = _coordinate_field(
+        settings.FAIRDM_X_COORD,
+        3,
+        verbose_name=_("east"),
+        help_text=_("The easternmost sample longitude in the dataset."),
+    )
+    max_y = _coordinate_field(
+        settings.FAIRDM_Y_COORD,
+        2,
+        verbose_name=_("north"),
+        help_text=_("The northernmost sample latitude in the dataset."),
+    )
+    earliest = models.PartialDateField(
+        _("earliest date"),
+        null=True,
+        blank=True,
+        help_text=_("The earliest date recorded for a sample in the dataset."),
+    )
+    latest = models.PartialDateField(
+        _("latest date"),
+        null=True,
+        blank=True,
+        help_text=_("The latest date recorded for a sample in the dataset."),
+    )
+
+    class Meta:
+        verbose_name = _("dataset extent")
+        verbose_name_plural = _("dataset extents")
+
+    def __str__(self):
+        return f"{self.dataset_id}: {self.sample_count} samples"
+
+    @property
+    def bbox(self) -> dict:
+        """The bounds, keyed as `bbox_for_dataset()` keys them."""
+        return {
+            "min_x": self.min_x,
+            "max_x": self.max_x,
+            "min_y": self.min_y,
+            "max_y": self.max_y,
+        }
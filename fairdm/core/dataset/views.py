@@ -148,7 +148,8 @@ class DatasetListView(FairDMListView):
     search_fields = ["name", "uuid", "descriptions__value"]
 
     def get_queryset(self) -> QuerySet[Dataset]:
-        """Return the queryset of visible datasets with prefetched contributors.
+        """Return the queryset of visible datasets with prefetched contributors
+        and their stored extents.
 
         `Dataset.objects` (the base this view's `super().get_queryset()`
         reads through) is privacy-first by default, so no separate
@@ -158,7 +159,7 @@ class DatasetListView(FairDMListView):
             QuerySet: Filtered and optimized Dataset queryset.
         """
         qs: DatasetQuerySet = super().get_queryset()
-        return qs.with_contributors()
+        return qs.with_contributors().with_extent()
 
 
 class DatasetUpdateView(LoginRequiredMixin, FairDMUpdateView):
@@ -0,0 +1,432 @@
+"""Per-request timing of queries, cache lookups, plugins, views and templates.
+
+A slow record page can spend its time resolving the record, building the plugin
+menu, assembling the context or rendering. :class:`InstrumentationMiddleware`
+records a trace of each request that tells them apart:
+
+- every SQL query, counted and timed, on every database connection
+- cache hits and misses, for caches wrapped by :func:`instrument_caches`
+- a span for each plugin (its dispatch, ``get_base_object`` and
+  ``get_context_data``), each API view and viewset action
+  (:class:`InstrumentedViewMixin`), the template rendering, and each template
+  block wrapped in ``{% timed "name" %}``
+
+Every span carries the queries and cache lookups made while it was open. Without
+the middleware there is no trace, and :func:`span` does nothing.
+
+A finished trace is:
+
+- logged to ``fairdm.instrumentation`` at ``INFO``, with the summary under the
+  record's ``instrumentation`` attribute for structured formatters
+- summarised in a ``Server-Timing`` header, which browser developer tools show
+- appended to a file as one line of OTLP/JSON, which the OpenTelemetry
+  Collector's ``otlpjsonfile`` receiver reads, so traces can be collected later
+  without a collector running
+
+Settings:
+    FAIRDM_INSTRUMENTATION_SERVER_TIMING: Whether to send the ``Server-Timing``
+        header. Defaults to ``DEBUG``: the header is visible to every client.
+    FAIRDM_INSTRUMENTATION_TRACE_FILE: The file traces are appended to. Unset, no
+        file is written.
+
+Example::
+
+    MIDDLEWARE = [*MIDDLEWARE, "fairdm.core.instrumentation.InstrumentationMiddleware"]
+    CACHES = instrument_caches(CACHES)
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from django.conf import settings
+from django.db import connections
+from django.utils.module_loading import import_string
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from django.http import HttpRequest, HttpResponse
+
+logger = logging.getLogger("fairdm.instrumentation")
+
+#: The ``BACKEND`` of a cache wrapped by :func:`instrument_caches`.
+INSTRUMENTED_CACHE = "fairdm.core.instrumentation.InstrumentedCache"
+
+#: Entries in a ``Server-Timing`` header beyond the totals, longest first.
+SERVER_TIMING_ENTRIES = 20
+
+_current: ContextVar[Trace | None] = ContextVar("fairdm_trace", default=None)
+_write_lock = threading.Lock()
+_UNSAFE_TOKEN = re.compile(r"[^\w.-]+")
+_MISSING = object()
+
+
+def _span_id(size: int = 8) -> str:
+    return os.urandom(size).hex()
+
+
+@dataclass
+class Span:
+    """A timed piece of a request, with the queries and cache lookups made in it."""
+
+    name: str
+    kind: str
+    parent_id: str | None = None
+    attributes: dict[str, Any] = field(default_factory=dict)
+    span_id: str = field(default_factory=_span_id)
+    start_ns: int = field(default_factory=time.time_ns)
+    end_ns: int | None = None
+    queries: int = 0
+    query_ns: int = 0
+    cache_hits: int = 0
+    cache_misses: int = 0
+
+    @property
+    def duration_ms(self) -> float:
+        return ((self.end_ns or time.time_ns()) - self.start_ns) / 1e6
+
+
+class Trace:
+    """The spans of one request, the first of them spanning the whole request."""
+
+    def __init__(self, name: str):
+        self.trace_id = _span_id(16)
+        self.root = Span(name, "request")
+        self.spans = [self.root]
+        self._open = [self.root]
+
+    def start(self, name: str, kind: str, **attributes) -> Span:
+        """Open a span inside the innermost open one."""
+        span = Span(name, kind, self._open[-1].span_id, attributes)
+        self.spans.append(span)
+        self._open.append(span)
+        return span
+
+    def finish(self, span: Span) -> None:
+        """Close ``span``, and any span opened inside it and left open."""
+        if span not in self._open:
+            return
+        while self._open:
+            closing = self._open.pop()
+            closing.end_ns = time.time_ns()
+            if closing is span:
+                break
+
+    def close(self) -> None:
+        """Close every span still open, the request's own last."""
+        self.finish(self.root)
+
+    def execute(self, execute, sql, params, many, context):
+        """A database execute wrapper, counting and timing each query."""
+        start = time.perf_counter_ns()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            elapsed = time.perf_counter_ns() - start
+            for span in self._open:
+                span.queries += 1
+                span.query_ns += elapsed
+
+    def count_cache(self, hits: int, misses: int) -> None:
+        for span in self._open:
+            span.cache_hits += hits
+            span.cache_misses += misses
+
+    def totals(self) -> dict[str, dict[str, float]]:
+        """Each span name below the request's own, with its count, time and queries."""
+        found: dict[str, dict[str, float]] = {}
+        for span in self.spans[1:]:
+            entry = found.setdefault(
+                span.name, {"count": 0, "duration_ms": 0.0, "queries": 0}
+            )
+            entry["count"] += 1
+            entry["duration_ms"] += span.duration_ms
+            entry["queries"] += span.queries
+        return found
+
+    def summary(self) -> dict[str, Any]:
+        """The trace as one flat record, for logs."""
+        root = self.root
+        return {
+            "trace_id": self.trace_id,
+            "name": root.name,
+            **root.attributes,
+            "duration_ms": round(root.duration_ms, 3),
+            "queries": root.queries,
+            "query_ms": round(root.query_ns / 1e6, 3),
+            "cache_hits": root.cache_hits,
+            "cache_misses": root.cache_misses,
+            "spans": {
+                name: {**entry, "duration_ms": round(entry["duration_ms"], 3)}
+                for name, entry in self.totals().items()
+            },
+        }
+
+
+def current_trace() -> Trace | None:
+    """The trace of the request being served, if it is instrumented."""
+    return _current.get()
+
+
+@contextlib.contextmanager
+def span(name: str, kind: str = "internal", **attributes) -> Iterator[Span | None]:
+    """Time the enclosed code as a span of the current trace.
+
+    Does nothing outside an instrumented request, so hooks can stay in place.
+    """
+    trace = _current.get()
+    if trace is None:
+        yield None
+        return
+    opened = trace.start(name, kind, **attributes)
+    try:
+        yield opened
+    finally:
+        trace.finish(opened)
+
+
+class InstrumentedViewMixin:
+    """Time a view's dispatch as a span named after the view and its action.
+
+    For a viewset the action is the one routed for the request's method, so
+    ``DatasetViewSet.list`` and ``DatasetViewSet.retrieve`` are told apart.
+    """
+
+    def dispatch(self, request, *args, **kwargs):
+        with span(self.get_span_name(request), "view"):
+            return super().dispatch(request, *args, **kwargs)  # type: ignore[misc]
+
+    def get_span_name(self, request) -> str:
+        name = type(self).__name__
+        actions = getattr(self, "action_map", None) or {}
+        action = actions.get(request.method.lower())
+        return f"{name}.{action}" if action else name
+
+
+class InstrumentedCache:
+    """A cache counting the hits and misses of the backend it wraps.
+
+    Configured by :func:`instrument_caches`; the wrapped backend's settings are
+    kept under ``OPTIONS["WRAPPED"]``. ``get``, ``get_many`` and ``has_key`` are
+    counted, and everything else is passed through.
+    """
+
+    def __init__(self, location, params):
+        wrapped = params["OPTIONS"]["WRAPPED"]
+        backend = import_string(wrapped["BACKEND"])
+        self._wrapped = backend(wrapped.get("LOCATION", ""), wrapped)
+
+    def __getattr__(self, name):
+        return getattr(self._wrapped, name)
+
+    def __contains__(self, key):
+        return self.has_key(key)
+
+    def _count(self, hits: int, misses: int) -> None:
+        if trace := _current.get():
+            trace.count_cache(hits, misses)
+
+    def get(self, key, default=None, version=None):
+        value = self._wrapped.get(key, _MISSING, version=version)
+        if value is _MISSING:
+            self._count(0, 1)
+            return default
+        self._count(1, 0)
+        return value
+
+    def get_many(self, keys, version=None):
+        keys = list(keys)
+        found = self._wrapped.get_many(keys, version=version)
+        self._count(len(found), len(keys) - len(found))
+        return found
+
+    def has_key(self, key, version=None):
+        present = self._wrapped.has_key(key, version=version)
+        self._count(int(present), int(not present))
+        return present
+
+
+def instrument_caches(caches: dict[str, dict]) -> dict[str, dict]:
+    """``CACHES`` with every cache wrapped to count its hits and misses."""
+    return {
+        alias: config
+        if config.get("BACKEND") == INSTRUMENTED_CACHE
+        else {
+            "BACKEND": INSTRUMENTED_CACHE,
+            "LOCATION": config.get("LOCATION", ""),
+            "OPTIONS": {"WRAPPED": config},
+        }
+        for alias, config in caches.items()
+    }
+
+
+def _token(name: str) -> str:
+    return _UNSAFE_TOKEN.sub("-", name).strip("-") or "span"
+
+
+def server_timing(trace: Trace) -> str:
+    """The ``Server-Timing`` header for ``trace``: totals, then the longest spans."""
+    root = trace.root
+    entries = [
+        f"total;dur={root.duration_ms:.1f}",
+        f'db;dur={root.query_ns / 1e6:.1f};desc="{root.queries} queries"',
+    ]
+    if root.cache_hits or root.cache_misses:
+        entries.append(
+            f'cache;desc="{root.cache_hits} hits, {root.cache_misses} misses"'
+        )
+    longest = sorted(
+        trace.totals().items(), key=lambda item: item[1]["duration_ms"], reverse=True
+    )
+    for name, entry in longest[:SERVER_TIMING_ENTRIES]:
+        desc = f"{entry['queries']} queries"
+        if entry["count"] > 1:
+            desc = f"{entry['count']}x, {desc}"
+        entries.append(f'{_token(name)};dur={entry["duration_ms"]:.1f};desc="{desc}"')
+    return ", ".join(entries)
+
+
+def _otlp_value(value) -> dict:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def otlp_json(trace: Trace) -> dict:
+    """``trace`` in the OTLP/JSON encoding of an ``ExportTraceServiceRequest``."""
+    spans = []
+    for span in trace.spans:
+        attributes = {
+            **span.attributes,
+            "fairdm.kind": span.kind,
+            "db.queries": span.queries,
+            "db.duration_ms": span.query_ns / 1e6,
+            "cache.hits": span.cache_hits,
+            "cache.misses": span.cache_misses,
+        }
+        encoded = {
+            "traceId": trace.trace_id,
+            "spanId": span.span_id,
+            "name": span.name,
+            # SPAN_KIND_SERVER for the request, SPAN_KIND_INTERNAL within it
+            "kind": 2 if span is trace.root else 1,
+            "startTimeUnixNano": str(span.start_ns),
+            "endTimeUnixNano": str(span.end_ns or span.start_ns),
+            "attributes": [
+                {"key": key, "value": _otlp_value(value)}
+                for key, value in attributes.items()
+            ],
+        }
+        if span.parent_id:
+            encoded["parentSpanId"] = span.parent_id
+        spans.append(encoded)
+
+    service = {"key": "service.name", "value": {"stringValue": "fairdm"}}
+    return {
+        "resourceSpans": [
+            {
+                "resource": {"attributes": [service]},
+                "scopeSpans": [
+                    {"scope": {"name": "fairdm.instrumentation"}, "spans": spans}
+                ],
+            }
+        ]
+    }
+
+
+def write_trace(trace: Trace, path) -> None:
+    """Append ``trace`` to ``path`` as one line of OTLP/JSON."""
+    line = json.dumps(otlp_json(trace), separators=(",", ":"))
+    with _write_lock, open(path, "a", encoding="utf-8") as file:
+        file.write(line + "\n")
+
+
+class InstrumentationMiddleware:
+    """Trace each request, and report the trace when the response is ready.
+
+    Place it first in ``MIDDLEWARE`` to include the other middleware in the
+    request's time. A streamed response is timed until its first byte is ready.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        trace = Trace(f"{request.method} {request.path}")
+        trace.root.attributes.update(
+            {"http.method": request.method, "http.target": request.path}
+        )
+        token = _current.set(trace)
+        try:
+            with contextlib.ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(trace.execute))
+                response = self.get_response(request)
+        finally:
+            trace.close()
+            _current.reset(token)
+
+        trace.root.attributes["http.status_code"] = response.status_code
+        self.report(trace, response)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        trace = _current.get()
+        match = getattr(request, "resolver_match", None)
+        if trace is None or match is None:
+            return None
+        if match.route:
+            trace.root.name = f"{request.method} /{match.route}"
+            trace.root.attributes["http.route"] = f"/{match.route}"
+        view = getattr(view_func, "cls", None) or getattr(view_func, "view_class", None)
+        view_name = view.__name__ if view else getattr(view_func, "__name__", "")
+        action = (getattr(view_func, "actions", None) or {}).get(request.method.lower())
+        trace.root.attributes["fairdm.view"] = (
+            f"{view_name}.{action}" if action else view_name
+        )
+        return None
+
+    def process_template_response(self, request, response):
+        trace = _current.get()
+        if trace is None:
+            return response
+        template = response.template_name
+        if isinstance(template, list | tuple):
+            template = template[0] if template else ""
+        rendering = trace.start("render", "template", template=str(template or ""))
+        response.add_post_render_callback(lambda _: trace.finish(rendering))
+        return response
+
+    def report(self, trace: Trace, response) -> None:
+        """Log ``trace``, and add it to the response and the trace file."""
+        summary = trace.summary()
+        logger.info(
+            "%s %s in %.1f ms, %d queries in %.1f ms",
+            trace.root.name,
+            response.status_code,
+            summary["duration_ms"],
+            summary["queries"],
+            summary["query_ms"],
+            extra={"instrumentation": summary},
+        )
+        if getattr(settings, "FAIRDM_INSTRUMENTATION_SERVER_TIMING", settings.DEBUG):
+            response["Server-Timing"] = server_timing(trace)
+        if path := getattr(settings, "FAIRDM_INSTRUMENTATION_TRACE_FILE", None):
+            try:
+                write_trace(trace, path)
+            except OSError:
+                logger.exception("Could not write the trace to %s", path)
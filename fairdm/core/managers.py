@@ -11,10 +11,17 @@ class PolymorphicManager(managers.PolymorphicManager):
     #         qs = qs.instance_of(self.model)
     #     return qs
 
-    def get_type_counts(self):
-        """Returns a dictionary with counts of each polymorphic child type in the queryset."""
+    def get_type_counts(self, queryset=None):
+        """Returns a dictionary with counts of each polymorphic child type in the queryset.
+
+        ``queryset`` narrows the records counted, e.g. to public datasets; it
+        defaults to every record of the manager's model. Either way it is one
+        grouped query plus one for the content types.
+        """
+        if queryset is None:
+            queryset = self.get_queryset()
         type_counts = (
-            self.get_queryset()
+            queryset.non_polymorphic()
             .values("polymorphic_ctype")
             .annotate(count=Count("id"))
             .order_by()
@@ -11,11 +11,11 @@ This module provides FilterSet classes for filtering Measurement models with sup
 
 import django_filters
 from django import forms
-from django.db.models import Q
 from django.utils.translation import gettext_lazy as _
 from partial_date import PartialDate
 
 from fairdm.core.measurement.models import Measurement
+from fairdm.core.search import search
 
 
 class PartialDateFilterField(forms.CharField):
@@ -66,7 +66,7 @@ class MeasurementFilterMixin(django_filters.FilterSet):
     - dataset: Filter by parent dataset
     - sample: Filter by associated sample
     - polymorphic_ctype: Filter by measurement type (XRFMeasurement, ICP_MS_Measurement, etc.)
-    - search: Generic search across name and uuid
+    - search: Full-text search of the measurements' search documents
     - description: Search in associated description text
     - date_after/date_before: Filter by associated date ranges
 
@@ -144,7 +144,10 @@ class MeasurementFilterMixin(django_filters.FilterSet):
     )
 
     def filter_search(self, queryset, name, value):
-        """Filter by generic search across name and uuid fields.
+        """Filter by full-text search of the measurements' search documents.
+
+        Matches names, local IDs, UUIDs, descriptions, keywords, tags and the
+        registered type's text fields, best match first (see `fairdm.core.search`).
 
         Args:
             queryset: The queryset to filter
@@ -152,12 +155,12 @@ class MeasurementFilterMixin(django_filters.FilterSet):
             value: The search term
 
         Returns:
-            Filtered queryset matching name or uuid
+            Filtered queryset of the matching measurements
         """
         if not value:
             return queryset
 
-        return queryset.filter(Q(name__icontains=value) | Q(uuid__icontains=value))
+        return search(queryset, value)
 
     def __init__(self, *args, **kwargs):
         """Initialise the filter and set the dynamic querysets.
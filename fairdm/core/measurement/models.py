@@ -1,4 +1,5 @@
 from django.contrib.contenttypes.fields import GenericRelation
+from django.contrib.postgres.indexes import GinIndex
 from django.utils.functional import classproperty
 
 # from rest_framework.authtoken.models import Token
@@ -91,6 +92,9 @@ class Measurement(BasePolymorphicModel):
         verbose_name_plural = _("measurements")
         ordering = ["-modified"]
         default_related_name = "measurements"
+        indexes = [
+            GinIndex(fields=["search_vector"], name="measurement_search_idx"),
+        ]
         permissions = [
             *CORE_PERMISSIONS,
         ]
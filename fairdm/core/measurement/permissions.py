@@ -93,7 +93,7 @@ class MeasurementPermissionBackend(PolymorphicObjectPermissionBackend):
             return True
 
         # Check inherited dataset permission
-        if obj.dataset:
+        if obj.dataset_id:
             # Map measurement permissions to dataset permissions
             permission_map = {
                 "measurement.view_measurement": "dataset.view_dataset",
@@ -107,6 +107,6 @@ class MeasurementPermissionBackend(PolymorphicObjectPermissionBackend):
             dataset_perm = permission_map.get(perm)
             if dataset_perm:
                 # Check if user has permission on parent dataset
-                return super().has_perm(user_obj, dataset_perm, obj.dataset)
+                return self.has_parent_perm(user_obj, dataset_perm, obj)
 
         return False
@@ -0,0 +1,294 @@
+"""Per-user snapshots of object permissions, cached across requests.
+
+Each object-level ``has_perm`` through guardian costs a query or two, and a record
+page asks a dozen times: once per plugin, and once more through the parent dataset
+for a sample or measurement. A snapshot holds every guardian row a user has,
+directly or through a group, as ``(content type id, object pk) → codenames``. It is
+read from the user's rows in two queries and kept in the cache, so every later
+check, on any object and in any request, is a dictionary lookup. Dataset-inherited
+rights need nothing extra: the dataset's rows are in the same snapshot, and the
+sample and measurement backends look them up by ``dataset_id``.
+
+Snapshots are versioned rather than deleted. A cached snapshot is valid for the
+user's version token and the global one; saving or deleting a user's permission
+row replaces the user's token, and anything that changes a group's rights or its
+members replaces the global token. Grants written without signals, such as
+guardian's ``bulk_create`` for a queryset, show up after
+``FAIRDM_PERMISSION_CACHE_TIMEOUT`` seconds, or at once after
+:func:`invalidate_permissions`.
+
+Anonymous, inactive and superusers never get a snapshot; guardian answers for them
+without a query or with the anonymous user's rows.
+"""
+
+from __future__ import annotations
+
+import functools
+import uuid
+
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+
+#: Seconds a snapshot is kept in the cache.
+DEFAULT_TIMEOUT = 300
+
+_MEMO_ATTR = "_fairdm_permission_snapshot"
+_ATTACHED_ATTR = "_fairdm_permissions"
+_GLOBAL_VERSION_KEY = "fairdm:perms:version"
+
+#: ``(content type id, object pk)`` → the codenames held on that object.
+Grants = dict[tuple[int, str], frozenset[str]]
+
+
+def _user_version_key(user_pk) -> str:
+    return f"fairdm:perms:version:{user_pk}"
+
+
+def _versions(user_pk) -> tuple[str, str]:
+    """The global and user version tokens, issuing any that are missing."""
+    keys = [_GLOBAL_VERSION_KEY, _user_version_key(user_pk)]
+    found = cache.get_many(keys)
+    tokens = []
+    for key in keys:
+        token = found.get(key)
+        if token is None:
+            token = uuid.uuid4().hex
+            # Another process may have issued one first; theirs wins.
+            if not cache.add(key, token, None):
+                token = cache.get(key, token)
+        tokens.append(token)
+    return tokens[0], tokens[1]
+
+
+def load_grants(user, objects: dict[int, set[str]] | None = None) -> Grants:
+    """Every object permission ``user`` holds, read in two queries.
+
+    Args:
+        user: The user whose rows, and whose groups' rows, are read.
+        objects: Content type id → object pks to limit the rows to. All of the
+            user's rows are read when it is None.
+    """
+    from django.db.models import Q
+    from guardian.utils import get_group_obj_perms_model, get_user_obj_perms_model
+
+    grants: dict[tuple[int, str], set[str]] = {}
+    sources = [
+        get_user_obj_perms_model().objects.filter(user=user),
+        get_group_obj_perms_model().objects.filter(group__user=user),
+    ]
+    if objects is not None:
+        if not objects:
+            return {}
+        limit = Q()
+        for content_type_id, pks in objects.items():
+            limit |= Q(content_type_id=content_type_id, object_pk__in=sorted(pks))
+        sources = [queryset.filter(limit) for queryset in sources]
+    for queryset in sources:
+        rows = queryset.values_list(
+            "content_type_id", "object_pk", "permission__codename"
+        )
+        for content_type_id, object_pk, codename in rows:
+            grants.setdefault((content_type_id, str(object_pk)), set()).add(codename)
+    return {key: frozenset(codenames) for key, codenames in grants.items()}
+
+
+class PermissionSnapshot:
+    """A user's object permissions, answering checks without a query."""
+
+    def __init__(self, grants: Grants):
+        self.grants = grants
+
+    def get_perms(self, model, object_pk) -> frozenset[str]:
+        content_type = ContentType.objects.get_for_model(model)
+        return self.grants.get((content_type.pk, str(object_pk)), frozenset())
+
+    def has_perm(self, perm: str, model, object_pk) -> bool:
+        """Whether ``perm`` is held on the ``model`` record ``object_pk``.
+
+        Raises guardian's ``WrongAppError`` for a permission whose app label is not
+        the model's, as guardian does.
+        """
+        if "." in perm:
+            app_label, codename = perm.split(".", 1)
+            if app_label != model._meta.app_label:
+                from guardian.exceptions import WrongAppError
+
+                raise WrongAppError(
+                    f"Passed perm has app label of '{app_label}' while given obj has "
+                    f"app label '{model._meta.app_label}'"
+                )
+        else:
+            codename = perm
+        return codename in self.get_perms(model, object_pk)
+
+    def has_obj_perm(self, perm: str, obj) -> bool:
+        """:meth:`has_perm` for an instance, filed as ``get_permission_target`` does."""
+        return self.has_perm(perm, permission_model(obj, perm), obj.pk)
+
+
+def has_own_rows(user) -> bool:
+    """Whether checks for ``user`` depend on the user's own guardian rows."""
+    return bool(
+        user is not None
+        and user.is_authenticated
+        and user.is_active
+        and not user.is_superuser
+    )
+
+
+def get_snapshot(user) -> PermissionSnapshot | None:
+    """The user's snapshot, from the user, the cache, or the database in that order.
+
+    Kept on the user object too, alongside the versions it was read at, so the
+    backends consulted for one check share it. Returns None for users guardian
+    answers without rows of their own.
+    """
+    if not has_own_rows(user):
+        return None
+
+    versions = _versions(user.pk)
+    memo = getattr(user, _MEMO_ATTR, None)
+    if memo is not None and memo[0] == versions:
+        return memo[1]
+
+    key = f"fairdm:perms:{user.pk}:{versions[0]}:{versions[1]}"
+    grants = cache.get(key)
+    if grants is None:
+        grants = load_grants(user)
+        timeout = getattr(settings, "FAIRDM_PERMISSION_CACHE_TIMEOUT", DEFAULT_TIMEOUT)
+        cache.set(key, grants, timeout)
+
+    snapshot = PermissionSnapshot(grants)
+    setattr(user, _MEMO_ATTR, (versions, snapshot))
+    return snapshot
+
+
+def prefetch_permissions(user, objects) -> list:
+    """Load ``user``'s grants on a page of objects, and on their datasets, at once.
+
+    Reads only the rows for these objects, in two queries, and attaches them to
+    each object; ``user.has_perm(perm, obj)`` on any of them then answers from the
+    attached rows, including through the parent dataset for a sample or
+    measurement. For list and table pages whose rows each check permissions, so
+    the page costs the same at any length without loading the user's whole
+    snapshot.
+
+    Returns:
+        list: ``objects``, evaluated. A queryset is evaluated in place, so a
+        template iterating it afterwards sees the same instances.
+    """
+    if hasattr(objects, "_fetch_all"):
+        objects._fetch_all()
+    objects = list(objects)
+    if not objects or not has_own_rows(user):
+        return objects
+
+    wanted: dict[int, set[str]] = {}
+
+    def want(model, pk):
+        content_type = ContentType.objects.get_for_model(model)
+        wanted.setdefault(content_type.pk, set()).add(str(pk))
+
+    for obj in objects:
+        want(type(obj), obj.pk)
+        base_class = getattr(obj, "type_of", None)
+        if base_class is not None:
+            want(base_class, obj.pk)
+        if getattr(obj, "dataset_id", None) is not None:
+            want(obj._meta.get_field("dataset").related_model, obj.dataset_id)
+
+    snapshot = PermissionSnapshot(load_grants(user, wanted))
+    for obj in objects:
+        setattr(obj, _ATTACHED_ATTR, (user.pk, snapshot))
+    return objects
+
+
+def snapshot_for(user, obj) -> PermissionSnapshot | None:
+    """Rows :func:`prefetch_permissions` attached to ``obj``, else the user's snapshot."""
+    attached = getattr(obj, _ATTACHED_ATTR, None)
+    if attached is not None and attached[0] == user.pk and has_own_rows(user):
+        return attached[1]
+    return get_snapshot(user)
+
+
+def invalidate_permissions(user=None) -> None:
+    """Retire ``user``'s snapshot, or every user's when no user is given."""
+    if user is None:
+        cache.set(_GLOBAL_VERSION_KEY, uuid.uuid4().hex, None)
+    else:
+        user_pk = getattr(user, "pk", user)
+        cache.set(_user_version_key(user_pk), uuid.uuid4().hex, None)
+
+
+@functools.cache
+def _base_owns_permission(base_label: str, codename: str) -> bool:
+    from django.apps import apps
+    from django.contrib.auth.models import Permission
+
+    base_class = apps.get_model(base_label)
+    return Permission.objects.filter(
+        content_type=ContentType.objects.get_for_model(base_class), codename=codename
+    ).exists()
+
+
+def base_owns_permission(base_class, perm: str) -> bool:
+    """Whether ``perm`` is declared on the polymorphic ``base_class``.
+
+    Memoised for the life of the process: permissions change with migrations, not
+    at runtime, and this is asked on every check of a polymorphic record.
+    """
+    return _base_owns_permission(base_class._meta.label, perm.rsplit(".", 1)[-1])
+
+
+def permission_model(obj, perm: str):
+    """The model whose content type ``perm`` on ``obj`` is filed under."""
+    base_class = getattr(obj, "type_of", None)
+    if (
+        base_class is not None
+        and type(obj) is not base_class
+        and base_owns_permission(base_class, perm)
+    ):
+        return base_class
+    return type(obj)
+
+
+def user_permission_changed(sender, instance, **kwargs):
+    invalidate_permissions(instance.user_id)
+
+
+def group_permission_changed(sender, instance, **kwargs):
+    invalidate_permissions()
+
+
+def group_membership_changed(sender, action, **kwargs):
+    if action in ("post_add", "post_remove", "post_clear"):
+        invalidate_permissions()
+
+
+def connect_signals() -> None:
+    """Retire snapshots whenever a guardian row or a group membership changes.
+
+    Connected to guardian's permission models by name, so a ``post_delete``
+    receiver does not switch off fast deletes for every other model.
+    """
+    from django.contrib.auth import get_user_model
+    from django.db.models.signals import m2m_changed, post_delete, post_save
+    from guardian.utils import get_group_obj_perms_model, get_user_obj_perms_model
+
+    for signal in (post_save, post_delete):
+        signal.connect(
+            user_permission_changed,
+            sender=get_user_obj_perms_model(),
+            dispatch_uid="permission_cache.user_permission_changed",
+        )
+        signal.connect(
+            group_permission_changed,
+            sender=get_group_obj_perms_model(),
+            dispatch_uid="permission_cache.group_permission_changed",
+        )
+    m2m_changed.connect(
+        group_membership_changed,
+        sender=get_user_model().groups.through,
+        dispatch_uid="permission_cache.group_membership_changed",
+    )
@@ -16,6 +16,7 @@ too, rather than through an unwritten delegation contract.
 
 from guardian.backends import ObjectPermissionBackend
 
+from .permission_cache import snapshot_for
 from .utils import get_non_polymorphic_instance, get_permission_target
 
 
@@ -32,8 +33,27 @@ class PolymorphicObjectPermissionBackend(ObjectPermissionBackend):
     """
 
     def has_perm(self, user_obj, perm, obj=None):
+        if obj is not None:
+            # Answered from prefetched rows or the user's cached permission snapshot
+            # where there is one (fairdm/core/permission_cache.py), without a query.
+            snapshot = snapshot_for(user_obj, obj)
+            if snapshot is not None:
+                return snapshot.has_obj_perm(perm, obj)
         return super().has_perm(user_obj, perm, get_permission_target(obj, perm))
 
+    def has_parent_perm(self, user_obj, perm, obj, field="dataset"):
+        """Check ``perm`` on the record ``obj.<field>`` points at.
+
+        Used by the sample and measurement backends for the parent dataset. The
+        snapshot needs only the foreign key, so the parent is loaded only when
+        guardian has to answer.
+        """
+        snapshot = snapshot_for(user_obj, obj)
+        if snapshot is not None:
+            model = obj._meta.get_field(field).related_model
+            return snapshot.has_perm(perm, model, getattr(obj, f"{field}_id"))
+        return super().has_perm(user_obj, perm, getattr(obj, field))
+
     def get_all_permissions(self, user_obj, obj=None):
         """List every permission this backend grants on ``obj`` (F4).
 
@@ -1,4 +1,5 @@
 from django.contrib.contenttypes.fields import GenericRelation
+from django.contrib.postgres.indexes import GinIndex
 from django.core.exceptions import ValidationError
 
 # from django.db.models import QuerySet
@@ -145,6 +146,9 @@ class Project(BaseModel):
         verbose_name_plural = _("projects")
         default_related_name = "projects"
         ordering = ["-modified"]
+        indexes = [
+            GinIndex(fields=["search_vector"], name="project_search_idx"),
+        ]
         permissions = [
             *CORE_PERMISSIONS,
             ("change_project_metadata", _("Can edit project metadata")),
@@ -17,7 +17,7 @@ class ProjectSerializer(ModelSerializer):
 
     class Meta:
         model = Project
-        exclude = ["visibility", "options"]
+        exclude = ["visibility", "options", "search_vector"]
         expandable_fields = {
             "datasets": (
                 "fairdm.contrib.api.serializers.DatasetSerializer",
@@ -0,0 +1,72 @@
+"""The core record a request is about, resolved once per request.
+
+A record page reads its record many times over: the plugin resolves it from the
+address, ``can_open`` checks it for every registered plugin, and templates reverse
+plugin URLs against its polymorphic base. :func:`resolve_record` fetches it once,
+as its real subclass, and keeps it on the request together with its base view,
+which is built from the row already fetched (see
+:func:`~fairdm.core.utils.get_non_polymorphic_instance`).
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from django.shortcuts import get_object_or_404
+
+from .utils import get_non_polymorphic_instance
+
+if TYPE_CHECKING:
+    from django.db.models import Model
+    from django.http import HttpRequest
+
+_CACHE_ATTR = "_fairdm_records"
+
+
+class Record(NamedTuple):
+    """A resolved record, as its real subclass and as its polymorphic base.
+
+    For a model that is not polymorphic the two are the same object.
+    """
+
+    typed: Model
+    base: Model
+
+
+def resolve_record(
+    request: HttpRequest | None,
+    model: type[Model],
+    manager: str | None = None,
+    **lookup: Any,
+) -> Record:
+    """Fetch the record of ``model`` matching ``lookup``, once per request.
+
+    Args:
+        request: The request the record is resolved for, which caches it. Without a
+            request the record is fetched and nothing is cached.
+        model: The model to look the record up in.
+        manager: The name of the manager to read through, such as ``"all_objects"``.
+            Defaults to the model's default manager. Records read through different
+            managers are cached apart, so a privacy-filtered manager still 404s.
+        **lookup: Field lookups identifying one record.
+
+    Raises:
+        Http404: if no record matches.
+    """
+    cache = getattr(request, _CACHE_ATTR, None) if request is not None else {}
+    if cache is None:
+        cache = {}
+        setattr(request, _CACHE_ATTR, cache)
+
+    key = (model._meta.label, manager, tuple(sorted(lookup.items())))
+    if key not in cache:
+        queryset = getattr(model, manager) if manager else model._default_manager
+        obj = get_object_or_404(queryset, **lookup)
+        # A polymorphic manager already returns the real subclass; any other
+        # manager over a polymorphic model returns the base, which is upgraded.
+        if hasattr(obj, "polymorphic_model_marker"):
+            real_class = obj.get_real_instance_class()
+            if real_class is not None and real_class is not type(obj):
+                obj = obj.get_real_instance()
+        cache[key] = Record(obj, get_non_polymorphic_instance(obj))
+    return cache[key]
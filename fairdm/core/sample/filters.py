@@ -14,6 +14,7 @@ from django.db.models import Q
 from django.utils.translation import gettext_lazy as _
 
 from fairdm.core.sample.models import Sample
+from fairdm.core.search import search
 from fairdm.core.vocabularies import FairDMSampleStatus
 
 
@@ -98,7 +99,7 @@ class SampleFilter(SampleFilterMixin, django_filters.FilterSet):
     - status: Filter by sample availability status
     - dataset: Filter by parent dataset
     - polymorphic_ctype: Filter by sample type (RockSample, WaterSample, etc.)
-    - search: Generic search across name, local_id, and uuid
+    - search: Full-text search of the samples' search documents
     - description: Search in associated description text
     - date_after/date_before: Filter by associated date ranges
 
@@ -176,7 +177,10 @@ class SampleFilter(SampleFilterMixin, django_filters.FilterSet):
         )
 
     def filter_search(self, queryset, name, value):
-        """Filter by generic search across name, local_id, and uuid fields.
+        """Filter by full-text search of the samples' search documents.
+
+        Matches names, local IDs, UUIDs, descriptions, keywords, tags and the
+        registered type's text fields, best match first (see `fairdm.core.search`).
 
         Args:
             queryset: The queryset to filter
@@ -184,16 +188,12 @@ class SampleFilter(SampleFilterMixin, django_filters.FilterSet):
             value: The search term
 
         Returns:
-            Filtered queryset matching name, local_id, or uuid
+            Filtered queryset of the matching samples
         """
         if not value:
             return queryset
 
-        return queryset.filter(
-            Q(name__icontains=value)
-            | Q(local_id__icontains=value)
-            | Q(uuid__icontains=value)
-        )
+        return search(queryset, value)
 
     class Meta(SampleFilterMixin.Meta):
         """Meta configuration for SampleFilter."""
@@ -0,0 +1,159 @@
+"""Sample hierarchy traversal in one recursive query.
+
+``SampleRelation`` rows are edges with ``source = child`` and ``target = parent``.
+A core split into sections, sub-samples and aliquots makes trees thousands of
+nodes wide and dozens deep, and walking them one level per query costs a round
+trip per generation. The helpers here walk the whole hierarchy in the database with
+a ``WITH RECURSIVE`` common table expression, which PostgreSQL and SQLite both
+support with the same syntax.
+
+A walk without a depth limit carries only sample ids and combines levels with
+``UNION``, so each sample is visited once and a cycle ends the walk rather than
+repeating it. A walk that reports or limits depth carries ``(id, depth)`` and stops
+at ``max_depth``, or at :data:`MAX_DEPTH` when none is given; the shortest depth is
+kept for a sample reached by several paths.
+
+:func:`find_cycles` checks a batch of new edges against the stored ones in the same
+way, so ``SampleRelation`` refuses loops of any length, and a bulk import can check
+every new edge at once.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from django.db import connection
+from django.db.models.expressions import RawSQL
+
+#: The deepest level a depth-reporting walk follows when no limit is given.
+MAX_DEPTH = 1000
+
+DESCENDANTS = "descendants"
+ANCESTORS = "ancestors"
+
+
+def _relation_table() -> str:
+    from .models import SampleRelation
+
+    return connection.ops.quote_name(SampleRelation._meta.db_table)
+
+
+def _columns(direction: str) -> tuple[str, str]:
+    """The column a walk steps from and the column it steps to."""
+    if direction == DESCENDANTS:
+        return "target_id", "source_id"
+    if direction == ANCESTORS:
+        return "source_id", "target_id"
+    raise ValueError(f"Unknown direction {direction!r}")
+
+
+def walk_sql(
+    sample_id,
+    direction: str = DESCENDANTS,
+    max_depth: int | None = None,
+    with_depth: bool = False,
+    relation_type: str = "child_of",
+) -> tuple[str, list]:
+    """SQL selecting the samples reached from ``sample_id``, and its parameters.
+
+    Args:
+        sample_id: The sample the walk starts from. It is never part of the result.
+        direction: :data:`DESCENDANTS` or :data:`ANCESTORS`.
+        max_depth: The deepest level to follow; None follows every level.
+        with_depth: Select ``(id, depth)`` instead of ``id``, with the shortest
+            depth for each sample.
+        relation_type: The ``SampleRelation.type`` to follow.
+    """
+    table = _relation_table()
+    step_from, step_to = _columns(direction)
+
+    # Only the quoted table name and fixed column names are interpolated; every
+    # value is a parameter.
+    if max_depth is None and not with_depth:
+        sql = (
+            f"WITH RECURSIVE walk(id) AS ("  # noqa: S608
+            f"SELECT r.{step_to} FROM {table} r "
+            f"WHERE r.{step_from} = %s AND r.type = %s "
+            f"UNION "
+            f"SELECT r.{step_to} FROM {table} r JOIN walk w ON r.{step_from} = w.id "
+            f"WHERE r.type = %s"
+            f") SELECT id FROM walk WHERE id <> %s"
+        )
+        return sql, [sample_id, relation_type, relation_type, sample_id]
+
+    limit = MAX_DEPTH if max_depth is None else max_depth
+    selected = "id, MIN(depth) AS depth" if with_depth else "id"
+    sql = (
+        f"WITH RECURSIVE walk(id, depth) AS ("  # noqa: S608
+        f"SELECT r.{step_to}, 1 FROM {table} r "
+        f"WHERE r.{step_from} = %s AND r.type = %s "
+        f"UNION "
+        f"SELECT r.{step_to}, w.depth + 1 FROM {table} r "
+        f"JOIN walk w ON r.{step_from} = w.id "
+        f"WHERE r.type = %s AND w.depth < %s"
+        f") SELECT {selected} FROM walk WHERE id <> %s GROUP BY id"
+    )
+    return sql, [sample_id, relation_type, relation_type, limit, sample_id]
+
+
+def reachable(sample_id, direction: str = DESCENDANTS, max_depth=None) -> RawSQL:
+    """The samples reached from ``sample_id``, as a subquery for ``pk__in``."""
+    return RawSQL(*walk_sql(sample_id, direction, max_depth))  # noqa: S611 — parameterised
+
+
+def depths(sample_id, direction: str = DESCENDANTS, max_depth=None) -> dict[int, int]:
+    """Sample id → its depth below (or above) ``sample_id``, in one query."""
+    sql, params = walk_sql(sample_id, direction, max_depth, with_depth=True)
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        return dict(cursor.fetchall())
+
+
+def find_cycles(
+    edges: Iterable[tuple[int, int]],
+    relation_type: str = "child_of",
+    exclude_pk=None,
+) -> set[tuple[int, int]]:
+    """The new ``(source_id, target_id)`` edges that would close a loop.
+
+    An edge makes ``source`` a child of ``target``, so it closes a loop when
+    ``target`` is already below ``source``: through the stored relations, the other
+    new edges, or both. Every edge is checked by one query.
+
+    Args:
+        edges: The edges about to be stored.
+        relation_type: The ``SampleRelation.type`` they will be stored with.
+        exclude_pk: A stored relation to leave out, such as the row being updated.
+    """
+    edges = sorted({(s, t) for s, t in edges if s is not None and t is not None})
+    if not edges:
+        return set()
+
+    table = _relation_table()
+    values = ", ".join(["(%s, %s)"] * len(edges))
+    params: list = [value for edge in edges for value in edge]
+    # The table name is quoted by the backend; every value is a parameter.
+    stored = f"SELECT source_id, target_id FROM {table} WHERE type = %s"  # noqa: S608
+    params.append(relation_type)
+    if exclude_pk is not None:
+        stored += " AND id <> %s"
+        params.append(exclude_pk)
+
+    # Walk down from each new edge's source, remembering where each walk began; an
+    # edge is a loop when its own walk reaches its target.
+    sql = (
+        f"WITH RECURSIVE added(source_id, target_id) AS (VALUES {values}), "  # noqa: S608
+        f"edges(source_id, target_id) AS ("
+        f"{stored} UNION ALL SELECT source_id, target_id FROM added"
+        f"), "
+        f"walk(origin, id) AS ("
+        f"SELECT source_id, source_id FROM added "
+        f"UNION "
+        f"SELECT w.origin, e.source_id FROM edges e JOIN walk w ON e.target_id = w.id"
+        f") "
+        f"SELECT a.source_id, a.target_id FROM added a "
+        f"JOIN walk w ON w.origin = a.source_id AND w.id = a.target_id"
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        return {(source_id, target_id) for source_id, target_id in cursor.fetchall()}
@@ -5,9 +5,10 @@ Provides optimized query methods for common Sample operations including:
 - Prefetching metadata (descriptions, dates, identifiers)
 - Prefetching controlled keywords
 - Filtering by relationship types
-- Traversing sample hierarchies
+- Traversing sample hierarchies in one recursive query
 """
 
+from django.db.models import Q
 from polymorphic.managers import PolymorphicQuerySet
 
 
@@ -126,12 +127,11 @@ class SampleQuerySet(PolymorphicQuerySet):
             # Return the sources (children)
             sample_ids = queryset.values_list("source_id", flat=True)
         else:
-            # Get all samples involved in these relationships
-            relationship_ids = queryset.values_list("source_id", "target_id")
-            sample_ids = set()
-            for source_id, target_id in relationship_ids:
-                sample_ids.add(source_id)
-                sample_ids.add(target_id)
+            # Get all samples involved in these relationships, on either side
+            return self.filter(
+                Q(id__in=queryset.values("source_id"))
+                | Q(id__in=queryset.values("target_id"))
+            )
 
         return self.filter(id__in=sample_ids)
 
@@ -141,13 +141,11 @@ class SampleQuerySet(PolymorphicQuerySet):
         The single traversal implementation for "descendants" (D-007): the model's
         `Sample.get_descendants()` delegates here rather than repeating the walk.
         `SampleRelation`'s edge convention is ``source = child``, ``target = parent``, so
-        finding descendants means walking from each level's ``target`` to its ``source``
-        - the reverse of this method's previous, swapped implementation, which walked
-        source to target and returned ancestors instead.
+        finding descendants means walking from each level's ``target`` to its ``source``.
 
-        Uses iterative breadth-first search to traverse the sample hierarchy
-        and collect all descendants. This is more efficient than recursive
-        queries for moderate depths (<10 levels).
+        The walk is one recursive query (:mod:`fairdm.core.sample.hierarchy`), used
+        as a subquery, so the whole hierarchy costs a single round trip at any depth.
+        A loop in the stored relations ends the walk rather than repeating it.
 
         Args:
             sample: The sample instance to get descendants for
@@ -161,43 +159,11 @@ class SampleQuerySet(PolymorphicQuerySet):
             >>> descendants = Sample.objects.get_descendants(parent, max_depth=5)
             >>> # descendants includes all children, grandchildren, etc.
         """
-        from .models import SampleRelation
+        from .hierarchy import DESCENDANTS, reachable
 
         if max_depth is not None and max_depth <= 0:
             return self.none()
-
-        descendant_ids = set()
-        visited = {sample.id}
-        current_level = {sample.id}
-        depth = 0
-
-        while current_level:
-            if max_depth is not None and depth >= max_depth:
-                break
-
-            # Children of the current level: rows whose target is a current-level
-            # sample, keeping their source (D-004: "child_of" is the only type).
-            next_level = set(
-                SampleRelation.objects.filter(
-                    target_id__in=current_level, type="child_of"
-                ).values_list("source_id", flat=True)
-            )
-
-            # Remove any samples we've already seen to prevent cycles
-            next_level = next_level - visited
-
-            if not next_level:
-                break
-
-            descendant_ids.update(next_level)
-            visited.update(next_level)
-            current_level = next_level
-            depth += 1
-
-        if not descendant_ids:
-            return self.none()
-
-        return self.filter(id__in=descendant_ids)
+        return self.filter(id__in=reachable(sample.id, DESCENDANTS, max_depth))
 
     def get_ancestors(self, sample, max_depth=None):
         """Get all ancestor samples in a hierarchy.
@@ -206,9 +172,7 @@ class SampleQuerySet(PolymorphicQuerySet):
         `Sample.get_ancestors()` delegates here. Walks the reverse direction of
         `get_descendants()` - from each level's ``source`` to its ``target`` - since
         an ancestor is reached by following ``child_of`` from a sample toward its parent.
-
-        Uses iterative breadth-first search to traverse the sample hierarchy
-        and collect all ancestors.
+        Like it, the walk is a single recursive query.
 
         Args:
             sample: The sample instance to get ancestors for
@@ -222,39 +186,40 @@ class SampleQuerySet(PolymorphicQuerySet):
             >>> ancestors = Sample.objects.get_ancestors(child, max_depth=3)
             >>> # ancestors includes all parents, grandparents, etc.
         """
-        from .models import SampleRelation
+        from .hierarchy import ANCESTORS, reachable
 
         if max_depth is not None and max_depth <= 0:
             return self.none()
+        return self.filter(id__in=reachable(sample.id, ANCESTORS, max_depth))
 
-        ancestor_ids = set()
-        visited = {sample.id}
-        current_level = {sample.id}
-        depth = 0
-
-        while current_level:
-            if max_depth is not None and depth >= max_depth:
-                break
-
-            # Parents of the current level: rows whose source is a current-level
-            # sample, keeping their target.
-            next_level = set(
-                SampleRelation.objects.filter(
-                    source_id__in=current_level, type="child_of"
-                ).values_list("target_id", flat=True)
-            )
+    def get_subtree(self, sample, max_depth=None):
+        """Get the descendants of a sample together with their depth below it.
 
-            next_level = next_level - visited
+        Two queries whatever the size of the tree: one recursive walk for the depths
+        and one for the samples. A sample reached along several paths is given its
+        shortest depth.
 
-            if not next_level:
-                break
+        Args:
+            sample: The sample at the root of the subtree
+            max_depth: Optional maximum depth to traverse (None = unlimited)
 
-            ancestor_ids.update(next_level)
-            visited.update(next_level)
-            current_level = next_level
-            depth += 1
+        Returns:
+            list: The descendant samples, each with a ``depth`` attribute (1 for a
+                direct child), ordered by depth and then id. Not chainable, unlike
+                the other methods here, since the depths come from the walk.
 
-        if not ancestor_ids:
-            return self.none()
+        Example:
+            >>> for sample in Sample.objects.get_subtree(core):
+            ...     print("  " * sample.depth, sample.name)
+        """
+        from .hierarchy import DESCENDANTS, depths
 
-        return self.filter(id__in=ancestor_ids)
+        if max_depth is not None and max_depth <= 0:
+            return []
+        found = depths(sample.id, DESCENDANTS, max_depth)
+        if not found:
+            return []
+        samples = list(self.filter(id__in=found))
+        for item in samples:
+            item.depth = found[item.id]
+        return sorted(samples, key=lambda item: (item.depth, item.id))
@@ -0,0 +1,36 @@
+# Generated by Django 5.2.12 on 2026-10-16 15:20
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+# Fills the name, identifiers and descriptions of existing records; keywords, tags
+# and registered type fields follow from `manage.py rebuild_search_index`.
+POPULATE = """
+UPDATE sample_sample t SET search_vector =
+    setweight(to_tsvector('simple', concat_ws(' ', t.name, t.uuid, t.local_id)), 'A')
+    || setweight(to_tsvector('simple', coalesce((
+        SELECT string_agg(d.value, ' ') FROM sample_sampledescription d
+        WHERE d.related_id = t.id
+    ), '')), 'B')
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sample', '0008_migrate_sample_status_to_unknown'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='sample',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True, verbose_name='search document'),
+        ),
+        migrations.AddIndex(
+            model_name='sample',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='sample_search_idx'),
+        ),
+        migrations.RunSQL(POPULATE, migrations.RunSQL.noop),
+    ]
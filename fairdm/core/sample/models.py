@@ -1,6 +1,7 @@
 import re
 
 from django.contrib.contenttypes.fields import GenericRelation
+from django.contrib.postgres.indexes import GinIndex
 from django.core.exceptions import ValidationError
 from django.db import models as django_models
 from django.db.models.signals import pre_save
@@ -9,7 +10,6 @@ from django.utils.functional import classproperty
 
 # from rest_framework.authtoken.models import Token
 from django.utils.translation import gettext_lazy as _
-from polymorphic.managers import PolymorphicManager
 from research_vocabs.fields import ConceptField
 from shortuuid.django_fields import ShortUUIDField
 
@@ -21,6 +21,7 @@ from ..abstract import (
     AbstractIdentifier,
     BasePolymorphicModel,
 )
+from ..managers import PolymorphicManager
 from ..utils import CORE_PERMISSIONS
 from ..vocabularies import (
     FairDMDates,
@@ -138,6 +139,9 @@ class Sample(BasePolymorphicModel):
         verbose_name_plural = _("samples")
         ordering = ["added"]
         default_related_name = "samples"
+        indexes = [
+            GinIndex(fields=["search_vector"], name="sample_search_idx"),
+        ]
         permissions = [
             *CORE_PERMISSIONS,
             ("import_data", "Can import sample data"),
@@ -201,20 +205,16 @@ class Sample(BasePolymorphicModel):
             >>> parent = Sample.objects.get(uuid="s_abc123")
             >>> children = parent.get_related_samples(relationship_type="child_of")
         """
-        relationships = self.get_all_relationships()
-
+        relationships = SampleRelation.objects.all()
         if relationship_type:
             relationships = relationships.filter(type=relationship_type)
 
-        # Get sample IDs from both source and target, excluding self
-        related_ids = set()
-        for rel in relationships:
-            if rel.source_id != self.id:
-                related_ids.add(rel.source_id)
-            if rel.target_id != self.id:
-                related_ids.add(rel.target_id)
-
-        return Sample.objects.filter(id__in=related_ids)
+        # Both sides as subqueries, so the relation rows are never loaded
+        sources = relationships.filter(target=self).values("source_id")
+        targets = relationships.filter(source=self).values("target_id")
+        return Sample.objects.filter(
+            django_models.Q(id__in=sources) | django_models.Q(id__in=targets)
+        ).exclude(id=self.id)
 
     def get_children(self):
         """Get all child samples (samples where this is the target of 'child_of' relationship).
@@ -457,7 +457,7 @@ class SampleRelation(models.Model):
 
     Validation:
         - Prevents self-reference (sample cannot relate to itself)
-        - Prevents direct circular relationships (A→B and B→A with same type)
+        - Prevents circular relationships of any length (A→B→...→A with same type)
         - Enforces unique_together constraint on (source, target, type)
     """
 
@@ -492,30 +492,30 @@ class SampleRelation(models.Model):
         return f"{self.source} {self.type} {self.target}"
 
     def _refuse_self_reference_and_loop(self):
-        """Raise if this relationship is a self-reference or a two-step loop.
+        """Raise if this relationship is a self-reference or closes a loop.
 
         FR-027: refused when saved directly, not only under validation - both
         ``clean()`` and ``save()`` call this rather than each carrying its own copy.
+        A loop of any length is found by one recursive query
+        (:func:`fairdm.core.sample.hierarchy.find_cycles`), not only a two-step one.
         """
+        from .hierarchy import find_cycles
+
         # 1. Prevent self-reference
         if self.source_id and self.target_id and self.source_id == self.target_id:
             raise ValidationError(_("Sample cannot relate to itself"))
 
-        # 2. Prevent direct circular relationships (A→B and B→A with same type)
+        # 2. Prevent circular relationships (A→B→...→A with the same type)
         if self.source_id and self.target_id and self.type:  # noqa: SIM102
-            # Check if reverse relationship already exists
-            if (
-                SampleRelation.objects.filter(
-                    source_id=self.target_id, target_id=self.source_id, type=self.type
-                )
-                .exclude(pk=self.pk)
-                .exists()
+            if find_cycles(
+                [(self.source_id, self.target_id)], self.type, exclude_pk=self.pk
             ):
                 raise ValidationError(
                     _(
-                        f"Circular relationship detected: {self.target} already "
-                        f"has {self.type} relationship to {self.source}"
+                        "Circular relationship detected: %(target)s already "
+                        "descends from %(source)s through %(type)s relationships"
                     )
+                    % {"target": self.target, "source": self.source, "type": self.type}
                 )
 
     def clean(self):
@@ -523,7 +523,7 @@ class SampleRelation(models.Model):
         self._refuse_self_reference_and_loop()
 
     def save(self, *args, **kwargs):
-        """Refuse a self-reference or a two-step loop even when saved directly.
+        """Refuse a self-reference or a loop even when saved directly.
 
         FR-027 requires the refusal to hold for ``SampleRelation.objects.create()`` and
         ``.save()``, not only for callers that run ``clean()``/``full_clean()`` first -
@@ -81,7 +81,7 @@ class SamplePermissionBackend(PolymorphicObjectPermissionBackend):
             return True
 
         # Check inherited dataset permission
-        if obj.dataset:
+        if obj.dataset_id:
             # Map sample permissions to dataset permissions
             # FR-031: changing a dataset confers changing AND deleting its samples, and adding
             # samples to it - not the dataset's own delete permission, which the specification
@@ -99,6 +99,6 @@ class SamplePermissionBackend(PolymorphicObjectPermissionBackend):
             dataset_perm = permission_map.get(perm)
             if dataset_perm:
                 # Check if user has permission on parent dataset
-                return super().has_perm(user_obj, dataset_perm, obj.dataset)
+                return self.has_parent_perm(user_obj, dataset_perm, obj)
 
         return False
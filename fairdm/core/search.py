@@ -0,0 +1,300 @@
+"""Ranked full-text search over projects, datasets, samples and measurements.
+
+Matching ``icontains`` across several columns and joins cannot use an index, so
+every search reads the whole table. Instead, each core record keeps a weighted
+``tsvector`` document in its ``search_vector`` column, under a GIN index:
+
+- **A**: the name, UUID and local ID
+- **B**: the descriptions, and the keywords' names and labels
+- **C**: the tags, and the text fields a registered Sample or Measurement type
+  lists in its configuration's ``fields``
+
+A document is rebuilt by one ``UPDATE`` that reads its parts in subqueries, so
+the text never passes through Python. Receivers rebuild a record's document when
+the record, one of its descriptions, its keywords or its tags change. Records
+written without signals (``bulk_create``, ``QuerySet.update()``) are found after
+:func:`rebuild_search_index` runs, which ``manage.py rebuild_search_index`` does.
+
+Documents and queries are parsed with the ``FAIRDM_SEARCH_CONFIG`` text search
+configuration, ``"simple"`` by default, which neither stems nor drops stop words
+and so suits identifiers and mixed-language metadata. Changing it takes effect
+for documents after a rebuild.
+"""
+
+from __future__ import annotations
+
+import re
+
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.contrib.postgres.aggregates import StringAgg
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+from django.core.exceptions import FieldDoesNotExist
+from django.db import models
+from django.db.models import F, OuterRef, Subquery
+from django.db.models.functions import Cast
+
+#: The text search configuration used when ``FAIRDM_SEARCH_CONFIG`` is not set.
+DEFAULT_CONFIG = "simple"
+
+_HEADING_FIELDS = ("name", "uuid", "local_id")
+
+
+def search_config() -> str:
+    return getattr(settings, "FAIRDM_SEARCH_CONFIG", DEFAULT_CONFIG)
+
+
+def indexed_models() -> list[type[models.Model]]:
+    from fairdm.core.models import Dataset, Measurement, Project, Sample
+
+    return [Project, Dataset, Sample, Measurement]
+
+
+def _base(model) -> type[models.Model]:
+    """The model whose table holds ``model``'s documents."""
+    return getattr(model, "type_of", None) or model
+
+
+def _has_field(model, name: str) -> bool:
+    try:
+        model._meta.get_field(name)
+    except FieldDoesNotExist:
+        return False
+    return True
+
+
+def is_indexed(model) -> bool:
+    return any(issubclass(model, base) for base in indexed_models())
+
+
+def registered_text_fields(model) -> list[str]:
+    """The text fields a registered type lists beyond those of its base model."""
+    from fairdm.registry import registry
+    from fairdm.registry.config import flatten_fields
+
+    base = _base(model)
+    if model is base or not registry.is_registered(model):
+        return []
+
+    names = []
+    for name in flatten_fields(registry.get_for_model(model).fields):
+        try:
+            field = model._meta.get_field(name)
+        except FieldDoesNotExist:
+            continue
+        if (
+            isinstance(field, (models.CharField, models.TextField))
+            and not field.choices
+            and not issubclass(base, field.model)
+        ):
+            names.append(name)
+    return names
+
+
+def _joined(queryset, group_by: str, expression) -> Subquery:
+    """``expression`` over every row of ``queryset``, joined with spaces."""
+    return Subquery(
+        queryset.order_by()
+        .values(group_by)
+        .annotate(text=StringAgg(expression, " "))
+        .values("text")
+    )
+
+
+def search_document(model) -> SearchVector:
+    """The weighted document of a ``model`` record, as an expression on its base table.
+
+    Args:
+        model: A core model, or a registered type whose registered text fields are
+            to be included.
+    """
+    from fairdm.contrib.generic.models import TaggedItem
+
+    base = _base(model)
+    config = search_config()
+    pk = OuterRef("pk")
+
+    heading = [F(name) for name in _HEADING_FIELDS if _has_field(base, name)]
+    document = SearchVector(*heading, weight="A", config=config)
+
+    descriptions = base._meta.get_field("descriptions").related_model
+    keywords = base._meta.get_field("keywords")
+    source = keywords.m2m_field_name()
+    concept = keywords.m2m_reverse_field_name()
+    keyword_links = keywords.remote_field.through.objects.filter(**{source: pk})
+    document += SearchVector(
+        _joined(descriptions.objects.filter(related=pk), "related", "value"),
+        _joined(keyword_links, source, f"{concept}__label"),
+        _joined(keyword_links, source, f"{concept}__name"),
+        weight="B",
+        config=config,
+    )
+
+    tags = TaggedItem.objects.filter(
+        content_type=ContentType.objects.get_for_model(model),
+        object_id=Cast(pk, models.CharField()),
+    )
+    fields = [
+        Subquery(model._base_manager.filter(pk=pk).values(name))
+        for name in registered_text_fields(model)
+    ]
+    document += SearchVector(
+        _joined(tags, "object_id", "tag__name"), *fields, weight="C", config=config
+    )
+    return document
+
+
+def update_search_document(obj) -> None:
+    """Rebuild the document of one record, in one query."""
+    model = type(obj)
+    ctype_id = getattr(obj, "polymorphic_ctype_id", None)
+    if model is _base(model) and ctype_id is not None:
+        # Loaded as its base model; the registered type decides the document.
+        model = ContentType.objects.get_for_id(ctype_id).model_class() or model
+    _base(model)._base_manager.filter(pk=obj.pk).update(
+        search_vector=search_document(model)
+    )
+
+
+def update_search_documents(queryset) -> int:
+    """Rebuild the documents of ``queryset``, with one ``UPDATE`` per type in it.
+
+    Args:
+        queryset: Records of an indexed base model.
+
+    Returns:
+        int: The number of records indexed.
+    """
+    base = queryset.model
+    if not _has_field(base, "polymorphic_ctype"):
+        return queryset.update(search_vector=search_document(base))
+
+    count = 0
+    ctype_ids = queryset.order_by().values_list("polymorphic_ctype", flat=True)
+    for ctype_id in set(ctype_ids.distinct()):
+        model = ContentType.objects.get_for_id(ctype_id).model_class() or base
+        count += queryset.filter(polymorphic_ctype_id=ctype_id).update(
+            search_vector=search_document(model)
+        )
+    return count
+
+
+def rebuild_search_index() -> int:
+    """Rebuild every document.
+
+    Returns:
+        int: The number of records indexed.
+    """
+    return sum(
+        update_search_documents(base._base_manager.all()) for base in indexed_models()
+    )
+
+
+#: Quotes, ``or`` and a leading ``-``: the text is a web search, not a prefix search.
+_OPERATORS = re.compile(r'"|(?:^|\s)-|\bor\b', re.IGNORECASE)
+
+
+def parse_query(text: str) -> SearchQuery | None:
+    """The query for ``text``, as the search box reads it.
+
+    Plain words must all appear, each as the start of a word, so a partial UUID
+    or a word still being typed matches. Text using quotes, ``or`` or a leading
+    ``-`` is read as a web search engine reads it: ``"quoted phrases"`` must
+    appear in order, ``or`` offers alternatives and ``-`` excludes a word.
+    Returns None when ``text`` has nothing to search for.
+    """
+    config = search_config()
+    words = re.findall(r"[^\W_]+", text)
+    if not words:
+        return None
+    if _OPERATORS.search(text):
+        return SearchQuery(text, search_type="websearch", config=config)
+    prefixes = " & ".join(f"{word}:*" for word in words)
+    return SearchQuery(prefixes, search_type="raw", config=config)
+
+
+def search(queryset, text: str, rank: bool = True):
+    """The records of ``queryset`` matching ``text``, best match first.
+
+    Matching records carry their relevance as ``search_rank``. Text with nothing
+    to search for leaves ``queryset`` as it is.
+
+    Args:
+        queryset: Records of an indexed model or one of its types.
+        text: The search as the user typed it; see :func:`parse_query`.
+        rank: Order by relevance. Pass False to keep the queryset's ordering.
+    """
+    query = parse_query(text)
+    if query is None:
+        return queryset
+    queryset = queryset.filter(search_vector=query).annotate(
+        search_rank=SearchRank(F("search_vector"), query)
+    )
+    if rank:
+        queryset = queryset.order_by("-search_rank", "pk")
+    return queryset
+
+
+def record_saved(sender, instance, raw=False, **kwargs):
+    """Rebuild the document of a saved record."""
+    if not raw:
+        update_search_document(instance)
+
+
+def part_changed(sender, instance, **kwargs):
+    """Rebuild the document of the record a description belongs to.
+
+    Looked up by ``related_id``, so a description deleted along with its record
+    costs no more than an ``UPDATE`` of no rows.
+    """
+    record = sender._meta.get_field("related").related_model
+    update_search_documents(record._base_manager.filter(pk=instance.related_id))
+
+
+def parts_changed(sender, instance, action, reverse, model, pk_set, **kwargs):
+    """Rebuild the documents of records whose keywords or tags changed."""
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    if not reverse:
+        if is_indexed(type(instance)):
+            update_search_document(instance)
+    elif pk_set and is_indexed(model):
+        base = _base(model)
+        update_search_documents(base._base_manager.filter(pk__in=pk_set))
+
+
+def connect_signals() -> None:
+    """Connect the receivers above for every indexed model and its types.
+
+    Signals are sent with the concrete class as sender, so each type is connected
+    individually rather than connecting ``post_save`` for every model.
+    """
+    from django.apps import apps
+    from django.db.models.signals import m2m_changed, post_delete, post_save
+
+    from fairdm.contrib.generic.models import TaggedItem
+
+    bases = tuple(indexed_models())
+    for model in apps.get_models():
+        if issubclass(model, bases):
+            post_save.connect(
+                record_saved,
+                sender=model,
+                dispatch_uid=f"search.record_saved.{model._meta.label}",
+            )
+    for base in bases:
+        descriptions = base._meta.get_field("descriptions").related_model
+        for signal in (post_save, post_delete):
+            signal.connect(
+                part_changed,
+                sender=descriptions,
+                dispatch_uid=f"search.part_changed.{descriptions._meta.label}",
+            )
+        m2m_changed.connect(
+            parts_changed,
+            sender=base._meta.get_field("keywords").remote_field.through,
+            dispatch_uid=f"search.keywords_changed.{base._meta.label}",
+        )
+    m2m_changed.connect(
+        parts_changed, sender=TaggedItem, dispatch_uid="search.tags_changed"
+    )
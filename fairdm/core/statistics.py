@@ -0,0 +1,104 @@
+"""Per-type record counts for the discovery and collection overview pages.
+
+Counting every registered type separately costs one ``COUNT(*)`` per type per
+request, which on a portal with thirty types is thirty queries before the page
+renders. :func:`get_type_counts` answers for every type at once from a single
+``GROUP BY polymorphic_ctype`` over the base ``Sample`` or ``Measurement`` table
+(:meth:`fairdm.core.managers.PolymorphicManager.get_type_counts`), and caches the
+result for ``FAIRDM_TYPE_COUNTS_TIMEOUT`` seconds.
+
+The cache is cleared when a record is created or deleted, and when a dataset is
+saved, since a dataset's visibility decides which of its records the public
+counts include. An edit that leaves the set of records unchanged keeps it.
+"""
+
+from __future__ import annotations
+
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import cache
+
+from fairdm.utils.choices import Visibility
+
+#: Seconds a set of counts is served from the cache.
+DEFAULT_TIMEOUT = 60
+
+
+def _cache_key(base, public_only: bool) -> str:
+    scope = "public" if public_only else "all"
+    return f"fairdm:type-counts:{base._meta.label_lower}:{scope}"
+
+
+def get_type_counts(base, public_only: bool = False) -> dict[type, int]:
+    """Records of each concrete type under ``base``, from one grouped query.
+
+    Args:
+        base: ``Sample`` or ``Measurement``.
+        public_only: Count only records in public datasets.
+
+    Returns:
+        dict: Model class → number of records of exactly that class. Types with
+        no records are absent.
+    """
+    key = _cache_key(base, public_only)
+    counts = cache.get(key)
+    if counts is None:
+        queryset = base.objects.all()
+        if public_only:
+            queryset = queryset.filter(dataset__visibility=Visibility.PUBLIC)
+        counts = {
+            model._meta.label_lower: count
+            for model, count in base.objects.get_type_counts(queryset).items()
+            if model is not None
+        }
+        timeout = getattr(settings, "FAIRDM_TYPE_COUNTS_TIMEOUT", DEFAULT_TIMEOUT)
+        cache.set(key, counts, timeout)
+    return {apps.get_model(label): count for label, count in counts.items()}
+
+
+def count_for(model, counts: dict[type, int]) -> int:
+    """The model's records and its subtypes', as ``model.objects.count()`` counts."""
+    return sum(count for cls, count in counts.items() if issubclass(cls, model))
+
+
+def invalidate_type_counts(base=None) -> None:
+    """Drop the cached counts for ``base``, or for both Sample and Measurement."""
+    from fairdm.core.models import Measurement, Sample
+
+    bases = [base] if base is not None else [Sample, Measurement]
+    cache.delete_many(
+        [_cache_key(model, scope) for model in bases for scope in (False, True)]
+    )
+
+
+def record_created_or_deleted(sender, instance, created=True, **kwargs):
+    """Clear the counts of the record's base type once one is added or removed."""
+    if created:
+        invalidate_type_counts(instance.type_of)
+
+
+def dataset_saved(sender, instance, **kwargs):
+    """Clear every count, as the dataset's visibility may have changed."""
+    invalidate_type_counts()
+
+
+def connect_signals() -> None:
+    """Connect the receivers above for every Sample and Measurement type.
+
+    Signals are sent with the concrete class as sender, so each type is connected
+    individually rather than connecting ``post_delete`` for every model.
+    """
+    from django.db.models.signals import post_delete, post_save
+
+    from fairdm.core.models import Dataset, Measurement, Sample
+
+    for model in apps.get_models():
+        if issubclass(model, (Sample, Measurement)):
+            uid = f"statistics.record_created_or_deleted.{model._meta.label}"
+            for signal in (post_save, post_delete):
+                signal.connect(
+                    record_created_or_deleted, sender=model, dispatch_uid=uid
+                )
+    post_save.connect(
+        dataset_saved, sender=Dataset, dispatch_uid="statistics.dataset_saved"
+    )
@@ -26,7 +26,12 @@ def documentation_link(path):
 
 
 def get_non_polymorphic_instance(obj):
-    """Return ``obj`` re-fetched through its polymorphic base's non-polymorphic manager.
+    """Return ``obj`` as an instance of its polymorphic base.
+
+    Built from the fields ``obj`` already holds rather than re-fetched: a subclass
+    instance carries every column of its base row, so the base instance is the same
+    record without another query. Permission checks call this for every object they
+    test, which used to cost a query each.
 
     Gated on ``type_of`` directly (F6), not on ``polymorphic_model_marker``: every
     polymorphic model carries the marker, but only ``Sample``, ``Measurement`` and
@@ -34,10 +39,13 @@ def get_non_polymorphic_instance(obj):
     those would otherwise raise ``AttributeError`` here rather than being left alone.
     """
     base_class = getattr(obj, "type_of", None)
-    if base_class is None:
+    if base_class is None or type(obj) is base_class:
         return obj
 
-    return base_class.objects.non_polymorphic().get(pk=obj.pk)
+    names = [field.attname for field in base_class._meta.concrete_fields]
+    return base_class.from_db(
+        obj._state.db, names, [getattr(obj, name) for name in names]
+    )
 
 
 def get_permission_target(obj, perm):
@@ -67,14 +75,10 @@ def get_permission_target(obj, perm):
     if base_class is None or type(obj) is base_class:
         return obj
 
-    from django.contrib.auth.models import Permission
-    from django.contrib.contenttypes.models import ContentType
+    # Memoised per process, so a check no longer queries Permission each time.
+    from .permission_cache import base_owns_permission
 
-    codename = perm.rsplit(".", 1)[-1]
-    base_content_type = ContentType.objects.get_for_model(base_class)
-    if not Permission.objects.filter(
-        content_type=base_content_type, codename=codename
-    ).exists():
+    if not base_owns_permission(base_class, perm):
         return obj
 
     return get_non_polymorphic_instance(obj)
@@ -0,0 +1,356 @@
+"""Bulk generation of fake data, at benchmark scale.
+
+The factories in this package save one record at a time, through ``save()`` and
+every signal and lifecycle hook. That is what a test wants and far too slow for a
+million measurements. :func:`generate` builds the same records with the same
+factories but writes them in batches with :func:`bulk_save`, then rebuilds the
+indexes the skipped hooks would have maintained: search documents, dataset
+extents, the dataset access index and the collaboration graph.
+
+``manage.py generate_fake_data --bulk`` runs it, and the benchmark suite in
+``benchmarks/`` seeds its database with it.
+
+Example::
+
+    from fairdm.factories.bulk import SCALES, generate
+    from fairdm_demo.factories import CustomSampleFactory, ExampleMeasurementFactory
+
+    generate(SCALES["small"], [CustomSampleFactory], [ExampleMeasurementFactory])
+"""
+
+from __future__ import annotations
+
+import random
+from dataclasses import asdict, dataclass
+from itertools import islice
+from typing import TYPE_CHECKING
+
+from django.contrib.auth.hashers import make_password
+from django.contrib.contenttypes.models import ContentType
+from django.db import router, transaction
+from faker import Faker
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Sequence
+
+#: Records written per INSERT.
+BATCH_SIZE = 2000
+
+#: Children per sample in the generated ``child_of`` hierarchy.
+BRANCHING = 4
+
+#: Contributors credited on each project and dataset.
+CREDITS_PER_OBJECT = 3
+
+
+@dataclass(frozen=True)
+class Scale:
+    """How many records of each kind to generate."""
+
+    projects: int
+    datasets: int
+    samples: int
+    measurements: int
+    people: int
+    organizations: int
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+
+#: Named scales. ``large`` is the size a busy portal reaches.
+SCALES = {
+    "small": Scale(
+        projects=5,
+        datasets=20,
+        samples=1_000,
+        measurements=5_000,
+        people=50,
+        organizations=10,
+    ),
+    "medium": Scale(
+        projects=20,
+        datasets=200,
+        samples=20_000,
+        measurements=100_000,
+        people=500,
+        organizations=50,
+    ),
+    "large": Scale(
+        projects=50,
+        datasets=1_000,
+        samples=100_000,
+        measurements=1_000_000,
+        people=2_000,
+        organizations=200,
+    ),
+}
+
+
+def _batches(iterable: Iterable, size: int):
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def bulk_save(objs: Sequence, batch_size: int = BATCH_SIZE) -> list:
+    """Insert unsaved instances of one model in batches, returning them with pks.
+
+    Unlike ``QuerySet.bulk_create()`` this handles multi-table inheritance, which
+    every sample, measurement and contributor type uses: each table of the chain,
+    root first, gets one INSERT per batch, the same call ``Model.save()`` makes per
+    table. A polymorphic model's content type is set as ``save()`` would set it.
+
+    No ``save()`` method, signal or lifecycle hook runs.
+    """
+    if not objs:
+        return []
+    model = type(objs[0])
+    opts = model._meta
+    using = router.db_for_write(model)
+    if any(f.name == "polymorphic_ctype" for f in opts.fields):
+        ctype = ContentType.objects.db_manager(using).get_for_model(
+            model, for_concrete_model=False
+        )
+        for obj in objs:
+            obj.polymorphic_ctype_id = ctype.pk
+
+    chain = [*reversed(opts.get_parent_list()), model]
+    root = chain[0]
+    fields = [
+        f for f in root._meta.local_concrete_fields if f is not root._meta.auto_field
+    ]
+    with transaction.atomic(using=using):
+        for batch in _batches(objs, batch_size):
+            rows = root._base_manager._insert(
+                batch, fields=fields, returning_fields=[root._meta.pk], using=using
+            )
+            for obj, (pk,) in zip(batch, rows, strict=True):
+                setattr(obj, root._meta.pk.attname, pk)
+            for table in chain[1:]:
+                for obj in batch:
+                    setattr(obj, table._meta.pk.attname, obj.pk)
+                table._base_manager._insert(
+                    batch, fields=table._meta.local_concrete_fields, using=using
+                )
+    for obj in objs:
+        obj._state.adding = False
+        obj._state.db = using
+    return list(objs)
+
+
+def _people(count: int, fake: Faker) -> list:
+    from fairdm.contrib.contributors.models import Person
+    from fairdm.contrib.contributors.services.matching import name_key
+
+    people = []
+    for _ in range(count):
+        first, last = fake.first_name(), fake.last_name()
+        name = f"{first} {last}"
+        people.append(
+            Person(
+                first_name=first,
+                last_name=last,
+                name=name,
+                name_key=name_key(name),
+                password=make_password(None),
+            )
+        )
+    return bulk_save(people)
+
+
+def _points(count: int) -> list:
+    """``count`` distinct locations spread over the globe."""
+    from decimal import Decimal
+
+    from fairdm.contrib.location.geohash import encode as encode_geohash
+    from fairdm.contrib.location.models import Point
+
+    coordinates = set()
+    while len(coordinates) < count:
+        coordinates.add(
+            (
+                Decimal(random.randint(-180_000_000, 180_000_000)) / 1_000_000,
+                Decimal(random.randint(-90_000_000, 90_000_000)) / 1_000_000,
+            )
+        )
+    return Point.objects.bulk_create(
+        [Point(x=x, y=y, geohash=encode_geohash(x, y)) for x, y in coordinates],
+        batch_size=BATCH_SIZE,
+    )
+
+
+def _credit(objs: Iterable, contributors: Sequence, first_order: int) -> int:
+    """Credit each of ``objs`` to a few random contributors, in one batch."""
+    from fairdm.contrib.contributors.models import Contribution
+
+    rows = []
+    for obj in objs:
+        content_type = ContentType.objects.get_for_model(obj)
+        for contributor in random.sample(
+            contributors, min(CREDITS_PER_OBJECT, len(contributors))
+        ):
+            rows.append(
+                Contribution(
+                    content_type=content_type,
+                    object_id=obj.pk,
+                    contributor=contributor,
+                    order=first_order + len(rows),
+                )
+            )
+    Contribution.objects.bulk_create(rows, batch_size=BATCH_SIZE)
+    return len(rows)
+
+
+def _spread(total: int, parts: int) -> list[int]:
+    """``total`` split into ``parts`` near-equal whole shares."""
+    share, extra = divmod(total, parts)
+    return [share + (1 if i < extra else 0) for i in range(parts)]
+
+
+def generate(
+    scale: Scale,
+    sample_factories: Sequence,
+    measurement_factories: Sequence,
+    log: Callable[[str], object] = lambda message: None,
+    seed: int | None = None,
+) -> dict:
+    """Generate a portal's worth of records in bulk.
+
+    Datasets are spread over the projects, samples and measurements over the
+    datasets. Each dataset's samples form a ``child_of`` tree with
+    :data:`BRANCHING` children per sample, and each measurement is of a sample in
+    its own dataset. Samples share a pool of a quarter as many locations. Half the
+    datasets are public.
+
+    Args:
+        scale: How many records to generate.
+        sample_factories: Concrete sample factories, picked at random per sample.
+            Without any, no samples or measurements are generated.
+        measurement_factories: Concrete measurement factories, picked at random per
+            measurement. Without any, no measurements are generated.
+        log: Called with a line of progress after each stage.
+        seed: Seeds ``random`` and Faker, for the same data on every run.
+
+    Returns:
+        dict: How many records of each kind were written.
+    """
+    from fairdm.contrib.contributors.models import Contribution, Organization
+    from fairdm.contrib.contributors.services.collaboration import (
+        rebuild_collaborations,
+    )
+    from fairdm.core.dataset.access import rebuild_access_index
+    from fairdm.core.dataset.extent import rebuild_extents
+    from fairdm.core.models import Dataset, Project
+    from fairdm.core.sample.models import SampleRelation
+    from fairdm.core.search import rebuild_search_index
+    from fairdm.utils.choices import Visibility
+
+    fake = Faker()
+    if seed is not None:
+        random.seed(seed)
+        fake.seed_instance(seed)
+
+    contributors = _people(scale.people, fake)
+    organizations = bulk_save(
+        [Organization(name=fake.unique.company()) for _ in range(scale.organizations)]
+    )
+    contributors += organizations
+    log(f"Contributors: {scale.people} people, {scale.organizations} organizations")
+
+    projects = Project.objects.bulk_create(
+        [
+            Project(
+                name=fake.sentence(nb_words=4).rstrip("."),
+                owner=random.choice(organizations) if organizations else None,
+            )
+            for _ in range(scale.projects)
+        ],
+        batch_size=BATCH_SIZE,
+    )
+    datasets = Dataset.objects.bulk_create(
+        [
+            Dataset(
+                name=fake.sentence(nb_words=5).rstrip("."),
+                project=projects[i % len(projects)] if projects else None,
+                visibility=Visibility.PUBLIC if i % 2 == 0 else Visibility.PRIVATE,
+            )
+            for i in range(scale.datasets)
+        ],
+        batch_size=BATCH_SIZE,
+    )
+    log(f"Projects: {len(projects)}, datasets: {len(datasets)}")
+
+    last = Contribution.objects.order_by("-order").values_list("order", flat=True)
+    order = (last.first() or 0) + 1
+    contributions = 0
+    if contributors:
+        contributions = _credit([*projects, *datasets], contributors, order)
+    log(f"Contributions: {contributions}")
+
+    samples = relations = measurements = 0
+    if sample_factories and datasets:
+        locations = _points(scale.samples // 4 + 1)
+        for dataset, sample_count, measurement_count in zip(
+            datasets,
+            _spread(scale.samples, len(datasets)),
+            _spread(scale.measurements, len(datasets)),
+            strict=True,
+        ):
+            if not sample_count:
+                continue
+            specimens = bulk_save(
+                [
+                    random.choice(sample_factories).build(
+                        dataset=dataset, location=random.choice(locations)
+                    )
+                    for _ in range(sample_count)
+                ]
+            )
+            # Sample i is a child of sample (i - 1) // BRANCHING
+            edges = [
+                SampleRelation(
+                    source_id=specimen.pk,
+                    target_id=specimens[(i - 1) // BRANCHING].pk,
+                    type="child_of",
+                )
+                for i, specimen in enumerate(specimens)
+                if i
+            ]
+            SampleRelation.objects.bulk_create(edges, batch_size=BATCH_SIZE)
+            samples += len(specimens)
+            relations += len(edges)
+
+            if not measurement_factories:
+                continue
+            # Built a batch at a time, so a million measurements never sit in memory
+            batches = -(-measurement_count // BATCH_SIZE) or 1
+            for size in _spread(measurement_count, batches):
+                bulk_save(
+                    [
+                        random.choice(measurement_factories).build(
+                            dataset=dataset, sample=random.choice(specimens)
+                        )
+                        for _ in range(size)
+                    ]
+                )
+                measurements += size
+        log(f"Samples: {samples} ({relations} relations)")
+        log(f"Measurements: {measurements}")
+
+    # The hooks bulk_save skipped keep these current one record at a time
+    rebuild_search_index()
+    rebuild_extents()
+    rebuild_access_index()
+    rebuild_collaborations()
+    log("Rebuilt the search, extent, access and collaboration indexes")
+
+    return {
+        "contributors": len(contributors),
+        "projects": len(projects),
+        "datasets": len(datasets),
+        "contributions": contributions,
+        "samples": samples,
+        "sample_relations": relations,
+        "measurements": measurements,
+    }
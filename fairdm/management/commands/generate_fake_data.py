@@ -22,6 +22,11 @@ Usage:
     poetry run python manage.py generate_fake_data
     poetry run python manage.py generate_fake_data --projects 5 --datasets 3
     poetry run python manage.py generate_fake_data --clear
+    poetry run python manage.py generate_fake_data --bulk --scale large
+
+With ``--bulk`` the records are written in batches by
+:func:`fairdm.factories.bulk.generate`, at one of its named scales, instead of one
+at a time. The other counts are then ignored.
 """
 
 import random
@@ -44,6 +49,7 @@ from fairdm.factories import (
     PersonFactory,
     ProjectFactory,
 )
+from fairdm.factories.bulk import SCALES, generate
 
 
 class Command(BaseCommand):
@@ -106,6 +112,23 @@ class Command(BaseCommand):
             default=5,
             help="Number of organizational contributors to create (default: 5)",
         )
+        parser.add_argument(
+            "--bulk",
+            action="store_true",
+            help="Write records in batches, at the size given by --scale",
+        )
+        parser.add_argument(
+            "--scale",
+            choices=sorted(SCALES),
+            default="small",
+            help="How much data --bulk generates (default: small)",
+        )
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=None,
+            help="Seed for --bulk, to generate the same data every run",
+        )
         parser.add_argument(
             "--clear",
             action="store_true",
@@ -209,6 +232,10 @@ class Command(BaseCommand):
         self.stdout.write(self.style.WARNING("Loading configured factories..."))
         factories = self._load_factories_from_settings()
 
+        if options["bulk"]:
+            self._generate_bulk(factories, options["scale"], options["seed"])
+            return
+
         self.stdout.write(self.style.WARNING("\nGenerating fake data..."))
 
         with transaction.atomic():
@@ -255,6 +282,21 @@ class Command(BaseCommand):
         self.stdout.write(f"  Contributions: {total_contributions}")
         self.stdout.write(self.style.SUCCESS("=" * 50 + "\n"))
 
+    def _generate_bulk(self, factories, scale, seed):
+        """Generate a named scale of records in batches."""
+        self.stdout.write(self.style.WARNING(f"\nGenerating {scale} data in bulk..."))
+        with transaction.atomic():
+            counts = generate(
+                SCALES[scale],
+                [factory for factory, _ in factories["sample_factories"]],
+                [factory for factory, _ in factories["measurement_factories"]],
+                log=lambda message: self.stdout.write(f"  ✓ {message}"),
+                seed=seed,
+            )
+        self.stdout.write(self.style.SUCCESS("\n✓ Bulk data generation complete!"))
+        for name, count in counts.items():
+            self.stdout.write(f"  {name.replace('_', ' ').capitalize()}: {count}")
+
     def _create_people(self, count):
         """Create personal contributors."""
         self.stdout.write(f"Creating {count} personal contributors...")
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from fairdm.core.dataset.access import rebuild_access_index
+
+
+class Command(BaseCommand):
+    help = "Rebuild the dataset access index from the guardian view_dataset grants."
+
+    def handle(self, *args, **options):
+        count = rebuild_access_index()
+        self.stdout.write(self.style.SUCCESS(f"Indexed {count} dataset grants."))
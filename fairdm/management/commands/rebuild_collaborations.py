@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from fairdm.contrib.contributors.services.collaboration import rebuild_collaborations
+
+
+class Command(BaseCommand):
+    help = "Recount the collaboration graph from every contribution."
+
+    def handle(self, *args, **options):
+        count = rebuild_collaborations()
+        self.stdout.write(self.style.SUCCESS(f"Wrote {count} collaboration edges."))
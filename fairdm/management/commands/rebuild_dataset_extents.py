@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from fairdm.core.dataset.extent import rebuild_extents
+
+
+class Command(BaseCommand):
+    help = "Recompute the stored bounds, date span and sample count of every dataset."
+
+    def handle(self, *args, **options):
+        count = rebuild_extents()
+        self.stdout.write(self.style.SUCCESS(f"Computed {count} dataset extents."))
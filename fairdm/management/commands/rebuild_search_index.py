@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from fairdm.core.search import rebuild_search_index
+
+
+class Command(BaseCommand):
+    help = "Rebuild the full-text search documents of every core record."
+
+    def handle(self, *args, **options):
+        count = rebuild_search_index()
+        self.stdout.write(self.style.SUCCESS(f"Indexed {count} records."))
@@ -9,9 +9,12 @@ three tiers of customisation, in increasing order of effort:
 3. override that component's ``get_<component>_class()`` method.
 
 Every caller inside the framework reaches a component through its accessor, so an
-override at tier 3 is what the whole framework receives. Nothing is cached: an
-accessor builds or resolves its class on every call, which is what Django's own
-``ModelFormMixin.get_form_class()`` does.
+override at tier 3 is what the whole framework receives. A generated or resolved
+class is memoised on the configuration, keyed by component name and the inputs it
+was built from, so a changed field list or class misses the cache rather than
+serving a stale class. The memo sits behind the default accessors only: an
+overridden ``get_<component>_class()`` never consults it and runs on every call.
+``invalidate()`` drops the memo, for tests and for hot reload.
 """
 
 from collections.abc import Sequence
@@ -130,6 +133,10 @@ admin's from ``django.contrib.admin``, both of which import app code.
 """
 
 
+API_PAGINATION_STYLES = ("page", "cursor")
+"""The values ``ModelConfiguration.api_pagination`` accepts."""
+
+
 def flatten_fields(fields: Sequence[Any] | None) -> list[str]:
     """Flatten a field list that groups names in tuples for layout.
 
@@ -233,6 +240,15 @@ class ModelConfiguration:
     description: str = ""
     """Description of this model type."""
 
+    api_pagination: str = "page"
+    """How the generated API list endpoint pages: ``"page"`` or ``"cursor"``.
+
+    Page numbers are the default. ``"cursor"`` pages on the primary key with no
+    total count, which keeps every page of a very large collection equally cheap
+    for harvesting clients. Either way a client can ask for a cursor per request
+    with ``?cursor=``.
+    """
+
     #: Attributes a caller may set per instance.
     _OVERRIDABLE = (
         "metadata",
@@ -242,6 +258,7 @@ class ModelConfiguration:
         *(c.class_attr for c in COMPONENTS.values()),
         "display_name",
         "description",
+        "api_pagination",
     )
 
     def __init__(self, model: "type[models.Model] | None" = None, **overrides: Any):
@@ -253,6 +270,10 @@ class ModelConfiguration:
         if model is not None:
             self.model = model
 
+        # Built component classes, keyed by _component_key(). Private, so that no
+        # caller can read a class without going through its accessor.
+        self._components: dict[tuple[Any, ...], type] = {}
+
         for name, value in overrides.items():
             if name not in self._OVERRIDABLE:
                 raise TypeError(
@@ -278,6 +299,7 @@ class ModelConfiguration:
         self._validate_fields()
         self._validate_custom_classes()
         self._validate_admin_inheritance()
+        self._validate_api_pagination()
 
     # Validation, all of it at construction time so that a misconfigured portal
     # stops at import rather than serving a broken page.
@@ -400,6 +422,16 @@ class ModelConfiguration:
                 f"class {admin_cls.__name__}(MeasurementChildAdmin): ..."
             )
 
+    def _validate_api_pagination(self) -> None:
+        """Refuse a pagination style the API does not offer."""
+        if self.api_pagination not in API_PAGINATION_STYLES:
+            raise ConfigurationError(
+                f"api_pagination for {self.model.__name__} must be one of "
+                f"{', '.join(repr(s) for s in API_PAGINATION_STYLES)}. Got "
+                f"{self.api_pagination!r} instead.",
+                model=self.model,
+            )
+
     # Field resolution and component production.
 
     @classmethod
@@ -432,20 +464,61 @@ class ModelConfiguration:
         excluded = set(self.exclude)
         return [name for name in flatten_fields(chosen) if name not in excluded]
 
+    def _component_key(self, component: str) -> tuple[Any, ...]:
+        """What one component's class is built from, as a memo key.
+
+        A supplied class keys on the declaration itself; a generated one on the
+        resolved field list. Either way, reassigning the attribute that decided the
+        class produces a different key, so the memo cannot outlive its inputs.
+        """
+        declared = getattr(self, COMPONENTS[component].class_attr)
+        if declared is not None:
+            return (component, "class", declared)
+        return (component, "fields", tuple(self.resolve_fields(component)))
+
     def _component_class(self, component: str) -> type:
-        """Resolve or build one component's class. Never cached."""
+        """Resolve or build one component's class, memoised per configuration."""
+        key = self._component_key(component)
+        cached = self._components.get(key)
+        if cached is not None:
+            return cached
+
         spec = COMPONENTS[component]
         declared = getattr(self, spec.class_attr)
         if declared is not None:
-            return self._get_class(declared)
+            resolved = self._get_class(declared)
+        else:
+            from fairdm.registry import factories
+
+            factory = getattr(factories, spec.factory)
+            resolved = cast(
+                type,
+                factory(
+                    model=self.model, fields=self.resolve_fields(component)
+                ).generate(),
+            )
+
+        self._components[key] = resolved
+        return resolved
+
+    def invalidate(self, *components: str) -> None:
+        """Forget memoised component classes, so the next call builds them again.
 
-        from fairdm.registry import factories
+        With no arguments every component is dropped; otherwise only those named.
+        An unknown name raises ``KeyError`` rather than invalidating nothing.
+        """
+        if not components:
+            self._components.clear()
+            return
 
-        factory = getattr(factories, spec.factory)
-        generated = factory(
-            model=self.model, fields=self.resolve_fields(component)
-        ).generate()
-        return cast(type, generated)
+        unknown = set(components) - COMPONENTS.keys()
+        if unknown:
+            raise KeyError(f"Unknown component(s): {', '.join(sorted(unknown))}")
+        self._components = {
+            key: cls
+            for key, cls in self._components.items()
+            if key[0] not in components
+        }
 
     def get_form_class(self) -> type[ModelForm]:
         """The ModelForm for this model. Override to build your own."""
@@ -515,6 +588,7 @@ class MeasurementConfig(ModelConfiguration):
 
 
 __all__ = [
+    "API_PAGINATION_STYLES",
     "COMPONENTS",
     "Authority",
     "Citation",
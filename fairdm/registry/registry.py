@@ -225,6 +225,15 @@ class FairDMRegistry:
         """
         return list(self._registry.values())
 
+    def invalidate(self) -> None:
+        """Drop every memoised component class, so each is built again on next use.
+
+        For tests that alter a configuration in place, and for a development server
+        reloading a portal's configuration without restarting the process.
+        """
+        for config in self._registry.values():
+            config.invalidate()
+
     def register(
         self, model_class: type[Model], config: ModelConfiguration | None = None
     ) -> None:
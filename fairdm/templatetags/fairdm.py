@@ -241,3 +241,35 @@ def get_related_field(obj, field_name):
     #     raise AttributeError(f"Failed to resolve final attribute: {final_attr} on {final_obj}")
 
     return final_obj, final_attr
+
+
+class TimedNode(template.Node):
+    def __init__(self, name, nodelist):
+        self.name = name
+        self.nodelist = nodelist
+
+    def render(self, context):
+        from fairdm.core.instrumentation import span
+
+        with span(self.name.resolve(context), "template"):
+            return self.nodelist.render(context)
+
+
+@register.tag
+def timed(parser, token):
+    """
+    Time the enclosed template as a span of an instrumented request.
+
+    Usage::
+
+        {% timed "plugin-menu" %}...{% endtimed %}
+
+    Renders the content unchanged. Only timed behind ``InstrumentationMiddleware``.
+    """
+    bits = token.split_contents()
+    if len(bits) != 2:
+        message = f"'{bits[0]}' takes one argument, the span name"
+        raise template.TemplateSyntaxError(message)
+    nodelist = parser.parse(("endtimed",))
+    parser.delete_first_token()
+    return TimedNode(parser.compile_filter(bits[1]), nodelist)
@@ -12,6 +12,9 @@ from mvp.views import (
     MVPUpdateView,
 )
 
+from fairdm.core import search
+from fairdm.core.permission_cache import prefetch_permissions
+
 
 class FairDMTemplateView(MetadataMixin, MVPTemplateView):
     """Template-only page with AdminLTE layout and SEO metadata support.
@@ -72,8 +75,15 @@ class FairDMListView(MetadataMixin, MVPFilteredListView):
             Default: ``None``.
         search_fields (list[str] | None): Model field paths searched by the
             ``?q=`` query parameter. Default: ``None`` (search disabled).
+            Projects, datasets, samples and measurements are searched through
+            their full-text index instead (:mod:`fairdm.core.search`), ranked
+            unless ``?o=`` asks for another order; for them ``search_fields``
+            only turns search on.
         filterset_class: A ``django_filters.FilterSet`` subclass for
             advanced filtering. Default: ``None``.
+        prefetch_permissions (bool): Load the user's object permissions for
+            the whole page in two queries before it renders, for item templates
+            that check ``has_perm`` per object. Default: ``False``.
 
     Override hooks:
         get_queryset(): Return the base queryset (add ``select_related`` /
@@ -108,6 +118,18 @@ class FairDMListView(MetadataMixin, MVPFilteredListView):
 
     paginate_by = 25
     grid = {"cols": 1, "gap": 2}
+    prefetch_permissions = False
+
+    def _apply_search(self, queryset, search_term):
+        if not search.is_indexed(queryset.model):
+            return super()._apply_search(queryset, search_term)
+        return search.search(queryset, search_term, rank=not self.request.GET.get("o"))
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        if self.prefetch_permissions:
+            prefetch_permissions(self.request.user, context["object_list"])
+        return context
 
 
 class FairDMDetailView(MetadataMixin, MVPDetailView):
@@ -248,6 +270,9 @@ class FairDMTableView(MetadataMixin, MVPTableViewMixin, FilterView):
         template_name (str): The template responsible for rendering the
             ``{{ table }}`` object. The template must explicitly render the
             table — no automatic table rendering is provided.
+        prefetch_permissions (bool): Load the user's object permissions for
+            the table's current page in two queries, for columns that check
+            ``has_perm`` per row. Default: ``False``.
 
     Context:
         meta: SEO metadata object (see :class:`meta.views.MetadataMixin`).
@@ -276,4 +301,13 @@ class FairDMTableView(MetadataMixin, MVPTableViewMixin, FilterView):
             template_name = "measurements/measurement_table.html"
     """
 
-    pass
+    prefetch_permissions = False
+
+    def get_table(self, **kwargs):
+        table = super().get_table(**kwargs)
+        page = getattr(table, "page", None)
+        if self.prefetch_permissions and page is not None:
+            # The page holds django-tables2 rows; the grants attach to their records.
+            records = [row.record for row in page.object_list]
+            prefetch_permissions(self.request.user, records)
+        return table
@@ -3,9 +3,8 @@ from __future__ import annotations
 from functools import cached_property
 
 from django.db.models import Model
-from django.shortcuts import get_object_or_404
 
-from fairdm.core.utils import get_non_polymorphic_instance
+from fairdm.core.records import Record, resolve_record
 from fairdm.utils import get_model_class
 
 # =============================================================================
@@ -41,17 +40,24 @@ class RelatedObjectMixin:
         return get_model_class(self.kwargs.get(self.base_object_url_kwarg))
 
     @cached_property
-    def base_object(self):
-        """Fetch the related object based on the primary key in the URL.
+    def base_record(self) -> Record:
+        """The related object named in the URL, resolved once for the request.
 
-        If the related model is polymorphic, the method fetches a non-polymorphic version of the object.
+        See :func:`fairdm.core.records.resolve_record`, which plugins and permission
+        checks on the same request share.
         """
         uuid = self.kwargs.get(self.base_object_url_kwarg)
-        obj = get_object_or_404(self.base_model, uuid=uuid)
-        if hasattr(obj, "polymorphic_model_marker"):
-            # If the object is polymorphic, get the non-polymorphic instance
-            self.non_polymorphic = get_non_polymorphic_instance(obj)
-        return obj
+        return resolve_record(self.request, self.base_model, uuid=uuid)
+
+    @property
+    def base_object(self):
+        """The related object named in the URL, as its real subclass."""
+        return self.base_record.typed
+
+    @property
+    def non_polymorphic(self):
+        """The related object as an instance of its polymorphic base."""
+        return self.base_record.base
 
     def get_context_data(self, **kwargs):
         """Add the related object and related model information to the context.
@@ -62,8 +68,6 @@ class RelatedObjectMixin:
         context["base_object"] = self.base_object
         context["base_model"] = self.base_model
         context["base_model_name"] = self.base_model._meta.model_name
-        context["non_polymorphic_object"] = get_non_polymorphic_instance(
-            self.base_object
-        )
+        context["non_polymorphic_object"] = self.non_polymorphic
         context[self.base_model._meta.model_name] = self.base_object
         return context
@@ -33,6 +33,23 @@ def django_db_setup(django_db_setup, django_db_blocker):
         Concept.preload()
 
 
+@pytest.fixture
+def locmem_cache(settings):
+    """
+    Swap the DummyCache of the test settings for a local-memory cache.
+
+    For tests of code that relies on the cache holding what it is given.
+    """
+    from django.core.cache import cache
+
+    settings.CACHES = {
+        **settings.CACHES,
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+    }
+    yield
+    cache.clear()
+
+
 @pytest.fixture
 def user():
     """
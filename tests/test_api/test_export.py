@@ -0,0 +1,81 @@
+"""Tests for the streamed bulk export action on generated API endpoints.
+
+Covers:
+- ``GET <collection>/export/`` streams CSV by default with the resource's headers
+- ``?format=ndjson`` streams one JSON object per line
+- visibility: private rows are left out for anonymous users
+- the generated filterset narrows an export as it narrows the list
+- an unknown format is refused at negotiation
+"""
+
+import csv
+import io
+import json
+
+import pytest
+
+from fairdm.api.viewsets import _model_to_slug
+from fairdm.factories import DatasetFactory
+from fairdm.utils.choices import Visibility
+from fairdm_demo.factories import CustomParentSampleFactory
+from fairdm_demo.models import CustomParentSample
+
+EXPORT_URL = f"/api/v1/samples/{_model_to_slug(CustomParentSample)}/export/"
+
+
+def _body(response) -> bytes:
+    return b"".join(response.streaming_content)
+
+
+@pytest.fixture
+def samples(public_dataset, private_dataset):
+    """Three public samples and one private one."""
+    public = CustomParentSampleFactory.create_batch(3, dataset=public_dataset)
+    private = CustomParentSampleFactory(dataset=private_dataset)
+    return public, private
+
+
+@pytest.mark.django_db
+class TestStreamingExport:
+    def test_csv_is_the_default(self, api_client, samples):
+        response = api_client.get(EXPORT_URL)
+        assert response.status_code == 200
+        assert response.streaming
+        assert response["Content-Type"].startswith("text/csv")
+        assert "attachment" in response["Content-Disposition"]
+
+        rows = list(csv.reader(io.StringIO(_body(response).decode())))
+        assert "char_field" in rows[0]
+        assert len(rows) == 1 + 3
+
+    def test_ndjson_writes_one_object_per_line(self, api_client, samples):
+        response = api_client.get(EXPORT_URL, {"format": "ndjson"})
+        assert response.status_code == 200
+        lines = _body(response).decode().splitlines()
+        assert len(lines) == 3
+        assert all(isinstance(json.loads(line), dict) for line in lines)
+
+    def test_private_rows_are_left_out_for_anonymous(self, api_client, samples):
+        public, private = samples
+        body = _body(api_client.get(EXPORT_URL, {"format": "ndjson"})).decode()
+        assert private.name not in body
+        assert all(sample.name in body for sample in public)
+
+    def test_filters_narrow_the_export(self, api_client, samples):
+        public, _ = samples
+        target = public[0]
+        response = api_client.get(
+            EXPORT_URL, {"format": "ndjson", "char_field": target.char_field}
+        )
+        lines = _body(response).decode().splitlines()
+        assert lines
+        assert all(target.char_field in line for line in lines)
+
+    def test_unknown_format_is_refused(self, api_client, samples):
+        response = api_client.get(EXPORT_URL, {"format": "xlsx"})
+        assert response.status_code == 404
+
+    def test_an_empty_collection_exports_headers_only(self, api_client, db):
+        DatasetFactory(visibility=Visibility.PUBLIC)
+        rows = list(csv.reader(io.StringIO(_body(api_client.get(EXPORT_URL)).decode())))
+        assert len(rows) == 1
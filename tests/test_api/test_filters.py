@@ -4,17 +4,25 @@ Covers:
 - Public objects visible to anonymous users via FairDMVisibilityFilter.
 - Private objects hidden from users without guardian view permission.
 - Authenticated user with view permission sees private objects.
-- Mixed public + private queryset returns correct subset (no duplicates via .distinct()).
+- Mixed public + private queryset returns correct subset, with no duplicates.
+- Samples in a private dataset are visible through a grant on the dataset.
+- A global view permission on the sample base model reveals every subtype's samples.
 - Models without a visibility field (e.g. Contributor) return all records.
+- Samples and measurements are restricted to a viewport by ?bbox= or ?near=.
 """
 
+from types import SimpleNamespace
+
 import pytest
+from django.contrib.auth.models import Group
 from django.urls import reverse
 from guardian.shortcuts import assign_perm
 from rest_framework.authtoken.models import Token
+from rest_framework.exceptions import ValidationError
 from rest_framework.test import APIClient
 
-from fairdm.factories import DatasetFactory, ProjectFactory, UserFactory
+from fairdm.api.filters import FairDMViewportFilter, FairDMVisibilityFilter
+from fairdm.factories import DatasetFactory, PointFactory, ProjectFactory, UserFactory
 from fairdm.utils.choices import Visibility
 
 
@@ -110,6 +118,80 @@ class TestVisibilityFilterDatasets:
         uuids = [d["uuid"] for d in resp.json()["results"]]
         assert str(ds.uuid) in uuids
 
+    def test_private_dataset_visible_through_group(self):
+        user = UserFactory()
+        group = Group.objects.create(name="reviewers")
+        user.groups.add(group)
+        ds = DatasetFactory(visibility=Visibility.PRIVATE)
+        assign_perm("view_dataset", group, ds)
+        resp = make_token_client(user).get(reverse("api:dataset-list"))
+        uuids = [d["uuid"] for d in resp.json()["results"]]
+        assert str(ds.uuid) in uuids
+
+
+@pytest.mark.django_db
+class TestVisibilityFilterSamples:
+    """Samples follow their dataset's visibility and its grants."""
+
+    def _filter(self, user, queryset):
+        request = SimpleNamespace(user=user)
+        return FairDMVisibilityFilter().filter_queryset(request, queryset, None)
+
+    def test_dataset_grant_reveals_its_samples(self):
+        from fairdm_demo.factories import CustomParentSampleFactory
+        from fairdm_demo.models import CustomParentSample
+
+        user = UserFactory()
+        granted = DatasetFactory(visibility=Visibility.PRIVATE)
+        hidden = DatasetFactory(visibility=Visibility.PRIVATE)
+        public = DatasetFactory(visibility=Visibility.PUBLIC)
+        for dataset in (granted, hidden, public):
+            CustomParentSampleFactory(dataset=dataset)
+        assign_perm("view_dataset", user, granted)
+
+        visible = self._filter(user, CustomParentSample.objects.all())
+
+        assert {s.dataset_id for s in visible} == {granted.pk, public.pk}
+        assert not visible.query.distinct
+
+    def test_direct_sample_grant(self):
+        from fairdm.core.utils import assign_perm as assign_record_perm
+        from fairdm_demo.factories import CustomParentSampleFactory
+        from fairdm_demo.models import CustomParentSample
+
+        user = UserFactory()
+        sample = CustomParentSampleFactory(
+            dataset=DatasetFactory(visibility=Visibility.PRIVATE)
+        )
+        assign_record_perm("view_sample", user, sample)
+
+        visible = self._filter(user, CustomParentSample.objects.all())
+
+        assert list(visible) == [sample]
+
+    def test_global_base_permission_through_group(self):
+        from django.contrib.auth.models import Permission
+
+        from fairdm.core.models import Sample
+        from fairdm_demo.factories import CustomParentSampleFactory
+        from fairdm_demo.models import CustomParentSample
+
+        user = UserFactory()
+        group = Group.objects.create(name="curators")
+        group.permissions.add(
+            Permission.objects.get_by_natural_key(
+                "view_sample", Sample._meta.app_label, "sample"
+            )
+        )
+        user.groups.add(group)
+        sample = CustomParentSampleFactory(
+            dataset=DatasetFactory(visibility=Visibility.PRIVATE)
+        )
+
+        visible = self._filter(user, CustomParentSample.objects.all())
+
+        assert list(visible) == [sample]
+
 
 @pytest.mark.django_db
 class TestVisibilityFilterContributors:
@@ -125,3 +207,82 @@ class TestVisibilityFilterContributors:
     def test_contributor_list_returns_200_for_authenticated(self):
         resp = make_token_client(UserFactory()).get(reverse("api:contributor-list"))
         assert resp.status_code == 200
+
+
+@pytest.mark.django_db
+class TestViewportFilter:
+    """Records are located by their own location, or their sample's."""
+
+    def _filter(self, queryset, **params):
+        request = SimpleNamespace(query_params=params)
+        return FairDMViewportFilter().filter_queryset(request, queryset, None)
+
+    @pytest.fixture
+    def samples(self):
+        from fairdm_demo.factories import CustomParentSampleFactory
+
+        dataset = DatasetFactory()
+        return {
+            name: CustomParentSampleFactory(
+                dataset=dataset, location=PointFactory(x=x, y=y)
+            )
+            for name, x, y in (
+                ("berlin", "13.40495", "52.52001"),
+                ("potsdam", "13.06449", "52.39057"),
+                ("fiji", "179.50000", "-17.80000"),
+            )
+        }
+
+    def test_bbox(self, samples):
+        from fairdm_demo.models import CustomParentSample
+
+        queryset = CustomParentSample.objects.all()
+
+        berlin = self._filter(queryset, bbox="13.2,52.4,13.6,52.6")
+        assert list(berlin) == [samples["berlin"]]
+        across = self._filter(queryset, bbox="179,-18,-179,-17")
+        assert list(across) == [samples["fiji"]]
+
+    def test_near(self, samples):
+        from fairdm_demo.models import CustomParentSample
+
+        queryset = CustomParentSample.objects.all()
+
+        nearby = self._filter(queryset, near="13.40495,52.52001", radius="40")
+        assert set(nearby) == {samples["berlin"], samples["potsdam"]}
+
+    def test_measurements_are_located_by_their_sample(self, samples):
+        from fairdm_demo.factories import ExampleMeasurementFactory
+        from fairdm_demo.models import ExampleMeasurement
+
+        measured = ExampleMeasurementFactory(sample=samples["fiji"])
+        ExampleMeasurementFactory(sample=samples["berlin"])
+
+        located = self._filter(
+            ExampleMeasurement.objects.all(), bbox="179,-18,-179,-17"
+        )
+        assert list(located) == [measured]
+
+    def test_malformed_viewport(self, samples):
+        from fairdm_demo.models import CustomParentSample
+
+        with pytest.raises(ValidationError):
+            self._filter(CustomParentSample.objects.all(), bbox="13,52,14")
+        with pytest.raises(ValidationError):
+            self._filter(CustomParentSample.objects.all(), near="13,52")
+
+    @pytest.mark.parametrize(
+        "params",
+        [
+            {"bbox": "nan,52,14,53"},
+            {"bbox": "13,52,inf,53"},
+            {"near": "nan,52", "radius": "10"},
+            {"near": "13,52", "radius": "inf"},
+        ],
+        ids=lambda params: ",".join(params.values()),
+    )
+    def test_non_finite_viewport(self, samples, params):
+        from fairdm_demo.models import CustomParentSample
+
+        with pytest.raises(ValidationError):
+            self._filter(CustomParentSample.objects.all(), **params)
@@ -6,6 +6,7 @@ Covers:
 - ?page_size above max (100) is capped at 100
 - Response includes next/previous navigation links when applicable
 - count reflects total accessible records
+- ?count=false omits the count, and ?cursor= switches to keyset pages
 """
 
 import pytest
@@ -92,3 +93,112 @@ class TestPagination:
         data = response.json()
         # Should see 3 public + 1 private = 4
         assert data["count"] == 4
+
+
+@pytest.mark.django_db
+class TestUncountedPagination:
+    """``?count=false`` pages without issuing a COUNT(*)."""
+
+    def test_count_is_null(self, api_client, many_public_projects):
+        response = api_client.get(reverse("api:project-list"), {"count": "false"})
+        assert response.status_code == 200
+        data = response.json()
+        assert data["count"] is None
+        assert len(data["results"]) == 25
+
+    def test_next_link_present_when_more_rows_follow(
+        self, api_client, many_public_projects
+    ):
+        data = api_client.get(reverse("api:project-list"), {"count": "false"}).json()
+        assert data["next"] is not None
+        assert "count=false" in data["next"]
+
+    def test_last_page_has_no_next_link(self, api_client, many_public_projects):
+        data = api_client.get(
+            reverse("api:project-list"), {"count": "false", "page": 2}
+        ).json()
+        assert len(data["results"]) == 5
+        assert data["next"] is None
+        assert data["previous"] is not None
+
+    def test_page_past_the_end_is_404(self, api_client, many_public_projects):
+        response = api_client.get(
+            reverse("api:project-list"), {"count": "false", "page": 3}
+        )
+        assert response.status_code == 404
+
+    def test_no_count_query_is_issued(self, api_client, many_public_projects):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        with CaptureQueriesContext(connection) as captured:
+            api_client.get(reverse("api:project-list"), {"count": "false"})
+        assert not any("COUNT(" in q["sql"].upper() for q in captured.captured_queries)
+
+
+@pytest.mark.django_db
+class TestCursorPagination:
+    """``?cursor=`` switches a list endpoint to keyset pagination."""
+
+    def test_empty_cursor_starts_at_the_first_page(
+        self, api_client, many_public_projects
+    ):
+        response = api_client.get(reverse("api:project-list"), {"cursor": ""})
+        assert response.status_code == 200
+        data = response.json()
+        assert "count" not in data
+        assert len(data["results"]) == 25
+        assert data["previous"] is None
+        assert data["next"] is not None
+
+    def test_following_next_walks_every_record_once(
+        self, api_client, many_public_projects
+    ):
+        seen = []
+        url = reverse("api:project-list") + "?cursor=&page_size=7"
+        while url:
+            data = api_client.get(url).json()
+            seen += [item["uuid"] for item in data["results"]]
+            url = data["next"]
+        assert len(seen) == 30
+        assert len(set(seen)) == 30
+
+    def test_cursor_pages_honour_visibility(self, api_client, db):
+        ProjectFactory.create_batch(4, visibility=Visibility.PUBLIC)
+        ProjectFactory.create_batch(2, visibility=Visibility.PRIVATE)
+        data = api_client.get(reverse("api:project-list"), {"cursor": ""}).json()
+        assert len(data["results"]) == 4
+
+
+class TestCursorPaginationByConfiguration:
+    """``api_pagination = "cursor"`` makes cursor pages the endpoint's default."""
+
+    def test_generated_viewset_uses_cursor_pagination(self):
+        from fairdm.api.pagination import FairDMCursorPagination
+        from fairdm.api.viewsets import generate_viewset
+        from fairdm.registry.config import ModelConfiguration
+        from tests.registry_models.models import ConcreteSample
+
+        config = ModelConfiguration(
+            model=ConcreteSample, fields=["name"], api_pagination="cursor"
+        )
+        assert generate_viewset(config).pagination_class is FairDMCursorPagination
+
+    def test_default_is_page_numbers(self):
+        from fairdm.api.pagination import FairDMCursorPagination
+        from fairdm.api.viewsets import generate_viewset
+        from fairdm.registry.config import ModelConfiguration
+        from tests.registry_models.models import ConcreteSample
+
+        config = ModelConfiguration(model=ConcreteSample, fields=["name"])
+        assert generate_viewset(config).pagination_class is not FairDMCursorPagination
+
+    def test_unknown_style_is_refused(self):
+        from fairdm.registry.config import ModelConfiguration
+        from fairdm.registry.exceptions import ConfigurationError
+        from tests.registry_models.models import ConcreteSample
+
+        with pytest.raises(ConfigurationError, match="api_pagination"):
+            ModelConfiguration(
+                model=ConcreteSample, fields=["name"], api_pagination="offset"
+            )
@@ -4,13 +4,14 @@ Covers:
 - List and detail endpoints for Project, Dataset, Contributor
 - Visibility filtering: public vs private access (anonymous + authenticated)
 - Ordering filter: ?ordering=field and ?ordering=-field
+- Full-text search: ?q= ranks matching datasets
 - CRUD write-protection (unauthenticated writes return 401)
 """
 
 import pytest
 from django.urls import reverse
 
-from fairdm.core.dataset.models import Dataset
+from fairdm.core.dataset.models import Dataset, DatasetDescription
 from fairdm.core.project.models import Project
 from fairdm.factories import DatasetFactory, ProjectFactory, UserFactory
 from fairdm.utils.choices import Visibility
@@ -170,6 +171,39 @@ class TestDatasetListEndpoint:
         names = [d["name"] for d in response.json()["results"]]
         assert names == sorted(names)
 
+    def test_search_ranks_matching_datasets(self, api_client, public_project, db):
+        mentioned = DatasetFactory(
+            project=public_project, name="Lake cores", visibility=Visibility.PUBLIC
+        )
+        DatasetDescription.objects.create(
+            related=mentioned, type="Abstract", value="Moraine sediments"
+        )
+        named = DatasetFactory(
+            project=public_project, name="Moraine survey", visibility=Visibility.PUBLIC
+        )
+        DatasetFactory(
+            project=public_project, name="River gauges", visibility=Visibility.PUBLIC
+        )
+
+        response = api_client.get(reverse("api:dataset-list"), {"q": "moraine"})
+
+        assert response.status_code == 200
+        uuids = [d["uuid"] for d in response.json()["results"]]
+        assert uuids == [str(named.uuid), str(mentioned.uuid)]
+
+    def test_search_keeps_requested_ordering(self, api_client, public_project, db):
+        for name in ("Moraine B", "Moraine A"):
+            DatasetFactory(
+                project=public_project, name=name, visibility=Visibility.PUBLIC
+            )
+
+        response = api_client.get(
+            reverse("api:dataset-list"), {"q": "moraine", "ordering": "name"}
+        )
+
+        names = [d["name"] for d in response.json()["results"]]
+        assert names == ["Moraine A", "Moraine B"]
+
 
 # ---------------------------------------------------------------------------
 # Dataset detail
@@ -267,6 +301,23 @@ class TestContributorListEndpoint:
         # when object-level permissions fire before method routing.
         assert response.status_code in (403, 405)
 
+    def test_network_lists_collaborators(self, api_client):
+        person, collaborator = UserFactory(), UserFactory()
+        for project in ProjectFactory.create_batch(2):
+            person.add_to(project)
+            collaborator.add_to(project)
+
+        url = reverse("api:contributor-network", args=[person.uuid])
+        data = api_client.get(url).json()
+
+        assert data["collaborators"] == [
+            {
+                "uuid": collaborator.uuid,
+                "name": collaborator.name,
+                "shared_credits": 2,
+            }
+        ]
+
 
 # ---------------------------------------------------------------------------
 # Project CRUD (authenticated write operations)
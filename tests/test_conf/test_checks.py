@@ -239,6 +239,25 @@ class TestCacheChecks:
         assert errors == []
 
 
+    def test_check_cache_backend_instrumented_is_judged_by_the_wrapped_backend(self):
+        """instrument_caches() wraps each backend in a counting proxy; the check
+        looks through it rather than failing every instrumented portal."""
+        from fairdm.conf.checks import check_cache_backend
+        from fairdm.core.instrumentation import instrument_caches
+
+        redis = {
+            "BACKEND": "django_redis.cache.RedisCache",
+            "LOCATION": "redis://redis:6379/1",
+        }
+        locmem = {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+
+        with override_settings(CACHES=instrument_caches({"default": redis})):
+            assert check_cache_backend(app_configs=None) == []
+        with override_settings(CACHES=instrument_caches({"default": locmem})):
+            errors = check_cache_backend(app_configs=None)
+
+        assert [error.id for error in errors] == ["fairdm.E200"]
+
 class TestSecretKeyChecks:
     """Tests for SECRET_KEY configuration checks."""
 
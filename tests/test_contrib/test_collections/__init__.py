@@ -0,0 +1 @@
+# Tests for fairdm.contrib.collections
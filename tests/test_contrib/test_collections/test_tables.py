@@ -0,0 +1,137 @@
+"""Tests for the collection tables.
+
+Covers:
+- the relations a table reads are derived from its visible columns
+- a page of samples or measurements renders in the same number of queries
+  whatever its length, concept many-to-many columns included
+"""
+
+import django_tables2 as tables
+import pytest
+from django.contrib.contenttypes.models import ContentType
+from django.db import connection
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+
+from fairdm.contrib.collections.tables import (
+    MeasurementTable,
+    SampleTable,
+    related_lookups,
+)
+from fairdm.contrib.collections.views import DataTableView
+from fairdm.factories import DatasetFactory, PointFactory
+from fairdm.registry import registry
+
+
+class KeywordSampleTable(SampleTable):
+    """A sample table with a concept many-to-many column."""
+
+    keywords = tables.ManyToManyColumn()
+
+
+class KeywordTableView(DataTableView):
+    def get_table_class(self):
+        return KeywordSampleTable
+
+
+def _render(model, view_class=DataTableView):
+    """Render every cell of a collection table, returning the queries it cost."""
+    view = view_class(model=model, model_config=registry.get_for_model(model))
+    view.setup(RequestFactory().get("/"))
+    view.object_list = model.objects.all()
+    table = view.get_table_class()(
+        data=view.get_table_data(), **view.get_table_kwargs()
+    )
+    ContentType.objects.clear_cache()
+    with CaptureQueriesContext(connection) as queries:
+        for row in table.rows:
+            list(row)
+    return len(queries)
+
+
+def _samples(dataset, n):
+    from fairdm_demo.factories import CustomParentSampleFactory
+
+    return [
+        CustomParentSampleFactory(
+            dataset=dataset, location=PointFactory(x=f"{i}.00000", y="50.00000")
+        )
+        for i in range(n)
+    ]
+
+
+class TestRelatedLookups:
+    def test_sample_columns(self):
+        from fairdm_demo.models import CustomParentSample
+
+        select, prefetch = related_lookups(SampleTable, CustomParentSample)
+
+        assert select == ["dataset", "location"]
+        assert prefetch == []
+
+    def test_measurement_columns(self):
+        from fairdm_demo.models import ExampleMeasurement
+
+        select, prefetch = related_lookups(MeasurementTable, ExampleMeasurement)
+
+        assert select == ["dataset", "sample", "sample__location"]
+        assert prefetch == []
+
+    def test_concept_columns_are_prefetched(self):
+        from fairdm_demo.models import CustomParentSample
+
+        select, prefetch = related_lookups(KeywordSampleTable, CustomParentSample)
+
+        assert select == ["dataset", "location"]
+        assert prefetch == ["keywords"]
+
+    def test_excluded_columns_are_skipped(self):
+        from fairdm_demo.models import CustomParentSample
+
+        select, _ = related_lookups(
+            SampleTable, CustomParentSample, exclude=["dataset"]
+        )
+
+        assert select == ["location"]
+
+
+@pytest.mark.django_db
+class TestQueryBudget:
+    def test_samples(self):
+        from fairdm_demo.models import CustomParentSample
+
+        dataset = DatasetFactory()
+        _samples(dataset, 2)
+        few = _render(CustomParentSample)
+        _samples(dataset, 98)
+
+        assert _render(CustomParentSample) == few
+
+    def test_measurements(self):
+        from fairdm_demo.factories import ExampleMeasurementFactory
+        from fairdm_demo.models import ExampleMeasurement
+
+        dataset = DatasetFactory()
+        for sample in _samples(dataset, 2):
+            ExampleMeasurementFactory(dataset=dataset, sample=sample)
+        few = _render(ExampleMeasurement)
+        for sample in _samples(dataset, 98):
+            ExampleMeasurementFactory(dataset=dataset, sample=sample)
+
+        assert _render(ExampleMeasurement) == few
+
+    def test_concept_column(self):
+        from research_vocabs.models import Concept
+
+        from fairdm_demo.models import CustomParentSample
+
+        terms = list(Concept.objects.filter(vocabulary__name="fairdm-roles")[:2])
+        assert terms
+        dataset = DatasetFactory()
+        for sample in _samples(dataset, 2):
+            sample.keywords.add(*terms)
+        few = _render(CustomParentSample, KeywordTableView)
+        for sample in _samples(dataset, 98):
+            sample.keywords.add(*terms)
+
+        assert _render(CustomParentSample, KeywordTableView) == few
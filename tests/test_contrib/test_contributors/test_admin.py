@@ -50,6 +50,23 @@ class TestPersonAdminChangelist:
         assert person.email in content
         assert person.first_name in content
 
+    def test_person_admin_change_view_lists_stored_candidates(
+        self, admin_client, person
+    ):
+        """The change view reads the duplicate candidates the batch task stored."""
+        from fairdm.contrib.contributors.services.matching import detect_duplicates
+        from fairdm.factories import PersonFactory
+
+        duplicate = PersonFactory(name=", ".join(reversed(person.name.split(" ", 1))))
+        url = reverse("admin:contributors_person_change", args=[person.pk])
+
+        assert admin_client.get(url).context["fuzzy_candidates"] == []
+
+        detect_duplicates()
+        candidates = admin_client.get(url).context["fuzzy_candidates"]
+
+        assert [c["person"] for c in candidates] == [duplicate]
+
 
 # ── T047: Claimed/unclaimed filtering ───────────────────────────────────────
 
@@ -377,10 +394,10 @@ class TestOrganizationAdminRORSync:
     def test_organization_admin_ror_sync_action_works(
         self, admin_client, organization, mocker
     ):
-        """ROR sync action triggers sync_contributor_identifier task."""
+        """ROR sync action triggers one sync_contributor_batch task."""
         # Mock the Celery task to prevent actual API calls
         mock_task = mocker.patch(
-            "fairdm.contrib.contributors.tasks.sync_contributor_identifier.delay"
+            "fairdm.contrib.contributors.tasks.sync_contributor_batch.delay"
         )
 
         # Create a ROR identifier for the organization
@@ -405,7 +422,7 @@ class TestOrganizationAdminRORSync:
         assert response.status_code == 200
 
         # Verify task was called for the ROR identifier
-        mock_task.assert_called_once_with(ror_id.pk)
+        mock_task.assert_called_once_with([ror_id.pk])
 
 
 # ── T129/T135: Ownership transfer admin action (US10, FR-046, SC-015) ───────
@@ -7,6 +7,7 @@ Tests cover:
 - Organization creation and validation (T014)
 - Affiliation unique constraints (T015)
 - Contribution GFK relationships (T016)
+- The collaboration graph behind get_co_contributors()
 - ContributorIdentifier uniqueness (T017)
 - ClaimingAuditLog immutability and manager filter methods (T046)
 """
@@ -22,6 +23,7 @@ from django.db import IntegrityError
 from fairdm.contrib.contributors.choices import AccountState, OrganizationType
 from fairdm.contrib.contributors.models import (
     Affiliation,
+    Collaboration,
     Contribution,
     Contributor,
     ContributorIdentifier,
@@ -1008,6 +1010,21 @@ class TestContributionGFKRelationships:
         qs = Contribution.objects.by_contributor(person)
         assert qs.count() >= 1
 
+    @pytest.mark.django_db
+    def test_object_id_is_an_integer(self, person, project_for_contributions):
+        """The generic relations join object_id to the credited pk without a cast."""
+        contribution = Contribution.objects.create(
+            contributor=person,
+            content_type=ContentType.objects.get_for_model(project_for_contributions),
+            object_id=str(project_for_contributions.pk),
+        )
+        contribution.refresh_from_db()
+        assert contribution.object_id == project_for_contributions.pk
+
+        projects = person.projects
+        assert list(projects) == [project_for_contributions]
+        assert "CAST" not in str(projects.query).upper()
+
 
 # ── T088: Contribution targets ───────────────────────────────────────────────
 
@@ -1313,6 +1330,107 @@ class TestCoContributors:
         assert false_positive not in co_contributors
 
 
+class TestCollaborationGraph:
+    """The precomputed collaboration edges follow credits as they come and go, and
+    agree with a full recount."""
+
+    def _weights(self, contributor):
+        return {
+            other: other.collaboration_count
+            for other in contributor.get_co_contributors()
+        }
+
+    @pytest.mark.django_db
+    def test_withdrawing_a_credit_lowers_the_weight(self, person):
+        collaborator = PersonFactory()
+        projects = ProjectFactory.create_batch(2)
+        for project in projects:
+            person.add_to(project)
+            collaborator.add_to(project)
+        assert self._weights(person) == {collaborator: 2}
+
+        Contribution.objects.for_entity(projects[0]).filter(
+            contributor=collaborator
+        ).delete()
+
+        assert self._weights(person) == {collaborator: 1}
+        assert self._weights(collaborator) == {person: 1}
+
+    @pytest.mark.django_db
+    def test_deleting_the_credited_object_removes_its_edges(self, person):
+        others = PersonFactory.create_batch(2)
+        project = ProjectFactory()
+        for contributor in (person, *others):
+            contributor.add_to(project)
+
+        project.delete()
+
+        assert not Collaboration.objects.exists()
+
+    @pytest.mark.django_db
+    def test_a_failed_deletion_leaves_nothing_behind(self, person):
+        from django.db import transaction
+        from django.db.models.signals import post_delete
+
+        from fairdm.contrib.contributors import receivers
+
+        others = PersonFactory.create_batch(2)
+        project = ProjectFactory()
+        for contributor in (person, *others):
+            contributor.add_to(project)
+
+        def fail(sender, **kwargs):
+            raise RuntimeError
+
+        # Fails after the first credit is counted, with the others still recorded
+        post_delete.connect(fail, sender=Contribution, dispatch_uid="test.fail")
+        try:
+            with pytest.raises(RuntimeError), transaction.atomic():
+                Contribution.objects.for_entity(project).delete()
+        finally:
+            post_delete.disconnect(sender=Contribution, dispatch_uid="test.fail")
+
+        Contribution.objects.for_entity(project).filter(contributor=others[0]).delete()
+
+        assert self._weights(person) == {others[1]: 1}
+        assert not receivers._deleting.credits
+
+    @pytest.mark.django_db
+    def test_reassigned_credit_moves_its_edges(self, person):
+        from fairdm.contrib.contributors.services.merge import merge_persons
+
+        duplicate = PersonFactory()
+        collaborator = PersonFactory()
+        project = ProjectFactory()
+        duplicate.add_to(project)
+        collaborator.add_to(project)
+
+        merge_persons(person, duplicate)
+
+        assert self._weights(collaborator) == {person: 1}
+
+    @pytest.mark.django_db
+    def test_matches_a_full_recount(self, person):
+        from fairdm.contrib.contributors.services.collaboration import (
+            rebuild_collaborations,
+        )
+
+        people = PersonFactory.create_batch(3)
+        for index, project in enumerate(ProjectFactory.create_batch(3)):
+            for contributor in (person, *people[: index + 1]):
+                contributor.add_to(project)
+        maintained = set(
+            Collaboration.objects.values_list("contributor", "collaborator", "weight")
+        )
+
+        rebuild_collaborations()
+
+        recounted = set(
+            Collaboration.objects.values_list("contributor", "collaborator", "weight")
+        )
+        assert maintained == recounted
+
+
 # ── T017: ContributorIdentifier uniqueness ───────────────────────────────────
 
 
@@ -52,3 +52,15 @@ class TestWithdrawRightsOnCreditDeletion:
         contribution = Contribution.add_to(organization, project_for_contributions)
 
         Contribution.objects.filter(pk=contribution.pk).delete()
+
+
+@pytest.mark.django_db
+class TestCreateTrigramExtension:
+    def test_test_database_has_pg_trgm(self):
+        """The test database is built without migrations, so pg_trgm comes from the
+        pre_migrate receiver."""
+        from django.db import connection
+
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+            assert cursor.fetchone() == (1,)
@@ -123,3 +123,68 @@ class TestFindDuplicateCandidates:
         unique_person = PersonFactory(name="Qxzrptlm Bvnwzxqk")
         candidates = find_duplicate_candidates(unique_person)
         assert candidates == []
+
+
+class TestNameKey:
+    """Tests for name_key(name), the blocking key stored on every person."""
+
+    def test_reordered_and_punctuated_names_share_a_key(self):
+        from fairdm.contrib.contributors.services.matching import name_key
+
+        assert name_key("Smith, Jöhn") == name_key("John Smith") == "john smith"
+
+    def test_blank_name(self):
+        from fairdm.contrib.contributors.services.matching import name_key
+
+        assert name_key(None) == name_key(" . ") == ""
+
+    def test_set_on_save(self, db, john_a_smith):
+        john_a_smith.name = "Smith, Jane"
+        john_a_smith.save(update_fields=["name"])
+        john_a_smith.refresh_from_db()
+
+        assert john_a_smith.name_key == "jane smith"
+
+
+class TestDetectDuplicates:
+    """Tests for the batch matcher and the pairs it stores."""
+
+    def test_pairs_are_stored_both_ways(
+        self, db, john_smith, john_a_smith, alice_brown
+    ):
+        from fairdm.contrib.contributors.models import DuplicateCandidate
+        from fairdm.contrib.contributors.services.matching import detect_duplicates
+
+        pairs = detect_duplicates()
+
+        low, high = sorted([john_smith.pk, john_a_smith.pk])
+        assert list(pairs) == [(low, high)]
+        assert set(DuplicateCandidate.objects.values_list("person", "candidate")) == {
+            (low, high),
+            (high, low),
+        }
+
+    def test_rerun_replaces_the_pairs(self, db, john_smith, john_a_smith):
+        from fairdm.contrib.contributors.models import DuplicateCandidate
+        from fairdm.contrib.contributors.services.matching import detect_duplicates
+
+        detect_duplicates()
+        john_a_smith.name = "Alice Brown"
+        john_a_smith.save()
+        detect_duplicates()
+
+        assert not DuplicateCandidate.objects.exists()
+
+    def test_stored_candidates(self, db, john_smith, john_a_smith):
+        from fairdm.contrib.contributors.services.matching import (
+            detect_duplicates,
+            find_duplicate_candidates,
+            stored_candidates,
+        )
+
+        detect_duplicates()
+
+        assert stored_candidates(john_a_smith) == find_duplicate_candidates(
+            john_a_smith
+        )
+        assert stored_candidates(john_a_smith, exclude=[john_smith.pk]) == []
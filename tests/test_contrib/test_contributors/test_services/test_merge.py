@@ -7,7 +7,10 @@ Verifies:
   - Affiliations reassigned (duplicates skipped)
   - Allauth records reassigned
   - Sessions invalidated for discarded person
-  - Permissions transferred (if guardian installed)
+  - Permissions transferred without duplicates
+  - A private dataset granted to person_discard stays visible to person_keep in the API
+  - Collaboration graph moved with the credits
+  - Several pairs merged in one call, one transaction per pair
   - Atomic rollback on error
   - Error if keep == discard
   - person_discard is deleted after successful merge
@@ -157,6 +160,158 @@ class TestMergeAffiliations:
         merge_persons(keep_person, discard_person)
         assert Affiliation.objects.filter(person=keep_person, organization=org).exists()
 
+    def test_keep_primary_affiliation_stays_primary(
+        self, db, keep_person, discard_person
+    ):
+        """Only one affiliation is primary after merging two primaries."""
+        from fairdm.contrib.contributors.models import Affiliation
+        from fairdm.contrib.contributors.services.merge import merge_persons
+        from fairdm.factories import OrganizationFactory
+
+        kept = Affiliation.objects.create(
+            person=keep_person, organization=OrganizationFactory(), is_primary=True
+        )
+        Affiliation.objects.create(
+            person=discard_person, organization=OrganizationFactory(), is_primary=True
+        )
+
+        merge_persons(keep_person, discard_person)
+
+        primary = Affiliation.objects.filter(person=keep_person, is_primary=True)
+        assert list(primary) == [kept]
+        assert Affiliation.objects.filter(person=keep_person).count() == 2
+
+
+class TestMergePermissions:
+    def test_permissions_moved_without_duplicates(
+        self, db, keep_person, discard_person
+    ):
+        """Permissions move to keep; one keep already holds is not duplicated."""
+        from guardian.models import UserObjectPermission
+        from guardian.shortcuts import assign_perm
+
+        from fairdm.contrib.contributors.services.merge import merge_persons
+        from fairdm.factories import ProjectFactory
+
+        shared, own = ProjectFactory(), ProjectFactory()
+        assign_perm("change_project", keep_person, shared)
+        assign_perm("change_project", discard_person, shared)
+        assign_perm("change_project", discard_person, own)
+
+        merge_persons(keep_person, discard_person)
+
+        held = UserObjectPermission.objects.filter(user=keep_person)
+        assert sorted(held.values_list("object_pk", flat=True)) == sorted(
+            [str(shared.pk), str(own.pk)]
+        )
+
+    def test_private_dataset_stays_visible_through_the_api(
+        self, db, keep_person, discard_person
+    ):
+        """The dataset access index and the permission cache follow the update."""
+        from django.urls import reverse
+        from guardian.shortcuts import assign_perm
+        from rest_framework.authtoken.models import Token
+        from rest_framework.test import APIClient
+
+        from fairdm.contrib.contributors.services.merge import merge_persons
+        from fairdm.factories import DatasetFactory
+        from fairdm.utils.choices import Visibility
+
+        dataset = DatasetFactory(visibility=Visibility.PRIVATE)
+        assign_perm("view_dataset", discard_person, dataset)
+        client = APIClient()
+        token, _ = Token.objects.get_or_create(user=keep_person)
+        client.credentials(HTTP_AUTHORIZATION=f"Token {token.key}")
+        assert keep_person.has_perm("dataset.view_dataset", dataset) is False
+
+        merge_persons(keep_person, discard_person)
+
+        keep_person = type(keep_person).objects.get(pk=keep_person.pk)
+        assert keep_person.has_perm("dataset.view_dataset", dataset) is True
+        response = client.get(reverse("api:dataset-list"))
+        uuids = [d["uuid"] for d in response.json()["results"]]
+        assert str(dataset.uuid) in uuids
+
+
+class TestMergeCollaborations:
+    def test_graph_matches_a_recount(self, db, keep_person, discard_person):
+        """The moved collaboration graph is the one a full recount gives."""
+        from fairdm.contrib.contributors.models import Collaboration, Contribution
+        from fairdm.contrib.contributors.services.collaboration import (
+            rebuild_collaborations,
+        )
+        from fairdm.contrib.contributors.services.merge import merge_persons
+        from fairdm.factories import PersonFactory, ProjectFactory
+
+        other = PersonFactory()
+        both, alone = ProjectFactory(), ProjectFactory()
+        for contributor in (keep_person, discard_person, other):
+            Contribution.add_to(contributor, both)
+        Contribution.add_to(discard_person, alone)
+        Contribution.add_to(other, alone)
+
+        merge_persons(keep_person, discard_person)
+        edges = set(
+            Collaboration.objects.values_list("contributor", "collaborator", "weight")
+        )
+        rebuild_collaborations()
+
+        assert (keep_person.pk, other.pk, 2) in edges
+        assert edges == set(
+            Collaboration.objects.values_list("contributor", "collaborator", "weight")
+        )
+
+
+class TestMergeSessions:
+    def test_only_discarded_sessions_are_ended(self, db, keep_person, discard_person):
+        """The discarded person's sessions end; other people stay logged in."""
+        from django.contrib.sessions.models import Session
+        from django.test import Client
+
+        from fairdm.contrib.contributors.services.merge import merge_persons
+
+        discard_client, keep_client = Client(), Client()
+        discard_client.force_login(discard_person)
+        keep_client.force_login(keep_person)
+
+        merge_persons(keep_person, discard_person)
+
+        assert not Session.objects.filter(
+            session_key=discard_client.session.session_key
+        ).exists()
+        assert Session.objects.filter(
+            session_key=keep_client.session.session_key
+        ).exists()
+
+
+class TestMergeMany:
+    def test_chained_pairs_merge_into_the_first(self, db, keep_person, discard_person):
+        """(a, b), (b, c) merges both b and c into a, one transaction per pair."""
+        from fairdm.contrib.contributors.models import Contribution, Person
+        from fairdm.contrib.contributors.services.merge import merge_many
+        from fairdm.factories import PersonFactory, ProjectFactory
+
+        third = PersonFactory()
+        Contribution.add_to(third, ProjectFactory())
+
+        result = merge_many(
+            [(keep_person.pk, discard_person.pk), (discard_person.pk, third.pk)]
+        )
+
+        assert result == {"merged": 2, "failed": []}
+        assert not Person.objects.filter(pk__in=[discard_person.pk, third.pk]).exists()
+        assert Contribution.objects.filter(contributor=keep_person).count() == 1
+
+    def test_failed_pair_does_not_stop_the_rest(self, db, keep_person, discard_person):
+        from fairdm.contrib.contributors.models import Person
+        from fairdm.contrib.contributors.services.merge import merge_many
+
+        result = merge_many([(keep_person.pk, 0), (keep_person.pk, discard_person.pk)])
+
+        assert result == {"merged": 1, "failed": [(keep_person.pk, 0)]}
+        assert not Person.objects.filter(pk=discard_person.pk).exists()
+
 
 class TestMergeGuards:
     def test_merge_with_self_raises(self, db, keep_person):
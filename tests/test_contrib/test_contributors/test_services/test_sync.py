@@ -0,0 +1,169 @@
+"""Tests for the batch ORCID/ROR sync engine (services/sync.py).
+
+The engine is pointed at a local stub server that answers like ORCID and ROR,
+including conditional requests.
+
+Covers:
+- the token bucket allows bursts, then paces acquisitions at its rate
+- records are fetched and applied in bulk through the transforms
+- a second sync sends the cached validators, and unchanged records are not
+  rewritten
+- missing records count as failures without stopping the batch
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from fairdm.contrib.contributors.models import (
+    Contributor,
+    ContributorIdentifier,
+    Organization,
+    Person,
+)
+from fairdm.contrib.contributors.services.sync import (
+    SyncEngine,
+    TokenBucket,
+    sync_identifiers,
+)
+
+RECORDS = {
+    "/orcid/0000-0001-2345-6789": {
+        "orcid-identifier": {"path": "0000-0001-2345-6789"},
+        "person": {
+            "name": {
+                "given-names": {"value": "Jane"},
+                "family-name": {"value": "Researcher"},
+            },
+            "biography": {"content": "Studies rocks."},
+        },
+    },
+    "/ror/02nr0ka47": {
+        "id": "https://ror.org/02nr0ka47",
+        "name": "Test Research Institute",
+        "aliases": ["TRI"],
+        "addresses": [{"city": "Potsdam"}],
+        "country": {"country_code": "DE"},
+        "links": ["https://example.org"],
+    },
+}
+
+
+class StubRegistry(BaseHTTPRequestHandler):
+    """Serves ``RECORDS`` with an ETag, answering 304 when it is sent back."""
+
+    requests: list = []
+
+    def do_GET(self):
+        self.requests.append((self.path, self.headers.get("If-None-Match")))
+        record = RECORDS.get(self.path)
+        if record is None:
+            self.send_response(404)
+            self.end_headers()
+            return
+        etag = f'"{hash(json.dumps(record, sort_keys=True))}"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+        body = json.dumps(record).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def registry():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubRegistry)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    StubRegistry.requests = []
+    host, port = server.server_address
+    yield {
+        "ORCID": f"http://{host}:{port}/orcid/{{id}}",
+        "ROR": f"http://{host}:{port}/ror/{{id}}",
+    }
+    server.shutdown()
+    server.server_close()
+
+
+def _sync(registry, *identifiers):
+    return sync_identifiers(
+        [identifier.pk for identifier in identifiers],
+        endpoints=registry,
+        rates={"ORCID": 100.0, "ROR": 100.0},
+        workers=4,
+    )
+
+
+class TestTokenBucket:
+    def test_bursts_then_paces(self):
+        now = [0.0]
+        waits = []
+
+        def sleep(seconds):
+            waits.append(seconds)
+            now[0] += seconds
+
+        bucket = TokenBucket(2.0, capacity=2, clock=lambda: now[0], sleep=sleep)
+        for _ in range(4):
+            bucket.acquire()
+
+        assert waits == [pytest.approx(0.5), pytest.approx(0.5)]
+        assert now[0] == pytest.approx(1.0)
+
+
+@pytest.mark.django_db
+class TestSyncEngine:
+    def test_records_are_applied(
+        self, registry, locmem_cache, orcid_identifier, ror_identifier
+    ):
+        result = _sync(registry, orcid_identifier, ror_identifier)
+
+        assert result.as_dict() == {"updated": 2, "unchanged": 0, "failed": 0}
+        person = Person.objects.get(pk=orcid_identifier.related_id)
+        assert person.first_name == "Jane"
+        assert person.name == "Jane Researcher"
+        assert person.profile == "Studies rocks."
+        assert person.last_synced is not None
+        organization = Organization.objects.get(pk=ror_identifier.related_id)
+        assert organization.city == "Potsdam"
+        assert organization.synced_data["name"] == "Test Research Institute"
+
+    def test_unchanged_records_are_not_rewritten(
+        self, registry, locmem_cache, orcid_identifier, ror_identifier
+    ):
+        _sync(registry, orcid_identifier, ror_identifier)
+        Contributor.objects.update(name="Edited locally", last_synced=None)
+
+        result = _sync(registry, orcid_identifier, ror_identifier)
+
+        assert result.as_dict() == {"updated": 0, "unchanged": 2, "failed": 0}
+        assert all(etag for _, etag in StubRegistry.requests[2:])
+        names = set(Contributor.objects.values_list("name", flat=True))
+        assert "Edited locally" in names
+        assert not Contributor.objects.filter(
+            pk__in=[orcid_identifier.related_id, ror_identifier.related_id],
+            last_synced=None,
+        ).exists()
+
+    def test_missing_records_fail_alone(self, registry, locmem_cache, orcid_identifier):
+        from fairdm.factories import PersonFactory
+
+        missing = ContributorIdentifier.objects.create(
+            related=PersonFactory(), type="ORCID", value="0000-0009-9999-9999"
+        )
+
+        result = SyncEngine(endpoints=registry, workers=2).sync(
+            [orcid_identifier.pk, missing.pk]
+        )
+
+        assert result.as_dict() == {"updated": 1, "unchanged": 0, "failed": 1}
@@ -157,11 +157,11 @@ class TestRORSyncTask:
 class TestPeriodicRefresh:
     """Verify periodic refresh task."""
 
-    @patch("fairdm.contrib.contributors.tasks.sync_contributor_identifier.delay")
+    @patch("fairdm.contrib.contributors.tasks.sync_contributor_batch.delay")
     def test_refresh_all_contributors(
         self, mock_sync_task, orcid_identifier, ror_identifier
     ):
-        """Refresh all task queues sync for all identifiers."""
+        """Refresh all task queues one batch sync for all identifiers."""
         from fairdm.contrib.contributors.tasks import refresh_all_contributors
 
         # Reset last_synced to None so they're considered stale
@@ -172,11 +172,25 @@ class TestPeriodicRefresh:
 
         result = refresh_all_contributors()
 
-        # Verify sync was queued for both identifiers
+        # Verify sync was queued for both identifiers, in one batch
+        mock_sync_task.assert_called_once_with([orcid_identifier.pk, ror_identifier.pk])
+        assert result == 2
+
+    @patch("fairdm.contrib.contributors.tasks.SYNC_BATCH_SIZE", 1)
+    @patch("fairdm.contrib.contributors.tasks.sync_contributor_batch.delay")
+    def test_refresh_all_contributors_is_not_capped(
+        self, mock_sync_task, orcid_identifier, ror_identifier
+    ):
+        """Every stale identifier is queued, split into batches."""
+        from fairdm.contrib.contributors.models import Contributor
+        from fairdm.contrib.contributors.tasks import refresh_all_contributors
+
+        Contributor.objects.update(last_synced=None)
+
+        assert refresh_all_contributors() == 2
         assert mock_sync_task.call_count == 2
-        assert result >= 2
 
-    @patch("fairdm.contrib.contributors.tasks.sync_contributor_identifier.delay")
+    @patch("fairdm.contrib.contributors.tasks.sync_contributor_batch.delay")
     def test_refresh_all_only_syncs_identifiers_with_data(self, mock_sync_task, person):
         """Refresh all skips identifiers without external IDs."""
         from fairdm.contrib.contributors.tasks import refresh_all_contributors
@@ -0,0 +1,156 @@
+"""Tests for prebuilt dataset download artefacts.
+
+Covers:
+- a build stores the metadata, the package and one table per type, named by hash
+- rebuilding an unchanged dataset keeps the stored files
+- the download views serve a current artefact and answer If-None-Match with 304,
+  without computing the dataset's package version
+- changes schedule one build per debounce window, and only when enabled
+- a dataset that is no longer public loses its artefacts
+"""
+
+from unittest import mock
+
+import pytest
+from django.core.files.storage import default_storage
+from django.urls import reverse
+
+from fairdm.contrib.import_export.artefacts import build_artefacts, current_artefact
+from fairdm.contrib.import_export.models import DatasetArtefact
+from fairdm.contrib.import_export.tasks import build_dataset_artefacts
+from fairdm.factories import DatasetFactory
+from fairdm.utils.choices import Visibility
+from fairdm_demo.factories import CustomParentSampleFactory
+from fairdm_demo.models import CustomParentSample
+
+
+@pytest.fixture
+def dataset():
+    dataset = DatasetFactory(visibility=Visibility.PUBLIC)
+    CustomParentSampleFactory.create_batch(3, dataset=dataset)
+    return dataset
+
+
+@pytest.fixture
+def enabled(settings, locmem_cache, dataset):
+    """Artefacts switched on once the dataset's records have been created."""
+    settings.FAIRDM_DATASET_ARTEFACTS = True
+
+
+@pytest.mark.django_db
+class TestBuild:
+    def test_stores_every_artefact(self, dataset):
+        built = build_artefacts(dataset)
+
+        kinds = {(artefact.kind, artefact.label) for artefact in built}
+        assert kinds == {
+            (DatasetArtefact.Kind.METADATA, ""),
+            (DatasetArtefact.Kind.PACKAGE, ""),
+            (DatasetArtefact.Kind.TABLE, CustomParentSample._meta.label_lower),
+        }
+        for artefact in built:
+            assert artefact.checksum[:12] in artefact.file.name
+            assert default_storage.exists(artefact.file.name)
+
+    def test_unchanged_rebuild_keeps_files(self, dataset):
+        first = {a.kind: a.file.name for a in build_artefacts(dataset)}
+        second = {a.kind: a.file.name for a in build_artefacts(dataset)}
+
+        metadata = DatasetArtefact.Kind.METADATA
+        assert first[metadata] == second[metadata]
+
+    def test_new_sample_makes_artefacts_stale(self, dataset, enabled):
+        build_artefacts(dataset)
+        assert current_artefact(dataset, DatasetArtefact.Kind.PACKAGE) is not None
+
+        CustomParentSampleFactory(dataset=dataset)
+
+        assert current_artefact(dataset, DatasetArtefact.Kind.PACKAGE) is None
+
+    def test_private_dataset_loses_artefacts(self, dataset):
+        built = build_artefacts(dataset)
+        dataset.visibility = Visibility.PRIVATE
+        dataset.save()
+
+        assert build_dataset_artefacts(dataset.pk) is False
+        assert not dataset.artefacts.exists()
+        for artefact in built:
+            assert not default_storage.exists(artefact.file.name)
+
+
+@pytest.mark.django_db
+class TestArtefactDownloads:
+    def test_metadata_is_served_with_etag(self, client, dataset, enabled):
+        build_artefacts(dataset)
+        artefact = current_artefact(dataset, DatasetArtefact.Kind.METADATA)
+        url = reverse("dataset-metadata-download", args=[dataset.uuid])
+
+        response = client.get(url)
+        assert response.status_code == 200
+        assert response["ETag"] == artefact.etag
+
+        response = client.get(url, HTTP_IF_NONE_MATCH=artefact.etag)
+        assert response.status_code == 304
+
+    def test_conditional_request_skips_the_package_version(
+        self, client, dataset, enabled
+    ):
+        build_artefacts(dataset)
+        artefact = current_artefact(dataset, DatasetArtefact.Kind.PACKAGE)
+        url = reverse("dataset-download", args=[dataset.uuid])
+
+        with mock.patch(
+            "fairdm.contrib.import_export.artefacts.get_package_version"
+        ) as get_package_version:
+            response = client.get(url, HTTP_IF_NONE_MATCH=artefact.etag)
+
+        assert response.status_code == 304
+        get_package_version.assert_not_called()
+
+    def test_live_metadata_has_etag(self, client, dataset):
+        url = reverse("dataset-metadata-download", args=[dataset.uuid])
+
+        response = client.get(url)
+        assert response.status_code == 200
+        etag = response["ETag"]
+
+        assert client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 304
+
+    def test_table_falls_back_to_streaming(self, client, dataset):
+        label = CustomParentSample._meta.label_lower
+        url = reverse("dataset-table-download", args=[dataset.uuid, label])
+
+        response = client.get(url)
+        assert response.status_code == 200
+        assert response.streaming
+
+    def test_unknown_table_is_not_found(self, client, dataset):
+        url = reverse("dataset-table-download", args=[dataset.uuid, "app.nothing"])
+
+        assert client.get(url).status_code == 404
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("locmem_cache")
+class TestScheduling:
+    def test_changes_queue_one_build(
+        self, settings, dataset, django_capture_on_commit_callbacks
+    ):
+        settings.FAIRDM_DATASET_ARTEFACTS = True
+        with (
+            mock.patch.object(build_dataset_artefacts, "apply_async") as apply_async,
+            django_capture_on_commit_callbacks(execute=True),
+        ):
+            CustomParentSampleFactory.create_batch(5, dataset=dataset)
+
+        apply_async.assert_called_once()
+        assert apply_async.call_args.args[0] == (dataset.pk,)
+
+    def test_disabled_by_default(self, dataset, django_capture_on_commit_callbacks):
+        with (
+            mock.patch.object(build_dataset_artefacts, "apply_async") as apply_async,
+            django_capture_on_commit_callbacks(execute=True),
+        ):
+            CustomParentSampleFactory(dataset=dataset)
+
+        apply_async.assert_not_called()
@@ -0,0 +1,101 @@
+"""Tests for the streamed dataset download package.
+
+Covers:
+- the package streams as a valid ZIP with one CSV per sample type
+- the download view streams it as an attachment; private datasets are not served
+- with FAIRDM_DATA_PACKAGE_CACHE the package is stored once per dataset version
+- the version changes when a sample is added, and the older package is removed
+"""
+
+import csv
+import io
+import zipfile
+
+import pytest
+from django.core.files.storage import default_storage
+from django.test import RequestFactory
+from django.urls import reverse
+
+from fairdm.contrib.import_export.utils import DataPackage, get_package_version
+from fairdm.factories import DatasetFactory
+from fairdm.utils.choices import Visibility
+from fairdm_demo.factories import CustomParentSampleFactory
+from fairdm_demo.models import CustomParentSample
+
+
+@pytest.fixture
+def dataset():
+    dataset = DatasetFactory(visibility=Visibility.PUBLIC)
+    CustomParentSampleFactory.create_batch(5, dataset=dataset)
+    return dataset
+
+
+def _package(dataset) -> DataPackage:
+    return DataPackage(dataset, RequestFactory().get("/"), chunk_size=2)
+
+
+@pytest.mark.django_db
+class TestStreamedPackage:
+    def test_stream_is_a_valid_zip(self, dataset):
+        archive = zipfile.ZipFile(io.BytesIO(b"".join(_package(dataset).stream())))
+
+        assert archive.testzip() is None
+        member = f"samples/{CustomParentSample._meta.verbose_name_plural}.csv"
+        assert member in archive.namelist()
+        assert "metadata.xml" in archive.namelist()
+        rows = list(csv.reader(io.StringIO(archive.read(member).decode())))
+        assert len(rows) == 1 + 5
+
+    def test_build_package_matches_the_stream(self, dataset):
+        with _package(dataset).build_package() as package:
+            archive = zipfile.ZipFile(package)
+            assert archive.testzip() is None
+
+
+@pytest.mark.django_db
+class TestPackageDownloadView:
+    def test_streams_an_attachment(self, client, dataset):
+        response = client.get(reverse("dataset-download", args=[dataset.uuid]))
+
+        assert response.status_code == 200
+        assert response.streaming
+        assert response["Content-Type"] == "application/zip"
+        assert "attachment" in response["Content-Disposition"]
+        archive = zipfile.ZipFile(io.BytesIO(b"".join(response.streaming_content)))
+        assert archive.testzip() is None
+
+    def test_private_dataset_is_not_served(self, client):
+        dataset = DatasetFactory(visibility=Visibility.PRIVATE)
+        response = client.get(reverse("dataset-download", args=[dataset.uuid]))
+
+        assert response.status_code == 404
+
+
+@pytest.mark.django_db
+class TestCachedPackage:
+    def test_package_is_stored_once_per_version(self, client, settings, dataset):
+        settings.FAIRDM_DATA_PACKAGE_CACHE = True
+        package = _package(dataset)
+        name = package.get_cache_name()
+        url = reverse("dataset-download", args=[dataset.uuid])
+
+        client.get(url)
+        assert default_storage.exists(name)
+        stored = default_storage.get_modified_time(name)
+
+        response = client.get(url)
+        assert response.status_code == 200
+        assert default_storage.get_modified_time(name) == stored
+
+    def test_new_sample_makes_a_new_version(self, dataset):
+        package = _package(dataset)
+        package.cached().close()
+        old_name = package.get_cache_name()
+        old_version = get_package_version(dataset)
+
+        CustomParentSampleFactory(dataset=dataset)
+
+        assert get_package_version(dataset) != old_version
+        package.cached().close()
+        assert default_storage.exists(package.get_cache_name())
+        assert not default_storage.exists(old_name)
@@ -0,0 +1,85 @@
+"""Smoke tests for the dataset import pages.
+
+Covers:
+- the import page and a job's status page serve to an editor of the dataset
+- the status fragment is served alone to htmx
+- a job is only found through its own dataset
+- both pages are closed to a visitor
+"""
+
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.urls import reverse
+from guardian.shortcuts import assign_perm
+
+from fairdm.contrib.import_export.models import ImportJob
+from fairdm.factories import DatasetFactory, UserFactory
+from fairdm_demo.models import CustomParentSample
+
+
+def _job(dataset) -> ImportJob:
+    return ImportJob.objects.create(
+        dataset=dataset,
+        data_type=CustomParentSample._meta.label_lower,
+        file=SimpleUploadedFile("samples.csv", b"id,name\n"),
+        input_format="csv",
+        chunk_size=2,
+    )
+
+
+@pytest.fixture
+def dataset(db):
+    return DatasetFactory()
+
+
+@pytest.fixture
+def editor(client, dataset):
+    user = UserFactory()
+    assign_perm("change_dataset", user, dataset)
+    client.force_login(user)
+    return user
+
+
+def _job_url(job) -> str:
+    return reverse(
+        "dataset:import-job", kwargs={"uuid": job.dataset.uuid, "job": job.uuid}
+    )
+
+
+@pytest.mark.django_db
+class TestImportPages:
+    def test_import_page(self, client, editor, dataset):
+        response = client.get(reverse("dataset:import", kwargs={"uuid": dataset.uuid}))
+
+        assert response.status_code == 200
+
+    def test_job_status_page(self, client, editor, dataset):
+        response = client.get(_job_url(_job(dataset)))
+
+        assert response.status_code == 200
+        assert "import_export/import_job.html" in [t.name for t in response.templates]
+
+    def test_job_status_fragment(self, client, editor, dataset):
+        response = client.get(_job_url(_job(dataset)), headers={"HX-Request": "true"})
+
+        assert response.status_code == 200
+        assert response.templates[0].name == (
+            "import_export/partials/import_job_status.html"
+        )
+
+    def test_job_of_another_dataset_is_not_found(self, client, editor, dataset):
+        job = _job(DatasetFactory())
+        url = reverse(
+            "dataset:import-job", kwargs={"uuid": dataset.uuid, "job": job.uuid}
+        )
+
+        assert client.get(url).status_code == 404
+
+    def test_closed_to_a_visitor(self, client, dataset):
+        urls = [
+            reverse("dataset:import", kwargs={"uuid": dataset.uuid}),
+            _job_url(_job(dataset)),
+        ]
+        client.force_login(UserFactory())
+
+        assert [client.get(url).status_code for url in urls] == [403, 403]
@@ -0,0 +1,134 @@
+"""Tests for the bulk row resolution in the sample and measurement resources.
+
+Covers:
+- before_import resolves every referenced record in a fixed number of queries
+- get_instance then answers by id and local_id without touching the database
+- ids belonging to another dataset are not resolved
+- an ambiguous measurement name is refused
+- SampleWidget resolves samples by uuid and by name from its preloaded lookup
+"""
+
+import pytest
+import tablib
+
+from fairdm.contrib.import_export.resources import (
+    MeasurementResource,
+    SampleResource,
+    SampleWidget,
+)
+from fairdm.factories import DatasetFactory
+from fairdm_demo.factories import (
+    CustomParentSampleFactory,
+    ExampleMeasurementFactory,
+)
+from fairdm_demo.models import CustomParentSample, ExampleMeasurement
+
+
+class CustomParentSampleResource(SampleResource):
+    class Meta:
+        model = CustomParentSample
+
+
+class ExampleMeasurementResource(MeasurementResource):
+    class Meta:
+        model = ExampleMeasurement
+        fields = ("dataset", "id", "name", "sample", "char_field")
+
+
+def _rows(headers, rows) -> tablib.Dataset:
+    return tablib.Dataset(*rows, headers=headers)
+
+
+@pytest.mark.django_db
+class TestSampleResolution:
+    def test_lookups_are_one_query_per_column(self, django_assert_num_queries):
+        dataset = DatasetFactory()
+        samples = CustomParentSampleFactory.create_batch(20, dataset=dataset)
+        data = _rows(
+            ["id", "local_id", "name"],
+            [(s.id, "", s.name) for s in samples[:10]]
+            + [("", f"L{i}", "new") for i in range(10)],
+        )
+        resource = CustomParentSampleResource(dataset=dataset)
+
+        with django_assert_num_queries(2):
+            resource.before_import(data)
+
+        with django_assert_num_queries(0):
+            found = [resource.get_instance(None, row) for row in data.dict]
+        assert found[:10] == samples[:10]
+        assert found[10:] == [None] * 10
+
+    def test_local_id_is_resolved_within_the_dataset(self):
+        dataset = DatasetFactory()
+        sample = CustomParentSampleFactory(dataset=dataset, local_id="A-1")
+        CustomParentSampleFactory(dataset=DatasetFactory(), local_id="A-2")
+        data = _rows(["id", "local_id"], [("", "A-1"), ("", "A-2")])
+        resource = CustomParentSampleResource(dataset=dataset)
+        resource.before_import(data)
+
+        assert resource.get_instance(None, data.dict[0]) == sample
+        assert resource.get_instance(None, data.dict[1]) is None
+
+    def test_ids_of_another_dataset_are_not_resolved(self):
+        other = CustomParentSampleFactory(dataset=DatasetFactory())
+        data = _rows(["id"], [(other.id,)])
+        resource = CustomParentSampleResource(dataset=DatasetFactory())
+        resource.before_import(data)
+
+        assert resource.get_instance(None, data.dict[0]) is None
+
+    def test_spreadsheet_ids_are_normalised(self):
+        dataset = DatasetFactory()
+        sample = CustomParentSampleFactory(dataset=dataset)
+        data = _rows(["id"], [(f"{sample.id}.0",)])
+        resource = CustomParentSampleResource(dataset=dataset)
+        resource.before_import(data)
+
+        assert resource.get_instance(None, data.dict[0]) == sample
+
+
+@pytest.mark.django_db
+class TestMeasurementResolution:
+    def test_ambiguous_name_is_refused(self):
+        dataset = DatasetFactory()
+        ExampleMeasurementFactory.create_batch(2, dataset=dataset, name="dup")
+        data = _rows(["id", "name"], [("", "dup")])
+        resource = ExampleMeasurementResource(dataset=dataset)
+        resource.before_import(data)
+
+        with pytest.raises(ExampleMeasurement.MultipleObjectsReturned):
+            resource.get_instance(None, dict(data.dict[0]))
+
+    def test_unique_name_updates_the_existing_record(self):
+        dataset = DatasetFactory()
+        measurement = ExampleMeasurementFactory(dataset=dataset, name="only")
+        data = _rows(["id", "name"], [("", "only")])
+        resource = ExampleMeasurementResource(dataset=dataset)
+        resource.before_import(data)
+
+        row = dict(data.dict[0])
+        assert resource.get_instance(None, row) == measurement
+        assert "id" not in row
+
+    def test_samples_are_preloaded(self, django_assert_num_queries):
+        dataset = DatasetFactory()
+        by_uuid = CustomParentSampleFactory(dataset=DatasetFactory())
+        by_name = CustomParentSampleFactory(dataset=dataset, name="core-7")
+        data = _rows(["name", "sample"], [("a", by_uuid.uuid), ("b", "core-7")])
+        resource = ExampleMeasurementResource(dataset=dataset)
+        resource.before_import(data)
+        widget = resource.fields["sample"].widget
+
+        with django_assert_num_queries(0):
+            assert widget.clean(by_uuid.uuid) == by_uuid
+            assert widget.clean("core-7") == by_name
+            assert widget.clean("missing") is None
+
+
+@pytest.mark.django_db
+class TestSampleWidgetWithoutPreload:
+    def test_falls_back_to_a_query(self):
+        sample = CustomParentSampleFactory()
+
+        assert SampleWidget().clean(sample.uuid) == sample
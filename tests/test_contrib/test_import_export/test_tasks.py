@@ -0,0 +1,164 @@
+"""Tests for the background import pipeline.
+
+Covers:
+- stage_import parses the upload once into chunks and the chunks import in order
+- a chunk with a failing row is rolled back alone and reported by file row number
+- a chunk redelivered after it committed leaves the job running, and queues
+  the first chunk left when the worker was lost before queueing it
+- an unreadable upload fails the job with a message
+- progress and the polling flag follow the job's status
+"""
+
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from import_export.resources import ModelResource
+
+from fairdm.contrib.import_export.models import ImportChunk, ImportJob
+from fairdm.contrib.import_export.tasks import import_chunk, stage_import
+from fairdm.factories import DatasetFactory
+from fairdm_demo.models import CustomParentSample
+
+
+class DatasetSampleResource(ModelResource):
+    """The registry resource does not attach rows to a dataset; this one does."""
+
+    def __init__(self, dataset, **kwargs):
+        self.dataset = dataset
+        super().__init__(**kwargs)
+
+    def before_import_row(self, row, **kwargs):
+        row["dataset"] = self.dataset.pk
+
+    class Meta:
+        model = CustomParentSample
+        fields = ("id", "name", "char_field", "dataset")
+
+
+@pytest.fixture(autouse=True)
+def resource(monkeypatch):
+    monkeypatch.setattr(
+        ImportJob, "get_resource", lambda job: DatasetSampleResource(job.dataset)
+    )
+
+
+def _job(dataset, content: bytes, name="samples.csv", chunk_size=2) -> ImportJob:
+    return ImportJob.objects.create(
+        dataset=dataset,
+        data_type=CustomParentSample._meta.label_lower,
+        file=SimpleUploadedFile(name, content),
+        input_format=name.rsplit(".", 1)[-1],
+        chunk_size=chunk_size,
+    )
+
+
+def _csv(*rows: tuple[str, str, str]) -> bytes:
+    lines = ["id,name,char_field", *(",".join(row) for row in rows)]
+    return ("\n".join(lines) + "\n").encode()
+
+
+@pytest.mark.django_db
+class TestChunkedImport:
+    def test_every_chunk_is_imported(self):
+        dataset = DatasetFactory()
+        job = _job(dataset, _csv(*[("", f"S{i}", "x") for i in range(5)]))
+
+        assert stage_import(job.pk) is True
+
+        job.refresh_from_db()
+        assert job.status == ImportJob.Status.COMPLETED
+        assert job.total_rows == 5
+        assert job.processed_rows == 5
+        assert job.totals["new"] == 5
+        assert job.progress == 100
+        assert not job.is_active
+        assert CustomParentSample.objects.filter(dataset=dataset).count() == 5
+        assert not ImportChunk.objects.filter(job=job).exists()
+
+    def test_failing_chunk_is_rolled_back_alone(self):
+        dataset = DatasetFactory()
+        job = _job(
+            dataset,
+            _csv(
+                ("", "S1", "x"),
+                ("", "S2", "x"),
+                ("", "S3", "x"),
+                ("nope", "S4", "x"),
+            ),
+        )
+
+        stage_import(job.pk)
+
+        job.refresh_from_db()
+        assert job.status == ImportJob.Status.COMPLETED
+        assert job.has_errors
+        assert job.rejected_rows == 2
+        assert job.totals["new"] == 2
+        assert [error["row"] for error in job.errors] == [4]
+        names = CustomParentSample.objects.filter(dataset=dataset).values_list(
+            "name", flat=True
+        )
+        assert sorted(names) == ["S1", "S2"]
+
+    def test_redelivered_chunk_does_not_finish_the_job(self, monkeypatch):
+        dataset = DatasetFactory()
+        job = _job(dataset, _csv(*[("", f"S{i}", "x") for i in range(3)]))
+        # Run each chunk by hand, as the broker would deliver them
+        monkeypatch.setattr(import_chunk, "delay", lambda *args: None)
+        stage_import(job.pk)
+        import_chunk(job.pk, 0)
+
+        # Chunk 0 committed, then its message was redelivered
+        assert import_chunk(job.pk, 0) is False
+
+        job.refresh_from_db()
+        assert job.status == ImportJob.Status.RUNNING
+        assert import_chunk(job.pk, 1) is True
+        assert import_chunk(job.pk, 2) is True
+        job.refresh_from_db()
+        assert job.status == ImportJob.Status.COMPLETED
+        assert CustomParentSample.objects.filter(dataset=dataset).count() == 3
+
+    def test_redelivered_chunk_queues_the_first_chunk_left(self, monkeypatch):
+        dataset = DatasetFactory()
+        job = _job(dataset, _csv(*[("", f"S{i}", "x") for i in range(5)]))
+        queued = []
+        monkeypatch.setattr(import_chunk, "delay", lambda *args: queued.append(args))
+        stage_import(job.pk)
+        import_chunk(job.pk, 0)
+        # The worker was lost after chunk 0 committed, before chunk 1 was queued
+        queued.clear()
+
+        import_chunk(job.pk, 0)
+
+        assert queued == [(job.pk, 1)]
+        assert import_chunk(job.pk, 1) is True
+        assert import_chunk(job.pk, 2) is True
+        assert import_chunk(job.pk, 3) is True
+        job.refresh_from_db()
+        assert job.status == ImportJob.Status.COMPLETED
+        assert CustomParentSample.objects.filter(dataset=dataset).count() == 5
+
+    def test_a_job_is_staged_once(self):
+        job = _job(DatasetFactory(), _csv(("", "S1", "x")))
+        stage_import(job.pk)
+
+        assert stage_import(job.pk) is False
+
+
+@pytest.mark.django_db
+class TestFailedImport:
+    def test_unreadable_upload_fails_the_job(self):
+        job = _job(DatasetFactory(), b"not a spreadsheet", name="samples.xlsx")
+
+        assert stage_import(job.pk) is False
+
+        job.refresh_from_db()
+        assert job.status == ImportJob.Status.FAILED
+        assert job.message
+        assert job.finished is not None
+
+    def test_queued_job_is_polled(self):
+        job = _job(DatasetFactory(), _csv(("", "S1", "x")))
+
+        assert job.is_active
+        assert job.progress == 0
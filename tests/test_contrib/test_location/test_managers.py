@@ -0,0 +1,79 @@
+"""Tests for the spatial queries of fairdm.contrib.location.
+
+Covers:
+- geohashes match the reference encoding, and cover a box within a cell budget
+- a saved location carries the geohash of its coordinates
+- within_bbox matches the exact box, including across the antimeridian
+- within_radius and nearest measure great-circle distances
+"""
+
+import pytest
+
+from fairdm.contrib.location import geohash
+from fairdm.contrib.location.models import Point
+from fairdm.contrib.location.utils import get_sites_within
+from fairdm.factories import PointFactory
+
+PLACES = {
+    "berlin": ("13.40495", "52.52001"),
+    "potsdam": ("13.06449", "52.39057"),
+    "hamburg": ("9.99368", "53.55108"),
+    "fiji": ("179.50000", "-17.80000"),
+    "samoa": ("-172.10000", "-13.75000"),
+}
+
+
+@pytest.fixture
+def places(db):
+    return {name: PointFactory(x=x, y=y) for name, (x, y) in PLACES.items()}
+
+
+class TestGeohash:
+    def test_encode(self):
+        assert geohash.encode(-5.6, 42.6, precision=5) == "ezs42"
+
+    def test_covering_contains_the_box(self):
+        cells = geohash.covering(13.3, 52.4, 13.5, 52.6)
+
+        assert 0 < len(cells) <= geohash.MAX_CELLS
+        for x, y in ((13.3, 52.4), (13.4, 52.5), (13.5, 52.6)):
+            assert any(geohash.encode(x, y).startswith(cell) for cell in cells)
+
+    def test_covering_the_globe(self):
+        assert len(geohash.covering(-180, -90, 180, 90)) == 32
+
+
+@pytest.mark.django_db
+class TestPointQuerySet:
+    def test_saved_points_are_geohashed(self, places):
+        berlin = Point.objects.get(pk=places["berlin"].pk)
+
+        assert berlin.geohash == geohash.encode(*PLACES["berlin"])
+
+    def test_within_bbox(self, places):
+        found = Point.objects.within_bbox(9, 52, 14, 54)
+
+        assert set(found) == {places["berlin"], places["potsdam"], places["hamburg"]}
+
+    def test_within_bbox_across_the_antimeridian(self, places):
+        found = Point.objects.within_bbox(170, -20, -170, -10)
+
+        assert set(found) == {places["fiji"], places["samoa"]}
+
+    def test_within_radius(self, places):
+        found = Point.objects.within_radius(*PLACES["berlin"], km=50)
+
+        assert set(found) == {places["berlin"], places["potsdam"]}
+        potsdam = found.get(pk=places["potsdam"].pk)
+        assert potsdam.distance == pytest.approx(27, abs=1)
+
+    def test_nearest(self, places):
+        found = Point.objects.nearest(*PLACES["fiji"], k=2)
+
+        assert list(found) == [places["fiji"], places["samoa"]]
+
+    def test_get_sites_within(self, places):
+        assert list(get_sites_within(places["berlin"], radius=300)) == [
+            places["potsdam"],
+            places["hamburg"],
+        ]
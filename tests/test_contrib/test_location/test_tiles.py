@@ -0,0 +1,117 @@
+"""Tests for the clustered sample map tiles.
+
+Covers:
+- tile bounds follow the web map scheme and reach the poles
+- cluster cells shrink as the zoom deepens
+- samples in a tile are clustered, single samples carry their uuid
+- the tile endpoint hides private datasets and caches anonymous tiles publicly
+"""
+
+import pytest
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from fairdm.contrib.location import geohash
+from fairdm.contrib.location.tiles import cluster_precision, sample_tile, tile_bounds
+from fairdm.contrib.location.utils import serialize_dataset_samples
+from fairdm.core.models import Sample
+from fairdm.factories import DatasetFactory, PointFactory
+from fairdm.utils.choices import Visibility
+
+
+def _sample(dataset, x, y):
+    from fairdm_demo.factories import CustomParentSampleFactory
+
+    return CustomParentSampleFactory(dataset=dataset, location=PointFactory(x=x, y=y))
+
+
+class TestTileBounds:
+    def test_world(self):
+        assert tile_bounds(0, 0, 0) == (-180, -90, 180, 90)
+
+    def test_quadrant(self):
+        west, south, east, north = tile_bounds(1, 1, 0)
+
+        assert (west, south, east, north) == (0, pytest.approx(0, abs=1e-9), 180, 90)
+
+    def test_cluster_precision_deepens_with_zoom(self):
+        precisions = [cluster_precision(z) for z in range(0, 23, 2)]
+
+        assert precisions == sorted(precisions)
+        assert precisions[-1] <= geohash.PRECISION
+
+
+@pytest.mark.django_db
+class TestSampleTile:
+    def test_clusters(self):
+        dataset = DatasetFactory()
+        berlin = _sample(dataset, "13.40495", "52.52001")
+        _sample(dataset, "13.06449", "52.39057")
+        _sample(dataset, "13.10000", "52.40000")
+        _sample(dataset, "179.50000", "-17.80000")
+
+        world = sample_tile(Sample.objects.all(), 0, 0, 0)
+        counts = sorted(f["properties"]["count"] for f in world["features"])
+        assert counts == [1, 3]
+
+        street = sample_tile(Sample.objects.all(), 16, 35208, 21492)
+        assert [f["properties"] for f in street["features"]] == [
+            {"count": 1, "uuid": str(berlin.uuid)}
+        ]
+
+    def test_serialize_dataset_samples(self):
+        dataset = DatasetFactory()
+        sample = _sample(dataset, "13.40495", "52.52001")
+
+        collection = serialize_dataset_samples(dataset)
+
+        assert [f["properties"] for f in collection["features"]] == [
+            {"uuid": str(sample.uuid), "name": sample.name}
+        ]
+
+
+@pytest.mark.django_db
+class TestSampleTileView:
+    @pytest.fixture
+    def api_client(self):
+        return APIClient()
+
+    def _url(self, z=0, x=0, y=0):
+        return reverse("api:api-sample-tiles", kwargs={"z": z, "x": x, "y": y})
+
+    def test_private_datasets_are_hidden(self, api_client, locmem_cache):
+        _sample(DatasetFactory(visibility=Visibility.PUBLIC), "10.00000", "50.00000")
+        _sample(DatasetFactory(visibility=Visibility.PRIVATE), "-60.00000", "-30.00000")
+
+        response = api_client.get(self._url())
+
+        assert response.status_code == 200
+        assert [f["geometry"]["coordinates"] for f in response.json()["features"]] == [
+            [10.0, 50.0]
+        ]
+        assert "public" in response["Cache-Control"]
+
+    def test_anonymous_tiles_are_cached(self, api_client, locmem_cache):
+        dataset = DatasetFactory(visibility=Visibility.PUBLIC)
+        _sample(dataset, "10.00000", "50.00000")
+        api_client.get(self._url())
+        _sample(dataset, "11.00000", "51.00000")
+
+        response = api_client.get(self._url())
+
+        assert len(response.json()["features"]) == 1
+
+    def test_dataset_parameter(self, api_client):
+        dataset = DatasetFactory(visibility=Visibility.PUBLIC)
+        _sample(dataset, "10.00000", "50.00000")
+        _sample(DatasetFactory(visibility=Visibility.PUBLIC), "-60.00000", "-30.00000")
+
+        response = api_client.get(self._url(), {"dataset": str(dataset.uuid)})
+
+        assert len(response.json()["features"]) == 1
+        unknown = api_client.get(self._url(), {"dataset": "dnope"})
+        assert unknown.json()["features"] == []
+        assert api_client.get(self._url(), {"dataset": "no:pe"}).status_code == 400
+
+    def test_no_such_tile(self, api_client):
+        assert api_client.get(self._url(z=1, x=2, y=0)).status_code == 404
@@ -0,0 +1,58 @@
+"""Tests for the dataset access index.
+
+Covers:
+- assigning and removing view_dataset, to a user or a group, updates the index
+- other permissions are not indexed
+- accessible_datasets resolves group membership when read
+- rebuild_access_index restores rows written without signals
+"""
+
+import pytest
+from django.contrib.auth.models import Group
+from guardian.shortcuts import assign_perm, remove_perm
+
+from fairdm.core.dataset.access import accessible_datasets, rebuild_access_index
+from fairdm.core.dataset.models import DatasetAccess
+from fairdm.factories import DatasetFactory, UserFactory
+
+
+def _visible(user):
+    return set(accessible_datasets(user).values_list("dataset_id", flat=True))
+
+
+@pytest.mark.django_db
+class TestAccessIndex:
+    def test_user_grant_is_indexed(self):
+        user = UserFactory()
+        dataset = DatasetFactory()
+
+        assign_perm("view_dataset", user, dataset)
+        assert _visible(user) == {dataset.pk}
+
+        remove_perm("view_dataset", user, dataset)
+        assert _visible(user) == set()
+
+    def test_other_permissions_are_not_indexed(self):
+        user = UserFactory()
+        assign_perm("change_dataset", user, DatasetFactory())
+
+        assert not DatasetAccess.objects.exists()
+
+    def test_group_grant_follows_membership(self):
+        user = UserFactory()
+        group = Group.objects.create(name="reviewers")
+        dataset = DatasetFactory()
+        assign_perm("view_dataset", group, dataset)
+        assert _visible(user) == set()
+
+        user.groups.add(group)
+        assert _visible(user) == {dataset.pk}
+
+    def test_rebuild(self):
+        user = UserFactory()
+        dataset = DatasetFactory()
+        assign_perm("view_dataset", user, dataset)
+        DatasetAccess.objects.all().delete()
+
+        assert rebuild_access_index() == 1
+        assert _visible(user) == {dataset.pk}
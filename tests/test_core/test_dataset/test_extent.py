@@ -0,0 +1,116 @@
+"""Tests for the stored dataset extents.
+
+Covers:
+- a new dataset starts with an empty extent
+- adding samples and sample dates widens the extent and counts the samples
+- deleting the sample on an edge shrinks the extent; others only uncount
+- moving a sample, or its location, recomputes the datasets concerned
+- deleting a dataset takes its extent with it
+- rebuild_extents restores extents stale after writes made without signals
+"""
+
+from decimal import Decimal
+
+import pytest
+
+from fairdm.core.dataset.extent import rebuild_extents
+from fairdm.core.dataset.models import Dataset, DatasetExtent
+from fairdm.core.models import Sample
+from fairdm.factories import DatasetFactory, PointFactory, SampleDateFactory
+
+
+def _sample(dataset, x=None, y=None):
+    from fairdm_demo.factories import CustomParentSampleFactory
+
+    location = PointFactory(x=x, y=y) if x is not None else None
+    return CustomParentSampleFactory(dataset=dataset, location=location)
+
+
+def _extent(dataset):
+    return DatasetExtent.objects.get(dataset=dataset)
+
+
+def _bounds(dataset):
+    return tuple(
+        value if value is None else float(value)
+        for value in _extent(dataset).bbox.values()
+    )
+
+
+@pytest.mark.django_db
+class TestDatasetExtent:
+    def test_new_dataset(self):
+        extent = _extent(DatasetFactory())
+
+        assert extent.sample_count == 0
+        assert extent.min_x is None
+
+    def test_samples_widen_the_extent(self):
+        dataset = DatasetFactory()
+        _sample(dataset, "10.00000", "50.00000")
+        _sample(dataset, "12.50000", "48.00000")
+        _sample(dataset)
+
+        assert _extent(dataset).sample_count == 3
+        assert _bounds(dataset) == (10.0, 12.5, 48.0, 50.0)
+        assert Dataset.all_objects.get(pk=dataset.pk).bbox["max_x"] == Decimal("12.5")
+
+    def test_sample_dates_widen_the_span(self):
+        dataset = DatasetFactory()
+        SampleDateFactory(related=_sample(dataset), value="2019-05")
+        SampleDateFactory(related=_sample(dataset), value="2021")
+
+        extent = _extent(dataset)
+        assert str(extent.earliest) == "2019-05"
+        assert str(extent.latest) == "2021"
+
+    def test_deleting_samples(self):
+        dataset = DatasetFactory()
+        inner = _sample(dataset, "11.00000", "49.00000")
+        edge = _sample(dataset, "12.50000", "50.00000")
+        _sample(dataset, "10.00000", "48.00000")
+
+        inner.delete()
+        assert _extent(dataset).sample_count == 2
+        assert _bounds(dataset) == (10.0, 12.5, 48.0, 50.0)
+
+        edge.delete()
+        assert _extent(dataset).sample_count == 1
+        assert _bounds(dataset) == (10.0, 10.0, 48.0, 48.0)
+
+    def test_moving_a_sample_to_another_dataset(self):
+        source, target = DatasetFactory(), DatasetFactory()
+        sample = _sample(source, "10.00000", "50.00000")
+
+        sample.dataset = target
+        sample.save()
+
+        assert _extent(source).sample_count == 0
+        assert _bounds(source) == (None, None, None, None)
+        assert _extent(target).sample_count == 1
+
+    def test_moving_a_location(self):
+        dataset = DatasetFactory()
+        point = _sample(dataset, "10.00000", "50.00000").location
+
+        point.x = Decimal("20.00000")
+        point.save()
+
+        assert _bounds(dataset) == (20.0, 20.0, 50.0, 50.0)
+
+    def test_deleting_the_dataset(self):
+        dataset = DatasetFactory()
+        _sample(dataset, "10.00000", "50.00000")
+
+        dataset.delete()
+
+        assert not DatasetExtent.objects.exists()
+
+    def test_rebuild_after_writes_without_signals(self):
+        dataset = DatasetFactory()
+        sample = _sample(dataset, "10.00000", "50.00000")
+        Sample.objects.filter(pk=sample.pk).update(location=None)
+
+        assert rebuild_extents() >= 1
+        assert _extent(dataset).sample_count == 1
+        assert _bounds(dataset) == (None, None, None, None)
@@ -0,0 +1,159 @@
+"""Tests for request instrumentation (fairdm/core/instrumentation.py).
+
+Covers:
+- the middleware counts every query, and spans count those made inside them
+- the trace is logged, sent as Server-Timing and appended as OTLP/JSON
+- spans and the {% timed %} tag do nothing outside an instrumented request
+- a viewset span is named after its action
+- InstrumentedCache counts hits and misses and passes everything else through
+"""
+
+import json
+import logging
+
+import pytest
+from django.template import Context, Template
+from django.test import RequestFactory, override_settings
+
+from fairdm.core.instrumentation import (
+    InstrumentationMiddleware,
+    InstrumentedCache,
+    InstrumentedViewMixin,
+    current_trace,
+    instrument_caches,
+    span,
+)
+from fairdm.core.models import Dataset
+
+LOCMEM = {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+
+
+def _serve(view, **settings):
+    """Run ``view`` behind the middleware, returning the response."""
+    with override_settings(**settings):
+        middleware = InstrumentationMiddleware(view)
+        return middleware(RequestFactory().get("/datasets/"))
+
+
+def _queries(request):
+    from django.http import HttpResponse
+
+    Dataset.all_objects.count()
+    with span("overview", "plugin"):
+        Dataset.all_objects.exists()
+        Dataset.all_objects.exists()
+    return HttpResponse("ok")
+
+
+@pytest.mark.django_db
+class TestMiddleware:
+    def test_counts_queries_per_span(self, caplog):
+        with caplog.at_level(logging.INFO, logger="fairdm.instrumentation"):
+            _serve(_queries)
+
+        summary = caplog.records[-1].instrumentation
+        assert summary["queries"] == 3
+        assert summary["spans"]["overview"]["queries"] == 2
+        assert summary["http.status_code"] == 200
+
+    def test_server_timing(self):
+        response = _serve(_queries, FAIRDM_INSTRUMENTATION_SERVER_TIMING=True)
+
+        header = response["Server-Timing"]
+        entries = [entry.split(";")[0] for entry in header.split(", ")]
+        assert entries == ["total", "db", "overview"]
+        assert 'desc="3 queries"' in header
+
+    def test_no_server_timing_unless_enabled(self):
+        response = _serve(_queries, FAIRDM_INSTRUMENTATION_SERVER_TIMING=False)
+
+        assert "Server-Timing" not in response
+
+    def test_trace_file_is_otlp_json(self, tmp_path):
+        path = tmp_path / "traces.jsonl"
+        _serve(_queries, FAIRDM_INSTRUMENTATION_TRACE_FILE=str(path))
+        _serve(_queries, FAIRDM_INSTRUMENTATION_TRACE_FILE=str(path))
+
+        lines = path.read_text().splitlines()
+        assert len(lines) == 2
+        (scope,) = json.loads(lines[0])["resourceSpans"][0]["scopeSpans"]
+        request, plugin = scope["spans"]
+        assert plugin["parentSpanId"] == request["spanId"]
+        assert plugin["traceId"] == request["traceId"]
+        assert int(request["endTimeUnixNano"]) >= int(plugin["endTimeUnixNano"])
+        attributes = {a["key"]: a["value"] for a in plugin["attributes"]}
+        assert attributes["db.queries"] == {"intValue": "2"}
+
+    def test_trace_ends_with_the_request(self):
+        _serve(_queries)
+
+        assert current_trace() is None
+
+
+class TestWithoutTrace:
+    def test_span_does_nothing(self):
+        with span("anything") as opened:
+            assert opened is None
+
+    def test_timed_tag_renders_its_content(self):
+        template = Template('{% load fairdm %}{% timed "menu" %}tabs{% endtimed %}')
+
+        assert template.render(Context()) == "tabs"
+
+
+class TestTimedTag:
+    def test_is_a_span(self):
+        from django.http import HttpResponse
+
+        def view(request):
+            template = Template('{% load fairdm %}{% timed "menu" %}x{% endtimed %}')
+            template.render(Context())
+            return HttpResponse(str(current_trace().totals()))
+
+        response = _serve(view)
+
+        assert "'menu'" in response.content.decode()
+
+
+class TestViewMixin:
+    def test_span_is_named_after_the_action(self):
+        class Viewset(InstrumentedViewMixin):
+            action_map = {"get": "list"}
+
+        request = RequestFactory().get("/")
+
+        assert Viewset().get_span_name(request) == "Viewset.list"
+
+
+class TestInstrumentedCache:
+    @pytest.fixture
+    def cache(self):
+        config = instrument_caches({"default": LOCMEM})["default"]
+        cache = InstrumentedCache(config["LOCATION"], config)
+        cache.clear()
+        return cache
+
+    def test_counts_hits_and_misses(self, cache):
+        from django.http import HttpResponse
+
+        def view(request):
+            cache.set("present", 0)
+            cache.get("present")
+            cache.get("absent")
+            cache.get_many(["present", "absent", "also-absent"])
+            return HttpResponse()
+
+        response = _serve(view, FAIRDM_INSTRUMENTATION_SERVER_TIMING=True)
+
+        assert 'cache;desc="2 hits, 3 misses"' in response["Server-Timing"]
+
+    def test_a_cached_falsy_value_is_a_hit(self, cache):
+        cache.set("zero", 0)
+
+        assert cache.get("zero", default="missing") == 0
+        assert cache.get("absent", default="missing") == "missing"
+
+    def test_instrument_caches_is_idempotent(self):
+        caches = instrument_caches({"default": LOCMEM})
+
+        assert instrument_caches(caches) == caches
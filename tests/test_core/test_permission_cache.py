@@ -0,0 +1,163 @@
+"""Tests for the cached per-user permission snapshot.
+
+Covers:
+- direct, group and dataset-inherited grants resolve from the snapshot
+- a warm snapshot answers checks without a query, across user instances
+- assigning or removing a grant, or joining a group, retires the snapshot
+- superusers and anonymous users are left to guardian
+- prefetch_permissions answers a page of checks from two queries
+"""
+
+import pytest
+from django.contrib.auth.models import AnonymousUser, Group
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from fairdm.core.permission_cache import (
+    get_snapshot,
+    invalidate_permissions,
+    prefetch_permissions,
+)
+from fairdm.core.utils import assign_perm, remove_perm
+from fairdm.factories import DatasetFactory, PersonFactory
+
+
+@pytest.fixture
+def user(db):
+    return PersonFactory(is_active=True)
+
+
+@pytest.fixture
+def dataset(db):
+    return DatasetFactory()
+
+
+@pytest.fixture
+def rock_sample(dataset):
+    from fairdm_demo.models import RockSample
+
+    return RockSample.objects.create(
+        name="Test Rock",
+        dataset=dataset,
+        rock_type="igneous",
+        collection_date="2024-01-15",
+    )
+
+
+def _fresh(user):
+    """The same user as a new instance, as the next request would load it."""
+    return type(user).objects.get(pk=user.pk)
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("locmem_cache")
+class TestPermissionSnapshot:
+    def test_direct_grant(self, user, rock_sample):
+        assign_perm("change_sample", user, rock_sample)
+
+        assert _fresh(user).has_perm("sample.change_sample", rock_sample) is True
+
+    def test_dataset_grant_is_inherited(self, user, rock_sample):
+        assign_perm("view_dataset", user, rock_sample.dataset)
+
+        assert _fresh(user).has_perm("sample.view_sample", rock_sample) is True
+        assert _fresh(user).has_perm("sample.change_sample", rock_sample) is False
+
+    def test_group_grant(self, user, dataset):
+        group = Group.objects.create(name="editors")
+        assign_perm("change_dataset", group, dataset)
+        user.groups.add(group)
+
+        assert _fresh(user).has_perm("dataset.change_dataset", dataset) is True
+
+    def test_warm_snapshot_needs_no_query(self, user, rock_sample):
+        assign_perm("view_dataset", user, rock_sample.dataset)
+        _fresh(user).has_perm("sample.view_sample", rock_sample)
+
+        user = _fresh(user)
+        with CaptureQueriesContext(connection) as queries:
+            for _ in range(12):
+                user.has_perm("sample.view_sample", rock_sample)
+                user.has_perm("sample.delete_sample", rock_sample)
+
+        # ModelBackend still reads the user's global permissions, once
+        assert len(queries) <= 2
+
+    def test_remove_retires_the_snapshot(self, user, rock_sample):
+        assign_perm("view_sample", user, rock_sample)
+        assert _fresh(user).has_perm("sample.view_sample", rock_sample) is True
+
+        remove_perm("view_sample", user, rock_sample)
+        assert _fresh(user).has_perm("sample.view_sample", rock_sample) is False
+
+    def test_joining_a_group_retires_the_snapshot(self, user, dataset):
+        group = Group.objects.create(name="viewers")
+        assign_perm("view_dataset", group, dataset)
+        assert _fresh(user).has_perm("dataset.view_dataset", dataset) is False
+
+        user.groups.add(group)
+        assert _fresh(user).has_perm("dataset.view_dataset", dataset) is True
+
+    def test_invalidate_permissions(self, user, dataset):
+        first = get_snapshot(user)
+        invalidate_permissions(user)
+
+        assert get_snapshot(user) is not first
+
+    def test_no_snapshot_for_superusers_or_anonymous(self, user):
+        user.is_superuser = True
+
+        assert get_snapshot(user) is None
+        assert get_snapshot(AnonymousUser()) is None
+
+
+@pytest.mark.django_db
+class TestPrefetchPermissions:
+    def _samples(self, dataset, count):
+        from fairdm_demo.models import RockSample
+
+        for number in range(count):
+            RockSample.objects.create(
+                name=f"Rock {number}",
+                dataset=dataset,
+                rock_type="igneous",
+                collection_date="2024-01-15",
+            )
+        return RockSample.objects.filter(dataset=dataset)
+
+    def test_cost_does_not_grow_with_the_page(self, user, dataset):
+        samples = self._samples(dataset, 10)
+        assign_perm("change_dataset", user, dataset)
+        user = _fresh(user)
+
+        prefetch_permissions(user, samples[:2])
+        with CaptureQueriesContext(connection) as small:
+            prefetch_permissions(user, samples[:2])
+        with CaptureQueriesContext(connection) as queries:
+            objects = prefetch_permissions(user, samples.all())
+        # The page itself, then the user's and the groups' rows
+        assert len(queries) == len(small) == 3
+
+        with CaptureQueriesContext(connection) as queries:
+            for sample in objects:
+                assert user.has_perm("sample.change_sample", sample) is True
+                assert user.has_perm("sample.view_sample", sample) is False
+        assert len(queries) <= 2
+
+    def test_queryset_is_evaluated_in_place(self, user, dataset):
+        samples = self._samples(dataset, 2).all()
+
+        objects = prefetch_permissions(user, samples)
+
+        assert list(samples) == objects
+        assert all(a is b for a, b in zip(samples, objects, strict=True))
+
+    def test_other_users_do_not_use_the_attached_rows(self, user, dataset):
+        samples = self._samples(dataset, 1)
+        other = PersonFactory(is_active=True)
+        assign_perm("view_dataset", other, dataset)
+
+        (sample,) = prefetch_permissions(user, samples)
+
+        assert other.has_perm("sample.view_sample", sample) is True
+        assert user.has_perm("sample.view_sample", sample) is False
@@ -0,0 +1,77 @@
+"""Tests for the per-request record resolver in fairdm.core.records.
+
+Covers:
+- a record is fetched once per request, as its real subclass
+- its base view is built without a query
+- records read through different managers are resolved apart
+- plugins resolve their record through the same cache
+"""
+
+import pytest
+from django.http import Http404
+from django.test import RequestFactory
+from django.views.generic import TemplateView
+
+from fairdm.contrib.plugins import Plugin
+from fairdm.core.dataset.models import Dataset
+from fairdm.core.models import Sample
+from fairdm.core.records import resolve_record
+from fairdm.core.utils import get_non_polymorphic_instance
+from fairdm.factories import DatasetFactory
+from fairdm.utils.choices import Visibility
+from fairdm_demo.factories import RockSampleFactory
+from fairdm_demo.models import RockSample
+
+
+@pytest.fixture
+def request_():
+    return RequestFactory().get("/")
+
+
+@pytest.mark.django_db
+class TestResolveRecord:
+    def test_fetched_once_as_its_subclass(self, request_, django_assert_num_queries):
+        sample = RockSampleFactory()
+
+        record = resolve_record(request_, Sample, uuid=sample.uuid)
+        with django_assert_num_queries(0):
+            again = resolve_record(request_, Sample, uuid=sample.uuid)
+
+        assert again is record
+        assert type(record.typed) is RockSample
+        assert type(record.base) is Sample
+        assert record.base.pk == sample.pk
+
+    def test_base_view_costs_no_query(self, django_assert_num_queries):
+        sample = RockSampleFactory()
+
+        with django_assert_num_queries(0):
+            base = get_non_polymorphic_instance(sample)
+
+        assert type(base) is Sample
+        assert base.name == sample.name
+
+    def test_managers_are_resolved_apart(self, request_):
+        dataset = DatasetFactory(visibility=Visibility.PRIVATE)
+
+        record = resolve_record(request_, Dataset, "all_objects", uuid=dataset.uuid)
+
+        assert record.typed == dataset
+        with pytest.raises(Http404):
+            resolve_record(request_, Dataset, uuid=dataset.uuid)
+
+    def test_plugins_share_the_record(self, request_, django_assert_num_queries):
+        sample = RockSampleFactory()
+
+        class RecordPlugin(Plugin, TemplateView):
+            template_name = "test.html"
+
+        first, second = RecordPlugin(), RecordPlugin()
+        for plugin in (first, second):
+            plugin.request = request_
+            plugin.kwargs = {"uuid": sample.uuid}
+            plugin.registered_model = Sample
+
+        first_record = first.base_object
+        with django_assert_num_queries(0):
+            assert second.base_object is first_record
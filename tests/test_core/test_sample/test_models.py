@@ -1828,6 +1828,45 @@ class TestSampleHierarchyDepth:
         assert set(root.get_descendants(depth=3)) == {level1, level2, level3}
         assert set(root.get_descendants()) == {level1, level2, level3}
 
+    def test_subtree_reports_shortest_depth(self, four_level_chain):
+        root, level1, level2, level3 = four_level_chain
+        # A second, shorter path to level3
+        SampleRelationFactory(source=level3, target=level1, type="child_of")
+
+        subtree = Sample.objects.get_subtree(root)
+
+        depths = [(sample, sample.depth) for sample in subtree]
+        assert depths == [(level1, 1), (level2, 2), (level3, 2)]
+
+    def test_walk_is_one_query_at_any_depth(self, dataset, django_assert_num_queries):
+        chain = [RockSampleFactory(dataset=dataset) for _ in range(8)]
+        for parent, child in itertools.pairwise(chain):
+            SampleRelationFactory(source=child, target=parent, type="child_of")
+
+        with django_assert_num_queries(1):
+            assert chain[0].get_descendants().count() == 7
+        with django_assert_num_queries(1):
+            assert chain[-1].get_ancestors().count() == 7
+
+    def test_multi_step_loop_is_refused(self, four_level_chain):
+        root, *_, level3 = four_level_chain
+
+        with pytest.raises(ValidationError, match="Circular relationship"):
+            SampleRelation.objects.create(source=root, target=level3, type="child_of")
+
+    def test_find_cycles_checks_a_batch(self, four_level_chain):
+        from fairdm.core.sample.hierarchy import find_cycles
+
+        root, *_, level3 = four_level_chain
+        other = RockSampleFactory(dataset=root.dataset)
+
+        # other → level3 is fine alone; with root → other it closes a loop
+        assert find_cycles([(other.pk, level3.pk)]) == set()
+        assert find_cycles([(other.pk, level3.pk), (root.pk, other.pk)]) == {
+            (other.pk, level3.pk),
+            (root.pk, other.pk),
+        }
+
 
 @pytest.mark.django_db
 class TestSampleRelationRefusals:
@@ -0,0 +1,115 @@
+"""Tests for the full-text search documents in fairdm.core.search.
+
+Covers:
+- a record's name, descriptions, keywords, tags and registered fields are searchable
+- each change to a record or its parts rebuilds its document
+- plain words match word prefixes; quotes, or and -exclusions read as web search
+- matches in the name rank above matches in a description
+- rebuild_search_index finds records written without signals
+"""
+
+import pytest
+
+from fairdm.core.dataset.models import Dataset, DatasetDescription
+from fairdm.core.models import Sample
+from fairdm.core.search import parse_query, rebuild_search_index, search
+from fairdm.factories import DatasetFactory
+
+
+@pytest.fixture
+def dataset(db):
+    return DatasetFactory(name="Moraine survey")
+
+
+def _rock(dataset, **fields):
+    from fairdm_demo.models import RockSample
+
+    fields = {"rock_type": "igneous", "collection_date": "2024-01-15", **fields}
+    return RockSample.objects.create(dataset=dataset, **fields)
+
+
+def _found(queryset, text):
+    return list(search(queryset, text))
+
+
+@pytest.mark.django_db
+class TestSearchDocument:
+    def test_name_and_registered_fields(self, dataset):
+        rock = _rock(dataset, name="Granite", mineral_content="quartz and feldspar")
+
+        assert _found(Sample.objects.all(), "granite") == [rock]
+        assert _found(Sample.objects.all(), "feldspar") == [rock]
+
+    def test_description_changes(self, dataset):
+        description = DatasetDescription.objects.create(
+            related=dataset, type="Abstract", value="Glacial till"
+        )
+        assert _found(Dataset.all_objects.all(), "till") == [dataset]
+
+        description.value = "Outwash gravel"
+        description.save()
+        assert _found(Dataset.all_objects.all(), "till") == []
+
+        description.delete()
+        assert _found(Dataset.all_objects.all(), "gravel") == []
+
+    def test_tags(self, dataset):
+        dataset.tags.add("holocene")
+
+        assert _found(Dataset.all_objects.all(), "holocene") == [dataset]
+
+        dataset.tags.remove("holocene")
+        assert _found(Dataset.all_objects.all(), "holocene") == []
+
+    def test_edits_to_the_record(self, dataset):
+        dataset.name = "Drumlin field"
+        dataset.save()
+
+        assert _found(Dataset.all_objects.all(), "drumlin") == [dataset]
+        assert _found(Dataset.all_objects.all(), "moraine") == []
+
+    def test_rebuild_finds_records_written_without_signals(self, dataset):
+        Dataset.all_objects.filter(pk=dataset.pk).update(name="Esker")
+        assert _found(Dataset.all_objects.all(), "esker") == []
+
+        assert rebuild_search_index() >= 1
+        assert _found(Dataset.all_objects.all(), "esker") == [dataset]
+
+
+@pytest.mark.django_db
+class TestSearchQuery:
+    def test_words_match_prefixes(self, dataset):
+        rock = _rock(dataset, name="Granite", local_id="ROCK-002")
+
+        assert _found(Sample.objects.all(), "gran") == [rock]
+        assert _found(Sample.objects.all(), str(rock.uuid)[:8]) == [rock]
+        assert _found(Sample.objects.all(), "ROCK-002") == [rock]
+        assert _found(Sample.objects.all(), "ROCK-001") == []
+
+    def test_web_search_operators(self, dataset):
+        granite = _rock(dataset, name="Pink granite")
+        basalt = _rock(dataset, name="Granite basalt contact")
+
+        assert _found(Sample.objects.all(), "granite -basalt") == [granite]
+        assert set(_found(Sample.objects.all(), "pink or contact")) == {
+            granite,
+            basalt,
+        }
+        assert _found(Sample.objects.all(), '"granite basalt"') == [basalt]
+
+    def test_nothing_to_search_for(self):
+        assert parse_query("  -- ") is None
+
+    def test_name_outranks_description(self, dataset):
+        mentioned = DatasetFactory(name="Lake cores")
+        DatasetDescription.objects.create(
+            related=mentioned, type="Abstract", value="Cores from a moraine lake"
+        )
+
+        assert _found(Dataset.all_objects.all(), "moraine") == [dataset, mentioned]
+
+    def test_rank_false_keeps_the_ordering(self, dataset):
+        other = DatasetFactory(name="Moraine cores")
+        queryset = Dataset.all_objects.order_by("-name")
+
+        assert list(search(queryset, "moraine", rank=False)) == [dataset, other]
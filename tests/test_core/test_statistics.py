@@ -0,0 +1,72 @@
+"""Tests for the grouped per-type counts in fairdm.core.statistics.
+
+Covers:
+- every type is counted by one grouped query
+- a registered type's count includes its subtypes, as ``objects.count()`` does
+- public_only leaves out records in private datasets
+- counts are served from the cache, and creating or deleting a record clears it
+"""
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from fairdm.core.models import Sample
+from fairdm.core.statistics import count_for, get_type_counts
+from fairdm.factories import DatasetFactory
+from fairdm.utils.choices import Visibility
+from fairdm_demo.factories import CustomParentSampleFactory
+from fairdm_demo.models import CustomParentSample
+
+
+@pytest.mark.django_db
+class TestTypeCounts:
+    def test_counts_every_type_in_one_query(self):
+        CustomParentSampleFactory.create_batch(3)
+
+        with CaptureQueriesContext(connection) as queries:
+            counts = get_type_counts(Sample)
+
+        assert counts[CustomParentSample] == 3
+        # The grouped count, then the content types it names
+        assert len(queries) == 2
+
+    def test_count_for_matches_objects_count(self):
+        CustomParentSampleFactory.create_batch(2)
+        counts = get_type_counts(Sample)
+
+        for model in {Sample, *counts}:
+            assert count_for(model, counts) == model.objects.count()
+
+    def test_public_only(self):
+        CustomParentSampleFactory.create_batch(
+            2, dataset=DatasetFactory(visibility=Visibility.PUBLIC)
+        )
+        CustomParentSampleFactory(dataset=DatasetFactory(visibility=Visibility.PRIVATE))
+
+        assert get_type_counts(Sample)[CustomParentSample] == 3
+        assert get_type_counts(Sample, public_only=True)[CustomParentSample] == 2
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("locmem_cache")
+class TestTypeCountCache:
+    def test_counts_are_cached(self):
+        CustomParentSampleFactory()
+        get_type_counts(Sample)
+
+        with CaptureQueriesContext(connection) as queries:
+            counts = get_type_counts(Sample)
+
+        assert counts[CustomParentSample] == 1
+        assert len(queries) == 0
+
+    def test_create_and_delete_clear_the_cache(self):
+        sample = CustomParentSampleFactory()
+        assert get_type_counts(Sample)[CustomParentSample] == 1
+
+        CustomParentSampleFactory(dataset=sample.dataset)
+        assert get_type_counts(Sample)[CustomParentSample] == 2
+
+        sample.delete()
+        assert get_type_counts(Sample)[CustomParentSample] == 1
@@ -0,0 +1,69 @@
+"""Tests for bulk fake data generation (fairdm/factories/bulk.py).
+
+Covers:
+- bulk_save writes every table of a multi-table inheritance chain and sets the
+  polymorphic content type
+- generate writes the counts of its scale, links samples into a hierarchy and
+  rebuilds the indexes its batched writes skip
+"""
+
+import pytest
+
+from fairdm.contrib.contributors.models import Contribution
+from fairdm.core.dataset.models import Dataset, DatasetExtent
+from fairdm.core.measurement.models import Measurement
+from fairdm.core.sample.models import Sample, SampleRelation
+from fairdm.factories import DatasetFactory
+from fairdm.factories.bulk import Scale, bulk_save, generate
+from fairdm_demo.factories import CustomSampleFactory, ExampleMeasurementFactory
+from fairdm_demo.models import CustomSample
+
+TINY = Scale(
+    projects=2, datasets=4, samples=40, measurements=100, people=6, organizations=2
+)
+
+
+@pytest.mark.django_db
+class TestBulkSave:
+    def test_writes_every_table_of_the_chain(self):
+        dataset = DatasetFactory()
+        samples = bulk_save(
+            [CustomSampleFactory.build(dataset=dataset) for _ in range(5)],
+            batch_size=2,
+        )
+
+        assert all(sample.pk for sample in samples)
+        stored = Sample.objects.filter(pk__in=[s.pk for s in samples])
+        assert {type(sample) for sample in stored} == {CustomSample}
+        assert CustomSample.objects.filter(dataset=dataset).count() == 5
+
+    def test_nothing_to_save(self):
+        assert bulk_save([]) == []
+
+
+@pytest.mark.django_db
+class TestGenerate:
+    def test_writes_the_scale(self):
+        counts = generate(
+            TINY, [CustomSampleFactory], [ExampleMeasurementFactory], seed=1
+        )
+
+        assert counts["datasets"] == Dataset.all_objects.count() == 4
+        assert counts["samples"] == Sample.objects.count() == 40
+        assert counts["measurements"] == Measurement.objects.count() == 100
+        assert counts["contributors"] == 6 + 2
+        # One tree per dataset: every sample but each root has a parent
+        assert SampleRelation.objects.count() == 40 - 4
+        assert Contribution.objects.count() == counts["contributions"] == 6 * 3
+
+    def test_rebuilds_the_indexes(self):
+        generate(TINY, [CustomSampleFactory], [ExampleMeasurementFactory], seed=1)
+
+        assert sum(DatasetExtent.objects.values_list("sample_count", flat=True)) == 40
+        assert not Sample.objects.filter(search_vector=None).exists()
+
+    def test_without_factories_only_datasets_are_written(self):
+        counts = generate(TINY, [], [])
+
+        assert counts["datasets"] == 4
+        assert counts["samples"] == counts["measurements"] == 0
@@ -131,18 +131,62 @@ class TestAccessorsGenerate:
         assert "rock_type" in filterset.base_filters
 
 
-class TestNothingIsCached:
-    """FR-014: each call builds the class again."""
+class TestComponentMemo:
+    """FR-014 and D19: the default accessors memoise, behind the override."""
 
     @pytest.mark.parametrize("accessor", ACCESSORS)
-    def test_two_calls_return_distinct_classes(self, rock_sample, accessor):
+    def test_two_calls_return_the_same_class(self, rock_sample, accessor):
         config = ModelConfiguration(model=rock_sample, fields=["rock_type"])
         first = getattr(config, accessor)()
         second = getattr(config, accessor)()
-        assert first is not second, accessor
+        assert first is second, accessor
+
+    def test_configurations_do_not_share_a_memo(self, rock_sample):
+        a = ModelConfiguration(model=rock_sample, fields=["rock_type"])
+        b = ModelConfiguration(model=rock_sample, fields=["rock_type"])
+        assert a.get_table_class() is not b.get_table_class()
+
+    def test_a_changed_field_list_misses_the_memo(self, rock_sample):
+        config = ModelConfiguration(model=rock_sample, fields=["rock_type"])
+        first = config.get_table_class()
+        config.fields = ["depth"]
+        second = config.get_table_class()
+        assert first is not second
+        assert "depth" in second.base_columns
+
+    def test_a_changed_class_misses_the_memo(self, rock_sample):
+        class MyTable(Table):
+            pass
+
+        config = ModelConfiguration(model=rock_sample, fields=["rock_type"])
+        generated = config.get_table_class()
+        config.table_class = MyTable
+        assert config.get_table_class() is MyTable
+        assert generated is not MyTable
+
+    def test_invalidate_rebuilds_every_component(self, rock_sample):
+        config = ModelConfiguration(model=rock_sample, fields=["rock_type"])
+        before = {accessor: getattr(config, accessor)() for accessor in ACCESSORS}
+        config.invalidate()
+        for accessor in ACCESSORS:
+            assert getattr(config, accessor)() is not before[accessor], accessor
+
+    def test_invalidate_one_component_keeps_the_others(self, rock_sample):
+        config = ModelConfiguration(model=rock_sample, fields=["rock_type"])
+        table = config.get_table_class()
+        form = config.get_form_class()
+        config.invalidate("table")
+        assert config.get_table_class() is not table
+        assert config.get_form_class() is form
+
+    def test_invalidate_refuses_an_unknown_component(self, rock_sample):
+        config = ModelConfiguration(model=rock_sample, fields=["rock_type"])
+        with pytest.raises(KeyError, match="tabel"):
+            config.invalidate("tabel")
 
     def test_no_public_attribute_returns_a_component_class(self, rock_sample):
         config = ModelConfiguration(model=rock_sample, fields=["rock_type"])
+        config.get_table_class()
         for name in COMPONENTS:
             assert not hasattr(config, name), (
                 f"{name} is reachable as an attribute, which bypasses "
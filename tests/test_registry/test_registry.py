@@ -755,6 +755,29 @@ class TestRegistryEnhancedMethods:
         for config in all_configs:
             assert isinstance(config, fairdm.config.ModelConfiguration)
 
+    def test_invalidate_drops_every_configurations_memo(self, clean_registry):
+        """Verify registry.invalidate() rebuilds components for every model."""
+
+        class Sample1(Sample):
+            class Meta:
+                app_label = "test_app"
+
+        class Sample2(Sample):
+            class Meta:
+                app_label = "test_app"
+
+        clean_registry.register(Sample1)
+        clean_registry.register(Sample2)
+        before = {
+            model: clean_registry.get_for_model(model).get_table_class()
+            for model in (Sample1, Sample2)
+        }
+
+        clean_registry.invalidate()
+
+        for model, table in before.items():
+            assert clean_registry.get_for_model(model).get_table_class() is not table
+
     def test_get_all_configs_returns_empty_list_when_no_models_registered(
         self, clean_registry
     ):
@@ -18,9 +18,12 @@ import django_tables2 as tables
 import pytest
 from django.contrib.auth.models import AnonymousUser
 from django.contrib.messages.storage.fallback import FallbackStorage
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
 from fairdm.core.models import Project
-from fairdm.factories import ProjectFactory
+from fairdm.core.utils import assign_perm
+from fairdm.factories import DatasetFactory, PersonFactory, ProjectFactory
 from fairdm.views.base import (
     FairDMCreateView,
     FairDMDeleteView,
@@ -30,6 +33,7 @@ from fairdm.views.base import (
     FairDMTemplateView,
     FairDMUpdateView,
 )
+from fairdm_demo.models import RockSample
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -109,6 +113,31 @@ class ConcreteTableView(FairDMTableView):
     filterset_fields = []
 
 
+class _EditableSampleTable(tables.Table):
+    """A table with a column that checks an object permission on every row."""
+
+    editable = tables.Column(empty_values=(), orderable=False)
+
+    class Meta:
+        model = RockSample
+        fields = ["name"]
+
+    def render_editable(self, record):
+        return self.request.user.has_perm("sample.change_sample", record)
+
+
+class PermissionTableView(FairDMTableView):
+    """A table view that loads the page's permissions for its editable column."""
+
+    model = RockSample
+    table_class = _EditableSampleTable
+    filterset_fields = []
+    prefetch_permissions = True
+
+    def get_queryset(self):
+        return RockSample.objects.order_by("pk")
+
+
 # ---------------------------------------------------------------------------
 # TestFairDMTemplateView (T018)
 # ---------------------------------------------------------------------------
@@ -317,3 +346,35 @@ class TestFairDMTableView:
         request.user = AnonymousUser()
         response = ConcreteTableView.as_view()(request)
         assert "meta" in response.context_data
+
+
+@pytest.mark.django_db
+class TestFairDMTableViewPermissions:
+    """prefetch_permissions answers a table's per-row checks for the whole page."""
+
+    def _render(self, rf, user, per_page):
+        request = rf.get("/", {"per_page": per_page})
+        request.user = user
+        table = PermissionTableView.as_view()(request).context_data["table"]
+        return [row.get_cell("editable") for row in table.page.object_list]
+
+    def test_cost_does_not_grow_with_the_page(self, rf, django_assert_num_queries):
+        dataset = DatasetFactory()
+        for number in range(10):
+            RockSample.objects.create(
+                name=f"Rock {number}",
+                dataset=dataset,
+                rock_type="igneous",
+                collection_date="2024-01-15",
+            )
+        user = PersonFactory(is_active=True)
+        assign_perm("change_dataset", user, dataset)
+        user = type(user).objects.get(pk=user.pk)
+
+        # Warm the per-process caches (content types, permission ownership)
+        self._render(rf, user, 2)
+        with CaptureQueriesContext(connection) as small:
+            assert self._render(rf, user, 2) == [True] * 2
+
+        with django_assert_num_queries(len(small)):
+            assert self._render(rf, user, 10) == [True] * 10